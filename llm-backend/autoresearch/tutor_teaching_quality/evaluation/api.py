@@ -158,7 +158,6 @@ def _run_session_evaluation(session_id: str):
     from autoresearch.tutor_teaching_quality.evaluation.evaluator import ConversationEvaluator
     from autoresearch.tutor_teaching_quality.evaluation.report_generator import ReportGenerator
     from database import get_db_manager
-    from tutor.models.session_state import SessionState
 
     run_dir = None
     try:
@@ -172,7 +171,8 @@ def _run_session_evaluation(session_id: str):
             db_session = db.query(SessionModel).filter(SessionModel.id == session_id).first()
             if not db_session:
                 raise RuntimeError(f"Session not found: {session_id}")
-            session = SessionState.model_validate_json(db_session.state_json)
+            from tutor.services.session_state_store import load_session_state
+            session = load_session_state(db, db_session)
         finally:
             db.close()
 
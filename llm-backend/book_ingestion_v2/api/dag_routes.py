@@ -106,8 +106,8 @@ def _resolve_topic_keys(db: Session, guideline_id: str) -> tuple[str, str, str]:
     return guideline.book_id, chapter.id, topic_key
 
 
-def _cascade_info(guideline_id: str) -> Optional[CascadeInfo]:
-    cascade = get_cascade_orchestrator().get_cascade(guideline_id)
+def _cascade_info(db: Session, guideline_id: str) -> Optional[CascadeInfo]:
+    cascade = get_cascade_orchestrator().get_cascade(guideline_id, db=db)
     if cascade is None:
         return None
     return CascadeInfo(
@@ -163,7 +163,7 @@ def _build_dag_view(db: Session, guideline_id: str) -> TopicDAGResponse:
     return TopicDAGResponse(
         guideline_id=guideline_id,
         stages=stages,
-        cascade=_cascade_info(guideline_id),
+        cascade=_cascade_info(db, guideline_id),
     )
 
 
@@ -505,5 +505,5 @@ def cancel_cascade(guideline_id: str, db: Session = Depends(get_db)):
     cascade was active").
     """
     _resolve_topic_keys(db, guideline_id)
-    cancelled = get_cascade_orchestrator().cancel(guideline_id)
+    cancelled = get_cascade_orchestrator().cancel(guideline_id, db=db)
     return CascadeCancelResponse(cancelled=cancelled)
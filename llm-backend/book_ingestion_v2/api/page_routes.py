@@ -24,7 +24,7 @@ async def upload_page(
     image: UploadFile = File(...),
     db: Session = Depends(get_db),
 ):
-    """Upload a single page with inline OCR."""
+    """Upload a single page; OCR runs in the background (poll ocr_status)."""
     try:
         image_data = await image.read()
         service = ChapterPageService(db)
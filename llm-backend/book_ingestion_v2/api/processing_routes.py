@@ -21,9 +21,18 @@ from book_ingestion_v2.models.schemas import (
 from book_ingestion_v2.repositories.chapter_repository import ChapterRepository
 from book_ingestion_v2.repositories.chapter_page_repository import ChapterPageRepository
 from book_ingestion_v2.repositories.topic_repository import TopicRepository
+from book_ingestion_v2.services.chapter_job_notifier import notify_chapter_job_terminal
 from book_ingestion_v2.services.chapter_job_service import ChapterJobService, ChapterJobLockError
 from book_ingestion_v2.services.chapter_page_service import ChapterPageService
 from book_ingestion_v2.services.topic_extraction_orchestrator import TopicExtractionOrchestrator
+from shared.services.job_queue import (
+    INGESTION_QUEUE,
+    enqueue_job,
+    job_task,
+    resolve_task_ref,
+    task_ref,
+    use_job_queue,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -652,80 +661,151 @@ def run_in_background_v2(target_fn, job_id: str, *args):
     Phase 2: writes per-stage state to `topic_stage_runs` via the
     `_write_topic_stage_run_*` helpers, treating this wrapper as the
     single point of capture for all 8 topic-DAG stages.
+
+    With `background_jobs_backend = "queue"` the job is enqueued for
+    `worker.py` (see `run_chapter_job`) and None is returned; otherwise it
+    runs on a daemon thread in this process and the thread is returned.
+    Queued jobs reference `target_fn` by name, so it must be a module-level
+    function or a method of a class built from the DB session.
     """
     import threading
-    import time
-    import logging
+
+    if use_job_queue():
+        enqueue_job(
+            CHAPTER_JOB_TASK, task_ref(target_fn), job_id, *args, entity_id=job_id,
+        )
+        logger.info(f"Queued V2 background task: {target_fn.__name__} (job_id={job_id})")
+        return None
+
+    thread = threading.Thread(
+        target=_execute_chapter_job, args=(target_fn, job_id, *args), daemon=True,
+    )
+    thread.start()
+    logger.info(f"Launched V2 background task: {target_fn.__name__} (job_id={job_id})")
+    return thread
+
+
+def _execute_chapter_job(target_fn, job_id: str, *args):
+    """Run one chapter job to its terminal state, on a thread or a queue worker.
+
+    Never raises: a failure is recorded on the job (and its stage-run row),
+    which the cascade and the pipeline orchestrator read. Always ends by
+    notifying job completion (see `chapter_job_notifier`).
+    """
     from datetime import datetime
     from database import get_db_manager
 
-    logger = logging.getLogger(__name__)
+    db_manager = get_db_manager()
+    session = db_manager.session_factory()
+    started_at = datetime.utcnow()
+    try:
+        job_service = ChapterJobService(session)
+        job_service.start_job(job_id)
 
-    def wrapper():
-        db_manager = get_db_manager()
-        session = db_manager.session_factory()
-        started_at = datetime.utcnow()
+        # Use a fresh session for the started-write so a transient DB
+        # failure here can't leave `session` in a `PendingRollbackError`
+        # state when target_fn picks it up.
+        started_session = db_manager.session_factory()
         try:
-            job_service = ChapterJobService(session)
-            job_service.start_job(job_id)
+            _write_topic_stage_run_started(
+                started_session, job_id, started_at=started_at,
+            )
+        finally:
+            started_session.close()
 
-            # Use a fresh session for the started-write so a transient DB
-            # failure here can't leave `session` in a `PendingRollbackError`
-            # state when target_fn picks it up.
-            started_session = db_manager.session_factory()
-            try:
-                _write_topic_stage_run_started(
-                    started_session, job_id, started_at=started_at,
-                )
-            finally:
-                started_session.close()
+        # Re-create orchestrator/service with the background session
+        target_fn(session, job_id, *args)
 
-            # Re-create orchestrator/service with the background session
-            target_fn(session, job_id, *args)
+        # Use a fresh session for the terminal write — `target_fn` may
+        # have refreshed `session` internally (legitimately, after
+        # long LLM calls), leaving it in an unknown state.
+        terminal_session = db_manager.session_factory()
+        try:
+            _write_topic_stage_run_terminal(
+                terminal_session, job_id, started_at=started_at,
+            )
+        finally:
+            terminal_session.close()
 
-            # Use a fresh session for the terminal write — `target_fn` may
-            # have refreshed `session` internally (legitimately, after
-            # long LLM calls), leaving it in an unknown state.
-            terminal_session = db_manager.session_factory()
+    except Exception as e:
+        logger.error(f"V2 background task failed: {e}", exc_info=True)
+        # Use a fresh session for error handling — the original may be dead
+        # after a long LLM call timed out the DB connection. Write the
+        # observability terminal row BEFORE release_lock so a failing
+        # release_lock can't drop the row.
+        try:
+            error_session = db_manager.session_factory()
             try:
                 _write_topic_stage_run_terminal(
-                    terminal_session, job_id, started_at=started_at,
+                    error_session,
+                    job_id,
+                    started_at=started_at,
+                    override_state="failed",
+                    error_summary=str(e),
                 )
+                job_service = ChapterJobService(error_session)
+                job_service.release_lock(job_id, status="failed", error=str(e))
             finally:
-                terminal_session.close()
+                error_session.close()
+        except Exception:
+            logger.error(f"Could not mark job {job_id} as failed")
+    finally:
+        try:
+            session.close()
+        except Exception:
+            pass  # Session may already be closed by orchestrator refresh
 
-        except Exception as e:
-            logger.error(f"V2 background task failed: {e}", exc_info=True)
-            # Use a fresh session for error handling — the original may be dead
-            # after a long LLM call timed out the DB connection. Write the
-            # observability terminal row BEFORE release_lock so a failing
-            # release_lock can't drop the row.
-            try:
-                error_session = db_manager.session_factory()
-                try:
-                    _write_topic_stage_run_terminal(
-                        error_session,
-                        job_id,
-                        started_at=started_at,
-                        override_state="failed",
-                        error_summary=str(e),
-                    )
-                    job_service = ChapterJobService(error_session)
-                    job_service.release_lock(job_id, status="failed", error=str(e))
-                finally:
-                    error_session.close()
-            except Exception:
-                logger.error(f"Could not mark job {job_id} as failed")
-        finally:
+        # Wake whoever waits on this job (TopicPipelineOrchestrator, here
+        # or via NOTIFY in another process). Fired after the terminal
+        # writes above so the next stage never races this one's rows.
+        try:
+            notify_session = db_manager.session_factory()
             try:
-                session.close()
-            except Exception:
-                pass  # Session may already be closed by orchestrator refresh
+                notify_chapter_job_terminal(notify_session, job_id)
+            finally:
+                notify_session.close()
+        except Exception:
+            logger.warning(f"Could not notify completion of job {job_id}")
 
-    thread = threading.Thread(target=wrapper, daemon=True)
-    thread.start()
-    logger.info(f"Launched V2 background task: {target_fn.__name__} (job_id={job_id})")
-    return thread
+
+# ─── Durable queue task ─────────────────────────────────────────────────────
+#
+# Queue leases for chapter jobs reuse `chapter_processing_jobs.heartbeat_at`
+# (bumped by every progress update) and HEARTBEAT_STALE_THRESHOLD, the same
+# signal stale detection already trusts. Stage failures are final, as on
+# the thread path — only a lost worker is retried.
+
+CHAPTER_JOB_TASK = "chapter_job"
+
+
+def _chapter_job_lease_expired(db: Session, queued) -> Optional[bool]:
+    """Chapter heartbeat decides while the job runs; otherwise the worker's."""
+    from book_ingestion_v2.models.database import ChapterProcessingJob
+
+    job = db.query(ChapterProcessingJob).filter(
+        ChapterProcessingJob.id == queued.entity_id
+    ).first()
+    if not job or job.status != "running":
+        return None
+    return ChapterJobService(db).is_job_heartbeat_stale(job.id)
+
+
+def _chapter_job_reclaimed(db: Session, queued, retry: bool) -> bool:
+    return ChapterJobService(db).reclaim_lost_job(queued.entity_id, retry)
+
+
+@job_task(
+    CHAPTER_JOB_TASK,
+    INGESTION_QUEUE,
+    lease_expired=_chapter_job_lease_expired,
+    on_reclaim=_chapter_job_reclaimed,
+)
+def run_chapter_job(target: str, job_id: str, *args):
+    """Queue task behind `run_in_background_v2`: run `target` for `job_id`."""
+    def target_fn(session, job_id, *args):
+        return resolve_task_ref(target, session)(session, job_id, *args)
+
+    _execute_chapter_job(target_fn, job_id, *args)
 
 
 def _run_refinalization(db: Session, job_id: str, chapter_id: str, book_id: str):
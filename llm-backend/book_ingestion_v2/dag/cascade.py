@@ -10,16 +10,21 @@ caller's lifetime. The API endpoint that kicks off a cascade returns 202
 immediately — the cascade runs entirely off the background-thread chain
 that already exists for stage execution.
 
-State lives in-memory only. A server restart drops active cascades; the
-admin can re-trigger from whichever stage is no longer `done`. This
-matches the existing `TopicPipelineOrchestrator`, which also holds state
-in a daemon thread and dies on restart.
-
-Concurrency: a single `RLock` guards the cascades dict and per-cascade
-mutations. Stage launches happen INSIDE the lock — they only do a quick
-DB insert (`acquire_lock`) plus a daemon-thread spawn before returning.
-The actual stage work runs on that other thread and re-enters via
-`on_stage_complete`.
+State lives in `topic_cascades`, one row per topic with an active
+cascade, so a cascade survives an API restart and any process that runs
+stages (API threads or `worker.py` — see `shared/services/job_queue.py`)
+can advance it. The row's primary key keeps one cascade per topic: a
+second kickoff's insert collides and maps to `CascadeAlreadyActiveError`.
+
+Concurrency: `on_stage_complete` locks the cascade row
+(`SELECT ... FOR UPDATE`), checks that `running` still names the stage
+that just finished, and commits `running = <next stage>` BEFORE calling
+the launcher. That commit is the claim — a duplicate completion event
+(terminal hook plus status-read reconciliation, or the same hook in two
+processes) sees a different `running` and no-ops, so each stage is
+launched once. Launchers only do a quick DB insert (`acquire_lock`)
+plus a background-job spawn before returning; the stage work runs
+elsewhere and re-enters via `on_stage_complete`.
 
 Why one stage at a time per topic: the partial unique index
 `idx_chapter_active_topic_job` on `chapter_processing_jobs` enforces at
@@ -31,14 +36,20 @@ the same serial-within-topic discipline.
 from __future__ import annotations
 
 import logging
-import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy.exc import IntegrityError
 
 from book_ingestion_v2.dag.launcher_map import LAUNCHER_BY_STAGE
 from book_ingestion_v2.dag.topic_pipeline_dag import DAG
+from book_ingestion_v2.models.database import ChapterProcessingJob, TopicCascade
+from book_ingestion_v2.repositories.topic_cascade_repository import (
+    TopicCascadeRepository,
+)
 from book_ingestion_v2.repositories.topic_stage_run_repository import (
     TopicStageRunRepository,
 )
@@ -130,14 +141,48 @@ def build_launcher_kwargs(
     return kwargs
 
 
+def _state_from_row(row: TopicCascade) -> CascadeState:
+    return CascadeState(
+        cascade_id=row.cascade_id,
+        book_id=row.book_id,
+        chapter_id=row.chapter_id,
+        guideline_id=row.guideline_id,
+        quality_level=row.quality_level,
+        force_first=bool(row.force_first),
+        pending=set(row.pending_json or []),
+        running=row.running,
+        halted_at=row.halted_at,
+        cancelled=bool(row.cancelled),
+        started_at=row.started_at,
+        stage_results=dict(row.stage_results_json or {}),
+        stale_marked=set(row.stale_marked_json or []),
+    )
+
+
+def _apply_state(row: TopicCascade, cascade: CascadeState) -> None:
+    # Fresh list/dict objects on every write — JSONB columns only track
+    # reassignment, not in-place mutation.
+    row.cascade_id = cascade.cascade_id
+    row.book_id = cascade.book_id
+    row.chapter_id = cascade.chapter_id
+    row.quality_level = cascade.quality_level
+    row.force_first = cascade.force_first
+    row.pending_json = sorted(cascade.pending)
+    row.running = cascade.running
+    row.halted_at = cascade.halted_at
+    row.cancelled = cascade.cancelled
+    row.started_at = cascade.started_at
+    row.stage_results_json = dict(cascade.stage_results)
+    row.stale_marked_json = sorted(cascade.stale_marked)
+
+
 class CascadeOrchestrator:
-    """Headless cascade engine. One instance per process; the terminal
-    hook in `run_in_background_v2` reaches it via
-    `get_cascade_orchestrator()`."""
+    """Headless cascade engine. Stateless apart from its session factory —
+    every cascade lives in `topic_cascades`, so any number of instances
+    (one per process) can drive the same cascades. The terminal hook in
+    `run_in_background_v2` reaches it via `get_cascade_orchestrator()`."""
 
     def __init__(self, *, session_factory: Optional[Callable] = None):
-        self._lock = threading.RLock()
-        self._cascades: dict[str, CascadeState] = {}
         self._session_factory = session_factory
 
     # ───── Public API ─────
@@ -167,80 +212,98 @@ class CascadeOrchestrator:
         has unmet upstream deps, and `ChapterJobLockError` if the first
         launch hits the per-topic lock (caller maps to 409).
         """
-        with self._lock:
-            if guideline_id in self._cascades:
-                existing = self._cascades[guideline_id]
-                raise CascadeAlreadyActiveError(
-                    f"Cascade {existing.cascade_id} already active for "
-                    f"guideline {guideline_id} (running={existing.running})"
-                )
-
-            state_map = self._build_state_map(db, guideline_id)
-            stale_set = self._build_stale_set(db, guideline_id)
-            pending = self._compute_pending(
-                state_map, stale_set, from_stage_id,
+        repo = TopicCascadeRepository(db)
+        existing = repo.get(guideline_id)
+        if existing is not None:
+            raise CascadeAlreadyActiveError(
+                f"Cascade {existing.cascade_id} already active for "
+                f"guideline {guideline_id} (running={existing.running})"
             )
 
-            # Reject upfront if `from_stage_id` has any dep that isn't
-            # `done AND not stale` — otherwise the cascade registers but
-            # `_launch_next` finds nothing ready, leaving an orphan
-            # entry that blocks future kickoffs.
-            if from_stage_id is not None:
-                stage = DAG.get(from_stage_id)
-                missing_deps = [
-                    dep for dep in stage.depends_on
-                    if state_map.get(dep) != "done" or dep in stale_set
-                ]
-                if missing_deps:
-                    raise CascadeNotReadyError(
-                        f"Cannot rerun {from_stage_id!r} — upstream "
-                        f"dep(s) not done or stale: {missing_deps}"
-                    )
-
-            cascade = CascadeState(
-                cascade_id=str(uuid.uuid4()),
-                book_id=book_id,
-                chapter_id=chapter_id,
-                guideline_id=guideline_id,
-                quality_level=quality_level,
-                force_first=force,
-                pending=pending,
-            )
+        state_map = self._build_state_map(db, guideline_id)
+        stale_set = self._build_stale_set(db, guideline_id)
+        pending = self._compute_pending(
+            state_map, stale_set, from_stage_id,
+        )
 
-            if not pending:
-                # Nothing to do. Don't register the cascade; let the
-                # caller decide what to communicate.
-                return cascade
+        # Reject upfront if `from_stage_id` has any dep that isn't
+        # `done AND not stale` — otherwise the cascade registers but
+        # `_launch_next` finds nothing ready, leaving an orphan
+        # row that blocks future kickoffs.
+        if from_stage_id is not None:
+            stage = DAG.get(from_stage_id)
+            missing_deps = [
+                dep for dep in stage.depends_on
+                if state_map.get(dep) != "done" or dep in stale_set
+            ]
+            if missing_deps:
+                raise CascadeNotReadyError(
+                    f"Cannot rerun {from_stage_id!r} — upstream "
+                    f"dep(s) not done or stale: {missing_deps}"
+                )
 
-            self._cascades[guideline_id] = cascade
+        cascade = CascadeState(
+            cascade_id=str(uuid.uuid4()),
+            book_id=book_id,
+            chapter_id=chapter_id,
+            guideline_id=guideline_id,
+            quality_level=quality_level,
+            force_first=force,
+            pending=pending,
+        )
+
+        if not pending:
+            # Nothing to do. Don't register the cascade; let the
+            # caller decide what to communicate.
+            return cascade
 
-            # Launch BEFORE marking descendants stale — otherwise a
-            # `ChapterJobLockError` on the first launch would commit
-            # `is_stale=True` writes against a cascade that never ran.
-            try:
-                self._launch_next(cascade, db=db)
-            except Exception:
-                self._cascades.pop(guideline_id, None)
-                raise
-
-            # Mark stale on every pending stage that already has a
-            # `done` row AND isn't already stale. Track which rows we
-            # flipped on `cascade.stale_marked` so halt-on-failure only
-            # clears those — pre-existing stale signals from a prior
-            # cancelled cascade or operator action stay intact.
-            #
-            # The `from_stage_id` itself is in `running` now; its
-            # terminal write will clear its own stale flag if it had one.
-            repo = TopicStageRunRepository(db)
-            for sid in pending:
-                if sid == from_stage_id:
-                    continue
-                row = repo.get(guideline_id, sid)
-                if row and row.state == "done" and not row.is_stale:
-                    repo.mark_stale(guideline_id, sid, is_stale=True)
-                    cascade.stale_marked.add(sid)
+        # Mark stale on every pending stage that already has a `done` row
+        # AND isn't already stale. Track which rows we flipped on
+        # `cascade.stale_marked` so halt-on-failure only clears those —
+        # pre-existing stale signals from a prior cancelled cascade or
+        # operator action stay intact. The `from_stage_id` itself goes to
+        # `running`; its terminal write will clear its own stale flag if
+        # it had one.
+        #
+        # The flags are set on the ORM rows here and committed together
+        # with the cascade row below — before any stage is launched, so a
+        # first stage that fails fast can't halt (and clear the flags)
+        # ahead of this write.
+        stage_runs = TopicStageRunRepository(db)
+        for sid in pending:
+            if sid == from_stage_id:
+                continue
+            row = stage_runs.get(guideline_id, sid)
+            if row and row.state == "done" and not row.is_stale:
+                row.is_stale = True
+                cascade.stale_marked.add(sid)
+
+        # The insert claims the topic. A concurrent kickoff from another
+        # process that got past the `existing` check collides here (and
+        # the rollback drops the stale flags with it).
+        try:
+            self._save(db, cascade)
+        except IntegrityError:
+            raise CascadeAlreadyActiveError(
+                f"Cascade already active for guideline {guideline_id}"
+            )
 
-            return cascade
+        # A first launch that raises (`ChapterJobLockError`) or launches
+        # nothing must not leave `is_stale=True` behind against a cascade
+        # that never ran — undo the flags in the same commit that drops
+        # the cascade row.
+        try:
+            self._launch_next(cascade, db=db)
+        except Exception:
+            db.rollback()
+            self._unflag_stale(db, guideline_id, cascade.stale_marked)
+            TopicCascadeRepository(db).delete(guideline_id)
+            raise
+        if cascade.running is None:
+            self._unflag_stale(db, guideline_id, cascade.stale_marked)
+            db.commit()
+
+        return cascade
 
     def on_stage_complete(
         self,
@@ -256,19 +319,26 @@ class CascadeOrchestrator:
         stale on cascade kickoff get their `is_stale` cleared on halt
         — the failed rerun didn't actually change upstream artifacts,
         so downstream isn't truly stale.
+
+        Opens its own session — the caller's is closing. The cascade row
+        stays locked from the read below until the next stage's claim
+        (or the cleanup delete) commits.
         """
         if terminal_state not in ("done", "failed"):
             return
 
-        with self._lock:
-            cascade = self._cascades.get(guideline_id)
-            if cascade is None:
+        db = self._resolve_session_factory()()
+        try:
+            row = TopicCascadeRepository(db).get_for_update(guideline_id)
+            if row is None:
                 return
-            if cascade.running != stage_id:
+            if row.running != stage_id:
                 # Some other code path (manual single-stage rerun, race
                 # with a long-running orphan) finished a stage we
-                # weren't tracking. Ignore.
+                # weren't tracking, or another process already handled
+                # this completion. Ignore.
                 return
+            cascade = _state_from_row(row)
 
             cascade.stage_results[stage_id] = terminal_state
             cascade.running = None
@@ -285,7 +355,7 @@ class CascadeOrchestrator:
                 logger.warning(
                     f"Cascade {cascade.cascade_id} halted at {stage_id} (failed)"
                 )
-                self._maybe_cleanup(cascade)
+                self._maybe_cleanup(cascade, db)
                 return
 
             if cascade.cancelled:
@@ -293,53 +363,76 @@ class CascadeOrchestrator:
                     f"Cascade {cascade.cascade_id} cancelled — not scheduling "
                     f"further stages"
                 )
-                self._maybe_cleanup(cascade)
+                self._maybe_cleanup(cascade, db)
                 return
 
             try:
-                self._launch_next(cascade, db=None)
+                self._launch_next(cascade, db=db)
             except ChapterJobLockError as e:
                 logger.warning(
                     f"Cascade {cascade.cascade_id} hit lock collision on next "
                     f"stage launch: {e}"
                 )
                 cascade.halted_at = "lock_collision"
-                self._maybe_cleanup(cascade)
+                db.rollback()
+                self._maybe_cleanup(cascade, db)
             except Exception as e:
                 logger.error(
                     f"Cascade {cascade.cascade_id} _launch_next crashed: {e}",
                     exc_info=True,
                 )
                 cascade.halted_at = "internal_error"
-                self._maybe_cleanup(cascade)
+                db.rollback()
+                self._maybe_cleanup(cascade, db)
+        finally:
+            db.close()
 
-    def cancel(self, guideline_id: str) -> bool:
+    def cancel(self, guideline_id: str, db=None) -> bool:
         """Soft-cancel. Running stage finishes; no further launches.
 
         Returns True if there was a cascade to cancel.
         """
-        with self._lock:
-            cascade = self._cascades.get(guideline_id)
-            if cascade is None:
+        with self._session(db) as s:
+            row = TopicCascadeRepository(s).get_for_update(guideline_id)
+            if row is None:
                 return False
+            cascade = _state_from_row(row)
             cascade.cancelled = True
             logger.info(
                 f"Cascade {cascade.cascade_id} cancelled for guideline "
                 f"{guideline_id} (running={cascade.running})"
             )
-            if cascade.running is None:
-                # No stage in flight — drop now so a fresh cascade can
-                # start without waiting for a hook that won't come.
-                self._maybe_cleanup(cascade)
+            if cascade.running is not None and not self._has_active_job(
+                s, guideline_id,
+            ):
+                # The claimed stage never got its chapter job (the
+                # claiming process died between claim and launch), so no
+                # terminal hook will ever arrive for it.
+                logger.warning(
+                    f"Cascade {cascade.cascade_id} running stage "
+                    f"{cascade.running} has no active job; dropping"
+                )
+                cascade.running = None
+            # No stage in flight — drop now so a fresh cascade can
+            # start without waiting for a hook that won't come.
+            if not self._maybe_cleanup(cascade, s):
+                self._save(s, cascade)
             return True
 
-    def get_cascade(self, guideline_id: str) -> Optional[CascadeState]:
-        with self._lock:
-            return self._cascades.get(guideline_id)
-
-    def list_active(self) -> list[CascadeState]:
-        with self._lock:
-            return list(self._cascades.values())
+    def get_cascade(
+        self, guideline_id: str, db=None,
+    ) -> Optional[CascadeState]:
+        """Snapshot of the topic's active cascade, or None."""
+        with self._session(db) as s:
+            row = TopicCascadeRepository(s).get(guideline_id)
+            return _state_from_row(row) if row is not None else None
+
+    def list_active(self, db=None) -> list[CascadeState]:
+        with self._session(db) as s:
+            return [
+                _state_from_row(r)
+                for r in TopicCascadeRepository(s).list_all()
+            ]
 
     # ───── Internals ─────
 
@@ -380,83 +473,84 @@ class CascadeOrchestrator:
         }
 
     def _launch_next(self, cascade: CascadeState, *, db) -> None:
-        """Pick one ready stage from `pending` and launch it.
+        """Pick one ready stage from `pending`, claim it, and launch it.
 
-        `db` is None when called from `on_stage_complete` — the caller's
-        session is closing. We open our own from `_session_factory` then.
+        The claim — `running = <stage>` committed to the cascade row —
+        happens before the launcher runs, so a duplicate completion
+        event arriving mid-launch finds `running` already moved on. If
+        the launcher raises, `running` is reset on the in-memory state
+        and the caller decides whether to drop the row.
         """
         if cascade.cancelled or cascade.halted_at is not None:
-            self._maybe_cleanup(cascade)
+            self._maybe_cleanup(cascade, db)
             return
 
-        owns_session = False
-        if db is None:
-            db = self._resolve_session_factory()()
-            owns_session = True
+        state_map = self._build_state_map(db, cascade.guideline_id)
+        ready = self._ready_in_pending(cascade, state_map)
+        if not ready:
+            # Defense-in-depth: the upfront check in `start_cascade`
+            # rejects from-stages with unmet deps, so we should never
+            # reach here with non-empty pending and no in-flight
+            # stage. If we do (e.g., a future regression in pending
+            # computation), halt loudly instead of orphaning the
+            # cascade with `running=None` and pending stuck in its
+            # row, which would block future kickoffs.
+            if cascade.pending and cascade.running is None:
+                cascade.halted_at = "no_ready_stages"
+                logger.warning(
+                    f"Cascade {cascade.cascade_id} has pending "
+                    f"{cascade.pending} but no ready stages; halting"
+                )
+            self._maybe_cleanup(cascade, db)
+            return
 
+        topo_order = [s.id for s in DAG.topo_sort()]
+        ready.sort(key=lambda sid: topo_order.index(sid))
+        next_stage_id = ready[0]
+
+        # Cascade contract on `force`:
+        # - First stage: honour the caller's `force` (e.g., "rerun
+        #   forcefully from explanations").
+        # - Descendants whose previous run was `done` or `failed`:
+        #   force=True. Several downstream services (visual
+        #   enrichment, audio synthesis) short-circuit when artifacts
+        #   already exist; without force, they declare success
+        #   without recomputing on the new upstream content, then
+        #   `upsert_terminal "done"` clears `is_stale` and we ship
+        #   stale artifacts as fresh.
+        # - Descendants with no prior row: force=False — first-time
+        #   stages don't need it.
+        is_first = not cascade.stage_results
+        if is_first:
+            stage_force = cascade.force_first
+        else:
+            prior_state = state_map.get(next_stage_id)
+            stage_force = prior_state in ("done", "failed")
+        kwargs = build_launcher_kwargs(
+            next_stage_id,
+            book_id=cascade.book_id,
+            chapter_id=cascade.chapter_id,
+            guideline_id=cascade.guideline_id,
+            quality_level=cascade.quality_level,
+            force=stage_force,
+        )
+
+        cascade.running = next_stage_id
+        self._save(db, cascade)
+
+        # Resolve the launcher via the module-level dict on every call
+        # (don't capture at import) so monkeypatched test launchers
+        # take effect — the dict is the seam tests use.
+        launcher = LAUNCHER_BY_STAGE[next_stage_id]
         try:
-            state_map = self._build_state_map(db, cascade.guideline_id)
-            ready = self._ready_in_pending(cascade, state_map)
-            if not ready:
-                # Defense-in-depth: the upfront check in `start_cascade`
-                # rejects from-stages with unmet deps, so we should never
-                # reach here with non-empty pending and no in-flight
-                # stage. If we do (e.g., a future regression in pending
-                # computation), halt loudly instead of orphaning the
-                # cascade with `running=None` and pending stuck in the
-                # dict, which would block future kickoffs.
-                if cascade.pending and cascade.running is None:
-                    cascade.halted_at = "no_ready_stages"
-                    logger.warning(
-                        f"Cascade {cascade.cascade_id} has pending "
-                        f"{cascade.pending} but no ready stages; halting"
-                    )
-                self._maybe_cleanup(cascade)
-                return
-
-            topo_order = [s.id for s in DAG.topo_sort()]
-            ready.sort(key=lambda sid: topo_order.index(sid))
-            next_stage_id = ready[0]
-
-            # Cascade contract on `force`:
-            # - First stage: honour the caller's `force` (e.g., "rerun
-            #   forcefully from explanations").
-            # - Descendants whose previous run was `done` or `failed`:
-            #   force=True. Several downstream services (visual
-            #   enrichment, audio synthesis) short-circuit when artifacts
-            #   already exist; without force, they declare success
-            #   without recomputing on the new upstream content, then
-            #   `upsert_terminal "done"` clears `is_stale` and we ship
-            #   stale artifacts as fresh.
-            # - Descendants with no prior row: force=False — first-time
-            #   stages don't need it.
-            is_first = not cascade.stage_results
-            if is_first:
-                stage_force = cascade.force_first
-            else:
-                prior_state = state_map.get(next_stage_id)
-                stage_force = prior_state in ("done", "failed")
-            kwargs = build_launcher_kwargs(
-                next_stage_id,
-                book_id=cascade.book_id,
-                chapter_id=cascade.chapter_id,
-                guideline_id=cascade.guideline_id,
-                quality_level=cascade.quality_level,
-                force=stage_force,
-            )
-            # Resolve the launcher via the module-level dict on every call
-            # (don't capture at import) so monkeypatched test launchers
-            # take effect — the dict is the seam tests use.
-            launcher = LAUNCHER_BY_STAGE[next_stage_id]
             launcher(db, **kwargs)
-            cascade.running = next_stage_id
-            logger.info(
-                f"Cascade {cascade.cascade_id} launched stage {next_stage_id} "
-                f"(force={kwargs.get('force', False)})"
-            )
-        finally:
-            if owns_session:
-                db.close()
+        except Exception:
+            cascade.running = None
+            raise
+        logger.info(
+            f"Cascade {cascade.cascade_id} launched stage {next_stage_id} "
+            f"(force={kwargs.get('force', False)})"
+        )
 
     def _ready_in_pending(
         self, cascade: CascadeState, state_map: dict[str, str]
@@ -515,14 +609,63 @@ class CascadeOrchestrator:
                 exc_info=True,
             )
 
-    def _maybe_cleanup(self, cascade: CascadeState) -> None:
-        """Drop the cascade entry once nothing is in flight and there's
-        nothing left to do."""
+    @staticmethod
+    def _unflag_stale(db, guideline_id: str, stage_ids: set[str]) -> None:
+        """Reset `is_stale` on `stage_ids` without committing."""
+        repo = TopicStageRunRepository(db)
+        for sid in stage_ids:
+            row = repo.get(guideline_id, sid)
+            if row is not None:
+                row.is_stale = False
+
+    def _maybe_cleanup(self, cascade: CascadeState, db) -> bool:
+        """Drop the cascade row once nothing is in flight and there's
+        nothing left to do. Returns True if the cascade is finished."""
         if cascade.running is not None:
-            return
+            return False
         if cascade.pending and not cascade.halted_at and not cascade.cancelled:
+            return False
+        TopicCascadeRepository(db).delete(cascade.guideline_id)
+        return True
+
+    def _save(self, db, cascade: CascadeState) -> None:
+        """Write `cascade` to its row (inserting it on first save) and
+        commit. Raises `IntegrityError` if the insert races another
+        kickoff for the same topic."""
+        repo = TopicCascadeRepository(db)
+        row = repo.get(cascade.guideline_id)
+        if row is None:
+            row = TopicCascade(guideline_id=cascade.guideline_id)
+            _apply_state(row, cascade)
+            repo.insert(row)
+            return
+        _apply_state(row, cascade)
+        repo.save(row)
+
+    @staticmethod
+    def _has_active_job(db, guideline_id: str) -> bool:
+        return (
+            db.query(ChapterProcessingJob.id)
+            .filter(
+                ChapterProcessingJob.guideline_id == guideline_id,
+                ChapterProcessingJob.status.in_(["pending", "running"]),
+            )
+            .first()
+            is not None
+        )
+
+    @contextmanager
+    def _session(self, db) -> Iterator:
+        """Yield `db`, or a session of our own (closed on exit) when the
+        caller has none."""
+        if db is not None:
+            yield db
             return
-        self._cascades.pop(cascade.guideline_id, None)
+        own = self._resolve_session_factory()()
+        try:
+            yield own
+        finally:
+            own.close()
 
     def _resolve_session_factory(self) -> Callable:
         if self._session_factory is not None:
@@ -542,6 +685,7 @@ def get_cascade_orchestrator() -> CascadeOrchestrator:
 
 
 def reset_cascade_orchestrator() -> None:
-    """Test helper — drops the singleton's in-memory state."""
+    """Test helper — replaces the singleton (and any patched session
+    factory). Cascade rows live in the database, not the instance."""
     global _default_orchestrator
     _default_orchestrator = CascadeOrchestrator()
@@ -329,6 +329,49 @@ class TopicStageRun(Base):
     )
 
 
+class TopicCascade(Base):
+    """Active cascade for one topic (Phase 3 cascade orchestrator).
+
+    One row per `guideline_id` while a cascade is in flight; the row is
+    deleted once nothing is running and nothing is left to launch. The
+    primary key is what makes "one cascade per topic" hold across API
+    and worker processes — a second kickoff's insert collides.
+
+    `on_stage_complete` locks the row (`SELECT ... FOR UPDATE`) and only
+    advances the cascade when `running` still names the stage that just
+    finished, so a duplicate completion event (terminal hook plus
+    reconciliation, or two processes) launches the next stage once.
+    """
+    __tablename__ = "topic_cascades"
+
+    guideline_id = Column(
+        String,
+        ForeignKey("teaching_guidelines.id", ondelete="CASCADE"),
+        primary_key=True,
+        nullable=False,
+    )
+    cascade_id = Column(String, nullable=False)
+    book_id = Column(String, nullable=False)
+    chapter_id = Column(String, nullable=False)
+    quality_level = Column(String, nullable=False, default="balanced")
+    force_first = Column(Boolean, nullable=False, default=False)
+
+    pending_json = Column(JSONB, nullable=False)          # sorted stage ids
+    running = Column(String, nullable=True)
+    halted_at = Column(String, nullable=True)
+    cancelled = Column(Boolean, nullable=False, default=False)
+    stage_results_json = Column(JSONB, nullable=True)     # stage_id -> done|failed
+    stale_marked_json = Column(JSONB, nullable=True)      # sorted stage ids
+
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
+
+
 class TopicContentHash(Base):
     """Phase 6 — durable content-hash anchor for cross-DAG warnings.
 
@@ -69,10 +69,10 @@ class ChapterPageRepository:
         ).order_by(ChapterPage.page_number).all()
 
     def get_pages_needing_ocr(self, chapter_id: str) -> List[ChapterPage]:
-        """Get pages with pending or failed OCR, ordered by page number."""
+        """Get pages with pending, failed or interrupted (processing) OCR, ordered by page number."""
         return self.db.query(ChapterPage).filter(
             ChapterPage.chapter_id == chapter_id,
-            ChapterPage.ocr_status.in_(["pending", "failed"]),
+            ChapterPage.ocr_status.in_(["pending", "processing", "failed"]),
         ).order_by(ChapterPage.page_number).all()
 
     def reset_ocr_for_chapter(self, chapter_id: str) -> int:
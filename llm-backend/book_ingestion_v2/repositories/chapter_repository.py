@@ -32,6 +32,12 @@ class ChapterRepository:
             BookChapter.id == chapter_id
         ).first()
 
+    def get_for_update(self, chapter_id: str) -> Optional[BookChapter]:
+        """Get chapter by ID, row-locked until the session's next commit."""
+        return self.db.query(BookChapter).filter(
+            BookChapter.id == chapter_id
+        ).with_for_update().populate_existing().first()
+
     def get_by_book_id(self, book_id: str) -> List[BookChapter]:
         """Get all chapters for a book, ordered by chapter number."""
         return self.db.query(BookChapter).filter(
@@ -0,0 +1,79 @@
+"""Repository for `topic_cascades` rows (Phase 3 cascade state).
+
+One row per topic with an active cascade. `CascadeOrchestrator` is the
+only writer; it converts rows to and from its `CascadeState` dataclass.
+
+`get_for_update` is the claim primitive: it row-locks the cascade so
+the read-check-write in `on_stage_complete` / `cancel` can't interleave
+with the same call from another thread or process. The lock holds until
+the caller's next commit.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from book_ingestion_v2.models.database import TopicCascade
+
+
+class TopicCascadeRepository:
+    """CRUD for `topic_cascades`. Writes commit — callers do not need to
+    wrap calls in their own transaction."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ───── Reads ─────
+
+    def get(self, guideline_id: str) -> Optional[TopicCascade]:
+        return (
+            self.db.query(TopicCascade)
+            .filter(TopicCascade.guideline_id == guideline_id)
+            .first()
+        )
+
+    def get_for_update(self, guideline_id: str) -> Optional[TopicCascade]:
+        """Row-locked read. Opens (or joins) a transaction that the caller
+        ends with `save` / `delete` / a rollback."""
+        return (
+            self.db.query(TopicCascade)
+            .filter(TopicCascade.guideline_id == guideline_id)
+            .with_for_update()
+            .first()
+        )
+
+    def list_all(self) -> List[TopicCascade]:
+        return (
+            self.db.query(TopicCascade)
+            .order_by(TopicCascade.started_at)
+            .all()
+        )
+
+    # ───── Writes ─────
+
+    def insert(self, row: TopicCascade) -> TopicCascade:
+        """Insert a new cascade row. Raises `IntegrityError` (after rolling
+        back) when the topic already has one."""
+        self.db.add(row)
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return row
+
+    def save(self, row: TopicCascade) -> TopicCascade:
+        """Commit pending changes to a row loaded from this session."""
+        self.db.commit()
+        return row
+
+    def delete(self, guideline_id: str) -> bool:
+        """Drop the topic's cascade row. Returns False if there was none."""
+        deleted = (
+            self.db.query(TopicCascade)
+            .filter(TopicCascade.guideline_id == guideline_id)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return bool(deleted)
@@ -15,6 +15,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from shared.services.llm_service import LLMService
+from shared.utils.strict_schema import get_strict_schema
 from shared.models.entities import TeachingGuideline, TopicExplanation
 from shared.repositories.explanation_repository import ExplanationRepository
 
@@ -74,9 +75,7 @@ class AnimationEnrichmentService:
         self.repo = ExplanationRepository(db)
         self._preflight_done = False
 
-        self._decision_schema = LLMService.make_schema_strict(
-            DecisionOutput.model_json_schema()
-        )
+        self._decision_schema = get_strict_schema(DecisionOutput)
 
     def _ensure_preflight(self) -> None:
         """Check the frontend dev server is reachable — needed by the stage-7
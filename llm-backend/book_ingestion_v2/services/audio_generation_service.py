@@ -13,11 +13,27 @@ override resolves first via shared.services.tts_config_service).
 Explanation lines use positional S3 keys `{card_idx}/{line_idx}.mp3`.
 Check-in fields use card_id-based keys `{card_id}/check_in/{field}.mp3` so
 re-insertion at a new card_idx doesn't serve stale audio.
+
+Every generated clip also stores a content hash next to its URL
+(`audio_url` → `audio_hash`, `hint_audio_url` → `hint_audio_hash`, …) over
+the normalized text, voice, emotion and provider. A clip is re-synthesized
+only when that hash no longer matches, so re-voicing a chapter after a text
+review or a provider switch touches just the clips that changed.
+
+Lines are synthesized and uploaded by a bounded worker pool
+(`tts_synthesis_concurrency`). Provider calls are paced process-wide per
+provider — a token bucket at `tts_{provider}_requests_per_second` plus a cap
+on in-flight calls — so parallel topic stages share one quota. Uploads run
+outside the provider slot, overlapping the next synthesis.
 """
+import hashlib
 import json
 import logging
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
@@ -28,7 +44,9 @@ from google.api_core.client_options import ClientOptions
 from config import get_settings
 from shared.services.tts_config_service import resolve_tts_provider
 from shared.types.emotion import Emotion, canonicalize_emotion
-from shared.utils.s3_client import S3Client
+from shared.utils.rate_limiter import ProviderLimiter, get_provider_limiter
+from shared.utils.blob_store import BlobStore
+from shared.utils.s3_client import get_s3_client
 
 # Pre-synthesis text fixes for Chirp 3 HD pronunciation quirks. Empty under
 # the current en-IN voice pair — those voices handle "us" / "U.S." cleanly.
@@ -150,6 +168,91 @@ class TTSProviderError(RuntimeError):
     """
 
 
+def _provider_limiter(provider: str) -> ProviderLimiter:
+    settings = get_settings()
+    rate = (
+        settings.tts_elevenlabs_requests_per_second
+        if provider == "elevenlabs"
+        else settings.tts_google_requests_per_second
+    )
+    return get_provider_limiter(f"tts:{provider}", rate, settings.tts_synthesis_concurrency)
+
+
+@dataclass
+class _AudioJob:
+    """One clip to synthesize: where the URL goes and how to make it."""
+    target: dict
+    url_field: str
+    text: str
+    s3_key: str
+    error_label: str
+    content_hash: str
+    synth_kwargs: dict = field(default_factory=dict)
+
+
+_SKIPPED = object()
+
+
+def _hash_field(url_field: str) -> str:
+    """`audio_url` → `audio_hash`, `hint_audio_url` → `hint_audio_hash`."""
+    return url_field.removesuffix("_url") + "_hash"
+
+
+def audio_content_hash(
+    text: str,
+    *,
+    provider: str,
+    language: str = "en",
+    speaker: Optional[str] = None,
+    emotion: Optional[Emotion] = None,
+) -> str:
+    """Hash of everything that determines a clip's audio.
+
+    Covers the normalized text (pronunciation fixes applied, whitespace
+    collapsed), provider and the resolved voice — voice id,
+    model and voice-settings preset on ElevenLabs (which is where emotion
+    takes effect), voice name on Google (which ignores emotion, so an
+    emotion-only edit doesn't re-voice Google clips).
+    """
+    emotion = canonicalize_emotion(emotion)
+    if provider == "elevenlabs":
+        voice = {
+            "voice_id": _el_voice_id_for_speaker(speaker),
+            "model_id": EL_MODEL_ID,
+            "voice_settings": (
+                EL_VOICE_SETTINGS_EXPRESSIVE if emotion is not None else EL_VOICE_SETTINGS_STEADY
+            ),
+            "emotion": emotion.value if emotion is not None else None,
+        }
+    else:
+        voice = {"voice": list(_voice_for_speaker(speaker, language))}
+    payload = json.dumps(
+        {
+            # Whitespace runs don't change the spoken audio.
+            "text": " ".join(normalize_tts_text(text).split()),
+            "provider": provider,
+            "voice": voice,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _needs_audio(target: dict, url_field: str, content_hash: str, force: bool) -> bool:
+    """Whether the clip for `target[url_field]` must be (re)synthesized.
+
+    `force` or a missing URL → yes. Stored hash → only if it differs. No
+    stored hash (clip made before hashes were recorded) → trusted.
+    """
+    if force or not target.get(url_field):
+        return True
+    stored = target.get(_hash_field(url_field))
+    if stored is not None:
+        return stored != content_hash
+    return False
+
+
 class AudioGenerationService:
     """Generates TTS audio for explanation lines and check-in fields, stores them on S3.
 
@@ -161,6 +264,10 @@ class AudioGenerationService:
     Settings.
     """
 
+    # Clips synthesized/uploaded at once per generate call. Instances built
+    # without __init__ (tests) run sequentially.
+    synthesis_concurrency = 1
+
     def __init__(
         self,
         language: str = "hinglish",
@@ -168,6 +275,7 @@ class AudioGenerationService:
         provider: Optional[str] = None,
         elevenlabs_api_key: Optional[str] = None,
         db=None,
+        concurrency: Optional[int] = None,
     ):
         """Construct the service for the active TTS provider.
 
@@ -182,7 +290,10 @@ class AudioGenerationService:
         """
         settings = get_settings()
         self.language = language
-        self.s3 = S3Client()
+        self.synthesis_concurrency = max(
+            1, concurrency if concurrency is not None else settings.tts_synthesis_concurrency,
+        )
+        self.s3 = get_s3_client()
         self.bucket = settings.aws_s3_bucket
         self.region = settings.aws_region
         if provider is not None:
@@ -326,9 +437,23 @@ class AudioGenerationService:
         raise last_err or TTSProviderError("ElevenLabs synthesis failed")
 
     def _s3_url(self, key: str) -> str:
-        """Construct the public HTTPS URL for an S3 object."""
+        """Public URL of a stored clip — the blob store's, else the S3 HTTPS form."""
+        if isinstance(self.s3, BlobStore):
+            return self.s3.public_url(key)
         return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
 
+    def _audio_hash(
+        self,
+        text: str,
+        *,
+        speaker: Optional[str] = None,
+        emotion: Optional[Emotion] = None,
+    ) -> str:
+        return audio_content_hash(
+            text, provider=self.provider, language=self.language,
+            speaker=speaker, emotion=emotion,
+        )
+
     def _synth_and_upload(
         self,
         text: str,
@@ -337,11 +462,90 @@ class AudioGenerationService:
         speaker: Optional[str] = None,
         emotion: Optional[Emotion] = None,
     ) -> str:
-        """Synthesize text → MP3 → upload to S3 → return public URL."""
-        mp3_bytes = self._synthesize(text, speaker=speaker, emotion=emotion)
+        """Synthesize text → MP3 → upload to S3 → return public URL.
+
+        Only the provider call holds a provider slot and a rate-limit token;
+        the upload runs after releasing them so another worker can start
+        synthesizing meanwhile.
+        """
+        limiter = _provider_limiter(self.provider)
+        with limiter.slots:
+            limiter.bucket.acquire()
+            mp3_bytes = self._synthesize(text, speaker=speaker, emotion=emotion)
         self.s3.upload_bytes(mp3_bytes, s3_key, content_type="audio/mpeg")
         return self._s3_url(s3_key)
 
+    def _run_jobs(self, jobs: list[_AudioJob]) -> tuple[int, int]:
+        """Synthesize + upload every job; return (generated, failed).
+
+        URLs are written onto each job's target dict in job order. Generic
+        per-clip failures are logged and counted. A `TTSProviderError` stops
+        any job that hasn't started yet, waits for the ones in flight (their
+        URLs are still recorded), then re-raises — the same fail-fast
+        contract as the sequential loop, with at most
+        `2 * synthesis_concurrency - 1` clips racing the failure (none at
+        concurrency 1).
+        """
+        if not jobs:
+            return 0, 0
+        stop = threading.Event()
+
+        def run(job: _AudioJob):
+            if stop.is_set():
+                return _SKIPPED
+            try:
+                return self._synth_and_upload(job.text, job.s3_key, **job.synth_kwargs)
+            except TTSProviderError:
+                stop.set()
+                raise
+
+        # Twice the provider cap so uploads never leave a provider slot idle;
+        # concurrency 1 keeps the original strictly sequential loop.
+        if self.synthesis_concurrency <= 1:
+            workers = 1
+        else:
+            workers = min(len(jobs), 2 * self.synthesis_concurrency)
+        if workers <= 1:
+            outcomes = []
+            for job in jobs:
+                try:
+                    outcomes.append((job, run(job), None))
+                except TTSProviderError:
+                    self._record_outcomes(outcomes)
+                    raise
+                except Exception as e:
+                    outcomes.append((job, None, e))
+            return self._record_outcomes(outcomes)
+
+        provider_error: Optional[TTSProviderError] = None
+        outcomes = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts") as pool:
+            futures = [(job, pool.submit(run, job)) for job in jobs]
+            for job, future in futures:
+                try:
+                    outcomes.append((job, future.result(), None))
+                except TTSProviderError as e:
+                    provider_error = provider_error or e
+                except Exception as e:
+                    outcomes.append((job, None, e))
+        generated, failed = self._record_outcomes(outcomes)
+        if provider_error is not None:
+            raise provider_error
+        return generated, failed
+
+    @staticmethod
+    def _record_outcomes(outcomes: list) -> tuple[int, int]:
+        generated = failed = 0
+        for job, url, error in outcomes:
+            if error is not None:
+                logger.error(f"{job.error_label}: {error}")
+                failed += 1
+            elif url is not _SKIPPED:
+                job.target[job.url_field] = url
+                job.target[_hash_field(job.url_field)] = job.content_hash
+                generated += 1
+        return generated, failed
+
     def generate_for_cards(
         self,
         cards_json: list[dict],
@@ -352,10 +556,12 @@ class AudioGenerationService:
     ) -> list[dict]:
         """Generate TTS audio for every line and check-in field in every card.
 
-        Mutates each dict in-place, adding the corresponding URL field. Items
-        that already have a URL are skipped (idempotent) unless `force=True`,
-        in which case the existing URL is overwritten with a freshly
-        synthesized clip. S3 keys are deterministic per
+        Mutates each dict in-place, adding the corresponding URL and content
+        hash fields. Items whose URL is present and whose stored hash still
+        matches are skipped (idempotent); a changed hash re-synthesizes the
+        clip. Clips without a stored hash (generated before hashing) are kept.
+        `force=True` re-synthesizes every clip regardless of its hash — the
+        admin override for replacing a bad clip. S3 keys are deterministic per
         (guideline, variant, card, line/field), so overwrites land at the
         same URL — no orphan cleanup needed. Items whose text is empty are
         always skipped regardless of force. Returns the same cards_json
@@ -366,9 +572,8 @@ class AudioGenerationService:
         ElevenLabs path uses the steady preset.
         """
         total = 0
-        generated = 0
         skipped = 0
-        failed = 0
+        jobs: list[_AudioJob] = []
 
         for card in cards_json:
             card_idx = card.get("card_idx", 0)
@@ -377,27 +582,25 @@ class AudioGenerationService:
             # ─── Explanation lines (positional key) ─────────────────────
             for line_idx, line in enumerate(card.get("lines") or []):
                 total += 1
-                if line.get("audio_url") and not force:
-                    skipped += 1
-                    continue
                 audio_text = (line.get("audio") or "").strip()
                 if not audio_text:
                     skipped += 1
                     continue
-                s3_key = f"audio/{guideline_id}/{variant_key}/{card_idx}/{line_idx}.mp3"
-                try:
-                    line["audio_url"] = self._synth_and_upload(audio_text, s3_key)
-                    generated += 1
-                except TTSProviderError:
-                    # Provider exhausted retries — abort the topic stage
-                    # rather than power through every remaining line.
-                    raise
-                except Exception as e:
-                    logger.error(
+                content_hash = self._audio_hash(audio_text)
+                if not _needs_audio(line, "audio_url", content_hash, force):
+                    skipped += 1
+                    continue
+                jobs.append(_AudioJob(
+                    target=line,
+                    url_field="audio_url",
+                    text=audio_text,
+                    s3_key=f"audio/{guideline_id}/{variant_key}/{card_idx}/{line_idx}.mp3",
+                    error_label=(
                         f"TTS/upload failed for {guideline_id}/{variant_key}/"
-                        f"card{card_idx}/line{line_idx}: {e}"
-                    )
-                    failed += 1
+                        f"card{card_idx}/line{line_idx}"
+                    ),
+                    content_hash=content_hash,
+                ))
 
             # ─── Check-in fields (UUID key) ─────────────────────────────
             check_in = card.get("check_in")
@@ -411,31 +614,32 @@ class AudioGenerationService:
                 continue
 
             for text_field, key_suffix, url_field in _check_in_fields_for(check_in):
-                if check_in.get(url_field) and not force:
-                    # Count toward total only if it's a real candidate (has text)
-                    text = (check_in.get(text_field) or "").strip()
-                    if text:
-                        total += 1
-                        skipped += 1
-                    continue
+                # Count toward total only if it's a real candidate (has text)
                 text = (check_in.get(text_field) or "").strip()
                 if not text:
                     continue
                 total += 1
-                s3_key = (
-                    f"audio/{guideline_id}/{variant_key}/{card_id}/check_in/{key_suffix}.mp3"
-                )
-                try:
-                    check_in[url_field] = self._synth_and_upload(text, s3_key)
-                    generated += 1
-                except TTSProviderError:
-                    raise
-                except Exception as e:
-                    logger.error(
+                content_hash = self._audio_hash(text)
+                if not _needs_audio(check_in, url_field, content_hash, force):
+                    skipped += 1
+                    continue
+                jobs.append(_AudioJob(
+                    target=check_in,
+                    url_field=url_field,
+                    text=text,
+                    s3_key=(
+                        f"audio/{guideline_id}/{variant_key}/{card_id}/check_in/{key_suffix}.mp3"
+                    ),
+                    error_label=(
                         f"TTS/upload failed for {guideline_id}/{variant_key}/"
-                        f"check-in {card_id}/{key_suffix}: {e}"
-                    )
-                    failed += 1
+                        f"check-in {card_id}/{key_suffix}"
+                    ),
+                    content_hash=content_hash,
+                ))
+
+        # Provider exhausted retries → TTSProviderError aborts the topic
+        # stage rather than powering through every remaining line.
+        generated, failed = self._run_jobs(jobs)
 
         logger.info(
             f"Audio generation for {guideline_id}/{variant_key} "
@@ -494,10 +698,9 @@ class AudioGenerationService:
         Args:
             explanation: TopicExplanation ORM object with cards_json
             dry_run: If True, count items but don't generate audio
-            force: If True, re-synthesize every line and check-in field
-                even when an `audio_url` is already populated. S3 keys are
-                deterministic so the new clip overwrites the old at the
-                same URL.
+            force: If True, re-synthesize every clip, including ones whose
+                stored content hash still matches. S3 keys are deterministic
+                so a new clip overwrites the old at the same URL.
 
         Returns:
             Updated cards_json if generated, None if dry_run or nothing to do
@@ -515,13 +718,8 @@ class AudioGenerationService:
             )
             return None
 
-        if total > 0 and existing == total and not force:
-            logger.info(
-                f"Skip {explanation.guideline_id}/{explanation.variant_key}: "
-                f"all {total} items already have audio"
-            )
-            return cards
-
+        # No "all items have audio" shortcut: a clip with a URL may still be
+        # stale (hash mismatch); generate_for_cards skips the current ones.
         return self.generate_for_cards(
             cards_json=cards,
             guideline_id=explanation.guideline_id,
@@ -548,7 +746,9 @@ class AudioGenerationService:
         - `card_id` is mandatory — dialogue regen rotates content, so
           positional keys would race. Cards without `card_id` are skipped
           with a warning.
-        - `force=True` overwrites lines that already have an `audio_url`.
+        - Lines with an `audio_url` are re-synthesized only when their
+          content hash (text, voice, emotion, provider) changed;
+          `force=True` re-voices every clip regardless of hash.
           S3 keys are deterministic per (guideline, dialogue, card_id,
           line/field) so writes overwrite cleanly at the same URL.
         """
@@ -557,7 +757,8 @@ class AudioGenerationService:
             return None
 
         guideline_id = dialogue.guideline_id
-        total = generated = skipped = failed = 0
+        total = skipped = 0
+        jobs: list[_AudioJob] = []
 
         for card in cards:
             if card.get("includes_student_name"):
@@ -574,28 +775,27 @@ class AudioGenerationService:
 
             for line_idx, line in enumerate(card.get("lines") or []):
                 total += 1
-                if line.get("audio_url") and not force:
-                    skipped += 1
-                    continue
                 text = (line.get("audio") or "").strip()
                 if not text or "{student_name}" in text:
                     skipped += 1
                     continue
                 emotion = canonicalize_emotion(line.get("emotion"))
-                s3_key = f"audio/{guideline_id}/dialogue/{card_id}/{line_idx}.mp3"
-                try:
-                    line["audio_url"] = self._synth_and_upload(
-                        text, s3_key, speaker=speaker, emotion=emotion,
-                    )
-                    generated += 1
-                except TTSProviderError:
-                    raise
-                except Exception as e:
-                    logger.error(
+                content_hash = self._audio_hash(text, speaker=speaker, emotion=emotion)
+                if not _needs_audio(line, "audio_url", content_hash, force):
+                    skipped += 1
+                    continue
+                jobs.append(_AudioJob(
+                    target=line,
+                    url_field="audio_url",
+                    text=text,
+                    s3_key=f"audio/{guideline_id}/dialogue/{card_id}/{line_idx}.mp3",
+                    error_label=(
                         f"Dialogue TTS failed for {guideline_id}/{card_id}/"
-                        f"line{line_idx}: {e}"
-                    )
-                    failed += 1
+                        f"line{line_idx}"
+                    ),
+                    content_hash=content_hash,
+                    synth_kwargs={"speaker": speaker, "emotion": emotion},
+                ))
 
             check_in = card.get("check_in")
             if check_in and card.get("card_type") == "check_in":
@@ -606,32 +806,31 @@ class AudioGenerationService:
                 # static, instructional prompts, so the steady preset is
                 # right.
                 for text_field, key_suffix, url_field in _check_in_fields_for(check_in):
-                    if check_in.get(url_field) and not force:
-                        if (check_in.get(text_field) or "").strip():
-                            total += 1
-                            skipped += 1
-                        continue
                     text = (check_in.get(text_field) or "").strip()
                     if not text or "{student_name}" in text:
                         continue
                     total += 1
-                    s3_key = (
-                        f"audio/{guideline_id}/dialogue/{card_id}"
-                        f"/check_in/{key_suffix}.mp3"
-                    )
-                    try:
-                        check_in[url_field] = self._synth_and_upload(
-                            text, s3_key, speaker="tutor",
-                        )
-                        generated += 1
-                    except TTSProviderError:
-                        raise
-                    except Exception as e:
-                        logger.error(
+                    content_hash = self._audio_hash(text, speaker="tutor")
+                    if not _needs_audio(check_in, url_field, content_hash, force):
+                        skipped += 1
+                        continue
+                    jobs.append(_AudioJob(
+                        target=check_in,
+                        url_field=url_field,
+                        text=text,
+                        s3_key=(
+                            f"audio/{guideline_id}/dialogue/{card_id}"
+                            f"/check_in/{key_suffix}.mp3"
+                        ),
+                        error_label=(
                             f"Dialogue check-in TTS failed for "
-                            f"{guideline_id}/{card_id}/{key_suffix}: {e}"
-                        )
-                        failed += 1
+                            f"{guideline_id}/{card_id}/{key_suffix}"
+                        ),
+                        content_hash=content_hash,
+                        synth_kwargs={"speaker": "tutor"},
+                    ))
+
+        generated, failed = self._run_jobs(jobs)
 
         logger.info(
             f"Dialogue audio for {guideline_id} "
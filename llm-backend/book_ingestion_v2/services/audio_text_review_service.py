@@ -23,6 +23,7 @@ from sqlalchemy.orm import attributes
 from shared.models.entities import TeachingGuideline, TopicExplanation
 from shared.repositories.explanation_repository import ExplanationRepository
 from shared.services.llm_service import LLMService
+from shared.utils.strict_schema import get_strict_schema
 
 logger = logging.getLogger(__name__)
 
@@ -93,9 +94,7 @@ class AudioTextReviewService:
         self.llm = llm_service
         self.language = language
         self.repo = ExplanationRepository(db)
-        self._review_schema = LLMService.make_schema_strict(
-            CardReviewOutput.model_json_schema()
-        )
+        self._review_schema = get_strict_schema(CardReviewOutput)
 
     def review_guideline(
         self,
@@ -451,9 +450,11 @@ class AudioTextReviewService:
         return applied
 
     def _strip_audio_urls(self, card: dict) -> dict:
+        """Copy of `card` without audio URLs or their content hashes."""
         out = copy.deepcopy(card)
         for line in (out.get("lines") or []):
             line.pop("audio_url", None)
+            line.pop("audio_hash", None)
         check_in = out.get("check_in")
         if isinstance(check_in, dict):
             for url_field in (
@@ -461,6 +462,7 @@ class AudioTextReviewService:
                 "success_audio_url", "reveal_audio_url",
             ):
                 check_in.pop(url_field, None)
+                check_in.pop(url_field.removesuffix("_url") + "_hash", None)
         return out
 
     def _clear_audio_urls_in_place(self, card: dict) -> None:
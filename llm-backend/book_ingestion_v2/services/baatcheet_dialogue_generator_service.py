@@ -33,6 +33,7 @@ from shared.repositories.dialogue_repository import DialogueRepository
 from shared.repositories.explanation_repository import ExplanationRepository
 from shared.repositories.guideline_repository import TeachingGuidelineRepository
 from shared.services import LLMService
+from shared.utils.strict_schema import get_strict_schema
 from shared.types.emotion import Emotion, canonicalize_emotion
 from shared.utils.dialogue_hash import compute_explanation_content_hash
 
@@ -495,9 +496,7 @@ class BaatcheetDialogueGeneratorService:
         self.repo = DialogueRepository(db)
         self.exp_repo = ExplanationRepository(db)
         self.guideline_repo = TeachingGuidelineRepository(db)
-        self._generation_schema = LLMService.make_schema_strict(
-            DialogueGenerationOutput.model_json_schema()
-        )
+        self._generation_schema = get_strict_schema(DialogueGenerationOutput)
 
     def _refresh_db_session(self) -> None:
         """Get a fresh DB session after long-running LLM calls."""
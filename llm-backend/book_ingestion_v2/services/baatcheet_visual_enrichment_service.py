@@ -16,7 +16,6 @@ Idempotent per (guideline_id, card_idx): cards that already have
 """
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import re
@@ -27,7 +26,7 @@ from sqlalchemy.orm import Session as DBSession
 
 from shared.models.entities import TeachingGuideline, TopicDialogue
 from shared.repositories.dialogue_repository import DialogueRepository
-from shared.services.llm_service import LLMService
+from shared.services.llm_service import LLMService, run_blocking
 from tutor.services.pixi_code_generator import PixiCodeGenerator
 
 logger = logging.getLogger(__name__)
@@ -142,7 +141,7 @@ class BaatcheetVisualEnrichmentService:
 
             try:
                 visual_prompt = self._build_pixi_prompt(intent, guideline)
-                pixi_code = asyncio.run(
+                pixi_code = run_blocking(
                     self.pixi_gen.generate(visual_prompt, output_type="image")
                 )
                 if not pixi_code:
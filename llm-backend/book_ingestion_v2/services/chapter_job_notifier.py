@@ -0,0 +1,181 @@
+"""Chapter-job completion notifications.
+
+`run_in_background_v2` calls `notify_chapter_job_terminal` once a job's
+row (and its `topic_stage_runs` terminal row) is written;
+`TopicPipelineOrchestrator` waits on `ChapterJobNotifier.watch` instead
+of sleeping between `get_job` polls, so the next stage launches as soon
+as the previous one finishes.
+
+Two delivery paths:
+- In-process: one `threading.Event` per waiter, keyed by job_id. Covers
+  the thread backend, where stage and orchestrator share a process.
+- Across processes: Postgres `NOTIFY chapter_job_terminal, '<job_id>'`.
+  A process with waiters keeps one `LISTEN` connection on a daemon
+  thread and sets the matching local events. Covers the queue backend,
+  where the stage runs in `worker.py` and the orchestrator in the API.
+
+Notifications only cut latency. Waiters still re-read the job row on a
+fallback interval, so a lost NOTIFY (listener reconnecting, non-Postgres
+database) costs at most that interval, never correctness.
+"""
+from __future__ import annotations
+
+import logging
+import select
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "chapter_job_terminal"
+# How long the listener blocks in select() before re-checking the socket,
+# and how long it backs off after losing its connection.
+LISTEN_IDLE_SEC = 30.0
+LISTEN_RETRY_SEC = 5.0
+
+
+def _is_postgres(bind) -> bool:
+    return getattr(getattr(bind, "dialect", None), "name", None) == "postgresql"
+
+
+class ChapterJobNotifier:
+    """Per-process registry of threads waiting for chapter jobs to finish."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters: dict[str, list[threading.Event]] = {}
+        self._listener: Optional[threading.Thread] = None
+
+    @contextmanager
+    def watch(self, job_id: str, db: Optional[Session] = None) -> Iterator[threading.Event]:
+        """Register for `job_id`'s completion for the duration of the block.
+
+        Yields an event that is set when the job is reported terminal.
+        Register BEFORE reading the job row — a completion that lands
+        between the read and the wait then still sets the event. Passing
+        the caller's session lets a Postgres-backed process start its
+        LISTEN thread on the same engine.
+        """
+        event = threading.Event()
+        with self._lock:
+            self._waiters.setdefault(job_id, []).append(event)
+        if db is not None:
+            self._ensure_listener(db.get_bind())
+        try:
+            yield event
+        finally:
+            with self._lock:
+                events = self._waiters.get(job_id, [])
+                if event in events:
+                    events.remove(event)
+                if not events:
+                    self._waiters.pop(job_id, None)
+
+    def notify_local(self, job_id: str) -> None:
+        """Wake every waiter in this process for `job_id`."""
+        with self._lock:
+            events = list(self._waiters.get(job_id, ()))
+        for event in events:
+            event.set()
+
+    def _wake_all(self) -> None:
+        with self._lock:
+            events = [e for evs in self._waiters.values() for e in evs]
+        for event in events:
+            event.set()
+
+    # ───── Cross-process (Postgres LISTEN) ─────
+
+    def _ensure_listener(self, engine) -> None:
+        if not _is_postgres(engine) or engine.dialect.driver != "psycopg2":
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(
+                target=self._listen, args=(engine,),
+                name="chapter-job-listener", daemon=True,
+            )
+        self._listener.start()
+
+    def _listen(self, engine) -> None:
+        """LISTEN loop. Runs for the life of the process on a dedicated
+        connection detached from the pool, so it never holds a pool slot."""
+        while True:
+            conn = None
+            try:
+                raw = engine.raw_connection()
+                raw.detach()
+                conn = raw.driver_connection
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                # Anything that finished while we were (re)connecting was
+                # missed — wake every waiter so it re-reads its row.
+                self._wake_all()
+                while True:
+                    if select.select([conn], [], [], LISTEN_IDLE_SEC) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self.notify_local(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning(
+                    f"Chapter job LISTEN connection lost: {e}; retrying in "
+                    f"{LISTEN_RETRY_SEC}s"
+                )
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+                time.sleep(LISTEN_RETRY_SEC)
+
+
+_notifier: Optional[ChapterJobNotifier] = None
+_notifier_lock = threading.Lock()
+
+
+def get_chapter_job_notifier() -> ChapterJobNotifier:
+    """Get or create the process-wide notifier."""
+    global _notifier
+    if _notifier is None:
+        with _notifier_lock:
+            if _notifier is None:
+                _notifier = ChapterJobNotifier()
+    return _notifier
+
+
+def reset_chapter_job_notifier() -> None:
+    """Drop the process-wide notifier (useful for testing)."""
+    global _notifier
+    _notifier = None
+
+
+def notify_chapter_job_terminal(db: Session, job_id: str) -> None:
+    """Report that `job_id` reached a terminal status.
+
+    Wakes local waiters, then (on Postgres) publishes a NOTIFY for other
+    processes. Best-effort: a failure is logged, and waiters fall back to
+    their re-check interval.
+    """
+    get_chapter_job_notifier().notify_local(job_id)
+    try:
+        if not _is_postgres(db.get_bind()):
+            return
+        db.execute(
+            text("SELECT pg_notify(:channel, :job_id)"),
+            {"channel": NOTIFY_CHANNEL, "job_id": job_id},
+        )
+        db.commit()
+    except Exception as e:
+        logger.warning(f"Could not publish completion of job {job_id}: {e}")
+        try:
+            db.rollback()
+        except Exception:
+            pass
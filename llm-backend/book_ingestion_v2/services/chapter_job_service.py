@@ -293,6 +293,46 @@ class ChapterJobService:
         self.db.commit()
         logger.info(f"Job {job_id} transitioned {old_status} → {status}")
 
+    def reclaim_lost_job(self, job_id: str, retry: bool) -> bool:
+        """Settle a job whose queue worker was lost. Returns whether to retry.
+
+        Called by the job queue inside its reclaim transaction, so this
+        flushes but does not commit. With `retry`, a running (or stale-marked
+        failed) job goes back to pending for the next attempt — unless the
+        job already completed, or another job took the lock meanwhile.
+        Without it, an active job is failed.
+        """
+        job = self.db.query(ChapterProcessingJob).filter(
+            ChapterProcessingJob.id == job_id
+        ).with_for_update().first()
+        if not job or job.status in ("completed", "completed_with_errors"):
+            return False
+
+        if not retry:
+            if job.status in ("pending", "running"):
+                job.status = "failed"
+                job.completed_at = datetime.utcnow()
+                job.error_message = (
+                    f"Job worker lost (last heartbeat "
+                    f"{job.heartbeat_at.isoformat() if job.heartbeat_at else 'never'}); "
+                    f"no retries left."
+                )
+                self.db.flush()
+            return False
+
+        try:
+            with self.db.begin_nested():
+                job.status = "pending"
+                job.started_at = datetime.utcnow()
+                job.heartbeat_at = None
+                job.completed_at = None
+                job.error_message = None
+        except IntegrityError:
+            logger.warning(f"Job {job_id} not retried: another job holds its lock")
+            return False
+        logger.info(f"Job {job_id} reset to pending for a retry")
+        return True
+
     def get_job(self, job_id: str) -> Optional[ProcessingJobResponse]:
         """Get job by ID as response schema."""
         job = self.db.query(ChapterProcessingJob).filter(
@@ -404,7 +444,12 @@ class ChapterJobService:
     def _is_pending_stale(self, job: ChapterProcessingJob) -> bool:
         if not job.started_at:
             return True
-        return (datetime.utcnow() - job.started_at) > _PENDING_THRESHOLD
+        if (datetime.utcnow() - job.started_at) <= _PENDING_THRESHOLD:
+            return False
+        # With the durable job queue a job stays pending until a worker has
+        # a free slot — that is waiting, not abandonment.
+        from shared.services.job_queue import JobQueue
+        return not JobQueue(self.db).has_active(job.id)
 
     def _mark_stale(self, job: ChapterProcessingJob):
         job = self.db.query(ChapterProcessingJob).filter(
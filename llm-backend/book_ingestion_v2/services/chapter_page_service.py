@@ -1,12 +1,14 @@
 """
-Chapter page service — page upload with inline OCR, completeness tracking.
+Chapter page service — page upload with background OCR, completeness tracking.
 
-Pages are scoped to a chapter via TOC range. OCR runs inline on every upload.
-When all pages in range are uploaded and OCR'd, chapter transitions to upload_complete.
+Pages are scoped to a chapter via TOC range. An upload returns once the image
+is stored; OCR runs on the shared OCR worker pool and the page's ocr_status
+moves pending → processing → completed/failed. When all pages in range are
+uploaded and OCR'd, chapter transitions to upload_complete.
 """
 import uuid
 import logging
-import tempfile
+from concurrent.futures import as_completed
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
@@ -24,6 +26,7 @@ from book_ingestion_v2.models.database import ChapterPage, BookChapter
 from book_ingestion_v2.models.schemas import PageResponse, PageDetailResponse, ChapterPagesResponse
 from book_ingestion_v2.repositories.chapter_repository import ChapterRepository
 from book_ingestion_v2.repositories.chapter_page_repository import ChapterPageRepository
+from book_ingestion_v2.services.ocr_worker_pool import extract_page_text, get_ocr_worker_pool
 
 logger = logging.getLogger(__name__)
 
@@ -36,17 +39,22 @@ V2_OCR_PROMPT = (Path(__file__).parent.parent / "prompts" / "ocr_page_extraction
 class ChapterPageService:
     """Service for page upload and management within chapter context."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, ocr_service=None):
+        self._bind(db)
+        self.s3_client = get_s3_client()
+
+        if ocr_service is None:
+            ocr_config = LLMConfigService(db).get_config("ocr")
+            ocr_service = get_ocr_service(
+                provider=ocr_config["provider"],
+                model=ocr_config["model_id"],
+            )
+        self.ocr_service = ocr_service
+
+    def _bind(self, db: Session):
         self.db = db
         self.chapter_repo = ChapterRepository(db)
         self.page_repo = ChapterPageRepository(db)
-        self.s3_client = get_s3_client()
-
-        ocr_config = LLMConfigService(db).get_config("ocr")
-        self.ocr_service = get_ocr_service(
-            provider=ocr_config["provider"],
-            model=ocr_config["model_id"],
-        )
 
     def upload_page(
         self,
@@ -57,13 +65,15 @@ class ChapterPageService:
         filename: str,
     ) -> PageResponse:
         """
-        Upload a single page with inline OCR.
+        Upload a single page and queue its OCR.
 
         1. Validate chapter exists and page_number is in range
-        2. Convert to PNG, upload to S3
-        3. Run OCR inline
-        4. Save text to S3, create DB record
-        5. Update chapter completeness
+        2. Convert to PNG, upload raw + PNG to S3
+        3. Create DB record with ocr_status=pending
+        4. Update chapter completeness
+        5. Hand OCR to the worker pool with the PNG bytes already in memory
+
+        Returns as soon as the record exists; poll the page for ocr_status.
         """
         chapter = self.chapter_repo.get_by_id(chapter_id)
         if not chapter or chapter.book_id != book_id:
@@ -92,51 +102,14 @@ class ChapterPageService:
             raise ValueError(f"File too large: {len(image_data)} bytes (max {MAX_FILE_SIZE})")
 
         # Build S3 keys
-        ch_num = str(chapter.chapter_number).zfill(2)
-        s3_base = f"books/{book_id}/chapters/{ch_num}/pages"
+        s3_base = self._pages_prefix(book_id, chapter)
         raw_s3_key = f"{s3_base}/raw/{page_number}{ext}"
         png_s3_key = f"{s3_base}/{page_number}.png"
         text_s3_key = f"{s3_base}/{page_number}.txt"
 
-        # Upload raw image to S3
-        self.s3_client.upload_bytes(image_data, raw_s3_key)
-
-        # Convert to PNG
+        # Convert to PNG, then upload raw + PNG together
         png_data = self._convert_to_png(image_data)
-        self.s3_client.upload_bytes(png_data, png_s3_key)
-
-        # Run OCR inline
-        ocr_status = OCRStatus.PENDING.value
-        ocr_error = None
-        ocr_completed_at = None
-        ocr_model = None
-        tmp_path = None
-
-        try:
-            # Write PNG to temp file for OCR service
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp.write(png_data)
-                tmp_path = tmp.name
-
-            ocr_text = self.ocr_service.extract_text_from_image(
-                image_path=tmp_path, prompt=V2_OCR_PROMPT
-            )
-            ocr_model = self.ocr_service.model
-
-            # Upload OCR text to S3
-            self.s3_client.upload_bytes(ocr_text.encode("utf-8"), text_s3_key)
-
-            ocr_status = OCRStatus.COMPLETED.value
-            ocr_completed_at = datetime.utcnow()
-            logger.info(f"OCR completed for page {page_number} in chapter {chapter_id}")
-        except Exception as e:
-            ocr_status = OCRStatus.FAILED.value
-            ocr_error = str(e)
-            text_s3_key = None
-            logger.warning(f"OCR failed for page {page_number}: {e}")
-        finally:
-            if tmp_path:
-                Path(tmp_path).unlink(missing_ok=True)
+        self.s3_client.upload_many({raw_s3_key: image_data, png_s3_key: png_data})
 
         # Create DB record
         page = ChapterPage(
@@ -146,12 +119,9 @@ class ChapterPageService:
             page_number=page_number,
             raw_image_s3_key=raw_s3_key,
             image_s3_key=png_s3_key,
-            text_s3_key=text_s3_key,
-            ocr_status=ocr_status,
-            ocr_error=ocr_error,
-            ocr_model=ocr_model,
+            text_s3_key=None,
+            ocr_status=OCRStatus.PENDING.value,
             uploaded_at=datetime.utcnow(),
-            ocr_completed_at=ocr_completed_at,
         )
         try:
             page = self.page_repo.create(page)
@@ -165,6 +135,14 @@ class ChapterPageService:
         # Update chapter completeness
         self._update_chapter_completeness(chapter)
 
+        # A page left pending here (pool unavailable) is picked up by ocr-retry.
+        try:
+            get_ocr_worker_pool().submit(
+                page.id, self._ocr_page_task, page.id, text_s3_key, png_data,
+            )
+        except Exception as e:
+            logger.warning(f"Could not queue OCR for page {page_number}: {e}")
+
         return self._to_response(page)
 
     def delete_page(self, book_id: str, chapter_id: str, page_number: int) -> bool:
@@ -173,13 +151,12 @@ class ChapterPageService:
         if not page or page.book_id != book_id:
             return False
 
-        # Delete S3 files
-        for key in [page.raw_image_s3_key, page.image_s3_key, page.text_s3_key]:
-            if key:
-                try:
-                    self.s3_client.delete_file(key)
-                except Exception as e:
-                    logger.warning(f"Failed to delete S3 file {key}: {e}")
+        # Delete S3 files (one batch request)
+        keys = [k for k in (page.raw_image_s3_key, page.image_s3_key, page.text_s3_key) if k]
+        try:
+            self.s3_client.delete_many(keys)
+        except Exception as e:
+            logger.warning(f"Failed to delete S3 files {keys}: {e}")
 
         self.page_repo.delete(page.id)
 
@@ -202,43 +179,21 @@ class ChapterPageService:
         if not page.image_s3_key:
             raise ValueError(f"Page {page_number} has no image to OCR")
 
-        # Download PNG from S3 and retry
         chapter = self.chapter_repo.get_by_id(chapter_id)
-        ch_num = str(chapter.chapter_number).zfill(2)
-        text_s3_key = f"books/{book_id}/chapters/{ch_num}/pages/{page_number}.txt"
-        tmp_path = None
-
-        try:
-            png_data = self.s3_client.download_bytes(page.image_s3_key)
+        text_s3_key = f"{self._pages_prefix(book_id, chapter)}/{page_number}.txt"
 
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp.write(png_data)
-                tmp_path = tmp.name
-
-            ocr_text = self.ocr_service.extract_text_from_image(
-                image_path=tmp_path, prompt=V2_OCR_PROMPT
-            )
-
-            self.s3_client.upload_bytes(ocr_text.encode("utf-8"), text_s3_key)
-
-            page.text_s3_key = text_s3_key
-            page.ocr_status = OCRStatus.COMPLETED.value
-            page.ocr_error = None
-            page.ocr_model = self.ocr_service.model
-            page.ocr_completed_at = datetime.utcnow()
-            self.page_repo.update(page)
+        # Run on the pool like every other OCR, so a retry racing a bulk
+        # job (or a second retry click) waits on the page's existing task
+        # instead of OCR'ing it twice. The task also re-checks completeness.
+        future = get_ocr_worker_pool().submit(
+            page.id, self._ocr_page_task, page.id, text_s3_key,
+        )
+        ok = future.result()
+        self.db.refresh(page)
+        if not ok:
+            raise ValueError(f"OCR retry failed: {page.ocr_error}")
 
-            # Re-check chapter completeness
-            self._update_chapter_completeness(chapter)
-
-            logger.info(f"OCR retry succeeded for page {page_number}")
-        except Exception as e:
-            page.ocr_error = str(e)
-            self.page_repo.update(page)
-            raise ValueError(f"OCR retry failed: {e}")
-        finally:
-            if tmp_path:
-                Path(tmp_path).unlink(missing_ok=True)
+        logger.info(f"OCR retry succeeded for page {page_number}")
 
         return self._to_response(page)
 
@@ -307,15 +262,14 @@ class ChapterPageService:
         """
         Bulk OCR background task. Called by run_in_background_v2.
 
-        Processes all pages needing OCR (pending/failed) for a chapter.
-        Updates job progress after each page.
+        Fans all pages needing OCR (pending/processing/failed) for a chapter
+        out to the OCR worker pool and updates job progress as each finishes.
+        Pages already being OCR'd after upload are waited on, not re-run.
         """
         from book_ingestion_v2.services.chapter_job_service import ChapterJobService
 
         # Rebind to background thread's DB session
-        self.db = db
-        self.chapter_repo = ChapterRepository(db)
-        self.page_repo = ChapterPageRepository(db)
+        self._bind(db)
 
         # Re-init OCR service in this session
         ocr_config = LLMConfigService(db).get_config("ocr")
@@ -329,54 +283,39 @@ class ChapterPageService:
         if not chapter:
             raise ValueError(f"Chapter not found: {chapter_id}")
 
-        ch_num = str(chapter.chapter_number).zfill(2)
+        s3_base = self._pages_prefix(book_id, chapter)
 
         # Snapshot pages at job start
         pages = self.page_repo.get_pages_needing_ocr(chapter_id)
         completed = 0
         failed = 0
 
-        for page in pages:
-            tmp_path = None
-            text_s3_key = f"books/{book_id}/chapters/{ch_num}/pages/{page.page_number}.txt"
-            try:
-                job_service.update_progress(
-                    job_id,
-                    current_item=f"OCR page {page.page_number}",
-                    completed=completed,
-                    failed=failed,
-                )
-
-                if not page.image_s3_key:
-                    raise ValueError(f"Page {page.page_number} has no image")
+        job_service.update_progress(
+            job_id,
+            current_item=f"OCR {len(pages)} pages",
+            completed=completed,
+            failed=failed,
+        )
 
-                png_data = self.s3_client.download_bytes(page.image_s3_key)
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                    tmp.write(png_data)
-                    tmp_path = tmp.name
-
-                ocr_text = self.ocr_service.extract_text_from_image(
-                    image_path=tmp_path, prompt=V2_OCR_PROMPT
-                )
-                self.s3_client.upload_bytes(ocr_text.encode("utf-8"), text_s3_key)
-
-                page.text_s3_key = text_s3_key
-                page.ocr_status = OCRStatus.COMPLETED.value
-                page.ocr_error = None
-                page.ocr_model = self.ocr_service.model
-                page.ocr_completed_at = datetime.utcnow()
-                self.page_repo.update(page)
+        pool = get_ocr_worker_pool()
+        futures = {
+            pool.submit(
+                page.id, self._ocr_page_task, page.id,
+                f"{s3_base}/{page.page_number}.txt", update_chapter=False,
+            ): page.page_number
+            for page in pages
+        }
+        for future in as_completed(futures):
+            if future.result():
                 completed += 1
-                logger.info(f"Bulk OCR completed for page {page.page_number}")
-            except Exception as e:
-                page.ocr_status = OCRStatus.FAILED.value
-                page.ocr_error = str(e)
-                self.page_repo.update(page)
+            else:
                 failed += 1
-                logger.warning(f"Bulk OCR failed for page {page.page_number}: {e}")
-            finally:
-                if tmp_path:
-                    Path(tmp_path).unlink(missing_ok=True)
+            job_service.update_progress(
+                job_id,
+                current_item=f"OCR page {futures[future]}",
+                completed=completed,
+                failed=failed,
+            )
 
         # Update chapter completeness (may transition to upload_complete)
         chapter = self.chapter_repo.get_by_id(chapter_id)
@@ -389,8 +328,80 @@ class ChapterPageService:
         )
         job_service.release_lock(job_id, status=final_status)
 
+    def _ocr_page_task(
+        self,
+        db: Session,
+        page_id: str,
+        text_s3_key: str,
+        png_data: Optional[bytes] = None,
+        update_chapter: bool = True,
+    ) -> bool:
+        """OCR worker pool task: OCR one page on the pool's session."""
+        worker = ChapterPageService(db, ocr_service=self.ocr_service)
+        page = worker.page_repo.get_by_id(page_id)
+        if page is None:
+            logger.info(f"Page {page_id} was deleted before OCR ran")
+            return False
+
+        ok = worker._ocr_page(page, text_s3_key, png_data)
+        if update_chapter:
+            chapter = worker.chapter_repo.get_by_id(page.chapter_id)
+            if chapter:
+                worker._update_chapter_completeness(chapter)
+        return ok
+
+    def _ocr_page(
+        self, page: ChapterPage, text_s3_key: str, png_data: Optional[bytes] = None,
+    ) -> bool:
+        """
+        OCR one page and record the outcome on it. Returns True on success.
+
+        Uses `png_data` when the caller already holds the PNG (fresh upload),
+        otherwise downloads it. The image never touches local disk.
+        """
+        page.ocr_status = OCRStatus.PROCESSING.value
+        self.page_repo.update(page)
+
+        try:
+            if png_data is None:
+                if not page.image_s3_key:
+                    raise ValueError(f"Page {page.page_number} has no image")
+                png_data = self.s3_client.download_bytes(page.image_s3_key)
+
+            ocr_text = extract_page_text(self.ocr_service, png_data, V2_OCR_PROMPT)
+            self.s3_client.upload_bytes(ocr_text.encode("utf-8"), text_s3_key)
+        except Exception as e:
+            page.ocr_status = OCRStatus.FAILED.value
+            page.ocr_error = str(e)
+            self.page_repo.update(page)
+            logger.warning(f"OCR failed for page {page.page_number}: {e}")
+            return False
+
+        page.text_s3_key = text_s3_key
+        page.ocr_status = OCRStatus.COMPLETED.value
+        page.ocr_error = None
+        page.ocr_model = self.ocr_service.model
+        page.ocr_completed_at = datetime.utcnow()
+        self.page_repo.update(page)
+        logger.info(f"OCR completed for page {page.page_number} in chapter {page.chapter_id}")
+        return True
+
+    @staticmethod
+    def _pages_prefix(book_id: str, chapter: BookChapter) -> str:
+        ch_num = str(chapter.chapter_number).zfill(2)
+        return f"books/{book_id}/chapters/{ch_num}/pages"
+
     def _update_chapter_completeness(self, chapter: BookChapter):
-        """Update chapter's uploaded_page_count and status based on current pages."""
+        """Update chapter's uploaded_page_count and status based on current pages.
+
+        The chapter row stays locked from the re-read through the commit.
+        Concurrent OCR tasks commit their page before getting here, so they
+        serialize on the lock and the last one through counts every page.
+        """
+        chapter = self.chapter_repo.get_for_update(chapter.id)
+        if chapter is None:
+            return
+
         uploaded_count = self.page_repo.count_by_chapter(chapter.id)
         ocr_completed_count = self.page_repo.count_ocr_completed(chapter.id)
 
@@ -18,6 +18,7 @@ from uuid import uuid4
 from pydantic import BaseModel, Field
 
 from shared.services.llm_service import LLMService, LLMServiceError
+from shared.utils.strict_schema import get_strict_schema
 from shared.models.entities import TeachingGuideline, TopicExplanation
 from shared.repositories.explanation_repository import ExplanationRepository
 
@@ -155,9 +156,7 @@ class CheckInEnrichmentService:
         self.llm = llm_service
         self.repo = ExplanationRepository(db)
 
-        self._generation_schema = LLMService.make_schema_strict(
-            CheckInGenerationOutput.model_json_schema()
-        )
+        self._generation_schema = get_strict_schema(CheckInGenerationOutput)
 
     def _refresh_db_session(self):
         """Get a fresh DB session after long-running LLM calls."""
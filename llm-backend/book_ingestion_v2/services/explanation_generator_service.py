@@ -7,6 +7,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from shared.services import LLMService
+from shared.utils.strict_schema import get_strict_schema
 from shared.models.entities import TeachingGuideline, TopicExplanation
 from shared.repositories.explanation_repository import ExplanationRepository
 
@@ -101,9 +102,7 @@ class ExplanationGeneratorService:
         self.repo = ExplanationRepository(db)
 
         # Pre-compute strict schema for structured output (shared by generation and review-refine)
-        self._generation_schema = LLMService.make_schema_strict(
-            GenerationOutput.model_json_schema()
-        )
+        self._generation_schema = get_strict_schema(GenerationOutput)
 
     def _refresh_db_session(self):
         """Get a fresh DB session after long-running LLM calls."""
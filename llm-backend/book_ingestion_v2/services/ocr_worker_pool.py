@@ -0,0 +1,145 @@
+"""
+OCR worker pool — concurrent page OCR for chapter uploads and bulk re-runs.
+
+Page uploads return once the image is stored and hand OCR to this pool;
+`bulk_ocr` (ocr-retry / ocr-rerun) fans a chapter's pages out to it and
+waits, and the single-page retry-ocr route waits on one task. One
+process-wide pool bounds the worker threads, and a per-provider limiter
+(token bucket + in-flight cap, as for TTS synthesis) keeps every worker
+under the provider's rate limit.
+
+Each task gets its own DB session from the pool's session factory, like
+`run_in_background_v2` gives each job one. A page already queued or running
+is never queued twice: `submit` returns the existing future, so a bulk job
+started while uploads are still being OCR'd simply waits for them.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from shared.utils.rate_limiter import ProviderLimiter, get_provider_limiter
+
+logger = logging.getLogger(__name__)
+
+
+def _provider_limiter(provider: str) -> ProviderLimiter:
+    from config import get_settings
+    settings = get_settings()
+    rate = (
+        settings.ocr_claude_code_requests_per_second
+        if provider == "claude_code"
+        else settings.ocr_openai_requests_per_second
+    )
+    return get_provider_limiter(f"ocr:{provider}", rate, settings.ocr_concurrency)
+
+
+def extract_page_text(ocr_service, png_data: bytes, prompt: str) -> str:
+    """OCR one page image held in memory, paced by the provider's limiter."""
+    limiter = _provider_limiter(ocr_service.provider)
+    with limiter.slots:
+        limiter.bucket.acquire()
+        return ocr_service.extract_text_from_image(image_bytes=png_data, prompt=prompt)
+
+
+class OCRWorkerPool:
+    """Bounded thread pool running page OCR tasks, at most one per page."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self._session_factory = session_factory
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ocr",
+        )
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._submitted = 0
+        self._succeeded = 0
+        self._failed = 0
+
+    def _session(self):
+        if self._session_factory is None:
+            from database import get_db_manager
+            self._session_factory = get_db_manager().session_factory
+        return self._session_factory()
+
+    def submit(self, page_id: str, fn: Callable[..., bool], *args, **kwargs) -> Future:
+        """
+        Queue `fn(db, *args, **kwargs)` for one page.
+
+        `fn` runs on a fresh session that is closed afterwards and returns
+        True when the page's OCR succeeded. If the page is already queued or
+        running, its existing future is returned and `fn` is not queued.
+        """
+        with self._lock:
+            existing = self._in_flight.get(page_id)
+            if existing is not None:
+                return existing
+            future = self._executor.submit(self._run, page_id, fn, args, kwargs)
+            self._in_flight[page_id] = future
+            self._submitted += 1
+        return future
+
+    def _run(self, page_id: str, fn: Callable[..., bool], args, kwargs) -> bool:
+        ok = False
+        try:
+            db = self._session()
+            try:
+                ok = bool(fn(db, *args, **kwargs))
+            finally:
+                db.close()
+        except Exception as e:
+            logger.error(f"OCR task for page {page_id} failed: {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self._in_flight.pop(page_id, None)
+                if ok:
+                    self._succeeded += 1
+                else:
+                    self._failed += 1
+        return ok
+
+    def is_in_flight(self, page_id: str) -> bool:
+        with self._lock:
+            return page_id in self._in_flight
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": len(self._in_flight),
+                "submitted": self._submitted,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+_ocr_worker_pool: Optional[OCRWorkerPool] = None
+_ocr_worker_pool_lock = threading.Lock()
+
+
+def get_ocr_worker_pool() -> OCRWorkerPool:
+    global _ocr_worker_pool
+    if _ocr_worker_pool is None:
+        with _ocr_worker_pool_lock:
+            if _ocr_worker_pool is None:
+                from config import get_settings
+                _ocr_worker_pool = OCRWorkerPool(max_workers=get_settings().ocr_concurrency)
+    return _ocr_worker_pool
+
+
+def reset_ocr_worker_pool() -> None:
+    """Shut down and drop the global pool (useful for testing)."""
+    global _ocr_worker_pool
+    with _ocr_worker_pool_lock:
+        pool, _ocr_worker_pool = _ocr_worker_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
@@ -22,6 +22,7 @@ from shared.models.entities import TeachingGuideline
 from shared.repositories.explanation_repository import ExplanationRepository
 from shared.repositories.practice_question_repository import PracticeQuestionRepository
 from shared.services.llm_service import LLMService, LLMServiceError
+from shared.utils.strict_schema import get_strict_schema
 from book_ingestion_v2.services.check_in_enrichment_service import (
     MatchPairOutput,
     BucketItemOutput,
@@ -138,9 +139,7 @@ class PracticeBankGeneratorService:
         self.explanation_repo = ExplanationRepository(db)
         self.question_repo = PracticeQuestionRepository(db)
 
-        self._generation_schema = LLMService.make_schema_strict(
-            PracticeBankOutput.model_json_schema()
-        )
+        self._generation_schema = get_strict_schema(PracticeBankOutput)
 
     def _refresh_db_session(self):
         """Get a fresh DB session after long-running LLM calls."""
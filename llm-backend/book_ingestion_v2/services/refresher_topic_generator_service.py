@@ -7,6 +7,7 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 from shared.services import LLMService
+from shared.utils.strict_schema import get_strict_schema
 from shared.models.entities import TeachingGuideline, TopicExplanation
 from shared.repositories.explanation_repository import ExplanationRepository
 from book_ingestion_v2.services.explanation_generator_service import ExplanationCardOutput
@@ -49,9 +50,7 @@ class RefresherTopicGeneratorService:
         self.llm = llm_service
         self.repo = ExplanationRepository(db)
 
-        self._refresher_schema = LLMService.make_schema_strict(
-            RefresherOutput.model_json_schema()
-        )
+        self._refresher_schema = get_strict_schema(RefresherOutput)
 
     def generate_for_chapter(self, book_id: str, chapter_key: str) -> Optional[str]:
         """Generate refresher topic. Returns guideline_id or None if skipped."""
@@ -5,7 +5,8 @@ Orchestrates chunk-by-chunk processing for a chapter:
 1. Validate chapter readiness
 2. Acquire job lock
 3. Build chunk windows
-4. Process each chunk, accumulating topic map
+4. Process each chunk, accumulating topic map — in page order, or
+   concurrently with an in-order merge when a chapter topic plan exists
 5. Persist draft topics
 6. Auto-trigger finalization
 7. Release job lock
@@ -13,8 +14,9 @@ Orchestrates chunk-by-chunk processing for a chapter:
 import json
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -29,7 +31,7 @@ from book_ingestion_v2.constants import (
 )
 from book_ingestion_v2.models.database import BookChapter, ChapterChunk, ChapterTopic, ChapterProcessingJob
 from book_ingestion_v2.models.processing_models import (
-    ChunkInput, RunningState, TopicAccumulator,
+    ChunkInput, ChunkWindow, ChunkExtractionOutput, RunningState, TopicAccumulator,
     PlannedTopic, ChapterTopicPlan,
 )
 from book_ingestion_v2.services.chapter_topic_planner_service import ChapterTopicPlannerService
@@ -75,6 +77,189 @@ class TopicExtractionOrchestrator:
         self.topic_repo = TopicRepository(self.db)
         self.job_service = ChapterJobService(self.db)
 
+    def _update_chunk_progress(self, job_id, window, total_chunks, completed, failed):
+        self.job_service.update_progress(
+            job_id,
+            current_item=f"Processing chunk {window.chunk_index + 1}/{total_chunks} "
+                         f"(pages {window.pages[0]}-{window.pages[-1]})",
+            completed=completed,
+            failed=failed,
+        )
+
+    def _build_chunk_input(
+        self,
+        window: ChunkWindow,
+        chapter: BookChapter,
+        book_metadata: dict,
+        state: RunningState,
+        s3_run_base: str,
+        base_summary: Optional[str] = None,
+    ) -> ChunkInput:
+        """Load a window's page texts and build (and save) its chunk input.
+
+        `base_summary` replaces the running summary in plan-guided parallel
+        mode, where chunks don't wait for each other's summaries.
+        """
+        # Load page texts
+        current_pages = []
+        for pn in window.pages:
+            page = self.page_repo.get_by_chapter_and_page_number(chapter.id, pn)
+            if page and page.text_s3_key:
+                text = self.s3_client.download_bytes(page.text_s3_key).decode("utf-8")
+                current_pages.append({"page_number": pn, "text": text})
+
+        # Load previous page context
+        prev_context = None
+        if window.previous_page:
+            prev_page = self.page_repo.get_by_chapter_and_page_number(
+                chapter.id, window.previous_page
+            )
+            if prev_page and prev_page.text_s3_key:
+                prev_context = self.s3_client.download_bytes(
+                    prev_page.text_s3_key
+                ).decode("utf-8")
+
+        chunk_input = ChunkInput(
+            book_metadata=book_metadata,
+            chapter_metadata={
+                "number": chapter.chapter_number,
+                "title": chapter.chapter_title,
+                "page_range": f"{chapter.start_page}-{chapter.end_page}",
+            },
+            current_pages=current_pages,
+            previous_page_context=prev_context,
+            chapter_summary_so_far=(
+                base_summary if base_summary is not None else state.chapter_summary_so_far
+            ),
+            # Copies: the merge mutates accumulators while other chunks' prompts
+            # may still be built from their inputs.
+            topics_so_far=[t.model_copy() for t in state.topic_guidelines_map.values()],
+        )
+
+        # Save chunk input to S3
+        self.s3_client.upload_bytes(
+            json.dumps(chunk_input.model_dump(), indent=2).encode("utf-8"),
+            f"{s3_run_base}/chunks/{str(window.chunk_index).zfill(3)}/input.json",
+        )
+        return chunk_input
+
+    @staticmethod
+    def _apply_chunk_output(
+        state: RunningState,
+        output: ChunkExtractionOutput,
+        window: ChunkWindow,
+        planned_topics: Optional[List[PlannedTopic]],
+    ):
+        """Merge one chunk's topic updates into the running state."""
+        state.chapter_summary_so_far = output.updated_chapter_summary
+        for topic_update in output.topics:
+            # Determine if this is a new topic
+            is_new_topic = topic_update.is_new  # unguided mode
+            if planned_topics and topic_update.topic_assignment == "unplanned":
+                is_new_topic = True
+            elif planned_topics and topic_update.topic_assignment == "planned":
+                is_new_topic = False
+
+            if is_new_topic and topic_update.topic_key not in state.topic_guidelines_map:
+                state.topic_guidelines_map[topic_update.topic_key] = TopicAccumulator(
+                    topic_key=topic_update.topic_key,
+                    topic_title=topic_update.topic_title,
+                    guidelines=f"## Pages {window.pages[0]}-{window.pages[-1]}\n"
+                               f"{topic_update.guidelines_for_this_chunk}",
+                    source_page_start=window.pages[0],
+                    source_page_end=window.pages[-1],
+                )
+            else:
+                existing = state.topic_guidelines_map.get(topic_update.topic_key)
+                if existing:
+                    existing.guidelines += (
+                        f"\n\n## Pages {window.pages[0]}-{window.pages[-1]}\n"
+                        f"{topic_update.guidelines_for_this_chunk}"
+                    )
+                    existing.source_page_end = window.pages[-1]
+
+    def _record_chunk(
+        self,
+        job_id: str,
+        chapter_id: str,
+        window: ChunkWindow,
+        chunk_input: ChunkInput,
+        output: Optional[ChunkExtractionOutput],
+        error: Optional[Exception],
+        state: RunningState,
+        planned_topics: Optional[List[PlannedTopic]],
+        s3_run_base: str,
+        config: dict,
+        chunk_processor: ChunkProcessorService,
+    ) -> bool:
+        """Merge a chunk's result into `state` and persist it. Returns True on success."""
+        chunk_idx = window.chunk_index
+        chunk_idx_str = str(chunk_idx).zfill(3)
+
+        # Refresh DB session — connection may have gone stale
+        # during the long LLM call
+        self._refresh_db_session()
+
+        if error is None:
+            try:
+                # Update accumulator
+                self._apply_chunk_output(state, output, window, planned_topics)
+
+                # Save chunk output to S3
+                self.s3_client.upload_bytes(
+                    json.dumps(output.model_dump(), indent=2).encode("utf-8"),
+                    f"{s3_run_base}/chunks/{chunk_idx_str}/output.json",
+                )
+
+                # Save state snapshot
+                self.s3_client.upload_bytes(
+                    json.dumps(state.model_dump(), indent=2).encode("utf-8"),
+                    f"{s3_run_base}/chunks/{chunk_idx_str}/state_after.json",
+                )
+
+                # Save chunk DB record
+                chunk_record = ChapterChunk(
+                    id=str(uuid.uuid4()),
+                    chapter_id=chapter_id,
+                    processing_job_id=job_id,
+                    chunk_index=chunk_idx,
+                    page_start=window.pages[0],
+                    page_end=window.pages[-1],
+                    previous_page_text=chunk_input.previous_page_context,
+                    chapter_summary_before=chunk_input.chapter_summary_so_far,
+                    raw_llm_response=json.dumps(output.model_dump()),
+                    topics_detected_json=json.dumps([t.model_dump() for t in output.topics]),
+                    chapter_summary_after=output.updated_chapter_summary,
+                    status="completed",
+                    model_provider=config["provider"],
+                    model_id=config["model_id"],
+                    prompt_hash=chunk_processor.get_prompt_hash(),
+                    completed_at=datetime.utcnow(),
+                )
+                self.chunk_repo.create(chunk_record)
+                return True
+            except Exception as e:
+                # Refresh session in case the error was connection-related
+                self._refresh_db_session()
+                error = e
+
+        # Record failed chunk
+        chunk_record = ChapterChunk(
+            id=str(uuid.uuid4()),
+            chapter_id=chapter_id,
+            processing_job_id=job_id,
+            chunk_index=chunk_idx,
+            page_start=window.pages[0],
+            page_end=window.pages[-1],
+            status="failed",
+            error_message=str(error),
+            model_provider=config["provider"],
+            model_id=config["model_id"],
+        )
+        self.chunk_repo.create(chunk_record)
+        logger.error(f"Chunk {chunk_idx} failed: {error}")
+        return False
+
     def extract(
         self, db: Session, job_id: str, chapter_id: str, book_id: str, resume: bool = False
     ):
@@ -128,6 +313,7 @@ class TopicExtractionOrchestrator:
 
         # ── Chapter-level topic planning (skip on resume — plan is restored later) ──
         planned_topics = None
+        chapter_overview = None
 
         if not resume:
             planner_service = ChapterTopicPlannerService(llm_service)
@@ -152,6 +338,7 @@ class TopicExtractionOrchestrator:
 
                 plan = planner_service.plan_chapter(book_metadata, chapter_metadata, all_page_texts)
                 planned_topics = plan.topics
+                chapter_overview = plan.chapter_overview
 
                 # Refresh DB session after LLM call
                 self._refresh_db_session()
@@ -235,6 +422,7 @@ class TopicExtractionOrchestrator:
                 try:
                     prev_plan = ChapterTopicPlan(**json.loads(prev_job.planned_topics_json))
                     planned_topics = prev_plan.topics
+                    chapter_overview = prev_plan.chapter_overview
                     # Copy plan to current job for self-containment
                     job_record = self.db.query(ChapterProcessingJob).filter(
                         ChapterProcessingJob.id == job_id
@@ -245,6 +433,11 @@ class TopicExtractionOrchestrator:
                 except Exception:
                     logger.warning("Failed to restore planned topics from previous job")
 
+        # With a plan the topic set is known up front, so chunks don't need
+        # each other's output and can be extracted concurrently.
+        chunk_concurrency = settings.topic_extraction_chunk_concurrency
+        parallel = bool(planned_topics) and chunk_concurrency > 1
+
         # S3 run directory
         ch_num = str(chapter.chapter_number).zfill(2)
         s3_run_base = f"books/{book_id}/chapters/{ch_num}/processing/runs/{job_id}"
@@ -258,6 +451,8 @@ class TopicExtractionOrchestrator:
             "model_id": config["model_id"],
             "total_chunks": total_chunks,
             "resume_from": start_chunk,
+            "chunk_mode": "parallel" if parallel else "sequential",
+            "chunk_concurrency": chunk_concurrency if parallel else 1,
             "started_at": datetime.utcnow().isoformat(),
         }
         self.s3_client.upload_bytes(
@@ -275,147 +470,61 @@ class TopicExtractionOrchestrator:
         # Process each chunk
         completed = start_chunk
         failed = 0
-
-        for window in chunk_windows[start_chunk:]:
-            chunk_idx = window.chunk_index
-            chunk_idx_str = str(chunk_idx).zfill(3)
-
-            self.job_service.update_progress(
-                job_id,
-                current_item=f"Processing chunk {chunk_idx + 1}/{total_chunks} "
-                             f"(pages {window.pages[0]}-{window.pages[-1]})",
-                completed=completed,
-                failed=failed,
-            )
-
-            # Load page texts
-            current_pages = []
-            for pn in window.pages:
-                page = self.page_repo.get_by_chapter_and_page_number(chapter_id, pn)
-                if page and page.text_s3_key:
-                    text = self.s3_client.download_bytes(page.text_s3_key).decode("utf-8")
-                    current_pages.append({"page_number": pn, "text": text})
-
-            # Load previous page context
-            prev_context = None
-            if window.previous_page:
-                prev_page = self.page_repo.get_by_chapter_and_page_number(
-                    chapter_id, window.previous_page
+        windows = chunk_windows[start_chunk:]
+
+        if parallel:
+            # Plan-guided: every chunk sees the same planned topics and base
+            # summary, so inputs don't depend on earlier outputs. LLM calls
+            # run concurrently; outputs are recorded strictly in chunk order,
+            # so the merged state and the completed-chunk prefix that resume
+            # relies on are the same as a sequential run would leave.
+            inputs = [
+                self._build_chunk_input(
+                    window, chapter, book_metadata, state, s3_run_base,
+                    base_summary=state.chapter_summary_so_far or chapter_overview or "",
                 )
-                if prev_page and prev_page.text_s3_key:
-                    prev_context = self.s3_client.download_bytes(
-                        prev_page.text_s3_key
-                    ).decode("utf-8")
-
-            # Build chunk input
-            chunk_input = ChunkInput(
-                book_metadata=book_metadata,
-                chapter_metadata={
-                    "number": chapter.chapter_number,
-                    "title": chapter.chapter_title,
-                    "page_range": f"{chapter.start_page}-{chapter.end_page}",
-                },
-                current_pages=current_pages,
-                previous_page_context=prev_context,
-                chapter_summary_so_far=state.chapter_summary_so_far,
-                topics_so_far=list(state.topic_guidelines_map.values()),
-            )
-
-            # Save chunk input to S3
-            self.s3_client.upload_bytes(
-                json.dumps(chunk_input.model_dump(), indent=2).encode("utf-8"),
-                f"{s3_run_base}/chunks/{chunk_idx_str}/input.json",
-            )
-
-            # Process chunk
-            try:
-                output = chunk_processor.process_chunk(chunk_input, planned_topics=planned_topics)
-
-                # Refresh DB session — connection may have gone stale
-                # during the long LLM call
-                self._refresh_db_session()
-
-                # Update accumulator
-                state.chapter_summary_so_far = output.updated_chapter_summary
-                for topic_update in output.topics:
-                    # Determine if this is a new topic
-                    is_new_topic = topic_update.is_new  # unguided mode
-                    if planned_topics and topic_update.topic_assignment == "unplanned":
-                        is_new_topic = True
-                    elif planned_topics and topic_update.topic_assignment == "planned":
-                        is_new_topic = False
-
-                    if is_new_topic and topic_update.topic_key not in state.topic_guidelines_map:
-                        state.topic_guidelines_map[topic_update.topic_key] = TopicAccumulator(
-                            topic_key=topic_update.topic_key,
-                            topic_title=topic_update.topic_title,
-                            guidelines=f"## Pages {window.pages[0]}-{window.pages[-1]}\n"
-                                       f"{topic_update.guidelines_for_this_chunk}",
-                            source_page_start=window.pages[0],
-                            source_page_end=window.pages[-1],
-                        )
+                for window in windows
+            ]
+            with ThreadPoolExecutor(
+                max_workers=min(chunk_concurrency, len(windows)) or 1,
+                thread_name_prefix="chunk-extract",
+            ) as pool:
+                futures = [
+                    pool.submit(chunk_processor.process_chunk, chunk_input, planned_topics=planned_topics)
+                    for chunk_input in inputs
+                ]
+                for window, chunk_input, future in zip(windows, inputs, futures):
+                    self._update_chunk_progress(job_id, window, total_chunks, completed, failed)
+                    try:
+                        output, error = future.result(), None
+                    except Exception as e:
+                        output, error = None, e
+                    if self._record_chunk(
+                        job_id, chapter_id, window, chunk_input, output, error,
+                        state, planned_topics, s3_run_base, config, chunk_processor,
+                    ):
+                        completed += 1
                     else:
-                        existing = state.topic_guidelines_map.get(topic_update.topic_key)
-                        if existing:
-                            existing.guidelines += (
-                                f"\n\n## Pages {window.pages[0]}-{window.pages[-1]}\n"
-                                f"{topic_update.guidelines_for_this_chunk}"
-                            )
-                            existing.source_page_end = window.pages[-1]
-
-                # Save chunk output to S3
-                self.s3_client.upload_bytes(
-                    json.dumps(output.model_dump(), indent=2).encode("utf-8"),
-                    f"{s3_run_base}/chunks/{chunk_idx_str}/output.json",
-                )
-
-                # Save state snapshot
-                self.s3_client.upload_bytes(
-                    json.dumps(state.model_dump(), indent=2).encode("utf-8"),
-                    f"{s3_run_base}/chunks/{chunk_idx_str}/state_after.json",
-                )
-
-                # Save chunk DB record
-                chunk_record = ChapterChunk(
-                    id=str(uuid.uuid4()),
-                    chapter_id=chapter_id,
-                    processing_job_id=job_id,
-                    chunk_index=chunk_idx,
-                    page_start=window.pages[0],
-                    page_end=window.pages[-1],
-                    previous_page_text=prev_context,
-                    chapter_summary_before=chunk_input.chapter_summary_so_far,
-                    raw_llm_response=json.dumps(output.model_dump()),
-                    topics_detected_json=json.dumps([t.model_dump() for t in output.topics]),
-                    chapter_summary_after=output.updated_chapter_summary,
-                    status="completed",
-                    model_provider=config["provider"],
-                    model_id=config["model_id"],
-                    prompt_hash=chunk_processor.get_prompt_hash(),
-                    completed_at=datetime.utcnow(),
-                )
-                self.chunk_repo.create(chunk_record)
-                completed += 1
-
-            except Exception as e:
-                # Refresh session in case the error was connection-related
-                self._refresh_db_session()
-                # Record failed chunk
-                chunk_record = ChapterChunk(
-                    id=str(uuid.uuid4()),
-                    chapter_id=chapter_id,
-                    processing_job_id=job_id,
-                    chunk_index=chunk_idx,
-                    page_start=window.pages[0],
-                    page_end=window.pages[-1],
-                    status="failed",
-                    error_message=str(e),
-                    model_provider=config["provider"],
-                    model_id=config["model_id"],
+                        failed += 1
+        else:
+            for window in windows:
+                self._update_chunk_progress(job_id, window, total_chunks, completed, failed)
+                chunk_input = self._build_chunk_input(
+                    window, chapter, book_metadata, state, s3_run_base,
                 )
-                self.chunk_repo.create(chunk_record)
-                failed += 1
-                logger.error(f"Chunk {chunk_idx} failed: {e}")
+                try:
+                    output, error = chunk_processor.process_chunk(
+                        chunk_input, planned_topics=planned_topics
+                    ), None
+                except Exception as e:
+                    output, error = None, e
+                if self._record_chunk(
+                    job_id, chapter_id, window, chunk_input, output, error,
+                    state, planned_topics, s3_run_base, config, chunk_processor,
+                ):
+                    completed += 1
+                else:
+                    failed += 1
 
         # Refresh session before batch DB writes
         self._refresh_db_session()
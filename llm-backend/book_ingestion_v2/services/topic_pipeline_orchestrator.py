@@ -15,8 +15,13 @@ We rely on cross-topic parallelism (chapter runner spawns multiple
 orchestrators) for throughput.
 
 Design decisions:
-- Polls by `job_id` returned from `Stage.launch`, not `get_latest_job`.
+- Waits by `job_id` returned from `Stage.launch`, not `get_latest_job`.
   Using `get_latest_job` would race with a freshly-committed job row.
+- Event-driven stage completion. `run_in_background_v2` notifies the job
+  id when it finishes (`chapter_job_notifier`: in-process event, plus
+  Postgres NOTIFY across processes), so the next stage launches at once.
+  The job row is still re-read every `POLL_INTERVAL_SEC` as a fallback and
+  to run the heartbeat / wall-time checks.
 - One DB session per stage call. Mirrors `run_in_background_v2` isolation.
 - Holds no lock itself. Each sub-stage acquires its own per-stage lock via
   the launcher; a concurrent super-button press fails loudly at the sub-stage.
@@ -36,6 +41,9 @@ from book_ingestion_v2.constants import HEARTBEAT_STALE_THRESHOLD
 from book_ingestion_v2.dag.launcher_map import LAUNCHER_BY_STAGE
 from book_ingestion_v2.dag.topic_pipeline_dag import DAG
 from book_ingestion_v2.models.schemas import QualityLevel, StageId
+from book_ingestion_v2.services.chapter_job_notifier import (
+    get_chapter_job_notifier,
+)
 from book_ingestion_v2.services.chapter_job_service import (
     ChapterJobLockError,
     ChapterJobService,
@@ -69,7 +77,10 @@ QUALITY_ROUNDS: dict[QualityLevel, dict[StageId, int]] = {
     },
 }
 
-POLL_INTERVAL_SEC = 5
+# Fallback re-read of the job row. Completion normally wakes the wait
+# immediately via `chapter_job_notifier`; this only bounds the delay when a
+# notification is lost and paces the heartbeat checks below.
+POLL_INTERVAL_SEC = 30
 # Absolute upper bound on polling — pure safety net. Primary stale detection
 # is heartbeat-based via `ChapterJobService.is_job_heartbeat_stale`, which
 # catches a dead backing thread within `HEARTBEAT_STALE_THRESHOLD` (30 min).
@@ -204,7 +215,12 @@ class TopicPipelineOrchestrator:
         return kwargs
 
     def _poll_to_terminal(self, db: Session, job_id: str) -> str:
-        """Poll the stage job's DB row until it reaches a terminal state.
+        """Wait for the stage job's DB row to reach a terminal state.
+
+        Registers with the completion notifier for the whole wait and
+        clears the event before each read of the row, so a job finishing
+        between the read and the wait still wakes it. Without a
+        notification the row is re-read every `POLL_INTERVAL_SEC`.
 
         Two safety nets against orphaned jobs (backing thread died without
         calling `release_lock` — OOM kill, process crash, or a BaseException
@@ -219,56 +235,58 @@ class TopicPipelineOrchestrator:
         """
         job_service = ChapterJobService(db)
         start = time.monotonic()
-        while True:
-            job = job_service.get_job(job_id)
-            if job and job.status in _TERMINAL:
-                logger.info(
-                    f"Pipeline {self.pipeline_run_id} job {job_id} "
-                    f"terminal={job.status}"
-                )
-                return job.status
-
-            if job_service.is_job_heartbeat_stale(job_id):
-                logger.warning(
-                    f"Pipeline {self.pipeline_run_id} job {job_id} "
-                    f"heartbeat stale — marking failed"
-                )
-                try:
-                    job_service.release_lock(
-                        job_id,
-                        status="failed",
-                        error=(
-                            "Heartbeat stale — backing thread likely died without "
-                            "releasing the lock."
-                        ),
+        with get_chapter_job_notifier().watch(job_id, db) as finished:
+            while True:
+                finished.clear()
+                job = job_service.get_job(job_id)
+                if job and job.status in _TERMINAL:
+                    logger.info(
+                        f"Pipeline {self.pipeline_run_id} job {job_id} "
+                        f"terminal={job.status}"
                     )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to release stale job {job_id}: {e}",
-                        exc_info=True,
-                    )
-                return "failed"
+                    return job.status
 
-            if time.monotonic() - start > MAX_POLL_WALL_TIME_SEC:
-                logger.warning(
-                    f"Pipeline {self.pipeline_run_id} job {job_id} "
-                    f"hit absolute poll cap of {MAX_POLL_WALL_TIME_SEC}s — marking failed"
-                )
-                try:
-                    job_service.release_lock(
-                        job_id,
-                        status="failed",
-                        error=(
-                            f"Orchestrator absolute poll cap ({MAX_POLL_WALL_TIME_SEC}s) reached."
-                        ),
+                if job_service.is_job_heartbeat_stale(job_id):
+                    logger.warning(
+                        f"Pipeline {self.pipeline_run_id} job {job_id} "
+                        f"heartbeat stale — marking failed"
                     )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to release capped job {job_id}: {e}",
-                        exc_info=True,
+                    try:
+                        job_service.release_lock(
+                            job_id,
+                            status="failed",
+                            error=(
+                                "Heartbeat stale — backing thread likely died without "
+                                "releasing the lock."
+                            ),
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to release stale job {job_id}: {e}",
+                            exc_info=True,
+                        )
+                    return "failed"
+
+                if time.monotonic() - start > MAX_POLL_WALL_TIME_SEC:
+                    logger.warning(
+                        f"Pipeline {self.pipeline_run_id} job {job_id} "
+                        f"hit absolute poll cap of {MAX_POLL_WALL_TIME_SEC}s — marking failed"
                     )
-                return "failed"
-            time.sleep(POLL_INTERVAL_SEC)
+                    try:
+                        job_service.release_lock(
+                            job_id,
+                            status="failed",
+                            error=(
+                                f"Orchestrator absolute poll cap ({MAX_POLL_WALL_TIME_SEC}s) reached."
+                            ),
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to release capped job {job_id}: {e}",
+                            exc_info=True,
+                        )
+                    return "failed"
+                finished.wait(POLL_INTERVAL_SEC)
 
 
 def run_topic_pipeline_sync(
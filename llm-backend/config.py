@@ -30,6 +30,35 @@ class Settings(BaseSettings):
         description="Connection pool timeout in seconds"
     )
 
+    # Async engine (asyncpg) used by the tutor WebSocket path. Separate pool
+    # so long-lived sockets never compete with sync request handlers.
+    db_async_pool_size: int = Field(
+        default=10,
+        description="Async (asyncpg) database connection pool size"
+    )
+    db_async_max_overflow: int = Field(
+        default=10,
+        description="Maximum overflow connections for the async pool"
+    )
+    db_async_pool_timeout: int = Field(
+        default=30,
+        description="Async connection pool timeout in seconds"
+    )
+
+    # Admin config cache (llm_config / feature_flags). Reads are served from
+    # process memory; the config_versions row is re-checked at most this often.
+    config_cache_ttl_seconds: float = Field(
+        default=5.0,
+        description="Seconds between config_versions checks for cached LLM config / feature flags (0 disables caching)"
+    )
+
+    # Session persistence. When on, sessions.state_json holds only the hot
+    # state and full_conversation_log is appended to session_messages.
+    session_split_message_log: bool = Field(
+        default=True,
+        description="Store the tutor conversation log append-only in session_messages instead of inside state_json"
+    )
+
     # API Configuration
     api_host: str = Field(
         default="0.0.0.0",
@@ -69,6 +98,144 @@ class Settings(BaseSettings):
         description="TTS provider: 'elevenlabs' or 'google_tts'"
     )
 
+    # Offline audio synthesis (AudioGenerationService). Rates are per process
+    # and shared by every topic stage running in it.
+    tts_synthesis_concurrency: int = Field(
+        default=4,
+        description="Clips synthesized at once per provider (and per generate call)"
+    )
+    tts_elevenlabs_requests_per_second: float = Field(
+        default=3.0,
+        description="Max ElevenLabs synthesis requests per second (0 disables pacing)"
+    )
+    tts_google_requests_per_second: float = Field(
+        default=15.0,
+        description="Max Google Cloud TTS synthesis requests per second (0 disables pacing)"
+    )
+
+    # Chapter page OCR (book_ingestion_v2 ocr_worker_pool). Rates are per
+    # process, shared by upload-triggered OCR, retry-ocr and bulk jobs.
+    ocr_concurrency: int = Field(
+        default=8,
+        description="Pages OCR'd at once per provider (worker pool size)"
+    )
+    ocr_openai_requests_per_second: float = Field(
+        default=2.0,
+        description="Max OpenAI Vision OCR requests per second (0 disables pacing)"
+    )
+    ocr_claude_code_requests_per_second: float = Field(
+        default=0.5,
+        description="Max Claude Code CLI OCR calls started per second (0 disables pacing)"
+    )
+
+    # LLM record/replay (shared/services/llm_replay.py). Off in production;
+    # benchmarks and offline runs serve LLMService calls from a JSONL file.
+    llm_replay_mode: str = Field(
+        default="off",
+        description="LLM record/replay: off, record, replay (miss raises) or auto (replay hits, record misses)"
+    )
+    llm_replay_path: str = Field(
+        default="llm-replay.jsonl",
+        description="JSONL file LLM calls are recorded to / replayed from"
+    )
+    llm_replay_latency_ms: float = Field(
+        default=-1,
+        description="Simulated latency per replayed call in ms (-1 uses each call's recorded latency)"
+    )
+    llm_replay_latency_scale: float = Field(
+        default=1.0,
+        description="Multiplier applied to replayed latency (0.01 replays 100x faster)"
+    )
+    llm_replay_match: str = Field(
+        default="exact",
+        description="Replay matching: exact (prompt + params) or schema (fall back to recorded responses with the same schema_name)"
+    )
+
+    # Topic extraction (TopicExtractionOrchestrator). Only plan-guided runs go
+    # parallel; unguided extraction needs each chunk's output for the next.
+    topic_extraction_chunk_concurrency: int = Field(
+        default=4,
+        description="Chunks extracted at once when a chapter topic plan exists (1 keeps strict page order)"
+    )
+
+    # Background jobs (shared/services/job_queue.py): ingestion stages and
+    # practice grading. "thread" runs them on a daemon thread in the API
+    # process; "queue" writes them to background_jobs for `python worker.py`.
+    background_jobs_backend: str = Field(
+        default="thread",
+        description="Where background jobs run: thread (in the API process) or queue (durable queue drained by worker.py)"
+    )
+    job_queue_ingestion_concurrency: int = Field(
+        default=4,
+        description="Ingestion jobs (OCR, extraction, topic stages) run at once per worker process"
+    )
+    job_queue_practice_grading_concurrency: int = Field(
+        default=8,
+        description="Practice grading jobs run at once per worker process"
+    )
+    job_queue_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="Seconds a worker sleeps between claim passes when its queues are idle"
+    )
+    job_queue_visibility_timeout_seconds: int = Field(
+        default=300,
+        description="A running job whose worker heartbeat is older than this is reclaimed (chapter jobs use their own heartbeat)"
+    )
+    job_queue_max_attempts: int = Field(
+        default=3,
+        description="Times a job is tried (including reclaims after a lost worker) before it is marked failed"
+    )
+    job_queue_retry_backoff_seconds: float = Field(
+        default=30.0,
+        description="Delay before the first retry; doubles on each further attempt"
+    )
+
+    # Runtime /text-to-speech audio cache (memory LRU + S3 tier)
+    tts_cache_enabled: bool = Field(
+        default=True,
+        description="Serve repeated /text-to-speech requests from the content-addressed audio cache"
+    )
+    tts_cache_memory_mb: int = Field(
+        default=64,
+        description="Per-process memory budget (MB) for cached TTS audio"
+    )
+    tts_cache_s3_prefix: str = Field(
+        default="tts-cache/",
+        description="S3 key prefix for the shared TTS audio tier (empty disables the S3 tier)"
+    )
+
+    # Student-message translation cache (memory LRU + optional DB tier)
+    translation_cache_enabled: bool = Field(
+        default=True,
+        description="Serve repeated student-message translations from the translation cache"
+    )
+    translation_cache_max_entries: int = Field(
+        default=10000,
+        description="Per-process LRU size for cached translations"
+    )
+    translation_cache_shared: bool = Field(
+        default=False,
+        description="Also read/write translations in the translation_cache table, shared by all workers"
+    )
+
+    # SafetyAgent local pre-classifier + verdict cache
+    safety_local_classifier_enabled: bool = Field(
+        default=True,
+        description="Skip the safety LLM for short messages made only of known-safe lexicon words"
+    )
+    safety_lexicon_max_words: int = Field(
+        default=10,
+        description="Longest message (in words) the lexicon pre-classifier may pass"
+    )
+    safety_lexicon_extra_path: str = Field(
+        default="",
+        description="Optional extra known-safe word list merged into tutor/agents/data/safety_lexicon.txt"
+    )
+    safety_verdict_cache_max_entries: int = Field(
+        default=20000,
+        description="Per-process LRU size for cached safety LLM verdicts (0 disables caching)"
+    )
+
     # Application Settings
     log_level: str = Field(
         default="INFO",
@@ -93,6 +260,34 @@ class Settings(BaseSettings):
         description="S3 bucket name for book storage"
     )
     # AWS credentials are auto-detected from ~/.aws/credentials or environment
+    blob_store_backend: str = Field(
+        default="s3",
+        description="Object storage backend: s3, local (files under blob_store_local_root) or memory"
+    )
+    blob_store_local_root: str = Field(
+        default="./blob-store",
+        description="Root directory for the local blob store backend"
+    )
+    blob_store_public_base_url: str = Field(
+        default="http://localhost:8000/blobs",
+        description="Base URL for objects in the local/memory backends (served by GET /blobs/{key})"
+    )
+    blob_store_signing_key: str = Field(
+        default="",
+        description="HMAC key for local/memory presigned URLs (empty: random per process)"
+    )
+    s3_max_pool_connections: int = Field(
+        default=50,
+        description="HTTP connections botocore keeps open to S3 (shared by all threads)"
+    )
+    s3_max_concurrency: int = Field(
+        default=16,
+        description="Worker threads for S3Client upload_many / download_many / multipart parts"
+    )
+    s3_multipart_threshold_mb: int = Field(
+        default=16,
+        description="Uploads at or above this size (MB) are streamed as multipart uploads"
+    )
 
     # Cognito Configuration (for authentication)
     cognito_user_pool_id: str = Field(
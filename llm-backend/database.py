@@ -4,9 +4,10 @@ Database management layer for PostgreSQL.
 Provides abstraction for database connections, sessions, and health checks.
 """
 
-from contextlib import contextmanager
-from typing import Generator
-from sqlalchemy import create_engine, text, Engine
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
+from sqlalchemy import create_engine, make_url, text, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from config import get_settings
@@ -163,8 +164,163 @@ class DatabaseManager:
         return url
 
 
-# Global database manager instance
+def async_database_url(url: str) -> str:
+    """
+    Rewrite a sync database URL for the matching async driver.
+
+    postgresql[+psycopg2]:// becomes postgresql+asyncpg:// (a libpq
+    ``sslmode`` query parameter is passed on as asyncpg's ``ssl``), and
+    sqlite:// becomes sqlite+aiosqlite://. URLs that already name an async
+    driver are returned unchanged.
+
+    Args:
+        url: Database URL as configured for the sync engine
+
+    Returns:
+        str: Equivalent URL for create_async_engine
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "postgresql" and parsed.get_driver_name() != "asyncpg":
+        query = dict(parsed.query)
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        parsed = parsed.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite" and parsed.get_driver_name() != "aiosqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+class AsyncDatabaseManager:
+    """
+    Manages the asyncio engine and sessions (asyncpg) for async endpoints.
+
+    Same database as DatabaseManager, but its own connection pool, sized by
+    the db_async_* settings. Used where a blocking DB call would stall every
+    other coroutine on the worker's event loop (the tutor WebSocket).
+
+    Sync ORM helpers can be reused unchanged through
+    ``await session.run_sync(fn, *args)``: their I/O is awaited on the
+    asyncpg connection instead of blocking the loop.
+    """
+
+    def __init__(self):
+        """Initialize the async database manager with settings from config."""
+        self.settings = get_settings()
+        self._engine: AsyncEngine | None = None
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        Get or create the async SQLAlchemy engine.
+
+        Returns:
+            AsyncEngine: Async SQLAlchemy engine instance
+        """
+        if self._engine is None:
+            self._engine = self._create_engine()
+        return self._engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """
+        Get or create the async session factory.
+
+        Sessions keep attribute values after commit (expire_on_commit=False):
+        an expired attribute would need a lazy load, which async sessions
+        cannot do implicitly.
+
+        Returns:
+            async_sessionmaker: Async session factory
+        """
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(
+                bind=self.engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+        return self._session_factory
+
+    def _create_engine(self) -> AsyncEngine:
+        """
+        Create the async engine with its own pool settings.
+
+        Returns:
+            AsyncEngine: Configured async SQLAlchemy engine
+        """
+        url = async_database_url(str(self.settings.database_url))
+        logger.info(f"Creating async database engine for: {DatabaseManager._mask_password(url)}")
+
+        options = {}
+        if make_url(url).get_backend_name() != "sqlite":
+            options = {
+                "pool_size": self.settings.db_async_pool_size,
+                "max_overflow": self.settings.db_async_max_overflow,
+                "pool_timeout": self.settings.db_async_pool_timeout,
+                "pool_recycle": 280,  # Recycle connections before server-side idle timeout
+            }
+        engine = create_async_engine(
+            url,
+            pool_pre_ping=True,  # Verify connections before using
+            echo=self.settings.log_level == "DEBUG",  # SQL logging
+            **options,
+        )
+
+        logger.info("Async database engine created successfully")
+        return engine
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Provide a transactional scope for async database operations.
+
+        Usage:
+            async with async_db_manager.session_scope() as session:
+                await session.execute(select(Model))
+
+        Yields:
+            AsyncSession: Async database session
+
+        Raises:
+            Exception: Re-raises any exception after rolling back
+        """
+        async with self.session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Async database transaction failed: {e}")
+                raise
+
+    async def health_check(self) -> bool:
+        """
+        Check database connectivity through the async pool.
+
+        Returns:
+            bool: True if database is accessible, False otherwise
+        """
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.error(f"Async database health check failed: {e}")
+            return False
+
+    async def close(self):
+        """Dispose of the async engine's connections."""
+        if self._engine:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_factory = None
+            logger.info("Async database engine closed")
+
+
+# Global database manager instances
 _db_manager: DatabaseManager | None = None
+_async_db_manager: AsyncDatabaseManager | None = None
 
 
 def get_db_manager() -> DatabaseManager:
@@ -180,6 +336,19 @@ def get_db_manager() -> DatabaseManager:
     return _db_manager
 
 
+def get_async_db_manager() -> AsyncDatabaseManager:
+    """
+    Get or create the global async database manager instance.
+
+    Returns:
+        AsyncDatabaseManager: Async database manager
+    """
+    global _async_db_manager
+    if _async_db_manager is None:
+        _async_db_manager = AsyncDatabaseManager()
+    return _async_db_manager
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency injection for FastAPI endpoints.
@@ -200,9 +369,38 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency injection for async FastAPI endpoints.
+
+    Usage:
+        @app.get("/")
+        async def endpoint(db: AsyncSession = Depends(get_async_db)):
+            return (await db.scalars(select(Model))).all()
+
+    Yields:
+        AsyncSession: Async database session
+    """
+    async with get_async_db_manager().session_factory() as session:
+        yield session
+
+
 def reset_db_manager():
     """Reset the global database manager (useful for testing)."""
     global _db_manager
     if _db_manager:
         _db_manager.close()
     _db_manager = None
+
+
+def reset_async_db_manager():
+    """
+    Reset the global async database manager (useful for testing).
+
+    Pooled connections are dropped without awaiting a graceful close; call
+    ``await get_async_db_manager().close()`` first from async code.
+    """
+    global _async_db_manager
+    if _async_db_manager and _async_db_manager._engine:
+        _async_db_manager._engine.sync_engine.dispose(close=False)
+    _async_db_manager = None
@@ -169,6 +169,9 @@ def migrate():
         # Add reasoning_effort column to llm_config (idempotent)
         _apply_llm_config_reasoning_effort_column(db_manager)
 
+        # Denormalized session summary columns (values: --backfill-session-summaries)
+        _apply_session_summary_columns(db_manager)
+
         # Seed LLM config defaults (only if table is empty)
         _seed_llm_config(db_manager)
 
@@ -965,6 +968,163 @@ def _apply_sessions_teach_me_mode_column(db_manager):
         print("  ✓ paused-session unique index rebuilt with teach_me_mode")
 
 
+_SESSION_SUMMARY_COLUMNS = [
+    ("topic_id", "VARCHAR"),
+    ("topic_name", "VARCHAR"),
+    ("message_count", "INTEGER"),
+    ("is_complete", "BOOLEAN"),
+    ("coverage", "FLOAT"),
+    ("concepts_covered", "JSONB"),
+    ("plan_concepts", "JSONB"),
+    ("concepts_discussed", "JSONB"),
+    ("summary_version", "INTEGER"),
+]
+
+
+def _apply_session_summary_columns(db_manager):
+    """Add denormalized summary columns + history indexes to sessions (idempotent).
+
+    Rows written before this migration keep NULL summary_version and are
+    summarized from state_json at read time until backfilled.
+    """
+    inspector = inspect(db_manager.engine)
+    existing_columns = {col["name"] for col in inspector.get_columns("sessions")}
+
+    with db_manager.engine.connect() as conn:
+        for name, sql_type in _SESSION_SUMMARY_COLUMNS:
+            if name not in existing_columns:
+                print(f"  Adding {name} column to sessions...")
+                conn.execute(text(f"ALTER TABLE sessions ADD COLUMN {name} {sql_type}"))
+                print(f"  ✓ {name} column added")
+
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_session_user_created ON sessions(user_id, created_at)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_session_user_topic ON sessions(user_id, topic_id)"
+        ))
+        conn.commit()
+
+
+def backfill_session_summaries(batch_size: int = 500) -> int:
+    """Populate session summary columns from state_json for rows that lack them.
+
+    Walks sessions whose summary_version is missing or outdated in id order,
+    one batch per transaction. Each update is guarded by the state_version
+    that was read, so a concurrent tutor save (which writes its own summary)
+    is never overwritten. Also fills a NULL `subject` from the state's topic.
+    Safe to re-run; returns the number of rows updated.
+    """
+    import json
+    from sqlalchemy import or_, update
+    from shared.models.entities import Session as SessionModel
+    from shared.repositories.session_message_repository import SessionMessageRepository
+    from tutor.services.session_state_store import SESSION_SUMMARY_VERSION, summarize_state_dict
+
+    db_manager = get_db_manager()
+    db = db_manager.session_factory()
+    updated = skipped = 0
+    last_id = ""
+    try:
+        while True:
+            rows = (
+                db.query(
+                    SessionModel.id,
+                    SessionModel.state_json,
+                    SessionModel.state_version,
+                    SessionModel.subject,
+                )
+                .filter(
+                    SessionModel.id > last_id,
+                    or_(
+                        SessionModel.summary_version.is_(None),
+                        SessionModel.summary_version < SESSION_SUMMARY_VERSION,
+                    ),
+                )
+                .order_by(SessionModel.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            logged = SessionMessageRepository(db).count_by_session(r.id for r in rows)
+            for row in rows:
+                try:
+                    state = json.loads(row.state_json)
+                except (json.JSONDecodeError, TypeError):
+                    state = None
+                if not isinstance(state, dict):
+                    skipped += 1
+                    continue
+
+                values = summarize_state_dict(state, logged.get(row.id))
+                topic = state.get("topic")
+                if row.subject is None and isinstance(topic, dict) and topic.get("subject"):
+                    values["subject"] = topic["subject"]
+
+                result = db.execute(
+                    update(SessionModel)
+                    .where(
+                        SessionModel.id == row.id,
+                        SessionModel.state_version == row.state_version,
+                    )
+                    .values(**values)
+                )
+                updated += result.rowcount
+            db.commit()
+            print(f"  … {updated} session(s) summarized so far")
+    finally:
+        db.close()
+
+    print(f"✓ Session summaries backfilled: {updated} updated, {skipped} unreadable state_json skipped")
+    return updated
+
+
+def rebuild_report_cards(verify_only: bool = False) -> int:
+    """Rebuild (or, with verify_only, check) every student's report-card rows.
+
+    Covers each user with a session or a graded practice attempt. Rebuilding
+    replaces the user's `student_topic_progress` rows with a from-scratch
+    aggregate; verifying compares the materialized views with the
+    from-scratch computation and writes nothing (beyond building students
+    who were never materialized). Returns the number of users rebuilt, or
+    with verify_only the number with mismatches.
+    """
+    from shared.models.entities import PracticeAttempt, Session as SessionModel
+    from tutor.services.report_card_service import ReportCardService
+
+    db_manager = get_db_manager()
+    db = db_manager.session_factory()
+    count = 0
+    try:
+        user_ids = {
+            uid for (uid,) in db.query(SessionModel.user_id).filter(SessionModel.user_id.isnot(None)).distinct()
+        } | {
+            uid for (uid,) in db.query(PracticeAttempt.user_id)
+            .filter(PracticeAttempt.status == "graded").distinct()
+        }
+        service = ReportCardService(db)
+        for user_id in sorted(user_ids):
+            if verify_only:
+                mismatches = service.verify(user_id)
+                if mismatches:
+                    count += 1
+                    print(f"  ✗ {user_id}: {', '.join(mismatches)} differ")
+            else:
+                service.rebuild(user_id)
+                count += 1
+    finally:
+        db.close()
+
+    if verify_only:
+        print(f"✓ Report cards verified: {len(user_ids)} user(s), {count} mismatched")
+    else:
+        print(f"✓ Report cards rebuilt for {count} user(s)")
+    return count
+
+
 def _ensure_llm_config(db_manager, component_key, provider, model_id, description,
                        reasoning_effort: str = "max"):
     """Insert an LLM config entry if the component_key is missing.
@@ -1151,12 +1311,33 @@ def _seed_feature_flags(db_manager):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Database management CLI")
     parser.add_argument("--migrate", action="store_true", help="Create database tables")
+    parser.add_argument(
+        "--backfill-session-summaries", action="store_true",
+        help="Populate sessions summary columns from state_json",
+    )
+    parser.add_argument(
+        "--rebuild-report-cards", action="store_true",
+        help="Rebuild every student's materialized report-card rows",
+    )
+    parser.add_argument(
+        "--verify-report-cards", action="store_true",
+        help="Compare materialized report cards with a from-scratch computation",
+    )
 
     args = parser.parse_args()
 
     if args.migrate:
         migrate()
+    elif args.backfill_session_summaries:
+        backfill_session_summaries()
+    elif args.rebuild_report_cards:
+        rebuild_report_cards()
+    elif args.verify_report_cards:
+        sys.exit(1 if rebuild_report_cards(verify_only=True) else 0)
     else:
         print("Usage:")
-        print("  python db.py --migrate  # Create tables")
+        print("  python db.py --migrate                     # Create tables")
+        print("  python db.py --backfill-session-summaries  # Summarize pre-existing sessions")
+        print("  python db.py --rebuild-report-cards        # Rebuild materialized report cards")
+        print("  python db.py --verify-report-cards         # Check report cards against sessions")
         sys.exit(1)
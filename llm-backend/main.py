@@ -9,12 +9,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import get_settings, validate_required_settings
-from database import get_db_manager
+from database import get_async_db_manager, get_db_manager
 from shared.api import health
 from shared.api import llm_config_routes
 from shared.api import tts_config_routes
 from shared.api import feature_flag_routes
 from shared.api import issue_routes
+from shared.api import blob_routes
 from tutor.api import curriculum, practice, sessions, transcription, tts
 from autoresearch.tutor_teaching_quality.evaluation.api import router as evaluation_router
 from auth.api.auth_routes import router as auth_router
@@ -127,6 +128,8 @@ app.include_router(v2_sync_routes.router)        # Book Ingestion V2: sync + res
 app.include_router(v2_visual_preview_routes.router)  # Book Ingestion V2: visual preview store
 app.include_router(v2_dag_routes.router)             # Book Ingestion V2: topic DAG cascade (Phase 3)
 app.include_router(issue_routes.router)          # Issue reporting: /issues/*
+if settings.blob_store_backend != "s3":
+    app.include_router(blob_routes.router)       # Local/memory blob store: GET /blobs/{key}
 
 
 @app.on_event("startup")
@@ -145,6 +148,12 @@ async def startup_event():
     logger.info("Application started successfully")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Dispose of the async (WebSocket) connection pool."""
+    await get_async_db_manager().close()
+
+
 if __name__ == "__main__":
     import uvicorn
     settings = get_settings()
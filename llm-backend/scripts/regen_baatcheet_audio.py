@@ -1,13 +1,16 @@
 """Regenerate Baatcheet dialogue audio (Stage 10) for a list of guideline IDs.
 
-Calls `AudioGenerationService.generate_for_topic_dialogue(force=True)` on each
-dialogue so every line's MP3 is re-synthesized. S3 keys are deterministic per
-(guideline, card_id, line_idx) so writes overwrite cleanly at the same URL —
-the runtime player picks up the fresh audio on next play.
+Calls `AudioGenerationService.generate_for_topic_dialogue` on each dialogue.
+Only clips whose content hash (normalized text, voice, emotion, provider)
+changed — or that have no audio yet — are re-synthesized, so re-running after
+a text edit or a provider switch re-voices just the diff. `--force`
+re-voices every clip regardless of hash. S3 keys are deterministic
+per (guideline, card_id, line_idx) so writes overwrite cleanly at the same
+URL — the runtime player picks up the fresh audio on next play.
 
 Usage:
     cd llm-backend && venv/bin/python scripts/regen_baatcheet_audio.py \\
-        <guideline_id> [<guideline_id> ...]
+        [--force] <guideline_id> [<guideline_id> ...]
 """
 import argparse
 import sys
@@ -27,6 +30,10 @@ from book_ingestion_v2.services.audio_generation_service import AudioGenerationS
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("guideline_ids", nargs="+")
+    ap.add_argument(
+        "--force", action="store_true",
+        help="re-voice every clip, even ones whose content hash matches",
+    )
     args = ap.parse_args()
 
     db = get_db_manager()
@@ -56,7 +63,7 @@ def main():
             print(f"[{gid}] {label!r}")
             print(f"  before: {with_audio}/{total} clips have audio_url")
 
-            updated = svc.generate_for_topic_dialogue(dialogue, force=True)
+            updated = svc.generate_for_topic_dialogue(dialogue, force=args.force)
             if updated is not None:
                 dialogue.cards_json = updated
                 attributes.flag_modified(dialogue, "cards_json")
@@ -0,0 +1,45 @@
+"""Serve objects from the local / in-memory blob store backends.
+
+With `local` or `memory`, `public_url()` points here so audio URLs and
+page-image links work on a single box without S3. main.py mounts the
+router only for those backends (the S3 bucket serves its own objects).
+The frontend loads these URLs with plain fetch() and <img src>, so there is
+no bearer token. Access mirrors the bucket instead: keys under
+PUBLIC_PREFIXES (audio) are open, and every other key (page images, issue
+screenshots) needs the signed, expiring URL from `get_presigned_url()`.
+"""
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, Response
+
+from shared.utils.blob_store import (
+    LocalBlobStore,
+    MemoryBlobStore,
+    get_blob_store,
+    guess_content_type,
+    is_public_key,
+)
+
+router = APIRouter(tags=["blobs"])
+
+
+@router.get("/blobs/{key:path}")
+def get_blob(key: str, exp: Optional[int] = None, sig: Optional[str] = None):
+    store = get_blob_store()
+    if not isinstance(store, (LocalBlobStore, MemoryBlobStore)):
+        raise HTTPException(status_code=404, detail="Not found")
+    if not is_public_key(key) and not store.verify_presigned(key, exp, sig):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    if isinstance(store, LocalBlobStore):
+        try:
+            path = store.path_for(key)
+        except ValueError:
+            raise HTTPException(status_code=404, detail="Not found")
+        if not path.is_file():
+            raise HTTPException(status_code=404, detail="Not found")
+        return FileResponse(path, media_type=guess_content_type(key))
+    data = store.download_bytes_if_exists(key)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    return Response(data, media_type=store.content_types.get(key) or guess_content_type(key))
@@ -45,6 +45,54 @@ def get_model_config(db: DBSession = Depends(get_db)):
     return result
 
 
+@router.get("/health/llm-clients")
+def llm_client_pool_stats():
+    """Process-wide LLM client registry stats — pool hits vs. constructions."""
+    from shared.services.llm_client_registry import get_llm_client_registry
+
+    return get_llm_client_registry().stats()
+
+
+@router.get("/health/config-cache")
+def config_cache_stats():
+    """In-process LLM config / feature flag cache stats."""
+    from shared.services.config_cache import get_config_cache
+
+    return get_config_cache().stats()
+
+
+@router.get("/health/tts-cache")
+def tts_cache_stats():
+    """Runtime TTS audio cache stats — hit rate and provider bytes saved."""
+    from shared.services.tts_audio_cache import get_tts_audio_cache
+
+    return get_tts_audio_cache().stats()
+
+
+@router.get("/health/translation-cache")
+def translation_cache_stats():
+    """Student-message translation stats — local skips, cache hits, LLM calls."""
+    from tutor.services.translation_cache import get_translation_cache
+
+    return get_translation_cache().stats()
+
+
+@router.get("/health/safety")
+def safety_stats():
+    """SafetyAgent tier counters — local skips, verdict cache hits, LLM calls."""
+    from tutor.agents.safety_classifier import get_safety_verdict_cache
+
+    return get_safety_verdict_cache().stats()
+
+
+@router.get("/health/ocr-pool")
+def ocr_pool_stats():
+    """Chapter page OCR worker pool — in-flight pages and outcome counters."""
+    from book_ingestion_v2.services.ocr_worker_pool import get_ocr_worker_pool
+
+    return get_ocr_worker_pool().stats()
+
+
 @router.get("/health/db")
 def database_health(db: DBSession = Depends(get_db)):
     """Database health check."""
@@ -49,7 +49,7 @@ class Session(Base):
     id = Column(String, primary_key=True)
     student_json = Column(Text, nullable=False)  # JSON: {id, grade, prefs}
     goal_json = Column(Text, nullable=False)     # JSON: {topic, syllabus, learning_objectives}
-    state_json = Column(Text, nullable=False)    # Full TutorState serialized
+    state_json = Column(Text, nullable=False)    # SessionState minus full_conversation_log (see session_messages)
     mastery = Column(Float, default=0.0)  # Matches production database column name
     step_idx = Column(Integer, default=0)
     user_id = Column(String, ForeignKey("users.id"), nullable=True)
@@ -62,14 +62,49 @@ class Session(Base):
     guideline_id = Column(String, nullable=True)
     state_version = Column(Integer, default=1, nullable=False)
 
+    # Denormalized summary of the session state for history / report-card
+    # reads. Written with every state save (tutor/services/session_state_store.py);
+    # NULL summary_version = row predates the columns (see db.py --backfill-session-summaries).
+    topic_id = Column(String, nullable=True)
+    topic_name = Column(String, nullable=True)
+    message_count = Column(Integer, nullable=True)
+    is_complete = Column(Boolean, nullable=True)
+    coverage = Column(Float, nullable=True)
+    concepts_covered = Column(JSONB, nullable=True)     # string[]
+    plan_concepts = Column(JSONB, nullable=True)        # string[] (mastery_estimates keys)
+    concepts_discussed = Column(JSONB, nullable=True)   # string[] (clarify_doubts)
+    summary_version = Column(Integer, nullable=True)
+
     events = relationship("Event", back_populates="session", cascade="all, delete-orphan")
+    messages = relationship("SessionMessage", back_populates="session", cascade="all, delete-orphan")
     user = relationship("User", back_populates="sessions")
 
     __table_args__ = (
         Index("idx_session_user_guideline", "user_id", "guideline_id", "mode"),
+        Index("idx_session_user_created", "user_id", "created_at"),
+        Index("idx_session_user_topic", "user_id", "topic_id"),
     )
 
 
+class SessionMessage(Base):
+    """Append-only conversation log - one row per SessionState.full_conversation_log entry.
+
+    Rows are only ever inserted, in the same transaction as the version-checked
+    sessions update, so (session_id, seq) mirrors the in-memory log order.
+    """
+    __tablename__ = "session_messages"
+
+    session_id = Column(String, ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)  # 0-based position in full_conversation_log
+    role = Column(String, nullable=False)  # 'student' | 'teacher'
+    content = Column(Text, nullable=False)
+    audio_text = Column(Text, nullable=True)
+    message_id = Column(String, nullable=True)
+    timestamp = Column(DateTime, nullable=False)
+
+    session = relationship("Session", back_populates="messages")
+
+
 class Event(Base):
     """Event log - tracks each node execution."""
     __tablename__ = "events"
@@ -295,6 +330,69 @@ class FeatureFlag(Base):
     updated_by = Column(String, nullable=True)
 
 
+class ConfigVersion(Base):
+    """Per-namespace change counter for admin-managed config tables.
+
+    Bumped in the same transaction as every admin write to `llm_config` or
+    `feature_flags`. Worker processes poll one row per namespace (not one
+    query per key) to notice that their in-process config cache is stale.
+    """
+    __tablename__ = "config_versions"
+
+    namespace = Column(String, primary_key=True)  # "llm_config" | "feature_flags"
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class TranslationCacheEntry(Base):
+    """Shared tier of the student-message translation cache.
+
+    Keyed by a hash of the normalized message and the translation prompt
+    (tutor/services/translation_cache.py). Rows are immutable; a prompt
+    edit simply starts writing new keys.
+    """
+    __tablename__ = "translation_cache"
+
+    key = Column(String, primary_key=True)
+    english = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class BackgroundJob(Base):
+    """One queued unit of background work (shared/services/job_queue.py).
+
+    Written by API nodes, claimed by `worker.py` processes with
+    `SELECT ... FOR UPDATE SKIP LOCKED`. `entity_id` names the row the task
+    works on (a chapter_processing_jobs id, a practice attempt id) so a
+    task's lease and "is it still queued?" checks can find it.
+
+    State machine: queued → running → done | failed (running → queued again
+    on a retryable failure or a reclaimed lease).
+    """
+    __tablename__ = "background_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid4()))
+    queue = Column(String, nullable=False)
+    task = Column(String, nullable=False)
+    args_json = Column(Text, nullable=False, default="[]")
+    entity_id = Column(String, nullable=True)
+    status = Column(String, nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    worker_id = Column(String, nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_background_jobs_claim", "queue", "status", "available_at"),
+        Index("idx_background_jobs_entity", "entity_id"),
+    )
+
+
 class TopicExplanation(Base):
     """Pre-computed explanation variants for teaching guidelines.
 
@@ -366,6 +464,45 @@ class StudentTopicCards(Base):
     )
 
 
+class StudentTopicProgress(Base):
+    """Materialized report-card aggregate per (student, guideline).
+
+    Derived from the student's session summary columns and graded practice
+    attempts (tutor/services/report_card_service.py). Refreshed when a
+    session's progress fields change or an attempt is graded; rebuilt with
+    `python db.py --rebuild-report-cards`.
+    """
+    __tablename__ = "student_topic_progress"
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    guideline_id = Column(String, primary_key=True)  # sessions' topic_id; no FK — guidelines can be resynced away
+    subject = Column(String, nullable=True)
+    topic_name = Column(String, nullable=True)         # from the latest session (hierarchy fallback)
+    session_count = Column(Integer, nullable=False, default=0)
+    teach_me_session_count = Column(Integer, nullable=False, default=0)
+    concepts_covered = Column(JSONB, nullable=True)    # union over teach_me sessions
+    plan_concepts = Column(JSONB, nullable=True)       # latest non-empty teach_me plan
+    last_studied = Column(DateTime, nullable=True)     # latest teach_me session created_at
+    last_session_at = Column(DateTime, nullable=True)  # latest session created_at (any mode)
+    latest_practice_score = Column(Float, nullable=True)
+    latest_practice_total = Column(Integer, nullable=True)
+    practice_attempt_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class StudentProgressBuild(Base):
+    """Marks a student's student_topic_progress rows as fully materialized.
+
+    Incremental refreshes only run for built students; everyone else is
+    built from scratch on their first report-card read.
+    """
+    __tablename__ = "student_progress_builds"
+
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False)
+    built_at = Column(DateTime, default=datetime.utcnow)
+
+
 class Issue(Base):
     """User-reported issues tracked by status."""
     __tablename__ = "issues"
@@ -7,3 +7,4 @@ from shared.repositories.book_repository import BookRepository
 from shared.repositories.explanation_repository import ExplanationRepository
 from shared.repositories.practice_question_repository import PracticeQuestionRepository
 from shared.repositories.practice_attempt_repository import PracticeAttemptRepository
+from shared.repositories.session_message_repository import SessionMessageRepository
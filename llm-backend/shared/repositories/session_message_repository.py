@@ -0,0 +1,71 @@
+"""Session message log data access layer."""
+from typing import Dict, Iterable, List
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session as DBSession
+
+from shared.models import SessionMessage
+
+
+class SessionMessageRepository:
+    """Repository for the append-only `session_messages` log.
+
+    Writes do not commit — they run inside the caller's session-state
+    transaction so the log and the version-checked `sessions` row move
+    together.
+    """
+
+    def __init__(self, db: DBSession):
+        self.db = db
+
+    def count(self, session_id: str) -> int:
+        """Number of messages already persisted for a session."""
+        return (
+            self.db.query(func.count(SessionMessage.seq))
+            .filter(SessionMessage.session_id == session_id)
+            .scalar()
+        ) or 0
+
+    def count_by_session(self, session_ids: Iterable[str]) -> Dict[str, int]:
+        """Message counts for many sessions in one query (missing ids -> absent)."""
+        ids = list(session_ids)
+        if not ids:
+            return {}
+        rows = (
+            self.db.query(SessionMessage.session_id, func.count(SessionMessage.seq))
+            .filter(SessionMessage.session_id.in_(ids))
+            .group_by(SessionMessage.session_id)
+            .all()
+        )
+        return {session_id: count for session_id, count in rows}
+
+    def get_for_session(self, session_id: str) -> List[SessionMessage]:
+        """All messages for a session in log order."""
+        return (
+            self.db.query(SessionMessage)
+            .filter(SessionMessage.session_id == session_id)
+            .order_by(SessionMessage.seq)
+            .all()
+        )
+
+    def append(self, session_id: str, start_seq: int, messages: list) -> None:
+        """
+        Stage new log rows starting at `start_seq`. Caller commits.
+
+        Args:
+            session_id: Session identifier
+            start_seq: Sequence number of the first message (= rows already stored)
+            messages: tutor Message models, in log order
+        """
+        self.db.add_all([
+            SessionMessage(
+                session_id=session_id,
+                seq=start_seq + offset,
+                role=msg.role,
+                content=msg.content,
+                audio_text=msg.audio_text,
+                message_id=msg.message_id,
+                timestamp=msg.timestamp,
+            )
+            for offset, msg in enumerate(messages)
+        ])
@@ -1,11 +1,10 @@
 """Session data access layer."""
-import json
 import logging
 from typing import Optional
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.orm import Session as DBSession, defer
 from datetime import datetime
 
-from shared.models import Session as SessionModel, TutorState
+from shared.models import Session as SessionModel, StudentProgressBuild, TutorState
 
 logger = logging.getLogger(__name__)
 
@@ -76,34 +75,22 @@ class SessionRepository:
 
     def list_all(self) -> list[dict]:
         """Return lightweight session summaries for all sessions."""
+        from tutor.services.session_state_store import read_session_summary
+
         rows = (
             self.db.query(SessionModel)
+            .options(defer(SessionModel.state_json))
             .order_by(SessionModel.created_at.desc())
             .all()
         )
         results = []
         for row in rows:
-            try:
-                state = json.loads(row.state_json)
-            except Exception:
-                state = {}
-
-            # Extract topic name
-            topic_name = None
-            topic = state.get("topic")
-            if topic:
-                topic_name = topic.get("topic_name") or topic.get("name")
-
-            # Message count: prefer full_conversation_log, fall back to conversation_history
-            full_log = state.get("full_conversation_log", [])
-            conv_history = state.get("conversation_history", [])
-            message_count = len(full_log) if full_log else len(conv_history)
-
+            summary = read_session_summary(self.db, row) or {}
             results.append({
                 "session_id": row.id,
                 "created_at": row.created_at.isoformat() if row.created_at else None,
-                "topic_name": topic_name,
-                "message_count": message_count,
+                "topic_name": summary.get("topic_name"),
+                "message_count": summary.get("message_count") or 0,
                 "mastery": row.mastery or 0.0,
             })
         return results
@@ -111,30 +98,28 @@ class SessionRepository:
     def list_by_user(self, user_id: str, subject: Optional[str] = None,
                      offset: int = 0, limit: int = 20) -> list[dict]:
         """List sessions for a specific user, with optional subject filter."""
-        query = self.db.query(SessionModel).filter(SessionModel.user_id == user_id)
+        from tutor.services.session_state_store import read_session_summary
+
+        query = (
+            self.db.query(SessionModel)
+            .options(defer(SessionModel.state_json))
+            .filter(SessionModel.user_id == user_id)
+        )
         if subject:
             query = query.filter(SessionModel.subject == subject)
         rows = query.order_by(SessionModel.created_at.desc()).offset(offset).limit(limit).all()
 
         results = []
         for row in rows:
-            try:
-                state = json.loads(row.state_json)
-            except Exception:
-                state = {}
-
-            topic_name = None
-            topic = state.get("topic")
-            if topic:
-                topic_name = topic.get("topic_name") or topic.get("name")
+            summary = read_session_summary(self.db, row) or {}
 
             # Mode-specific fields
-            mode = state.get("mode", "teach_me")
+            mode = summary.get("mode", "teach_me")
             entry = {
                 "session_id": row.id,
                 "created_at": row.created_at.isoformat() if row.created_at else None,
                 "updated_at": row.updated_at.isoformat() if row.updated_at else None,
-                "topic_name": topic_name,
+                "topic_name": summary.get("topic_name"),
                 "subject": row.subject,
                 "mastery": row.mastery or 0.0,
                 "step_idx": row.step_idx or 0,
@@ -142,18 +127,9 @@ class SessionRepository:
             }
 
             if mode == "teach_me":
-                # coverage_percentage is a computed @property, not serialized.
-                # Compute from persisted primitives.
-                covered_set = set(state.get("concepts_covered_set", []))
-                plan = (topic or {}).get("study_plan", {})
-                plan_steps = plan.get("steps", [])
-                all_concepts = [s.get("concept") for s in plan_steps if s.get("concept")]
-                if all_concepts:
-                    entry["coverage"] = round(len(covered_set & set(all_concepts)) / len(all_concepts) * 100, 1)
-                else:
-                    entry["coverage"] = 0
+                entry["coverage"] = summary.get("coverage") or 0
             elif mode == "clarify_doubts":
-                entry["concepts_discussed"] = state.get("concepts_discussed", [])
+                entry["concepts_discussed"] = summary.get("concepts_discussed", [])
 
             results.append(entry)
         return results
@@ -194,13 +170,15 @@ class SessionRepository:
     ) -> list[dict]:
         """List sessions for a user+guideline, optionally filtered by mode and completion.
 
-        Uses SessionState.is_complete as the single source of truth for completion
-        across teach_me and clarify_doubts modes.
+        Completion comes from the `is_complete` summary column, which is
+        SessionState.is_complete captured at save time — the single source
+        of truth across teach_me and clarify_doubts modes.
         """
-        from tutor.models.session_state import SessionState
+        from tutor.services.session_state_store import read_session_summary
 
         query = (
             self.db.query(SessionModel)
+            .options(defer(SessionModel.state_json))
             .filter(SessionModel.user_id == user_id, SessionModel.guideline_id == guideline_id)
         )
         if mode:
@@ -211,29 +189,28 @@ class SessionRepository:
         canonical_concepts = self._get_canonical_concepts(guideline_id)
 
         for row in rows:
-            try:
-                session_state = SessionState.model_validate_json(row.state_json)
-            except Exception:
+            summary = read_session_summary(self.db, row)
+            if summary is None or summary["is_complete"] is None:
                 logger.warning("Skipping session %s: cannot parse state_json", row.id)
                 continue
 
-            is_complete = session_state.is_complete
+            is_complete = summary["is_complete"]
 
             if finished_only and not is_complete:
                 continue
 
             coverage = None
-            if session_state.mode == "teach_me":
+            if summary["mode"] == "teach_me":
                 coverage = self._compute_coverage(
-                    session_state.concepts_covered_set, canonical_concepts
+                    set(summary["concepts_covered"]), canonical_concepts
                 )
 
             results.append({
                 "session_id": row.id,
-                "mode": session_state.mode,
+                "mode": summary["mode"],
                 "teach_me_mode": (
-                    session_state.teach_me_mode
-                    if session_state.mode == "teach_me" else None
+                    summary["teach_me_mode"]
+                    if summary["mode"] == "teach_me" else None
                 ),
                 "created_at": row.created_at.isoformat() if row.created_at else None,
                 "is_complete": is_complete,
@@ -249,10 +226,11 @@ class SessionRepository:
         exists (practice-only users get 0% coverage until they also do Teach
         Me — acceptable).
         """
-        from tutor.models.session_state import SessionState
+        from tutor.services.session_state_store import read_session_summary
 
         teach_me_row = (
             self.db.query(SessionModel)
+            .options(defer(SessionModel.state_json))
             .filter(
                 SessionModel.guideline_id == guideline_id,
                 SessionModel.mode == "teach_me",
@@ -261,11 +239,9 @@ class SessionRepository:
             .first()
         )
         if teach_me_row:
-            try:
-                state = SessionState.model_validate_json(teach_me_row.state_json)
-                return list(state.mastery_estimates.keys())
-            except Exception:
-                pass
+            summary = read_session_summary(self.db, teach_me_row)
+            if summary and summary["is_complete"] is not None:
+                return list(summary["plan_concepts"])
         return []
 
     @staticmethod
@@ -280,6 +256,9 @@ class SessionRepository:
         """
         Delete a session.
 
+        Also drops the owner's report-card build marker so their
+        `student_topic_progress` rows are rebuilt on the next read.
+
         Args:
             session_id: Session identifier
 
@@ -288,6 +267,10 @@ class SessionRepository:
         """
         session = self.get_by_id(session_id)
         if session:
+            if session.user_id:
+                self.db.query(StudentProgressBuild).filter(
+                    StudentProgressBuild.user_id == session.user_id
+                ).delete(synchronize_session=False)
             self.db.delete(session)
             self.db.commit()
             return True
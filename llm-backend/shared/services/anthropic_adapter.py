@@ -13,9 +13,11 @@ Handles:
 
 import json
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, AsyncGenerator, Generator
 
 import anthropic
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -49,10 +51,33 @@ THINKING_BUDGET_MAP = {
 class AnthropicAdapter:
     """Adapter that translates OpenAI-style calls to Anthropic's Messages API."""
 
-    def __init__(self, api_key: str, timeout: int = 60, model: str = DEFAULT_CLAUDE_MODEL):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 60,
+        model: str = DEFAULT_CLAUDE_MODEL,
+        pool_limits: Optional[httpx.Limits] = None,
+    ):
         self.model = model
+        self._api_key = api_key
+        self._timeout = timeout
+        self._pool_limits = pool_limits
         self.client = anthropic.Anthropic(api_key=api_key, timeout=timeout)
-        self.async_client = anthropic.AsyncAnthropic(api_key=api_key, timeout=timeout)
+        self.async_client = self.build_async_client()
+
+    def build_async_client(self):
+        """Build a fresh AsyncAnthropic on the adapter's pool limits.
+
+        LLMService builds one per event loop and passes it to the async
+        methods via `client=`; `self.async_client` is the default otherwise.
+        """
+        if self._pool_limits is None:
+            return anthropic.AsyncAnthropic(api_key=self._api_key, timeout=self._timeout)
+        return anthropic.AsyncAnthropic(
+            api_key=self._api_key,
+            timeout=self._timeout,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=self._pool_limits),
+        )
 
     def _uses_adaptive_thinking(self) -> bool:
         """Whether this model uses adaptive thinking + the effort parameter.
@@ -186,10 +211,17 @@ class AnthropicAdapter:
         json_mode: bool = True,
         json_schema: Optional[Dict[str, Any]] = None,
         schema_name: str = "response",
+        client: Any = None,
     ) -> Dict[str, Any]:
         """Async call to Claude, returning the standard output dict."""
         kwargs = self._build_kwargs(prompt, reasoning_effort, json_mode, json_schema, schema_name)
-        response = await self.async_client.messages.create(**kwargs)
+        try:
+            response = await (client or self.async_client).messages.create(**kwargs)
+        except anthropic.APIStatusError as e:
+            logger.error(
+                f"Anthropic API error ({type(e).__name__}): status={e.status_code} {e.message}"
+            )
+            raise
         return self._parse_response(response, json_mode, json_schema)
 
     def call_sync(
@@ -211,6 +243,40 @@ class AnthropicAdapter:
             raise
         return self._parse_response(response, json_mode, json_schema)
 
+    @staticmethod
+    def _stream_delta(event: Any, current_block_type: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+        """Map one stream event to (new_block_type, text_to_yield).
+
+        Tracks content block types so thinking-block deltas (internal
+        reasoning) are never yielded. For tool_use (json_schema) responses the
+        JSON input delta is yielded; for text responses the text delta.
+        """
+        event_type = getattr(event, 'type', None)
+        if event_type == 'content_block_start':
+            block = getattr(event, 'content_block', None)
+            return (getattr(block, 'type', None) if block else None), None
+        if event_type == 'content_block_stop':
+            return None, None
+        if event_type == 'content_block_delta' and current_block_type != 'thinking':
+            delta = getattr(event, 'delta', None)
+            if delta:
+                if hasattr(delta, 'text'):
+                    return current_block_type, delta.text
+                if hasattr(delta, 'partial_json'):
+                    return current_block_type, delta.partial_json
+        return current_block_type, None
+
+    def _log_stream(self, status: str, start_time: float, total_chars: int = 0) -> None:
+        entry: Dict[str, Any] = {
+            "step": "LLM_CALL_STREAM",
+            "status": status,
+            "model": self.model,
+        }
+        if status == "complete":
+            entry["output"] = {"response_length": total_chars}
+            entry["duration_ms"] = int((time.time() - start_time) * 1000)
+        logger.info(json.dumps(entry))
+
     def stream_sync(
         self,
         prompt: str,
@@ -218,65 +284,60 @@ class AnthropicAdapter:
         json_mode: bool = True,
         json_schema: Optional[Dict[str, Any]] = None,
         schema_name: str = "response",
-    ):
+    ) -> Generator[str, None, None]:
         """Streaming sync call to Claude. Yields text chunks as they arrive.
 
         For tool_use (json_schema) responses, yields the JSON input delta chunks.
         For text responses, yields text delta chunks.
         """
-        import time
         kwargs = self._build_kwargs(prompt, reasoning_effort, json_mode, json_schema, schema_name)
-
-        logger.info(json.dumps({
-            "step": "LLM_CALL_STREAM",
-            "status": "starting",
-            "model": self.model,
-        }))
         start_time = time.time()
+        self._log_stream("starting", start_time)
         total_chars = 0
 
         try:
-            # Track which content block type we're in to skip thinking blocks
             current_block_type = None
             with self.client.messages.stream(**kwargs) as stream:
                 for event in stream:
-                    if not hasattr(event, 'type'):
-                        continue
-
-                    # Track content block types to filter thinking blocks
-                    if event.type == 'content_block_start':
-                        block = getattr(event, 'content_block', None)
-                        current_block_type = getattr(block, 'type', None) if block else None
-                        continue
-
-                    if event.type == 'content_block_stop':
-                        current_block_type = None
-                        continue
-
-                    if event.type == 'content_block_delta':
-                        # Skip thinking block deltas — don't yield internal reasoning
-                        if current_block_type == 'thinking':
-                            continue
-
-                        delta = getattr(event, 'delta', None)
-                        if delta:
-                            if hasattr(delta, 'text'):
-                                total_chars += len(delta.text)
-                                yield delta.text
-                            elif hasattr(delta, 'partial_json'):
-                                total_chars += len(delta.partial_json)
-                                yield delta.partial_json
+                    current_block_type, text = self._stream_delta(event, current_block_type)
+                    if text:
+                        total_chars += len(text)
+                        yield text
         except anthropic.APIStatusError as e:
             logger.error(
                 f"Anthropic streaming error ({type(e).__name__}): status={e.status_code} {e.message}"
             )
             raise
 
-        duration_ms = int((time.time() - start_time) * 1000)
-        logger.info(json.dumps({
-            "step": "LLM_CALL_STREAM",
-            "status": "complete",
-            "model": self.model,
-            "output": {"response_length": total_chars},
-            "duration_ms": duration_ms,
-        }))
+        self._log_stream("complete", start_time, total_chars)
+
+    async def stream_async(
+        self,
+        prompt: str,
+        reasoning_effort: str = "none",
+        json_mode: bool = True,
+        json_schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "response",
+        client: Any = None,
+    ) -> AsyncGenerator[str, None]:
+        """Async twin of `stream_sync` on the pooled AsyncAnthropic client."""
+        kwargs = self._build_kwargs(prompt, reasoning_effort, json_mode, json_schema, schema_name)
+        start_time = time.time()
+        self._log_stream("starting", start_time)
+        total_chars = 0
+
+        try:
+            current_block_type = None
+            async with (client or self.async_client).messages.stream(**kwargs) as stream:
+                async for event in stream:
+                    current_block_type, text = self._stream_delta(event, current_block_type)
+                    if text:
+                        total_chars += len(text)
+                        yield text
+        except anthropic.APIStatusError as e:
+            logger.error(
+                f"Anthropic streaming error ({type(e).__name__}): status={e.status_code} {e.message}"
+            )
+            raise
+
+        self._log_stream("complete", start_time, total_chars)
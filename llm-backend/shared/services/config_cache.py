@@ -0,0 +1,161 @@
+"""
+Config cache — in-process read-through cache for admin-managed config rows.
+
+`LLMConfigService.get_config`, `FeatureFlagService.is_enabled` and
+`TTSConfigService.get_provider` sit on hot paths (every WebSocket connect,
+every SessionService construction, every ingestion stage, every /tts
+request). The rows they read change only when an admin edits them, so
+lookups are served from process memory.
+
+Staleness is bounded per namespace, not per key: at most once every
+`config_cache_ttl_seconds` a lookup reads that namespace's single
+`config_versions` row. If the version moved (another worker's admin write),
+every cached key in the namespace is dropped and reloaded on demand.
+Writers call `bump()` in the same transaction as the row change, which also
+clears the local namespace immediately.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session as DBSession
+
+from shared.models.entities import ConfigVersion
+
+logger = logging.getLogger(__name__)
+
+LLM_CONFIG_NAMESPACE = "llm_config"
+FEATURE_FLAGS_NAMESPACE = "feature_flags"
+
+_MISSING = object()
+
+
+class ConfigCache:
+    """Thread-safe namespace -> key -> value cache with version-row invalidation."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, Optional[int]] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._hits = 0
+        self._misses = 0
+        self._version_checks = 0
+
+    def get(
+        self,
+        db: DBSession,
+        namespace: str,
+        key: str,
+        loader: Callable[[], Any],
+    ) -> Any:
+        """Return the cached value for (namespace, key), calling `loader()` on a miss.
+
+        `loader` must return a value safe to share between callers (plain
+        data, not an ORM row). `None` is cached like any other value.
+        """
+        if self.ttl_seconds <= 0:
+            return loader()
+
+        self._sync(db, namespace)
+        with self._lock:
+            value = self._entries.get(namespace, {}).get(key, _MISSING)
+            if value is not _MISSING:
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries.setdefault(namespace, {})[key] = value
+        return value
+
+    def _sync(self, db: DBSession, namespace: str) -> None:
+        """Re-read the namespace's version row if the TTL has lapsed."""
+        now = time.monotonic()
+        checked_at = self._checked_at.get(namespace)
+        if checked_at is not None and now - checked_at < self.ttl_seconds:
+            return
+
+        try:
+            # Savepoint, so a failed read rolls back only itself and never
+            # leaves the caller's transaction aborted (Postgres).
+            with db.begin_nested():
+                version = db.query(ConfigVersion.version).filter(
+                    ConfigVersion.namespace == namespace
+                ).scalar()
+        except Exception as e:
+            # Table missing (pre-migration) or transient DB error — serve
+            # straight from the loader until the check succeeds.
+            logger.warning(f"config_versions check failed for {namespace}: {e}")
+            self.invalidate(namespace)
+            return
+
+        with self._lock:
+            self._version_checks += 1
+            if namespace not in self._versions or self._versions[namespace] != version:
+                self._entries.pop(namespace, None)
+                self._versions[namespace] = version
+            self._checked_at[namespace] = now
+
+    def bump(self, db: DBSession, namespace: str) -> None:
+        """Advance the namespace version in the caller's transaction and drop local entries.
+
+        The caller commits; other workers notice the new version on their
+        next check (at most `ttl_seconds` later).
+        """
+        db.execute(
+            text(
+                "INSERT INTO config_versions (namespace, version, updated_at) "
+                "VALUES (:namespace, 1, CURRENT_TIMESTAMP) "
+                "ON CONFLICT (namespace) DO UPDATE "
+                "SET version = config_versions.version + 1, updated_at = CURRENT_TIMESTAMP"
+            ),
+            {"namespace": namespace},
+        )
+        self.invalidate(namespace)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Forget cached entries (one namespace, or everything) and force a version re-check."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                self._versions.clear()
+                self._checked_at.clear()
+            else:
+                self._entries.pop(namespace, None)
+                self._versions.pop(namespace, None)
+                self._checked_at.pop(namespace, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "version_checks": self._version_checks,
+                "cached_keys": sum(len(v) for v in self._entries.values()),
+            }
+
+
+_config_cache: Optional[ConfigCache] = None
+_config_cache_lock = threading.Lock()
+
+
+def get_config_cache() -> ConfigCache:
+    global _config_cache
+    if _config_cache is None:
+        with _config_cache_lock:
+            if _config_cache is None:
+                from config import get_settings
+                _config_cache = ConfigCache(get_settings().config_cache_ttl_seconds)
+    return _config_cache
+
+
+def reset_config_cache() -> None:
+    """Drop the global cache instance (useful for testing)."""
+    global _config_cache
+    _config_cache = None
@@ -4,24 +4,38 @@ from typing import Optional
 from sqlalchemy.orm import Session as DBSession
 
 from shared.repositories.feature_flag_repository import FeatureFlagRepository
+from shared.services.config_cache import FEATURE_FLAGS_NAMESPACE, get_config_cache
 
 logger = logging.getLogger(__name__)
 
 
 class FeatureFlagService:
-    """Reads/writes feature flags from the feature_flags DB table."""
+    """Reads/writes feature flags from the feature_flags DB table.
+
+    Lookups go through the process-wide config cache; writes bump the
+    `feature_flags` version so every worker picks up the toggle.
+    """
 
     def __init__(self, db: DBSession):
         self.repo = FeatureFlagRepository(db)
 
+    def _cached_state(self, flag_name: str) -> Optional[bool]:
+        """Cached flag state: True/False, or None when the flag doesn't exist."""
+        def _load() -> Optional[bool]:
+            row = self.repo.get_by_name(flag_name)
+            return bool(row.enabled) if row else None
+
+        return get_config_cache().get(
+            self.repo.db, FEATURE_FLAGS_NAMESPACE, flag_name, _load,
+        )
+
     def flag_exists(self, flag_name: str) -> bool:
         """Return True if the flag exists in the DB."""
-        return self.repo.get_by_name(flag_name) is not None
+        return self._cached_state(flag_name) is not None
 
     def is_enabled(self, flag_name: str) -> bool:
         """Return True if the flag exists and is enabled, False otherwise."""
-        row = self.repo.get_by_name(flag_name)
-        return bool(row and row.enabled)
+        return bool(self._cached_state(flag_name))
 
     def get_all_flags(self) -> list[dict]:
         """Return all flags as dicts."""
@@ -45,6 +59,7 @@ class FeatureFlagService:
     ) -> dict:
         """Toggle a flag on/off. Returns the updated flag."""
         row = self.repo.upsert(flag_name, enabled, updated_by=updated_by)
+        get_config_cache().bump(self.repo.db, FEATURE_FLAGS_NAMESPACE)
         return {
             "flag_name": row.flag_name,
             "enabled": row.enabled,
@@ -0,0 +1,473 @@
+"""
+Durable background job queue — the `background_jobs` table, drained by
+`worker.py` processes.
+
+Ingestion stages (`run_in_background_v2`) and practice grading run on daemon
+threads inside the API process by default. That work competes with request
+handling, dies on every restart and cannot spread across machines. With
+`background_jobs_backend = "queue"` the API node only inserts a row; any
+number of worker processes claim rows with `SELECT ... FOR UPDATE SKIP
+LOCKED`, so two workers never take the same job and never wait on each
+other's row locks.
+
+Tasks are registered by name with `@job_task(...)` and are called with the
+JSON arguments they were enqueued with. Each opens its own DB sessions,
+exactly like the thread bodies they replace. Each queue has its own
+concurrency limit per worker process (`job_queue_<queue>_concurrency`).
+
+Leases (visibility timeout): a worker refreshes `heartbeat_at` on the rows
+it is running. A task may supply its own lease check instead — chapter jobs
+use `chapter_processing_jobs.heartbeat_at`, which stages already bump on
+progress, with the usual HEARTBEAT_STALE_THRESHOLD. A running row whose
+lease has expired is reclaimed by whichever worker notices it: requeued
+while it has attempts left, otherwise failed. Delivery is at-least-once (a
+reclaimed task may still be running in a hung worker), so tasks must be
+safe to re-run.
+
+Retries: a task that raises is requeued after `job_queue_retry_backoff_seconds`,
+doubling per attempt, until its `max_attempts`; then it is marked failed.
+"""
+
+import importlib
+import inspect
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy.orm import Session as DBSession
+
+from shared.models.entities import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+INGESTION_QUEUE = "ingestion"
+PRACTICE_GRADING_QUEUE = "practice_grading"
+QUEUES = (INGESTION_QUEUE, PRACTICE_GRADING_QUEUE)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# How often a worker refreshes its leases and looks for expired ones.
+LEASE_REFRESH_INTERVAL_SEC = 15
+
+
+@dataclass(frozen=True)
+class JobTask:
+    """A registered task. See `job_task`."""
+
+    name: str
+    queue: str
+    fn: Callable[..., Any]
+    max_attempts: Optional[int] = None
+    lease_expired: Optional[Callable[[DBSession, BackgroundJob], Optional[bool]]] = None
+    on_reclaim: Optional[Callable[[DBSession, BackgroundJob, bool], bool]] = None
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    id: str
+    queue: str
+    task: str
+    args: List[Any]
+    attempts: int
+
+
+_TASKS: Dict[str, JobTask] = {}
+
+
+def job_task(
+    name: str,
+    queue: str,
+    *,
+    max_attempts: Optional[int] = None,
+    lease_expired: Optional[Callable[[DBSession, BackgroundJob], Optional[bool]]] = None,
+    on_reclaim: Optional[Callable[[DBSession, BackgroundJob, bool], bool]] = None,
+):
+    """Register the decorated function as task `name` on `queue`.
+
+    - `lease_expired(db, job)` decides whether a running job's lease is gone;
+      returning None falls back to the worker heartbeat + visibility timeout.
+    - `on_reclaim(db, job, retry)` runs in the reclaiming transaction before
+      the row is requeued (`retry=True`) or failed, and returns whether to
+      retry — so it can veto a retry when the job's entity has moved on. It
+      must not commit.
+    """
+    if queue not in QUEUES:
+        raise ValueError(f"Unknown queue {queue!r} (expected one of {QUEUES})")
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        _TASKS[name] = JobTask(
+            name=name, queue=queue, fn=fn, max_attempts=max_attempts,
+            lease_expired=lease_expired, on_reclaim=on_reclaim,
+        )
+        return fn
+
+    return decorator
+
+
+def get_task(name: str) -> JobTask:
+    try:
+        return _TASKS[name]
+    except KeyError:
+        raise LookupError(
+            f"Unknown background job task {name!r} — is its module in worker.TASK_MODULES?"
+        ) from None
+
+
+def use_job_queue() -> bool:
+    """True when background work is enqueued for worker.py instead of run on a thread."""
+    from config import get_settings
+    return get_settings().background_jobs_backend.lower() == "queue"
+
+
+def queue_concurrency(queue: str) -> int:
+    from config import get_settings
+    return getattr(get_settings(), f"job_queue_{queue}_concurrency")
+
+
+def task_ref(fn: Callable[..., Any]) -> str:
+    """`module:qualname` of a module-level function or a bound method.
+
+    Bound methods are recorded by class; `resolve_task_ref` calls them on a
+    new instance, so only classes cheaply rebuilt from constructor args
+    (services constructed from a DB session) can be referenced this way.
+    """
+    if inspect.ismethod(fn):
+        cls = type(fn.__self__)
+        ref = f"{cls.__module__}:{cls.__qualname__}.{fn.__name__}"
+    else:
+        ref = f"{fn.__module__}:{fn.__qualname__}"
+    if "<" in ref:
+        raise ValueError(f"{ref} is not importable by name and cannot be enqueued")
+    return ref
+
+
+def resolve_task_ref(ref: str, *init_args: Any) -> Callable[..., Any]:
+    """Inverse of `task_ref`. Methods are bound to `cls(*init_args)`."""
+    module_name, _, qualname = ref.partition(":")
+    owner: Any = None
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        owner, target = target, getattr(target, part)
+    if isinstance(owner, type):
+        return getattr(owner(*init_args), qualname.rsplit(".", 1)[-1])
+    return target
+
+
+def enqueue_job(task_name: str, *args: Any, entity_id: Optional[str] = None) -> str:
+    """Enqueue `task_name(*args)` on a fresh session. Returns the queue row id."""
+    from database import get_db_manager
+
+    db = get_db_manager().session_factory()
+    try:
+        return JobQueue(db).enqueue(task_name, *args, entity_id=entity_id)
+    finally:
+        db.close()
+
+
+class JobQueue:
+    """Enqueue / claim / finish operations on `background_jobs`.
+
+    Each method commits its own change on the session it was given.
+    """
+
+    def __init__(self, db: DBSession):
+        from config import get_settings
+
+        settings = get_settings()
+        self.db = db
+        self.visibility_timeout = timedelta(seconds=settings.job_queue_visibility_timeout_seconds)
+        self.max_attempts = settings.job_queue_max_attempts
+        self.retry_backoff_seconds = settings.job_queue_retry_backoff_seconds
+
+    def enqueue(self, task_name: str, *args: Any, entity_id: Optional[str] = None) -> str:
+        task = get_task(task_name)
+        job = BackgroundJob(
+            id=str(uuid.uuid4()),
+            queue=task.queue,
+            task=task_name,
+            args_json=json.dumps(list(args)),
+            entity_id=entity_id,
+            status="queued",
+            attempts=0,
+            max_attempts=task.max_attempts or self.max_attempts,
+            available_at=datetime.utcnow(),
+        )
+        self.db.add(job)
+        self.db.commit()
+        logger.info(f"Enqueued background job {job.id}: {task_name} on {task.queue} (entity={entity_id})")
+        return job.id
+
+    def has_active(self, entity_id: str) -> bool:
+        """True if a queued or running job works on `entity_id`."""
+        return self.db.query(BackgroundJob.id).filter(
+            BackgroundJob.entity_id == entity_id,
+            BackgroundJob.status.in_(ACTIVE_STATUSES),
+        ).first() is not None
+
+    def claim(self, queue: str, limit: int, worker_id: str) -> List[ClaimedJob]:
+        """Move up to `limit` due jobs on `queue` to running for `worker_id`.
+
+        `FOR UPDATE SKIP LOCKED` lets concurrent workers claim disjoint rows
+        without blocking (SQLite ignores it; it has one writer anyway).
+        """
+        if limit <= 0:
+            return []
+        now = datetime.utcnow()
+        rows = (
+            self.db.query(BackgroundJob)
+            .filter(
+                BackgroundJob.queue == queue,
+                BackgroundJob.status == "queued",
+                BackgroundJob.available_at <= now,
+            )
+            .order_by(BackgroundJob.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        claimed = []
+        for job in rows:
+            job.status = "running"
+            job.attempts += 1
+            job.worker_id = worker_id
+            job.claimed_at = now
+            job.heartbeat_at = now
+            claimed.append(ClaimedJob(
+                id=job.id, queue=job.queue, task=job.task,
+                args=json.loads(job.args_json), attempts=job.attempts,
+            ))
+        self.db.commit()
+        return claimed
+
+    def heartbeat(self, job_ids: List[str], worker_id: str) -> None:
+        """Extend the leases `worker_id` holds on `job_ids`."""
+        if not job_ids:
+            return
+        self.db.query(BackgroundJob).filter(
+            BackgroundJob.id.in_(job_ids),
+            BackgroundJob.status == "running",
+            BackgroundJob.worker_id == worker_id,
+        ).update({BackgroundJob.heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+        self.db.commit()
+
+    def complete(self, job_id: str, worker_id: str) -> None:
+        job = self._locked_running(job_id, worker_id)
+        if job is None:
+            return
+        job.status = "done"
+        job.finished_at = datetime.utcnow()
+        self.db.commit()
+
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Record a failed attempt. Returns True if the job was requeued."""
+        job = self._locked_running(job_id, worker_id)
+        if job is None:
+            return False
+        retry = job.attempts < job.max_attempts
+        self._finish_attempt(job, error, retry=retry)
+        self.db.commit()
+        return retry
+
+    def reclaim_expired(self) -> int:
+        """Requeue or fail running jobs whose lease expired. Returns how many.
+
+        Each row is locked (SKIP LOCKED) and settled in its own transaction,
+        so workers reclaiming at the same time split the rows between them.
+        """
+        job_ids = [
+            job_id for (job_id,) in self.db.query(BackgroundJob.id).filter(
+                BackgroundJob.status == "running",
+            ).all()
+        ]
+        self.db.commit()
+        reclaimed = 0
+        for job_id in job_ids:
+            try:
+                if self._reclaim_one(job_id):
+                    reclaimed += 1
+            except Exception:
+                logger.exception(f"Could not reclaim background job {job_id}")
+                self.db.rollback()
+        return reclaimed
+
+    def _reclaim_one(self, job_id: str) -> bool:
+        job = self.db.query(BackgroundJob).filter(
+            BackgroundJob.id == job_id,
+        ).with_for_update(skip_locked=True).first()
+        if job is None or job.status != "running":
+            self.db.rollback()
+            return False
+
+        task = _TASKS.get(job.task)
+        expired = task.lease_expired(self.db, job) if task and task.lease_expired else None
+        if expired is None:
+            lease_at = job.heartbeat_at or job.claimed_at
+            expired = lease_at is None or datetime.utcnow() - lease_at > self.visibility_timeout
+        if not expired:
+            self.db.rollback()
+            return False
+
+        retry = job.attempts < job.max_attempts
+        if task and task.on_reclaim:
+            retry = task.on_reclaim(self.db, job, retry)
+        logger.warning(
+            f"Background job {job.id} ({job.task}) lost its lease on worker {job.worker_id} "
+            f"after attempt {job.attempts} — {'requeued' if retry else 'failed'}"
+        )
+        self._finish_attempt(
+            job, f"Lease expired on worker {job.worker_id} (attempt {job.attempts})", retry=retry,
+        )
+        self.db.commit()
+        return True
+
+    def _locked_running(self, job_id: str, worker_id: str) -> Optional[BackgroundJob]:
+        job = self.db.query(BackgroundJob).filter(
+            BackgroundJob.id == job_id,
+        ).with_for_update().first()
+        if job is None or job.status != "running" or job.worker_id != worker_id:
+            # Reclaimed while this worker was still running it; the new
+            # owner's outcome wins.
+            logger.warning(f"Background job {job_id} is no longer held by {worker_id}; dropping its result")
+            self.db.rollback()
+            return None
+        return job
+
+    def _finish_attempt(self, job: BackgroundJob, error: str, *, retry: bool) -> None:
+        now = datetime.utcnow()
+        job.last_error = error[:2000]
+        if retry:
+            delay = self.retry_backoff_seconds * 2 ** max(job.attempts - 1, 0)
+            job.status = "queued"
+            job.available_at = now + timedelta(seconds=delay)
+            job.worker_id = None
+        else:
+            job.status = "failed"
+            job.finished_at = now
+
+
+class JobWorker:
+    """Claims and runs jobs from `concurrency`'s queues until `stop()`.
+
+    One thread pool per queue, sized to that queue's limit, so a backlog of
+    slow ingestion stages never starves grading. Claims only as many rows
+    as a queue has free slots, and claims again as soon as a slot frees up.
+    """
+
+    def __init__(
+        self,
+        concurrency: Dict[str, int],
+        *,
+        session_factory: Optional[Callable[[], DBSession]] = None,
+        poll_interval: Optional[float] = None,
+        worker_id: Optional[str] = None,
+    ):
+        from config import get_settings
+
+        unknown = set(concurrency) - set(QUEUES)
+        if unknown:
+            raise ValueError(f"Unknown queues: {', '.join(sorted(unknown))}")
+        self.concurrency = dict(concurrency)
+        self.poll_interval = (
+            poll_interval if poll_interval is not None
+            else get_settings().job_queue_poll_interval_seconds
+        )
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._session_factory = session_factory
+        self._executors = {
+            queue: ThreadPoolExecutor(max_workers=limit, thread_name_prefix=f"job-{queue}")
+            for queue, limit in self.concurrency.items()
+        }
+        self._running: Dict[str, set] = {queue: set() for queue in self.concurrency}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._leases_checked_at = 0.0
+
+    def run(self) -> None:
+        """Poll until `stop()`, then wait for running jobs to finish."""
+        logger.info(f"Job worker {self.worker_id} started: {self.concurrency}")
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Job worker pass failed")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+        self.shutdown()
+
+    def stop(self) -> None:
+        """Stop claiming. `run()` returns once running jobs have finished."""
+        self._stop.set()
+        self._wake.set()
+
+    def shutdown(self, wait: bool = True) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    def run_once(self) -> int:
+        """One pass: refresh/reclaim leases when due, fill free slots. Returns jobs started."""
+        started = 0
+        with self._session() as db:
+            queue = JobQueue(db)
+            now = time.monotonic()
+            if now - self._leases_checked_at >= LEASE_REFRESH_INTERVAL_SEC:
+                self._leases_checked_at = now
+                queue.heartbeat(self.running_job_ids(), self.worker_id)
+                queue.reclaim_expired()
+            for name, limit in self.concurrency.items():
+                with self._lock:
+                    free = limit - len(self._running[name])
+                for job in queue.claim(name, free, self.worker_id):
+                    with self._lock:
+                        self._running[name].add(job.id)
+                    self._executors[name].submit(self._execute, job)
+                    started += 1
+        return started
+
+    def running_job_ids(self) -> List[str]:
+        with self._lock:
+            return [job_id for ids in self._running.values() for job_id in ids]
+
+    def _execute(self, job: ClaimedJob) -> None:
+        error = None
+        try:
+            get_task(job.task).fn(*job.args)
+        except Exception as e:
+            logger.error(
+                f"Background job {job.id} ({job.task}) failed on attempt {job.attempts}: {e}",
+                exc_info=True,
+            )
+            error = str(e) or type(e).__name__
+        try:
+            with self._session() as db:
+                if error is None:
+                    JobQueue(db).complete(job.id, self.worker_id)
+                else:
+                    JobQueue(db).fail(job.id, self.worker_id, error)
+        except Exception:
+            logger.exception(f"Could not record the outcome of background job {job.id}")
+        finally:
+            with self._lock:
+                self._running[job.queue].discard(job.id)
+            self._wake.set()
+
+    @contextmanager
+    def _session(self) -> Iterator[DBSession]:
+        if self._session_factory is None:
+            from database import get_db_manager
+            self._session_factory = get_db_manager().session_factory
+        db = self._session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
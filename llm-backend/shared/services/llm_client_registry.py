@@ -0,0 +1,172 @@
+"""
+LLM client registry — process-wide pool of long-lived LLMService instances.
+
+Constructing an LLMService builds fresh OpenAI / Gemini / Anthropic clients,
+each with its own connection pool, so the first call on every new instance
+pays a TLS handshake. The registry keys instances by everything that shapes
+the clients (provider, model, effort, fast model, API keys, retry/timeout
+knobs) and hands the same instance to every caller with that key, so all
+sessions on a worker share warm keep-alive connections.
+
+Entries are invalidated when an admin changes an `llm_config` row
+(`LLMConfigService.update_config`), so the next lookup constructs a service
+for the new model. Callers already holding the old instance keep using it
+until they finish — LLMService carries no per-call state.
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from shared.services.llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(secret: Optional[str]) -> str:
+    """Short stable digest so raw API keys never appear in registry keys or logs."""
+    if not secret:
+        return ""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+
+class LLMClientRegistry:
+    """Thread-safe map of construction params -> shared LLMService."""
+
+    def __init__(self):
+        self._services: Dict[Tuple, LLMService] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._constructions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _key(
+        api_key: str,
+        provider: str,
+        model_id: str,
+        reasoning_effort: str,
+        gemini_api_key: Optional[str],
+        anthropic_api_key: Optional[str],
+        options: Dict[str, Any],
+    ) -> Tuple:
+        return (
+            provider,
+            model_id,
+            reasoning_effort,
+            _fingerprint(api_key),
+            _fingerprint(gemini_api_key),
+            _fingerprint(anthropic_api_key),
+            tuple(sorted(options.items())),
+        )
+
+    def get(
+        self,
+        api_key: str,
+        *,
+        provider: str,
+        model_id: str,
+        reasoning_effort: str = "none",
+        gemini_api_key: Optional[str] = None,
+        anthropic_api_key: Optional[str] = None,
+        **options: Any,
+    ) -> LLMService:
+        """Return the shared LLMService for these params, constructing it on first use.
+
+        Accepts the same arguments as `LLMService(...)`; extra keyword
+        options (fast_model_id, initial_retry_delay, timeout, ...) are part
+        of the key.
+        """
+        key = self._key(
+            api_key, provider, model_id, reasoning_effort,
+            gemini_api_key, anthropic_api_key, options,
+        )
+        with self._lock:
+            service = self._services.get(key)
+            if service is not None:
+                self._hits += 1
+                return service
+
+            service = LLMService(
+                api_key=api_key,
+                provider=provider,
+                model_id=model_id,
+                reasoning_effort=reasoning_effort,
+                gemini_api_key=gemini_api_key,
+                anthropic_api_key=anthropic_api_key,
+                **options,
+            )
+            self._services[key] = service
+            self._constructions += 1
+
+        logger.info(
+            f"LLM client registry: constructed {provider}/{model_id} "
+            f"(effort={reasoning_effort}, pool size={len(self._services)})"
+        )
+        return service
+
+    def invalidate(self, provider: Optional[str] = None, model_id: Optional[str] = None) -> int:
+        """Drop entries matching provider/model_id (all entries when both are None).
+
+        Returns the number of entries removed.
+        """
+        with self._lock:
+            stale = [
+                k for k in self._services
+                if (provider is None or k[0] == provider)
+                and (model_id is None or k[1] == model_id)
+            ]
+            for k in stale:
+                del self._services[k]
+            self._invalidations += len(stale)
+        if stale:
+            logger.info(
+                f"LLM client registry: invalidated {len(stale)} entr"
+                f"{'y' if len(stale) == 1 else 'ies'} (provider={provider}, model={model_id})"
+            )
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        """Pool hits vs. constructions since process start."""
+        with self._lock:
+            return {
+                "size": len(self._services),
+                "hits": self._hits,
+                "constructions": self._constructions,
+                "invalidations": self._invalidations,
+            }
+
+
+_registry: Optional[LLMClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = LLMClientRegistry()
+    return _registry
+
+
+def get_shared_llm_service(config: Dict[str, Any], **options: Any) -> LLMService:
+    """Shared LLMService for an `LLMConfigService.get_config()` dict.
+
+    API keys come from settings, mirroring how callers construct LLMService
+    directly. Extra keyword options (fast_model_id, initial_retry_delay, ...)
+    pass through to the registry.
+    """
+    from config import get_settings
+
+    settings = get_settings()
+    return get_llm_client_registry().get(
+        settings.openai_api_key,
+        provider=config["provider"],
+        model_id=config["model_id"],
+        reasoning_effort=config["reasoning_effort"],
+        gemini_api_key=settings.gemini_api_key if settings.gemini_api_key else None,
+        anthropic_api_key=settings.anthropic_api_key if settings.anthropic_api_key else None,
+        **options,
+    )
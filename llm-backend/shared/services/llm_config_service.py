@@ -4,6 +4,7 @@ from typing import Optional
 from sqlalchemy.orm import Session as DBSession
 
 from shared.repositories.llm_config_repository import LLMConfigRepository
+from shared.services.config_cache import LLM_CONFIG_NAMESPACE, get_config_cache
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +22,11 @@ class LLMConfigNotFoundError(Exception):
 
 
 class LLMConfigService:
-    """Reads/writes LLM config from the llm_config DB table. No fallbacks."""
+    """Reads/writes LLM config from the llm_config DB table. No fallbacks.
+
+    Reads go through the process-wide config cache (see
+    `shared.services.config_cache`); writes bump the `llm_config` version.
+    """
 
     def __init__(self, db: DBSession):
         self.repo = LLMConfigRepository(db)
@@ -33,12 +38,21 @@ class LLMConfigService:
                 f"Component '{component_key}' is not an LLM component — "
                 f"use the dedicated admin surface for it."
             )
-        row = self.repo.get_by_key(component_key)
-        if not row:
+        config = get_config_cache().get(
+            self.repo.db, LLM_CONFIG_NAMESPACE, component_key,
+            lambda: self._load_config(component_key),
+        )
+        if config is None:
             raise LLMConfigNotFoundError(
                 f"LLM config not found for component '{component_key}'. "
                 f"Add it via /admin/llm-config or run 'python db.py --migrate' to seed defaults."
             )
+        return dict(config)
+
+    def _load_config(self, component_key: str) -> Optional[dict]:
+        row = self.repo.get_by_key(component_key)
+        if not row:
+            return None
         return {
             "provider": row.provider,
             "model_id": row.model_id,
@@ -82,10 +96,17 @@ class LLMConfigService:
                 f"Component '{component_key}' is not editable from the LLM "
                 f"config endpoint — use its dedicated admin surface."
             )
+        previous = self.repo.get_by_key(component_key)
         row = self.repo.upsert(
             component_key, provider, model_id,
             reasoning_effort=reasoning_effort, updated_by=updated_by,
         )
+        get_config_cache().bump(self.repo.db, LLM_CONFIG_NAMESPACE)
+        if previous is not None:
+            # Drop pooled clients built for the old model so the next
+            # lookup constructs one for the new row.
+            from shared.services.llm_client_registry import get_llm_client_registry
+            get_llm_client_registry().invalidate(previous.provider, previous.model_id)
         return {
             "component_key": row.component_key,
             "provider": row.provider,
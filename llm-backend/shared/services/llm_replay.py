@@ -0,0 +1,349 @@
+"""
+LLM record/replay — serve `LLMService` calls from a recorded JSONL file.
+
+Lets the ingestion pipeline run end to end without paying for live LLM
+calls: record a run once with real keys, then replay it offline (benchmarks,
+demos, debugging a stage against yesterday's outputs).
+
+Each `LLMService.call` / `call_fast` / `call_stream` is keyed by a hash of
+the method name, the prompt and every other bound argument (reasoning
+effort, JSON schema, schema name, system prompt file contents). Provider
+and model are recorded alongside but are not part of the key, so a
+recording stays usable after an admin swaps models.
+
+Modes (`llm_replay_mode`):
+
+- off — calls go straight to the provider (production default).
+- record — every call goes live and is appended to the file.
+- replay — every call is served from the file; a miss raises
+  `LLMReplayMissError`.
+- auto — hits are replayed, misses go live and are recorded.
+
+Replayed calls sleep to simulate provider latency: the recorded latency,
+or a fixed `llm_replay_latency_ms`, times `llm_replay_latency_scale`.
+With `llm_replay_match="schema"`, a miss falls back to the recorded
+responses for the same method + schema_name (in recording order), so a
+prompt-template edit doesn't invalidate a whole recording.
+"""
+
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MODES = ("off", "record", "replay", "auto")
+MATCH_MODES = ("exact", "schema")
+
+# Bump when the key inputs change shape so stale recordings miss loudly
+# instead of matching the wrong response.
+REPLAY_KEY_VERSION = 1
+
+
+class LLMReplayMissError(Exception):
+    """Replay mode found no recorded response for a call."""
+
+
+def _file_fingerprint(path: str) -> str:
+    """Content hash of a system prompt file (absolute paths differ per machine)."""
+    try:
+        with open(path, "rb") as f:
+            return "sha256:" + hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return os.path.basename(path)
+
+
+def llm_request_key(method: str, params: Dict[str, Any]) -> str:
+    """Replay key for one call: method + every bound argument."""
+    canonical = dict(params)
+    if canonical.get("system_prompt_file"):
+        canonical["system_prompt_file"] = _file_fingerprint(canonical["system_prompt_file"])
+    payload = json.dumps(
+        {"v": REPLAY_KEY_VERSION, "method": method, "params": canonical},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMRecording:
+    """JSONL file of recorded calls. Later entries for a key win."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, dict] = {}
+        self._by_schema: Dict[Tuple[str, str], List[dict]] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        self._index(json.loads(line))
+
+    def _index(self, entry: dict) -> None:
+        if entry["key"] not in self._by_key:
+            self._by_schema.setdefault((entry["method"], entry.get("schema_name", "")), []).append(entry)
+        self._by_key[entry["key"]] = entry
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def get(self, key: str) -> Optional[dict]:
+        return self._by_key.get(key)
+
+    def by_schema(self, method: str, schema_name: str) -> List[dict]:
+        return self._by_schema.get((method, schema_name), [])
+
+    def add(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._index(entry)
+
+
+class LLMReplay:
+    """Record/replay policy shared by every LLMService in the process."""
+
+    def __init__(
+        self,
+        mode: str,
+        path: str,
+        *,
+        latency_ms: float = -1,
+        latency_scale: float = 1.0,
+        match: str = "exact",
+    ):
+        if mode not in REPLAY_MODES or mode == "off":
+            raise ValueError(f"Unknown llm replay mode: {mode!r} (expected record, replay or auto)")
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown llm replay match: {match!r} (expected exact or schema)")
+        self.mode = mode
+        self.match = match
+        self.latency_ms = latency_ms
+        self.latency_scale = latency_scale
+        self.recording = LLMRecording(path)
+        self._lock = threading.Lock()
+        self._fallback_cursor: Dict[Tuple[str, str], int] = {}
+        self._hits = 0
+        self._fallback_hits = 0
+        self._misses = 0
+        self._recorded = 0
+
+    def lookup(self, method: str, key: str, schema_name: str) -> Optional[dict]:
+        """Recorded entry to serve, or None when the call should go live."""
+        if self.mode == "record":
+            return None
+        entry = self.recording.get(key)
+        if entry is not None:
+            with self._lock:
+                self._hits += 1
+            return entry
+        if self.match == "schema":
+            candidates = self.recording.by_schema(method, schema_name)
+            if candidates:
+                with self._lock:
+                    cursor = self._fallback_cursor.get((method, schema_name), 0)
+                    self._fallback_cursor[(method, schema_name)] = cursor + 1
+                    self._fallback_hits += 1
+                return candidates[cursor % len(candidates)]
+        with self._lock:
+            self._misses += 1
+        if self.mode == "replay":
+            raise LLMReplayMissError(
+                f"No recorded {method} response for schema {schema_name!r} "
+                f"(key {key[:12]}) in {self.recording.path}"
+            )
+        return None
+
+    def record(self, entry: dict) -> None:
+        # Stored by value: the caller goes on to use (and may mutate) the
+        # live response it just handed over.
+        self.recording.add(copy.deepcopy(entry))
+        with self._lock:
+            self._recorded += 1
+
+    def delay_seconds(self, entry: dict) -> float:
+        base = self.latency_ms if self.latency_ms >= 0 else entry.get("latency_ms", 0)
+        return max(0.0, base * self.latency_scale / 1000)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "match": self.match,
+                "entries": len(self.recording),
+                "hits": self._hits,
+                "fallback_hits": self._fallback_hits,
+                "misses": self._misses,
+                "recorded": self._recorded,
+            }
+
+
+# ─── LLMService hook ─────────────────────────────────────────────────────────
+
+# `call_stream` falls back to `call` for non-streaming providers; only the
+# outermost call on a thread is recorded or replayed.
+_passthrough_state = threading.local()
+
+
+@contextmanager
+def _passthrough():
+    _passthrough_state.depth = getattr(_passthrough_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _passthrough_state.depth -= 1
+
+
+def _in_passthrough() -> bool:
+    return getattr(_passthrough_state, "depth", 0) > 0
+
+
+def _entry(method: str, key: str, service: Any, params: Dict[str, Any], latency_ms: int) -> dict:
+    prompt = params.get("prompt") or ""
+    return {
+        "key": key,
+        "method": method,
+        "schema_name": params.get("schema_name", ""),
+        "provider": getattr(service, "provider", None),
+        "model_id": getattr(service, "model_id", None),
+        "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        "prompt_chars": len(prompt),
+        "latency_ms": latency_ms,
+        "recorded_at": datetime.utcnow().isoformat(),
+    }
+
+
+def replayable(method: str) -> Callable:
+    """Route an LLMService entry point through the active LLMReplay, if any."""
+
+    def decorate(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        def prepare(self, args, kwargs) -> Tuple["LLMReplay", Dict[str, Any], str]:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            params.pop("self", None)
+            return get_llm_replay(), params, llm_request_key(method, params)
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def stream_wrapper(self, *args, **kwargs) -> Iterator[str]:
+                if get_llm_replay() is None or _in_passthrough():
+                    yield from fn(self, *args, **kwargs)
+                    return
+                replay, params, key = prepare(self, args, kwargs)
+                entry = replay.lookup(method, key, params.get("schema_name", ""))
+                if entry is not None:
+                    chunks = entry.get("chunks") or []
+                    pause = replay.delay_seconds(entry) / max(1, len(chunks))
+                    for chunk in chunks:
+                        time.sleep(pause)
+                        yield chunk
+                    return
+
+                start = time.perf_counter()
+                chunks = []
+                live = fn(self, *args, **kwargs)
+                while True:
+                    with _passthrough():
+                        try:
+                            chunk = next(live)
+                        except StopIteration:
+                            break
+                    chunks.append(chunk)
+                    yield chunk
+                latency_ms = int((time.perf_counter() - start) * 1000)
+                record = _entry(method, key, self, params, latency_ms)
+                record["chunks"] = chunks
+                replay.record(record)
+
+            return stream_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if get_llm_replay() is None or _in_passthrough():
+                return fn(self, *args, **kwargs)
+            replay, params, key = prepare(self, args, kwargs)
+            entry = replay.lookup(method, key, params.get("schema_name", ""))
+            if entry is not None:
+                time.sleep(replay.delay_seconds(entry))
+                # Nested output (e.g. `parsed`) must not alias the recording,
+                # or a caller's edits leak into the next replay of this entry.
+                return copy.deepcopy(entry["response"])
+
+            start = time.perf_counter()
+            with _passthrough():
+                response = fn(self, *args, **kwargs)
+            latency_ms = int((time.perf_counter() - start) * 1000)
+            record = _entry(method, key, self, params, latency_ms)
+            record["response"] = response
+            replay.record(record)
+            return response
+
+        return wrapper
+
+    return decorate
+
+
+# ─── Process-wide instance ───────────────────────────────────────────────────
+
+_llm_replay: Optional[LLMReplay] = None
+_llm_replay_configured = False
+_llm_replay_lock = threading.Lock()
+
+
+def get_llm_replay() -> Optional[LLMReplay]:
+    """The active LLMReplay, or None when `llm_replay_mode` is off."""
+    global _llm_replay, _llm_replay_configured
+    if not _llm_replay_configured:
+        with _llm_replay_lock:
+            if not _llm_replay_configured:
+                from config import get_settings
+                settings = get_settings()
+                mode = settings.llm_replay_mode.strip().lower()
+                if mode != "off":
+                    _llm_replay = LLMReplay(
+                        mode,
+                        settings.llm_replay_path,
+                        latency_ms=settings.llm_replay_latency_ms,
+                        latency_scale=settings.llm_replay_latency_scale,
+                        match=settings.llm_replay_match.strip().lower(),
+                    )
+                    logger.warning(
+                        f"LLM replay active: mode={mode} path={settings.llm_replay_path} "
+                        f"entries={len(_llm_replay.recording)}"
+                    )
+                _llm_replay_configured = True
+    return _llm_replay
+
+
+def install_llm_replay(replay: Optional[LLMReplay]) -> None:
+    """Use `replay` for every LLMService in the process (None turns it off)."""
+    global _llm_replay, _llm_replay_configured
+    with _llm_replay_lock:
+        _llm_replay = replay
+        _llm_replay_configured = True
+
+
+def reset_llm_replay() -> None:
+    """Drop the global instance; the next call re-reads settings (useful for testing)."""
+    global _llm_replay, _llm_replay_configured
+    with _llm_replay_lock:
+        _llm_replay = None
+        _llm_replay_configured = False
@@ -6,24 +6,112 @@ provider + model_id set from the DB-backed LLM config.
 
 The primary entry point is `call()`. `call_fast()` uses a separate lightweight
 model (also DB-configurable via the 'fast_model' llm_config entry).
+
+`acall()`, `acall_fast()` and `acall_stream()` are the native-async twins used
+by the live tutor. They run on AsyncOpenAI / AsyncAnthropic / Gemini `aio`
+clients with a pooled keep-alive HTTP transport, so concurrent sessions never
+queue behind the default thread-pool executor.
+
+Sync code that drives those async paths (welcome messages, simplified cards,
+Pixi generation) runs them with `run_blocking()` rather than a bare
+`asyncio.run()`, so the per-loop clients they open are closed with the loop.
+
+`call()`, `call_fast()` and `call_stream()` go through `llm_replay.replayable`:
+with `llm_replay_mode` set they are recorded to / served from a JSONL file
+instead of the provider (offline benchmarks; see shared/services/llm_replay.py).
 """
 
+import asyncio
 import json
+import threading
 import time
-from typing import Dict, Any, Optional, Literal, Generator
-from openai import OpenAI, OpenAIError, RateLimitError, APITimeoutError
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Literal, Generator, AsyncGenerator
+import httpx
+from openai import (
+    OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient,
+    OpenAIError, RateLimitError, APITimeoutError,
+)
 from google import genai
 from google.genai import types
 import logging
 
+from shared.services.llm_replay import replayable
+from shared.utils.strict_schema import make_schema_strict
+
 logger = logging.getLogger(__name__)
 
+# Connection-pool sizing for the async clients. A single worker multiplexes
+# every live tutor session over these pools, so they are much wider than the
+# httpx defaults (100 / 20).
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+
 # Models that use the OpenAI Responses API (vs Chat Completions)
 _RESPONSES_API_MODELS = {"gpt-5.4", "gpt-5.4-nano", "gpt-5.3-codex", "gpt-5.2", "gpt-5.1"}
 # Note: gpt-realtime-1.5 is excluded — it's a realtime-only model incompatible
 # with both Chat Completions and Responses API endpoints.
 
 
+@dataclass
+class _AsyncClients:
+    """Async provider clients sharing one event loop's connection pools."""
+    openai: AsyncOpenAI
+    gemini: Any = None
+    anthropic: Any = None
+
+    async def aclose(self) -> None:
+        await self.openai.close()
+        if self.gemini is not None:
+            await self.gemini.aclose()
+        if self.anthropic is not None:
+            await self.anthropic.close()
+
+
+# Every LLMService's per-loop bundle map that holds a bundle for a given loop,
+# so `aclose_loop_clients()` can find them all without tracking services.
+_loop_bundle_owners: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, list]" = (
+    weakref.WeakKeyDictionary()
+)
+_loop_bundle_owners_lock = threading.Lock()
+
+
+async def aclose_loop_clients() -> None:
+    """Close every LLMService async client bundle opened on the running loop.
+
+    Long-lived loops (the uvicorn worker) never need this. Short-lived ones
+    should call it before they end — otherwise the httpx pools and their
+    sockets are left for the garbage collector.
+    """
+    loop = asyncio.get_running_loop()
+    with _loop_bundle_owners_lock:
+        owners = _loop_bundle_owners.pop(loop, [])
+    for bundles in owners:
+        clients = bundles.pop(loop, None)
+        if clients is None:
+            continue
+        try:
+            await clients.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close async LLM clients: {e}")
+
+
+def run_blocking(coro):
+    """`asyncio.run(coro)` for sync callers of the async LLM paths.
+
+    Closes the async clients the coroutine opened on its throwaway loop
+    before that loop is torn down.
+    """
+    async def _run():
+        try:
+            return await coro
+        finally:
+            await aclose_loop_clients()
+
+    return asyncio.run(_run())
+
+
 class LLMService:
     """
     Service for making LLM API calls with retry logic and error handling.
@@ -45,8 +133,22 @@ class LLMService:
         max_retries: int = 3,
         initial_retry_delay: float = 1.0,
         timeout: int = 60,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     ):
         self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        self._gemini_api_key = gemini_api_key
+        self.pool_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        # Async clients are bound to the event loop that uses them (httpx
+        # connections cannot hop loops); see _async_clients().
+        self._async_bundles: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncClients]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_lock = threading.Lock()
         self.max_retries = max_retries
         self.initial_retry_delay = initial_retry_delay
         self.timeout = timeout
@@ -79,7 +181,8 @@ class LLMService:
         if anthropic_api_key:
             from shared.services.anthropic_adapter import AnthropicAdapter
             self.anthropic_adapter = AnthropicAdapter(
-                api_key=anthropic_api_key, timeout=timeout, model=model_id
+                api_key=anthropic_api_key, timeout=timeout, model=model_id,
+                pool_limits=self.pool_limits,
             )
 
         self.claude_code_adapter = None
@@ -89,6 +192,7 @@ class LLMService:
 
     # ─── Primary entry point ───────────────────────────────────────────
 
+    @replayable("call")
     def call(
         self,
         prompt: str,
@@ -141,6 +245,7 @@ class LLMService:
 
     # ─── Fast model entry point (lightweight tasks) ─────────────────
 
+    @replayable("call_fast")
     def call_fast(
         self,
         prompt: str,
@@ -167,6 +272,7 @@ class LLMService:
 
     # ─── Streaming entry point ───────────────────────────────────────
 
+    @replayable("call_stream")
     def call_stream(
         self,
         prompt: str,
@@ -238,28 +344,9 @@ class LLMService:
         }))
         start_time = time.time()
 
-        kwargs = {
-            "model": model,
-            "input": prompt,
-            "stream": True,
-            "timeout": self.timeout,
-        }
-
-        if reasoning_effort != "none":
-            kwargs["reasoning"] = {"effort": reasoning_effort}
-
-        if json_schema:
-            kwargs["text"] = {
-                "format": {
-                    "type": "json_schema",
-                    "name": schema_name,
-                    "schema": json_schema,
-                    "strict": True,
-                }
-            }
-        elif json_mode:
-            kwargs["text"] = {"format": {"type": "json_object"}}
-
+        kwargs = self._responses_kwargs(
+            prompt, model, reasoning_effort, json_mode, json_schema, schema_name, stream=True
+        )
         stream = self.client.responses.create(**kwargs)
         total_chars = 0
         for event in stream:
@@ -292,17 +379,9 @@ class LLMService:
         }))
         start_time = time.time()
 
-        kwargs = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_completion_tokens": max_tokens,
-            "temperature": temperature,
-            "stream": True,
-            "timeout": self.timeout,
-        }
-        if json_mode:
-            kwargs["response_format"] = {"type": "json_object"}
-
+        kwargs = self._chat_kwargs(
+            prompt, model, max_tokens, temperature, json_mode, stream=True
+        )
         stream = self.client.chat.completions.create(**kwargs)
         total_chars = 0
         for chunk in stream:
@@ -345,45 +424,66 @@ class LLMService:
         }))
 
         def _api_call():
-            kwargs = {
-                "model": model,
-                "input": prompt,
-                "timeout": self.timeout,
-            }
+            kwargs = self._responses_kwargs(
+                prompt, model, reasoning_effort, json_mode, json_schema, schema_name
+            )
+            result = self.client.responses.create(**kwargs)
+            return self._parse_responses_result(result)
 
-            if reasoning_effort != "none":
-                kwargs["reasoning"] = {"effort": reasoning_effort}
-
-            if json_schema:
-                kwargs["text"] = {
-                    "format": {
-                        "type": "json_schema",
-                        "name": schema_name,
-                        "schema": json_schema,
-                        "strict": True,
-                    }
-                }
-            elif json_mode:
-                kwargs["text"] = {"format": {"type": "json_object"}}
+        return self._execute_with_retry(_api_call, model)
 
-            result = self.client.responses.create(**kwargs)
+    def _responses_kwargs(
+        self,
+        prompt: str,
+        model: str,
+        reasoning_effort: str = "none",
+        json_mode: bool = True,
+        json_schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "response",
+        stream: bool = False,
+    ) -> Dict[str, Any]:
+        """Build kwargs for responses.create() — shared by sync, async and streaming paths."""
+        kwargs: Dict[str, Any] = {
+            "model": model,
+            "input": prompt,
+            "timeout": self.timeout,
+        }
+        if stream:
+            kwargs["stream"] = True
 
-            reasoning_obj = getattr(result, "reasoning", None)
-            reasoning_str = None
-            if reasoning_obj is not None:
-                if hasattr(reasoning_obj, "summary") and reasoning_obj.summary:
-                    reasoning_str = str(reasoning_obj.summary)
-                elif hasattr(reasoning_obj, "text") and reasoning_obj.text:
-                    reasoning_str = str(reasoning_obj.text)
-                else:
-                    reasoning_str = str(reasoning_obj)
-
-            return {
-                "output_text": result.output_text,
-                "reasoning": reasoning_str,
+        if reasoning_effort != "none":
+            kwargs["reasoning"] = {"effort": reasoning_effort}
+
+        if json_schema:
+            kwargs["text"] = {
+                "format": {
+                    "type": "json_schema",
+                    "name": schema_name,
+                    "schema": json_schema,
+                    "strict": True,
+                }
             }
+        elif json_mode:
+            kwargs["text"] = {"format": {"type": "json_object"}}
+        return kwargs
 
-        return self._execute_with_retry(_api_call, model)
+    @staticmethod
+    def _parse_responses_result(result: Any) -> Dict[str, Any]:
+        """Map a Responses API result to the standard {output_text, reasoning} dict."""
+        reasoning_obj = getattr(result, "reasoning", None)
+        reasoning_str = None
+        if reasoning_obj is not None:
+            if hasattr(reasoning_obj, "summary") and reasoning_obj.summary:
+                reasoning_str = str(reasoning_obj.summary)
+            elif hasattr(reasoning_obj, "text") and reasoning_obj.text:
+                reasoning_str = str(reasoning_obj.text)
+            else:
+                reasoning_str = str(reasoning_obj)
+
+        return {
+            "output_text": result.output_text,
+            "reasoning": reasoning_str,
+        }
 
     # ─── OpenAI Chat Completions API (gpt-4o, gpt-4o-mini) ───────────
 
@@ -404,20 +504,35 @@ class LLMService:
         }))
 
         def _api_call():
-            kwargs = {
-                "model": model,
-                "messages": [{"role": "user", "content": prompt}],
-                "max_completion_tokens": max_tokens,
-                "temperature": temperature,
-                "timeout": self.timeout,
-            }
-            if json_mode:
-                kwargs["response_format"] = {"type": "json_object"}
+            kwargs = self._chat_kwargs(prompt, model, max_tokens, temperature, json_mode)
             response = self.client.chat.completions.create(**kwargs)
             return response.choices[0].message.content
 
         return self._execute_with_retry(_api_call, model)
 
+    def _chat_kwargs(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.7,
+        json_mode: bool = True,
+        stream: bool = False,
+    ) -> Dict[str, Any]:
+        """Build kwargs for chat.completions.create() — shared by sync, async and streaming paths."""
+        kwargs: Dict[str, Any] = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_completion_tokens": max_tokens,
+            "temperature": temperature,
+            "timeout": self.timeout,
+        }
+        if stream:
+            kwargs["stream"] = True
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+
     # ─── Anthropic ────────────────────────────────────────────────────
 
     def _call_anthropic(
@@ -493,6 +608,264 @@ class LLMService:
 
         return self._execute_with_retry(_api_call, f"Gemini-{model_name}")
 
+    # ─── Native async entry points (live tutor) ──────────────────────
+
+    def _async_clients(self) -> "_AsyncClients":
+        """Pooled async clients for the running event loop.
+
+        httpx connection pools belong to the loop that opened them, so one
+        bundle is kept per loop (weakly — it goes away with the loop, and
+        `aclose_loop_clients()` closes it for short-lived loops). Within
+        a loop — e.g. a uvicorn worker — every call shares the same warm
+        keep-alive pool, and a shared LLMService stays safe to use from
+        threads running their own loops.
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._async_bundles.get(loop)
+        if clients is None:
+            with self._async_lock:
+                clients = self._async_bundles.get(loop)
+                if clients is None:
+                    clients = _AsyncClients(
+                        openai=AsyncOpenAI(
+                            api_key=self._api_key,
+                            http_client=DefaultAsyncHttpxClient(limits=self.pool_limits),
+                        ),
+                        gemini=(
+                            genai.Client(api_key=self._gemini_api_key).aio
+                            if self.has_gemini else None
+                        ),
+                        anthropic=(
+                            self.anthropic_adapter.build_async_client()
+                            if self.anthropic_adapter else None
+                        ),
+                    )
+                    self._async_bundles[loop] = clients
+                    with _loop_bundle_owners_lock:
+                        _loop_bundle_owners.setdefault(loop, []).append(
+                            self._async_bundles
+                        )
+        return clients
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client bound to the running event loop."""
+        return self._async_clients().openai
+
+    async def acall(
+        self,
+        prompt: str,
+        reasoning_effort: str = "none",
+        json_mode: bool = True,
+        json_schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "response",
+        system_prompt_file: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async twin of `call()` — same routing, same return shape."""
+        effort = reasoning_effort if reasoning_effort and reasoning_effort != "none" \
+            else self.reasoning_effort
+
+        if self.provider == "claude_code":
+            # Subprocess-based CLI has no async client; keep it off the loop.
+            return await asyncio.to_thread(
+                self._call_claude_code, prompt, effort, json_mode, json_schema,
+                schema_name, system_prompt_file,
+            )
+
+        if self.provider in ("anthropic", "anthropic-haiku"):
+            if not self.anthropic_adapter:
+                raise LLMServiceError("Anthropic adapter not configured (missing API key)")
+            return await self.anthropic_adapter.call_async(
+                prompt=prompt,
+                reasoning_effort=effort,
+                json_mode=json_mode,
+                json_schema=json_schema,
+                schema_name=schema_name,
+                client=self._async_clients().anthropic,
+            )
+        elif self.provider == "google":
+            text = await self._acall_gemini(prompt, model_name=self.model_id, json_mode=json_mode)
+            return {"output_text": text, "reasoning": None}
+        else:
+            if self.model_id in _RESPONSES_API_MODELS:
+                return await self._acall_responses_api(
+                    prompt, self.model_id, effort, json_mode, json_schema, schema_name
+                )
+            text = await self._acall_chat_completions(
+                prompt, self.model_id, json_mode=json_mode
+            )
+            return {"output_text": text, "reasoning": None}
+
+    async def acall_fast(
+        self,
+        prompt: str,
+        json_mode: bool = True,
+        json_schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "response",
+    ) -> Dict[str, Any]:
+        """Async twin of `call_fast()` — always OpenAI Chat Completions on the fast model."""
+        model = self.fast_model_id
+        logger.info(json.dumps({
+            "step": "LLM_CALL_FAST",
+            "status": "starting",
+            "model": model,
+        }))
+        text = await self._acall_chat_completions(
+            prompt, model, max_tokens=512, temperature=0.3, json_mode=json_mode
+        )
+        return {"output_text": text, "reasoning": None}
+
+    async def acall_stream(
+        self,
+        prompt: str,
+        reasoning_effort: str = "none",
+        json_mode: bool = True,
+        json_schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "response",
+    ) -> AsyncGenerator[str, None]:
+        """Async twin of `call_stream()` — yields text chunks as they arrive."""
+        effort = reasoning_effort if reasoning_effort and reasoning_effort != "none" \
+            else self.reasoning_effort
+
+        if self.provider == "claude_code":
+            result = await self.acall(prompt, effort, json_mode, json_schema, schema_name)
+            yield result.get("output_text", "")
+            return
+
+        if self.provider in ("anthropic", "anthropic-haiku"):
+            if self.anthropic_adapter:
+                async for chunk in self.anthropic_adapter.stream_async(
+                    prompt, effort, json_mode, json_schema, schema_name,
+                    client=self._async_clients().anthropic,
+                ):
+                    yield chunk
+                return
+            result = await self.acall(prompt, effort, json_mode, json_schema, schema_name)
+            yield result.get("output_text", "")
+            return
+
+        if self.provider == "google":
+            yield await self._acall_gemini(prompt, model_name=self.model_id, json_mode=json_mode)
+            return
+
+        if self.model_id in _RESPONSES_API_MODELS:
+            kwargs = self._responses_kwargs(
+                prompt, self.model_id, effort, json_mode, json_schema, schema_name, stream=True
+            )
+        else:
+            kwargs = self._chat_kwargs(prompt, self.model_id, json_mode=json_mode, stream=True)
+
+        logger.info(json.dumps({
+            "step": "LLM_CALL_STREAM",
+            "status": "starting",
+            "model": self.model_id,
+        }))
+        start_time = time.time()
+        total_chars = 0
+
+        if self.model_id in _RESPONSES_API_MODELS:
+            stream = await self.async_client.responses.create(**kwargs)
+            async for event in stream:
+                if getattr(event, "type", None) == "response.output_text.delta":
+                    total_chars += len(event.delta)
+                    yield event.delta
+        else:
+            stream = await self.async_client.chat.completions.create(**kwargs)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    content = chunk.choices[0].delta.content
+                    total_chars += len(content)
+                    yield content
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(json.dumps({
+            "step": "LLM_CALL_STREAM",
+            "status": "complete",
+            "model": self.model_id,
+            "output": {"response_length": total_chars},
+            "duration_ms": duration_ms,
+        }))
+
+    async def _acall_responses_api(
+        self,
+        prompt: str,
+        model: str,
+        reasoning_effort: str = "none",
+        json_mode: bool = True,
+        json_schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "response",
+    ) -> Dict[str, Any]:
+        logger.info(json.dumps({
+            "step": "LLM_CALL",
+            "status": "starting",
+            "model": model,
+            "params": {
+                "reasoning_effort": reasoning_effort,
+                "json_mode": json_mode,
+                "has_schema": json_schema is not None,
+                "schema_name": schema_name if json_schema else None,
+            }
+        }))
+
+        async def _api_call():
+            kwargs = self._responses_kwargs(
+                prompt, model, reasoning_effort, json_mode, json_schema, schema_name
+            )
+            result = await self.async_client.responses.create(**kwargs)
+            return self._parse_responses_result(result)
+
+        return await self._aexecute_with_retry(_api_call, model)
+
+    async def _acall_chat_completions(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int = 2048,
+        temperature: float = 0.7,
+        json_mode: bool = True,
+    ) -> str:
+        logger.info(json.dumps({
+            "step": "LLM_CALL",
+            "status": "starting",
+            "model": model,
+            "params": {"json_mode": json_mode}
+        }))
+
+        async def _api_call():
+            kwargs = self._chat_kwargs(prompt, model, max_tokens, temperature, json_mode)
+            response = await self.async_client.chat.completions.create(**kwargs)
+            return response.choices[0].message.content
+
+        return await self._aexecute_with_retry(_api_call, model)
+
+    async def _acall_gemini(
+        self,
+        prompt: str,
+        model_name: str = "gemini-3-pro-preview",
+        temperature: float = 0.7,
+        json_mode: bool = True,
+    ) -> str:
+        if not self.has_gemini:
+            raise LLMServiceError("Gemini API key not configured")
+
+        logger.info(json.dumps({
+            "step": "LLM_CALL",
+            "status": "starting",
+            "model": model_name,
+            "params": {"temperature": temperature}
+        }))
+
+        async def _api_call():
+            config = {"temperature": temperature}
+            if json_mode:
+                config["response_mime_type"] = "application/json"
+            response = await self._async_clients().gemini.models.generate_content(
+                model=model_name, contents=prompt, config=config
+            )
+            return response.text
+
+        return await self._aexecute_with_retry(_api_call, f"Gemini-{model_name}")
+
     # ─── Helpers ──────────────────────────────────────────────────────
 
     @staticmethod
@@ -500,40 +873,10 @@ class LLMService:
         """
         Transform a JSON schema to meet OpenAI's strict mode requirements.
 
-        OpenAI's structured output with strict=true requires:
-        1. All objects must have additionalProperties: false
-        2. All properties must be in the required array
-        3. $defs references must also be transformed
-        4. $ref cannot have sibling keywords (like description)
+        See shared/utils/strict_schema.py. Prefer `get_strict_schema(Model)`,
+        which computes a model's strict schema once per process.
         """
-        def transform(obj: Dict[str, Any]) -> Dict[str, Any]:
-            if not isinstance(obj, dict):
-                return obj
-
-            if "$ref" in obj:
-                return {"$ref": obj["$ref"]}
-
-            result = {}
-            for key, value in obj.items():
-                if key == "$defs":
-                    result[key] = {k: transform(v) for k, v in value.items()}
-                elif isinstance(value, dict):
-                    result[key] = transform(value)
-                elif isinstance(value, list):
-                    result[key] = [
-                        transform(item) if isinstance(item, dict) else item
-                        for item in value
-                    ]
-                else:
-                    result[key] = value
-
-            if result.get("type") == "object" and "properties" in result:
-                result["additionalProperties"] = False
-                result["required"] = list(result["properties"].keys())
-
-            return result
-
-        return transform(schema)
+        return make_schema_strict(schema)
 
     def _execute_with_retry(self, api_call_fn, model_name: str) -> Any:
         """Execute API call with exponential backoff retry logic."""
@@ -600,6 +943,61 @@ class LLMService:
             f"{model_name} failed after {self.max_retries} attempts. Last error: {str(last_error)}"
         ) from last_error
 
+    async def _aexecute_with_retry(self, api_call_fn, model_name: str) -> Any:
+        """Async twin of `_execute_with_retry` — backs off with asyncio.sleep."""
+        last_error = None
+        delay = self.initial_retry_delay
+        start_time = time.time()
+
+        for attempt in range(self.max_retries):
+            try:
+                result = await api_call_fn()
+                duration_ms = int((time.time() - start_time) * 1000)
+
+                logger.info(json.dumps({
+                    "step": "LLM_CALL",
+                    "status": "complete",
+                    "model": model_name,
+                    "output": {"response_length": len(str(result)) if result else 0},
+                    "duration_ms": duration_ms,
+                    "attempts": attempt + 1
+                }))
+
+                if attempt > 0:
+                    logger.info(f"{model_name} call succeeded on attempt {attempt + 1}")
+                return result
+
+            except (RateLimitError, APITimeoutError) as e:
+                last_error = e
+                kind = "rate limit hit" if isinstance(e, RateLimitError) else "timeout"
+                logger.warning(
+                    f"{model_name} {kind} (attempt {attempt + 1}/{self.max_retries}). "
+                    f"Retrying in {delay}s..."
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+            except OpenAIError as e:
+                logger.error(f"{model_name} API error: {str(e)}")
+                raise LLMServiceError(f"{model_name} API error: {str(e)}") from e
+
+            except Exception as e:
+                logger.error(f"{model_name} unexpected error: {str(e)}")
+                raise LLMServiceError(f"{model_name} unexpected error: {str(e)}") from e
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(json.dumps({
+            "step": "LLM_CALL",
+            "status": "failed",
+            "model": model_name,
+            "error": str(last_error),
+            "duration_ms": duration_ms,
+            "attempts": self.max_retries
+        }))
+        raise LLMServiceError(
+            f"{model_name} failed after {self.max_retries} attempts. Last error: {str(last_error)}"
+        ) from last_error
+
     def parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON response from LLM."""
         try:
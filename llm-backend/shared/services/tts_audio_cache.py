@@ -0,0 +1,249 @@
+"""
+TTS audio cache — content-addressed MP3s for the runtime /text-to-speech endpoint.
+
+Many students hear the same tutor openers and check-in prompts, and every
+call to the endpoint used to go to Google / ElevenLabs. Audio is keyed by a
+hash of everything that determines the bytes — provider, voice role, the
+provider's voice/model settings and the normalized text — so identical
+requests share one synthesis.
+
+Two tiers, checked in order:
+
+1. Process memory — LRU bounded by total bytes (`tts_cache_memory_mb`).
+2. S3 — `{tts_cache_s3_prefix}{key[:2]}/{key}.mp3` in the app bucket, shared
+   by every worker and surviving deploys. S3 errors are logged and treated
+   as a miss; they never fail the request. Callers pass `use_s3=False` for
+   text that carries a student's name, which then never leaves the process.
+
+Concurrent misses for the same key are collapsed (single-flight): the first
+request synthesizes, the others await its result.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump to orphan every cached object (e.g. after a normalization change that
+# the key inputs don't capture).
+CACHE_KEY_VERSION = 1
+
+
+def tts_cache_key(provider: str, voice_role: str, voice_spec: Dict[str, Any], text: str) -> str:
+    """Content address for one synthesized clip."""
+    payload = json.dumps(
+        {
+            "v": CACHE_KEY_VERSION,
+            "provider": provider,
+            "voice_role": voice_role,
+            "voice": voice_spec,
+            "text": text,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTSAudioCache:
+    """Memory + S3 cache of synthesized MP3s with single-flight misses."""
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        s3_prefix: Optional[str] = None,
+        s3_client: Any = None,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.max_memory_bytes = max_memory_bytes
+        self.s3_prefix = s3_prefix
+        self._s3 = s3_client
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._uploads: Set[asyncio.Task] = set()
+        self._requests = 0
+        self._memory_hits = 0
+        self._s3_hits = 0
+        self._collapsed = 0
+        self._misses = 0
+        self._bytes_saved = 0
+
+    async def get_or_synthesize(
+        self,
+        key: str,
+        synthesize: Callable[[], Awaitable[bytes]],
+        *,
+        use_s3: bool = True,
+    ) -> Tuple[bytes, str]:
+        """Return (mp3_bytes, source); source is memory | s3 | shared | provider.
+
+        `synthesize` is only awaited on a miss in both tiers, and only by the
+        first of any concurrent requests for `key`. With `use_s3=False` the
+        S3 tier is neither read nor written.
+        """
+        if not self.enabled:
+            return await synthesize(), "provider"
+
+        with self._lock:
+            self._requests += 1
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                self._bytes_saved += len(audio)
+                return audio, "memory"
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                audio = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading request was cancelled, not us — start over.
+                with self._lock:
+                    self._requests -= 1
+                return await self.get_or_synthesize(key, synthesize, use_s3=use_s3)
+            with self._lock:
+                self._collapsed += 1
+                self._bytes_saved += len(audio)
+            return audio, "shared"
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            audio = await self._s3_get(key) if use_s3 else None
+            if audio is not None:
+                source = "s3"
+                with self._lock:
+                    self._s3_hits += 1
+                    self._bytes_saved += len(audio)
+            else:
+                source = "provider"
+                with self._lock:
+                    self._misses += 1
+                audio = await synthesize()
+                if use_s3:
+                    self._schedule_s3_put(key, audio)
+            self._memory_put(key, audio)
+            future.set_result(audio)
+            return audio, source
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved — there may be no waiters
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _memory_put(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = audio
+            self._memory_bytes += len(audio)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _s3_key(self, key: str) -> str:
+        return f"{self.s3_prefix}{key[:2]}/{key}.mp3"
+
+    def _s3_client(self):
+        if self._s3 is None:
+            from shared.utils.s3_client import get_s3_client
+            self._s3 = get_s3_client()
+        return self._s3
+
+    async def _s3_get(self, key: str) -> Optional[bytes]:
+        if not self.s3_prefix:
+            return None
+        try:
+            return await asyncio.to_thread(
+                self._s3_client().download_bytes_if_exists, self._s3_key(key),
+            )
+        except Exception as e:
+            logger.warning(f"TTS cache S3 read failed for {key}: {e}")
+            return None
+
+    def _schedule_s3_put(self, key: str, audio: bytes) -> None:
+        """Upload in the background so the response isn't held up by S3."""
+        if not self.s3_prefix:
+            return
+        task = asyncio.create_task(self._s3_put(key, audio))
+        self._uploads.add(task)
+        task.add_done_callback(self._uploads.discard)
+
+    async def _s3_put(self, key: str, audio: bytes) -> None:
+        try:
+            await asyncio.to_thread(
+                self._s3_client().upload_bytes, audio, self._s3_key(key), "audio/mpeg",
+            )
+        except Exception as e:
+            logger.warning(f"TTS cache S3 write failed for {key}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self._memory_hits + self._s3_hits + self._collapsed
+            return {
+                "enabled": self.enabled,
+                "requests": self._requests,
+                "memory_hits": self._memory_hits,
+                "s3_hits": self._s3_hits,
+                "collapsed": self._collapsed,
+                "misses": self._misses,
+                "hit_rate": round(hits / self._requests, 4) if self._requests else 0.0,
+                "bytes_saved": self._bytes_saved,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._requests = 0
+            self._memory_hits = 0
+            self._s3_hits = 0
+            self._collapsed = 0
+            self._misses = 0
+            self._bytes_saved = 0
+
+
+_tts_audio_cache: Optional[TTSAudioCache] = None
+_tts_audio_cache_lock = threading.Lock()
+
+
+def get_tts_audio_cache() -> TTSAudioCache:
+    global _tts_audio_cache
+    if _tts_audio_cache is None:
+        with _tts_audio_cache_lock:
+            if _tts_audio_cache is None:
+                from config import get_settings
+                settings = get_settings()
+                _tts_audio_cache = TTSAudioCache(
+                    max_memory_bytes=settings.tts_cache_memory_mb * 1024 * 1024,
+                    s3_prefix=settings.tts_cache_s3_prefix or None,
+                    enabled=settings.tts_cache_enabled,
+                )
+    return _tts_audio_cache
+
+
+def reset_tts_audio_cache() -> None:
+    """Drop the global cache instance (useful for testing)."""
+    global _tts_audio_cache
+    _tts_audio_cache = None
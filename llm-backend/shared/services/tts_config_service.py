@@ -20,6 +20,7 @@ from sqlalchemy.orm import Session as DBSession
 
 from config import get_settings
 from shared.repositories.llm_config_repository import LLMConfigRepository
+from shared.services.config_cache import LLM_CONFIG_NAMESPACE, get_config_cache
 
 logger = logging.getLogger(__name__)
 
@@ -47,14 +48,24 @@ class TTSConfigService:
         self.repo = LLMConfigRepository(db)
 
     def get_provider(self) -> str:
-        """Return the active TTS provider, resolving admin row → env → default."""
-        row = self.repo.get_by_key(TTS_COMPONENT_KEY)
-        if row and row.provider:
-            provider = row.provider.strip().lower()
+        """Return the active TTS provider, resolving admin row → env → default.
+
+        The admin row is read through the process-wide config cache, so
+        per-request resolution (e.g. `/text-to-speech`) costs no query.
+        """
+        def _load() -> Optional[str]:
+            row = self.repo.get_by_key(TTS_COMPONENT_KEY)
+            return row.provider if row else None
+
+        stored = get_config_cache().get(
+            self.repo.db, LLM_CONFIG_NAMESPACE, TTS_COMPONENT_KEY, _load,
+        )
+        if stored:
+            provider = stored.strip().lower()
             if provider in VALID_TTS_PROVIDERS:
                 return provider
             logger.warning(
-                f"Invalid tts provider {row.provider!r} in llm_config — "
+                f"Invalid tts provider {stored!r} in llm_config — "
                 f"falling back to env"
             )
         env_provider = (get_settings().tts_provider or "").strip().lower()
@@ -81,6 +92,7 @@ class TTSConfigService:
             reasoning_effort="max",  # column is NOT NULL; unused for TTS
             updated_by=updated_by,
         )
+        get_config_cache().bump(self.db, LLM_CONFIG_NAMESPACE)
         self.db.commit()
         return {
             "provider": row.provider,
@@ -0,0 +1,418 @@
+"""
+Blob storage backends behind the S3Client interface.
+
+Ingestion, audio synthesis and the TTS cache talk to `get_s3_client()`,
+which returns the backend picked by `blob_store_backend`:
+
+- `s3` (default) — `S3Client`, AWS S3.
+- `local` — `LocalBlobStore`, files under `blob_store_local_root`. For dev
+  and single-node deployments; objects are served at `GET /blobs/{key}`
+  (shared/api/blob_routes.py). As on the S3 bucket, keys under
+  `PUBLIC_PREFIXES` are readable by anyone; every other key needs the
+  HMAC-signed, expiring URL from `get_presigned_url()`.
+- `memory` — `MemoryBlobStore`, a process-local dict. For tests and
+  benchmarks.
+
+All backends share the `BlobStore` method set and error contract: a missing
+key on a strict read raises botocore `ClientError` with code `NoSuchKey`,
+exactly as S3 does, so callers don't branch on the backend.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import mimetypes
+import os
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Mapping, Optional
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# Key prefixes the S3 bucket serves publicly (pre-generated audio clips).
+PUBLIC_PREFIXES = ("audio/",)
+
+
+def _not_found(s3_key: str, operation: str = "GetObject") -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "NoSuchKey", "Message": f"No such key: {s3_key}"}}, operation,
+    )
+
+
+class BlobStore(ABC):
+    """Object store interface shared by the S3, local-disk and in-memory backends."""
+
+    bucket_name: str
+    max_concurrency: int = 8
+
+    # ─── Backend-specific ────────────────────────────────────────────────
+
+    @abstractmethod
+    def upload_bytes(self, data: bytes, s3_key: str, content_type: Optional[str] = None) -> str:
+        """Store `data` under `s3_key`; returns the backend URI of the object."""
+
+    @abstractmethod
+    def download_bytes_if_exists(self, s3_key: str) -> Optional[bytes]:
+        """Object contents, or None if the key is missing."""
+
+    @abstractmethod
+    def delete_many(self, s3_keys: Iterable[str]) -> int:
+        """Delete objects; missing keys count as deleted. Returns the count."""
+
+    @abstractmethod
+    def list_keys(self, prefix: str) -> List[str]:
+        """Every object key under `prefix`."""
+
+    @abstractmethod
+    def file_exists(self, s3_key: str) -> bool:
+        """Whether an object exists at `s3_key`."""
+
+    @abstractmethod
+    def public_url(self, s3_key: str) -> str:
+        """URL a browser can fetch the object from (e.g. audio_url fields)."""
+
+    # ─── Shared behavior ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _check_upload_args(data: Any, s3_key: Any, method: str = "upload_bytes") -> None:
+        """Type guards to prevent argument order mistakes."""
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                f"data must be bytes-like, got {type(data).__name__}. "
+                f"Did you swap the arguments? {method}(data, s3_key)"
+            )
+        if not isinstance(s3_key, str):
+            raise TypeError(
+                f"s3_key must be str, got {type(s3_key).__name__}. "
+                f"Did you swap the arguments? {method}(data, s3_key)"
+            )
+
+    def _map(self, fn, items: List[Any]) -> List[Any]:
+        """Run `fn` over `items` on the bulk thread pool, preserving order."""
+        if len(items) <= 1 or self.max_concurrency == 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(items)),
+            thread_name_prefix="blob-bulk",
+        ) as pool:
+            return list(pool.map(fn, items))
+
+    def upload_file(self, local_path: str, s3_key: str) -> str:
+        with open(local_path, "rb") as f:
+            return self.upload_fileobj(f, s3_key)
+
+    def upload_fileobj(
+        self, fileobj: BinaryIO, s3_key: str, content_type: Optional[str] = None,
+    ) -> str:
+        return self.upload_bytes(fileobj.read(), s3_key, content_type)
+
+    def download_bytes(self, s3_key: str) -> bytes:
+        data = self.download_bytes_if_exists(s3_key)
+        if data is None:
+            raise _not_found(s3_key)
+        return data
+
+    def download_file(self, s3_key: str, local_path: str) -> str:
+        Path(local_path).write_bytes(self.download_bytes(s3_key))
+        return local_path
+
+    def get_presigned_url(self, s3_key: str, expiration: int = 3600) -> str:
+        """Public URL plus an expiry and HMAC signature that GET /blobs checks."""
+        expires = int(time.time()) + expiration
+        return f"{self.public_url(s3_key)}?exp={expires}&sig={self._signature(s3_key, expires)}"
+
+    def verify_presigned(self, s3_key: str, expires: Optional[int], signature: Optional[str]) -> bool:
+        """Whether (`expires`, `signature`) came from get_presigned_url and is unexpired."""
+        if expires is None or not signature or expires < time.time():
+            return False
+        return hmac.compare_digest(signature, self._signature(s3_key, expires))
+
+    def _signature(self, s3_key: str, expires: int) -> str:
+        message = f"{s3_key}\n{expires}".encode()
+        return hmac.new(self._signing_key, message, hashlib.sha256).hexdigest()
+
+    def delete_file(self, s3_key: str) -> bool:
+        self.delete_many([s3_key])
+        return True
+
+    def delete_folder(self, prefix: str) -> int:
+        """
+        Delete all objects with a given prefix (folder).
+
+        Args:
+            prefix: Key prefix (e.g., "books/book_id/")
+
+        Returns:
+            Number of objects deleted
+        """
+        keys = self.list_keys(prefix)
+        if not keys:
+            logger.info(f"No objects found with prefix: {prefix}")
+            return 0
+        count = self.delete_many(keys)
+        logger.info(f"Deleted {count} objects with prefix: {prefix}")
+        return count
+
+    def upload_many(
+        self, objects: Mapping[str, bytes], content_type: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Upload several objects concurrently.
+
+        Args:
+            objects: key -> bytes
+            content_type: MIME type applied to every object
+
+        Returns:
+            key -> backend URI, in input order
+        """
+        keys = list(objects)
+        urls = self._map(lambda key: self.upload_bytes(objects[key], key, content_type), keys)
+        return dict(zip(keys, urls))
+
+    def download_many(
+        self, s3_keys: Iterable[str], missing_ok: bool = False,
+    ) -> Dict[str, Optional[bytes]]:
+        """
+        Download several objects concurrently.
+
+        Args:
+            s3_keys: Object keys
+            missing_ok: Map missing keys to None instead of raising
+
+        Returns:
+            key -> contents, in input order
+        """
+        keys = list(dict.fromkeys(s3_keys))
+        fetch = self.download_bytes_if_exists if missing_ok else self.download_bytes
+        return dict(zip(keys, self._map(fetch, keys)))
+
+    def upload_json(self, data: Dict[str, Any], s3_key: str) -> str:
+        """
+        Upload a Python dict as JSON.
+
+        Raises:
+            TypeError: If arguments are wrong types
+        """
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"data must be dict, got {type(data).__name__}. "
+                f"Did you swap the arguments? upload_json(data, s3_key)"
+            )
+        if not isinstance(s3_key, str):
+            raise TypeError(
+                f"s3_key must be str, got {type(s3_key).__name__}. "
+                f"Did you swap the arguments? upload_json(data, s3_key)"
+            )
+
+        json_str = json.dumps(data, indent=2)
+        json_bytes = json_str.encode('utf-8')
+        return self.upload_bytes(json_bytes, s3_key, content_type='application/json')
+
+    def download_json(self, s3_key: str) -> Dict[str, Any]:
+        """Download and parse a JSON object."""
+        return json.loads(self.download_bytes(s3_key).decode('utf-8'))
+
+    def update_metadata_json(self, book_id: str, metadata: Dict[str, Any]) -> str:
+        """Update the metadata.json file for a book."""
+        return self.upload_json(metadata, f"books/{book_id}/metadata.json")
+
+
+class LocalBlobStore(BlobStore):
+    """Objects as files under `root`; keys are relative paths.
+
+    Writes go to a temp file in the target directory and are renamed into
+    place, so readers never see a partial object.
+    """
+
+    def __init__(
+        self, root: str, public_base_url: str = "", max_concurrency: int = 8,
+        signing_key: str = "",
+    ):
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.bucket_name = str(self.root)
+        self.public_base_url = public_base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self._signing_key = (signing_key or secrets.token_hex(32)).encode()
+        logger.info(f"Local blob store at {self.root}")
+
+    def path_for(self, s3_key: str) -> Path:
+        """Filesystem path of `s3_key`; rejects keys that escape the root."""
+        path = (self.root / s3_key.lstrip("/")).resolve()
+        if path != self.root and self.root not in path.parents:
+            raise ValueError(f"Blob key escapes the store root: {s3_key!r}")
+        return path
+
+    def upload_bytes(self, data: bytes, s3_key: str, content_type: Optional[str] = None) -> str:
+        self._check_upload_args(data, s3_key)
+        path = self.path_for(s3_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path.as_uri()
+
+    def upload_file(self, local_path: str, s3_key: str) -> str:
+        path = self.path_for(s3_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(local_path, path)
+        return path.as_uri()
+
+    def download_bytes_if_exists(self, s3_key: str) -> Optional[bytes]:
+        # One sized read into one buffer; callers need `bytes`, so mapping
+        # the file would only add a copy out of the map.
+        try:
+            return self.path_for(s3_key).read_bytes()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
+    def download_file(self, s3_key: str, local_path: str) -> str:
+        path = self.path_for(s3_key)
+        if not path.is_file():
+            raise _not_found(s3_key)
+        shutil.copyfile(path, local_path)
+        return local_path
+
+    def delete_many(self, s3_keys: Iterable[str]) -> int:
+        count = 0
+        for key in dict.fromkeys(s3_keys):
+            self.path_for(key).unlink(missing_ok=True)
+            count += 1
+        return count
+
+    def list_keys(self, prefix: str) -> List[str]:
+        keys = []
+        for path in self.root.rglob("*"):
+            if path.is_file() and not path.name.startswith(".upload-"):
+                key = path.relative_to(self.root).as_posix()
+                if key.startswith(prefix):
+                    keys.append(key)
+        return sorted(keys)
+
+    def file_exists(self, s3_key: str) -> bool:
+        return self.path_for(s3_key).is_file()
+
+    def public_url(self, s3_key: str) -> str:
+        if self.public_base_url:
+            return f"{self.public_base_url}/{s3_key}"
+        return self.path_for(s3_key).as_uri()
+
+
+class MemoryBlobStore(BlobStore):
+    """Thread-safe in-process object store."""
+
+    def __init__(self, public_base_url: str = "", max_concurrency: int = 8, signing_key: str = ""):
+        self.bucket_name = "memory"
+        self.public_base_url = public_base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self._signing_key = (signing_key or secrets.token_hex(32)).encode()
+        self.objects: Dict[str, bytes] = {}
+        self.content_types: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def upload_bytes(self, data: bytes, s3_key: str, content_type: Optional[str] = None) -> str:
+        self._check_upload_args(data, s3_key)
+        with self._lock:
+            self.objects[s3_key] = bytes(data)
+            if content_type:
+                self.content_types[s3_key] = content_type
+            else:
+                self.content_types.pop(s3_key, None)
+        return f"memory://{s3_key}"
+
+    def download_bytes_if_exists(self, s3_key: str) -> Optional[bytes]:
+        with self._lock:
+            return self.objects.get(s3_key)
+
+    def delete_many(self, s3_keys: Iterable[str]) -> int:
+        keys = list(dict.fromkeys(s3_keys))
+        with self._lock:
+            for key in keys:
+                self.objects.pop(key, None)
+                self.content_types.pop(key, None)
+        return len(keys)
+
+    def list_keys(self, prefix: str) -> List[str]:
+        with self._lock:
+            return sorted(k for k in self.objects if k.startswith(prefix))
+
+    def file_exists(self, s3_key: str) -> bool:
+        with self._lock:
+            return s3_key in self.objects
+
+    def public_url(self, s3_key: str) -> str:
+        if self.public_base_url:
+            return f"{self.public_base_url}/{s3_key}"
+        return f"memory://{s3_key}"
+
+
+def is_public_key(s3_key: str) -> bool:
+    """Whether `s3_key` is under a prefix the bucket serves without signing."""
+    parts = s3_key.split("/")
+    if "." in parts or ".." in parts:
+        return False
+    return s3_key.startswith(PUBLIC_PREFIXES)
+
+
+def guess_content_type(s3_key: str) -> str:
+    return mimetypes.guess_type(s3_key)[0] or "application/octet-stream"
+
+
+_blob_store: Optional[BlobStore] = None
+_blob_store_lock = threading.Lock()
+
+
+def create_blob_store(backend: Optional[str] = None) -> BlobStore:
+    """Build the backend named by `backend` (default: `blob_store_backend`)."""
+    from config import get_settings
+
+    settings = get_settings()
+    backend = (backend or settings.blob_store_backend).strip().lower()
+    if backend == "s3":
+        from shared.utils.s3_client import S3Client
+        return S3Client()
+    if backend == "local":
+        return LocalBlobStore(
+            settings.blob_store_local_root,
+            public_base_url=settings.blob_store_public_base_url,
+            max_concurrency=settings.s3_max_concurrency,
+            signing_key=settings.blob_store_signing_key,
+        )
+    if backend == "memory":
+        return MemoryBlobStore(
+            public_base_url=settings.blob_store_public_base_url,
+            max_concurrency=settings.s3_max_concurrency,
+            signing_key=settings.blob_store_signing_key,
+        )
+    raise ValueError(f"Unknown blob_store_backend: {backend!r} (expected s3, local or memory)")
+
+
+def get_blob_store() -> BlobStore:
+    """Get or create the process-wide blob store for the configured backend."""
+    global _blob_store
+    if _blob_store is None:
+        with _blob_store_lock:
+            if _blob_store is None:
+                _blob_store = create_blob_store()
+    return _blob_store
+
+
+def reset_blob_store() -> None:
+    """Drop the global blob store (useful for testing)."""
+    global _blob_store
+    _blob_store = None
@@ -0,0 +1,75 @@
+"""Thread-safe token bucket and per-provider limiters for pacing calls to rate-limited external APIs."""
+
+import threading
+import time
+from typing import Callable, Dict
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, bursting up to `burst`.
+
+    `acquire()` blocks the calling thread until a token is available, so a
+    pool of worker threads sharing one bucket never exceeds the rate no
+    matter how many workers there are. A rate of 0 or less disables pacing.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting if necessary. Returns seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class ProviderLimiter:
+    """Process-wide pacing for one provider: request rate + in-flight cap."""
+
+    def __init__(self, requests_per_second: float, concurrency: int):
+        self.bucket = TokenBucket(requests_per_second, burst=concurrency)
+        self.slots = threading.BoundedSemaphore(concurrency)
+
+
+_provider_limiters: Dict[str, ProviderLimiter] = {}
+_provider_limiters_lock = threading.Lock()
+
+
+def get_provider_limiter(name: str, requests_per_second: float, concurrency: int) -> ProviderLimiter:
+    """The shared limiter for `name`, created with these settings on first use."""
+    with _provider_limiters_lock:
+        limiter = _provider_limiters.get(name)
+        if limiter is None:
+            limiter = ProviderLimiter(requests_per_second, max(1, concurrency))
+            _provider_limiters[name] = limiter
+        return limiter
+
+
+def reset_provider_limiters() -> None:
+    """Forget per-provider limiters so settings are re-read (useful for testing)."""
+    with _provider_limiters_lock:
+        _provider_limiters.clear()
@@ -2,19 +2,36 @@
 AWS S3 client for book ingestion feature.
 
 Provides a clean interface for S3 operations with proper error handling.
+
+One boto3 client is shared process-wide (`get_s3_client`). boto3 clients
+are thread-safe, and the botocore connection pool is sized by
+`s3_max_pool_connections` so worker threads (audio synthesis, OCR, bulk
+calls below) reuse keep-alive connections instead of queueing for a pool
+of 10. Bulk helpers — `upload_many`, `download_many`, `delete_many` — run
+single-object calls on a thread pool of `s3_max_concurrency`; deletes use
+the 1000-key batch `DeleteObjects` API. Uploads of `s3_multipart_threshold_mb`
+or more are streamed as multipart uploads.
+
+`S3Client` is the S3 backend of `BlobStore` (shared/utils/blob_store.py);
+`get_s3_client()` returns whichever backend `blob_store_backend` selects.
 """
-import json
+import io
 import logging
-from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from config import get_settings
+from shared.utils.blob_store import BlobStore, get_blob_store, reset_blob_store
 
 logger = logging.getLogger(__name__)
 
+# DeleteObjects accepts at most this many keys per request.
+DELETE_BATCH_SIZE = 1000
+
 
-class S3Client:
+class S3Client(BlobStore):
     """
     AWS S3 client for book storage operations.
 
@@ -22,7 +39,13 @@ class S3Client:
     Credentials are automatically detected from ~/.aws/credentials or environment.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        client: Any = None,
+        *,
+        bucket_name: Optional[str] = None,
+        region: Optional[str] = None,
+    ):
         """
         Initialize S3 client with settings from config.
 
@@ -30,14 +53,41 @@ class S3Client:
         1. Environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)
         2. ~/.aws/credentials file
         3. IAM role (when running on AWS)
+
+        Args:
+            client: Pre-built boto3 S3 client (tests: a `botocore.stub.Stubber`
+                target or any stand-in with the same methods). Built from
+                settings when omitted.
+            bucket_name: Overrides `aws_s3_bucket`.
+            region: Overrides `aws_region`.
         """
         settings = get_settings()
-        self.bucket_name = settings.aws_s3_bucket
-        self.region = settings.aws_region
-
+        self.bucket_name = bucket_name or settings.aws_s3_bucket
+        self.region = region or settings.aws_region
+        self.max_concurrency = max(1, settings.s3_max_concurrency)
+        multipart_threshold = max(5, settings.s3_multipart_threshold_mb) * 1024 * 1024
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_threshold,
+            max_concurrency=self.max_concurrency,
+        )
+
+        if client is not None:
+            self.s3_client = client
+            return
         try:
-            self.s3_client = boto3.client('s3', region_name=self.region)
-            logger.info(f"S3 client initialized for bucket: {self.bucket_name}, region: {self.region}")
+            self.s3_client = boto3.client(
+                's3',
+                region_name=self.region,
+                config=Config(
+                    max_pool_connections=settings.s3_max_pool_connections,
+                    retries={'mode': 'standard'},
+                ),
+            )
+            logger.info(
+                f"S3 client initialized for bucket: {self.bucket_name}, region: {self.region} "
+                f"(pool={settings.s3_max_pool_connections})"
+            )
         except NoCredentialsError:
             logger.error("AWS credentials not found! Check ~/.aws/credentials or environment variables")
             raise
@@ -57,7 +107,9 @@ class S3Client:
             ClientError: If upload fails
         """
         try:
-            self.s3_client.upload_file(local_path, self.bucket_name, s3_key)
+            self.s3_client.upload_file(
+                local_path, self.bucket_name, s3_key, Config=self.transfer_config,
+            )
             logger.info(f"Uploaded {local_path} to s3://{self.bucket_name}/{s3_key}")
             return f"s3://{self.bucket_name}/{s3_key}"
         except ClientError as e:
@@ -80,17 +132,10 @@ class S3Client:
             ClientError: If upload fails
             TypeError: If arguments are wrong types
         """
-        # Type guards to prevent argument order mistakes
-        if not isinstance(data, (bytes, bytearray, memoryview)):
-            raise TypeError(
-                f"data must be bytes-like, got {type(data).__name__}. "
-                f"Did you swap the arguments? upload_bytes(data, s3_key)"
-            )
-        if not isinstance(s3_key, str):
-            raise TypeError(
-                f"s3_key must be str, got {type(s3_key).__name__}. "
-                f"Did you swap the arguments? upload_bytes(data, s3_key)"
-            )
+        self._check_upload_args(data, s3_key)
+
+        if len(data) >= self.transfer_config.multipart_threshold:
+            return self.upload_fileobj(io.BytesIO(data), s3_key, content_type)
 
         try:
             if content_type:
@@ -112,6 +157,38 @@ class S3Client:
             logger.error(f"Failed to upload bytes to S3: {e}")
             raise
 
+    def upload_fileobj(
+        self, fileobj: BinaryIO, s3_key: str, content_type: Optional[str] = None,
+    ) -> str:
+        """
+        Stream a file-like object to S3, multipart above the threshold.
+
+        Parts are read and uploaded `s3_max_concurrency` at a time, so a large
+        PDF or page image is never held in memory twice.
+
+        Args:
+            fileobj: Readable binary file object
+            s3_key: S3 object key
+            content_type: MIME type
+
+        Returns:
+            S3 URL of uploaded object
+
+        Raises:
+            ClientError: If upload fails
+        """
+        extra_args = {'ContentType': content_type} if content_type else None
+        try:
+            self.s3_client.upload_fileobj(
+                fileobj, self.bucket_name, s3_key,
+                ExtraArgs=extra_args, Config=self.transfer_config,
+            )
+            logger.info(f"Streamed upload to s3://{self.bucket_name}/{s3_key}")
+            return f"s3://{self.bucket_name}/{s3_key}"
+        except ClientError as e:
+            logger.error(f"Failed to stream upload to S3: {e}")
+            raise
+
     def download_file(self, s3_key: str, local_path: str) -> str:
         """
         Download a file from S3.
@@ -156,6 +233,30 @@ class S3Client:
             logger.error(f"Failed to download bytes from S3: {e}")
             raise
 
+    def download_bytes_if_exists(self, s3_key: str) -> Optional[bytes]:
+        """
+        Download file contents as bytes, or None if the object doesn't exist.
+
+        For cache-style reads where a missing key is the normal case.
+
+        Args:
+            s3_key: S3 object key
+
+        Returns:
+            File contents as bytes, or None if the key is missing
+
+        Raises:
+            ClientError: If download fails for any other reason
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            return response['Body'].read()
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return None
+            logger.error(f"Failed to download bytes from S3: {e}")
+            raise
+
     def get_presigned_url(self, s3_key: str, expiration: int = 3600) -> str:
         """
         Generate a presigned URL for temporary access to an S3 object.
@@ -203,44 +304,63 @@ class S3Client:
             logger.error(f"Failed to delete {s3_key} from S3: {e}")
             raise
 
-    def delete_folder(self, prefix: str) -> int:
+    def delete_many(self, s3_keys: Iterable[str]) -> int:
         """
-        Delete all objects with a given prefix (folder).
+        Delete objects with batch DeleteObjects calls (1000 keys each).
 
         Args:
-            prefix: S3 key prefix (e.g., "books/book_id/")
+            s3_keys: S3 object keys; missing keys count as deleted
 
         Returns:
             Number of objects deleted
 
         Raises:
-            ClientError: If deletion fails
+            ClientError: If a batch request fails
+            RuntimeError: If S3 reports per-key failures (after all batches)
         """
-        try:
-            # List all objects with prefix
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
+        keys = list(dict.fromkeys(s3_keys))
+        batches = [
+            keys[i:i + DELETE_BATCH_SIZE] for i in range(0, len(keys), DELETE_BATCH_SIZE)
+        ]
 
-            if 'Contents' not in response:
-                logger.info(f"No objects found with prefix: {prefix}")
-                return 0
-
-            # Delete all objects
-            objects = [{'Key': obj['Key']} for obj in response['Contents']]
-            self.s3_client.delete_objects(
+        def _delete_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            response = self.s3_client.delete_objects(
                 Bucket=self.bucket_name,
-                Delete={'Objects': objects}
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True},
             )
+            return response.get('Errors', [])
 
-            count = len(objects)
-            logger.info(f"Deleted {count} objects with prefix: {prefix}")
-            return count
-
+        try:
+            errors = [err for batch_errors in self._map(_delete_batch, batches) for err in batch_errors]
         except ClientError as e:
-            logger.error(f"Failed to delete folder {prefix} from S3: {e}")
+            logger.error(f"Failed to batch-delete from S3: {e}")
             raise
+        if errors:
+            failed = ", ".join(f"{err.get('Key')} ({err.get('Code')})" for err in errors[:5])
+            logger.error(f"Failed to delete {len(errors)} of {len(keys)} S3 objects: {failed}")
+            raise RuntimeError(f"Failed to delete {len(errors)} S3 objects: {failed}")
+        if keys:
+            logger.info(f"Deleted {len(keys)} objects from s3://{self.bucket_name}")
+        return len(keys)
+
+    def list_keys(self, prefix: str) -> List[str]:
+        """
+        List every object key under a prefix (all pages).
+
+        Args:
+            prefix: S3 key prefix
+
+        Returns:
+            Object keys
+
+        Raises:
+            ClientError: If listing fails
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        keys: List[str] = []
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            keys.extend(obj['Key'] for obj in page.get('Contents', []))
+        return keys
 
     def file_exists(self, s3_key: str) -> bool:
         """
@@ -262,91 +382,25 @@ class S3Client:
                 logger.error(f"Error checking if {s3_key} exists: {e}")
                 raise
 
-    def upload_json(self, data: Dict[str, Any], s3_key: str) -> str:
-        """
-        Upload a Python dict as JSON to S3.
+    def public_url(self, s3_key: str) -> str:
+        """Public HTTPS URL of an object (the bucket serves audio publicly)."""
+        return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{s3_key}"
 
-        Args:
-            data: Dictionary to upload
-            s3_key: S3 object key
-
-        Returns:
-            S3 URL of uploaded JSON
-
-        Raises:
-            ClientError: If upload fails
-            TypeError: If arguments are wrong types
-        """
-        # Type guards to prevent argument order mistakes
-        if not isinstance(data, dict):
-            raise TypeError(
-                f"data must be dict, got {type(data).__name__}. "
-                f"Did you swap the arguments? upload_json(data, s3_key)"
-            )
-        if not isinstance(s3_key, str):
-            raise TypeError(
-                f"s3_key must be str, got {type(s3_key).__name__}. "
-                f"Did you swap the arguments? upload_json(data, s3_key)"
-            )
-
-        json_str = json.dumps(data, indent=2)
-        json_bytes = json_str.encode('utf-8')
-        return self.upload_bytes(json_bytes, s3_key, content_type='application/json')
 
-    def download_json(self, s3_key: str) -> Dict[str, Any]:
-        """
-        Download and parse JSON from S3.
-
-        Args:
-            s3_key: S3 object key
-
-        Returns:
-            Parsed JSON as dictionary
-
-        Raises:
-            ClientError: If download fails
-            json.JSONDecodeError: If JSON parsing fails
-        """
-        json_bytes = self.download_bytes(s3_key)
-        json_str = json_bytes.decode('utf-8')
-        return json.loads(json_str)
-
-    def update_metadata_json(self, book_id: str, metadata: Dict[str, Any]) -> str:
-        """
-        Update the metadata.json file for a book.
-
-        Args:
-            book_id: Book identifier
-            metadata: Metadata dictionary
-
-        Returns:
-            S3 URL of updated metadata.json
-
-        Raises:
-            ClientError: If upload fails
-        """
-        s3_key = f"books/{book_id}/metadata.json"
-        return self.upload_json(metadata, s3_key)
-
-
-# Global S3 client instance
-_s3_client: Optional[S3Client] = None
-
-
-def get_s3_client() -> S3Client:
+# Global S3 client instance — kept as the historical entry point; returns
+# whichever backend `blob_store_backend` selects (S3 by default).
+def get_s3_client() -> BlobStore:
     """
-    Get or create the global S3 client instance.
+    Get or create the global blob store instance.
+
+    Safe to call from worker threads; every caller shares one connection pool.
 
     Returns:
-        S3Client: S3 client instance
+        BlobStore: S3Client, or the local / in-memory backend when configured
     """
-    global _s3_client
-    if _s3_client is None:
-        _s3_client = S3Client()
-    return _s3_client
+    return get_blob_store()
 
 
 def reset_s3_client():
     """Reset the global S3 client (useful for testing)."""
-    global _s3_client
-    _s3_client = None
+    reset_blob_store()
@@ -0,0 +1,61 @@
+"""Strict JSON schemas for structured LLM output, computed once per model.
+
+OpenAI's structured output with strict=true requires:
+1. All objects must have additionalProperties: false
+2. All properties must be in the required array
+3. $defs references must also be transformed
+4. $ref cannot have sibling keywords (like description)
+
+`get_strict_schema(Model)` runs `model_json_schema()` + `make_schema_strict`
+the first time a model class is requested and returns the same dict on every
+later call, so per-turn agent calls and per-stream calls stop re-walking
+deep models like `TutorTurnOutput`. The returned dict is shared — callers
+pass it to the LLM client as-is and must not mutate it.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+
+def make_schema_strict(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform a JSON schema to meet OpenAI's strict mode requirements."""
+    def transform(obj: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(obj, dict):
+            return obj
+
+        if "$ref" in obj:
+            return {"$ref": obj["$ref"]}
+
+        result = {}
+        for key, value in obj.items():
+            if key == "$defs":
+                result[key] = {k: transform(v) for k, v in value.items()}
+            elif isinstance(value, dict):
+                result[key] = transform(value)
+            elif isinstance(value, list):
+                result[key] = [
+                    transform(item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            else:
+                result[key] = value
+
+        if result.get("type") == "object" and "properties" in result:
+            result["additionalProperties"] = False
+            result["required"] = list(result["properties"].keys())
+
+        return result
+
+    return transform(schema)
+
+
+@lru_cache(maxsize=None)
+def get_strict_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Strict JSON schema for a Pydantic model class, computed on first use.
+
+    `get_strict_schema.cache_info()` reports hits / computed models;
+    `get_strict_schema.cache_clear()` forgets them.
+    """
+    return make_schema_strict(model.model_json_schema())
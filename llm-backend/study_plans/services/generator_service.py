@@ -3,6 +3,7 @@ import logging
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from pydantic import BaseModel, Field
 from shared.services import LLMService
+from shared.utils.strict_schema import get_strict_schema
 from shared.models.entities import TeachingGuideline
 
 if TYPE_CHECKING:
@@ -88,12 +89,8 @@ class StudyPlanGeneratorService:
         self.prompt_loader = prompt_loader
 
         # Pre-compute the strict schema for structured output
-        self._study_plan_schema = LLMService.make_schema_strict(
-            StudyPlan.model_json_schema()
-        )
-        self._session_plan_schema = LLMService.make_schema_strict(
-            SessionPlan.model_json_schema()
-        )
+        self._study_plan_schema = get_strict_schema(StudyPlan)
+        self._session_plan_schema = get_strict_schema(SessionPlan)
 
     def generate_plan(self, guideline: TeachingGuideline, student_context: Optional["StudentContext"] = None) -> Dict[str, Any]:
         """
@@ -9,6 +9,10 @@ from fastapi.testclient import TestClient
 from shared.models.entities import Base
 # Import all models to ensure they are registered with Base.metadata
 from shared.models.entities import *
+from shared.services.config_cache import reset_config_cache
+from tutor.agents.safety_classifier import reset_safety_classifier
+from tutor.agents.system_prompt_cache import get_system_prompt_cache
+from tutor.services.translation_cache import reset_translation_cache
 from main import app
 
 
@@ -20,6 +24,27 @@ def _compile_jsonb_as_text_on_sqlite(element, compiler, **kw):  # noqa: ARG001
     return "TEXT"
 
 
+# Process-wide caches that tutor and LLM-config code paths reach from many
+# test modules. Singletons only a few modules touch (TTS audio cache, blob
+# store, OCR pool, provider limiters, LLM replay) are reset in those modules.
+_PROCESS_CACHE_RESETS = (
+    reset_config_cache,
+    lambda: get_system_prompt_cache().clear(),
+    reset_translation_cache,
+    reset_safety_classifier,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    """Isolate tests from the shared in-process caches."""
+    for reset in _PROCESS_CACHE_RESETS:
+        reset()
+    yield
+    for reset in _PROCESS_CACHE_RESETS:
+        reset()
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """
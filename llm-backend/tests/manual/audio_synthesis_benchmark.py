@@ -0,0 +1,99 @@
+"""Throughput of AudioGenerationService's synthesis pipeline vs. concurrency.
+
+Runs `generate_for_cards` over synthetic cards against a fake provider and a
+fake S3 client that just sleep, so the numbers show the pipeline (worker
+pool, provider slots, token bucket, synth/upload overlap) rather than
+network noise. No credentials, no network.
+
+Usage:
+    cd llm-backend
+    source venv/bin/activate
+    python tests/manual/audio_synthesis_benchmark.py
+    python tests/manual/audio_synthesis_benchmark.py --clips 120 --synth-ms 800 --upload-ms 120
+    python tests/manual/audio_synthesis_benchmark.py --rps 3   # ElevenLabs-style quota
+
+Output: per concurrency level, wall time, clips/sec and speedup vs. 1.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from book_ingestion_v2.services import audio_generation_service as ags  # noqa: E402
+from shared.utils.rate_limiter import reset_provider_limiters  # noqa: E402
+
+
+class FakeS3:
+    def __init__(self, upload_s: float):
+        self.upload_s = upload_s
+
+    def upload_bytes(self, data, s3_key, content_type=None):
+        time.sleep(self.upload_s)
+        return f"s3://bench/{s3_key}"
+
+
+def _service(concurrency: int, synth_s: float, upload_s: float) -> ags.AudioGenerationService:
+    svc = ags.AudioGenerationService.__new__(ags.AudioGenerationService)
+    svc.provider = "elevenlabs"
+    svc.language = "en"
+    svc.bucket = "bench"
+    svc.region = "us-east-1"
+    svc.s3 = FakeS3(upload_s)
+    svc.synthesis_concurrency = concurrency
+
+    def fake_synthesize(text, *, speaker=None, emotion=None):
+        time.sleep(synth_s)
+        return b"\xff\xfb" * 1024
+
+    svc._synthesize = fake_synthesize
+    return svc
+
+
+def _cards(clips: int, lines_per_card: int = 6) -> list[dict]:
+    cards = []
+    for card_idx in range(0, clips, lines_per_card):
+        n = min(lines_per_card, clips - card_idx)
+        cards.append({
+            "card_idx": card_idx, "card_type": "concept", "title": f"C{card_idx}",
+            "lines": [{"audio": f"line {card_idx}.{i}", "display": "x"} for i in range(n)],
+        })
+    return cards
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=60)
+    parser.add_argument("--synth-ms", type=float, default=400)
+    parser.add_argument("--upload-ms", type=float, default=80)
+    parser.add_argument("--rps", type=float, default=0, help="provider requests/sec (0 = unpaced)")
+    parser.add_argument("--levels", default="1,2,4,8")
+    args = parser.parse_args()
+
+    print(
+        f"{args.clips} clips, synth {args.synth_ms:.0f} ms, upload {args.upload_ms:.0f} ms, "
+        f"rps {args.rps or 'unlimited'}"
+    )
+    print(f"{'concurrency':>12}{'wall s':>10}{'clips/s':>10}{'speedup':>10}")
+    baseline = None
+    for level in (int(x) for x in args.levels.split(",")):
+        settings = MagicMock(
+            tts_synthesis_concurrency=level,
+            tts_elevenlabs_requests_per_second=args.rps,
+            tts_google_requests_per_second=args.rps,
+        )
+        reset_provider_limiters()
+        with patch.object(ags, "get_settings", return_value=settings):
+            svc = _service(level, args.synth_ms / 1000, args.upload_ms / 1000)
+            cards = _cards(args.clips)
+            start = time.perf_counter()
+            svc.generate_for_cards(cards, guideline_id="bench", variant_key="A")
+            wall = time.perf_counter() - start
+        baseline = baseline or wall
+        print(f"{level:>12}{wall:>10.2f}{args.clips / wall:>10.1f}{baseline / wall:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Wall time of TopicExtractionOrchestrator chunk extraction: sequential vs. plan-guided parallel.
+
+Replays a recorded chapter through `TopicExtractionOrchestrator.extract`
+with the chunk LLM call replaced by a stub that returns the recorded output
+for each window after sleeping its recorded latency (scaled by --speedup).
+The planner and finalization are stubbed too; the DB is a throwaway SQLite
+file and S3 is the in-memory blob store, so the numbers isolate the chunk
+loop. No credentials, no network.
+
+The recording is either the bundled fixture (synthetic 40-page chapter) or a
+real run directory copied from S3 — `aws s3 sync
+s3://<bucket>/books/<book>/chapters/<nn>/processing/runs/<job_id> ./run` —
+which has chunks/NNN/input.json + output.json but no latencies, so every
+chunk then sleeps --latency-ms.
+
+Usage:
+    cd llm-backend
+    source venv/bin/activate
+    python tests/manual/chunk_extraction_benchmark.py
+    python tests/manual/chunk_extraction_benchmark.py --levels 1,2,4,8 --speedup 50
+    python tests/manual/chunk_extraction_benchmark.py --run-dir ./run --latency-ms 25000
+
+Output: per concurrency level, wall time, speedup vs. 1 (sequential), and
+whether the merged topics match the sequential run's.
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from book_ingestion_v2.models.database import BookChapter, ChapterPage, ChapterTopic  # noqa: E402
+from book_ingestion_v2.models.processing_models import (  # noqa: E402
+    ChapterTopicPlan, ChunkExtractionOutput,
+)
+from book_ingestion_v2.services import topic_extraction_orchestrator as teo  # noqa: E402
+from shared.models.entities import Base, Book  # noqa: E402
+from shared.utils.blob_store import MemoryBlobStore  # noqa: E402
+
+DEFAULT_RECORDING = (
+    Path(__file__).parent.parent / "fixtures" / "chunk_extraction" / "recorded_chapter.json"
+)
+
+
+def _load_run_dir(run_dir: Path, latency_ms: int) -> dict:
+    """Rebuild a recording from a processing run directory."""
+    pages, chunks, first_input = {}, [], None
+    for chunk_dir in sorted((run_dir / "chunks").iterdir()):
+        chunk_input = json.loads((chunk_dir / "input.json").read_text())
+        output_path = chunk_dir / "output.json"
+        if not output_path.exists():
+            continue
+        first_input = first_input or chunk_input
+        for page in chunk_input["current_pages"]:
+            pages[page["page_number"]] = page["text"]
+        chunks.append({
+            "pages": [p["page_number"] for p in chunk_input["current_pages"]],
+            "latency_ms": latency_ms,
+            "output": json.loads(output_path.read_text()),
+        })
+    if first_input is None:
+        raise SystemExit(f"No completed chunks under {run_dir}/chunks")
+    planned = json.loads((run_dir / "planned_topics.json").read_text())
+    chapter = first_input["chapter_metadata"]
+    start, end = (int(x) for x in chapter["page_range"].split("-"))
+    return {
+        "book": first_input["book_metadata"],
+        "chapter": {
+            "chapter_number": chapter["number"], "chapter_title": chapter["title"],
+            "start_page": start, "end_page": end,
+        },
+        "plan": {"topics": planned, "chapter_overview": "", "planning_rationale": ""},
+        "pages": [{"page_number": n, "text": t} for n, t in sorted(pages.items())],
+        "chunks": chunks,
+    }
+
+
+class ReplayChunkLLM:
+    """Returns the recorded output for a window after its recorded latency."""
+
+    def __init__(self, recording: dict, speedup: float):
+        self.by_first_page = {c["pages"][0]: c for c in recording["chunks"]}
+        self.speedup = speedup
+
+    def __call__(self, chunk_input, planned_topics=None):
+        chunk = self.by_first_page[chunk_input.current_pages[0]["page_number"]]
+        time.sleep(chunk["latency_ms"] / 1000 / self.speedup)
+        return ChunkExtractionOutput(**chunk["output"])
+
+
+def _seed(factory, store, recording: dict) -> tuple[str, str]:
+    book_id, chapter_id = str(uuid.uuid4()), str(uuid.uuid4())
+    ch = recording["chapter"]
+    with factory() as db:
+        db.add(Book(
+            id=book_id, title=recording["book"]["title"], country="India",
+            board=recording["book"]["board"], grade=recording["book"]["grade"],
+            subject=recording["book"]["subject"], s3_prefix=f"books/{book_id}/",
+        ))
+        total = ch["end_page"] - ch["start_page"] + 1
+        db.add(BookChapter(
+            id=chapter_id, book_id=book_id, chapter_number=ch["chapter_number"],
+            chapter_title=ch["chapter_title"], start_page=ch["start_page"],
+            end_page=ch["end_page"], total_pages=total, uploaded_page_count=total,
+            status="upload_complete",
+        ))
+        for page in recording["pages"]:
+            key = f"books/{book_id}/pages/{page['page_number']}.txt"
+            store.upload_bytes(page["text"].encode("utf-8"), key)
+            db.add(ChapterPage(
+                id=str(uuid.uuid4()), book_id=book_id, chapter_id=chapter_id,
+                page_number=page["page_number"], text_s3_key=key, ocr_status="completed",
+            ))
+        db.commit()
+    return book_id, chapter_id
+
+
+def _run(recording: dict, concurrency: int, speedup: float) -> tuple[float, dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{tmp}/bench.db", connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        store = MemoryBlobStore()
+        book_id, chapter_id = _seed(factory, store, recording)
+
+        db_manager = MagicMock()
+        db_manager.get_session.side_effect = factory
+        settings = MagicMock(
+            openai_api_key="unused", gemini_api_key="", anthropic_api_key="",
+            topic_extraction_chunk_concurrency=concurrency,
+        )
+        planner = MagicMock()
+        planner.return_value.plan_chapter.return_value = ChapterTopicPlan(**recording["plan"])
+        finalizer = MagicMock()
+        finalizer.return_value.finalize.return_value = MagicMock(final_status="chapter_completed")
+
+        with patch.object(teo, "get_s3_client", return_value=store), \
+                patch.object(teo, "get_db_manager", return_value=db_manager), \
+                patch.object(teo, "get_settings", return_value=settings), \
+                patch.object(teo, "LLMService"), \
+                patch.object(teo, "LLMConfigService") as cfg, \
+                patch.object(teo, "ChapterJobService"), \
+                patch.object(teo, "ChapterTopicPlannerService", planner), \
+                patch.object(teo, "ChapterFinalizationService", finalizer), \
+                patch.object(teo.ChunkProcessorService, "process_chunk",
+                             side_effect=ReplayChunkLLM(recording, speedup)):
+            cfg.return_value.get_config.return_value = {
+                "provider": "replay", "model_id": "replay", "reasoning_effort": "none",
+            }
+            db = factory()
+            orchestrator = teo.TopicExtractionOrchestrator(db)
+            start = time.perf_counter()
+            orchestrator.extract(db, str(uuid.uuid4()), chapter_id, book_id)
+            wall = time.perf_counter() - start
+            orchestrator.db.close()
+
+        with factory() as db:
+            topics = {
+                t.topic_key: (t.guidelines, t.source_page_start, t.source_page_end)
+                for t in db.query(ChapterTopic).filter_by(chapter_id=chapter_id)
+            }
+        engine.dispose()
+    return wall, topics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", type=Path, default=DEFAULT_RECORDING)
+    parser.add_argument("--run-dir", type=Path, default=None, help="processing run directory copied from S3")
+    parser.add_argument("--latency-ms", type=int, default=20000, help="per-chunk latency for --run-dir")
+    parser.add_argument("--speedup", type=float, default=100.0, help="divide recorded latencies by this")
+    parser.add_argument("--levels", default="1,2,4,8")
+    args = parser.parse_args()
+
+    recording = (
+        _load_run_dir(args.run_dir, args.latency_ms) if args.run_dir
+        else json.loads(args.recording.read_text())
+    )
+    recorded_s = sum(c["latency_ms"] for c in recording["chunks"]) / 1000
+    print(
+        f"{len(recording['pages'])} pages, {len(recording['chunks'])} chunks, "
+        f"{recorded_s:.0f} s of recorded LLM time, replayed {args.speedup:g}x faster"
+    )
+    print(f"{'concurrency':>12}{'wall s':>10}{'real-time est s':>17}{'speedup':>10}{'same topics':>13}")
+    baseline = None
+    for level in (int(x) for x in args.levels.split(",")):
+        wall, topics = _run(recording, level, args.speedup)
+        if baseline is None:
+            baseline = (wall, topics)
+        print(
+            f"{level:>12}{wall:>10.2f}{wall * args.speedup:>17.0f}"
+            f"{baseline[0] / wall:>9.1f}x{str(topics == baseline[1]):>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Offline eval for SafetyAgent's local tiers and verdict cache.
+
+Replays logged student messages through the same tiers `SafetyAgent.execute`
+uses — allow-list, lexicon pre-classifier, verdict cache — and reports how
+many would skip the LLM and where a local "safe" disagrees with the LLM's
+verdict. A disagreement is a message the local tiers would pass that the
+LLM flagged unsafe; the target is zero.
+
+Messages come from a JSONL file (`{"message": ..., "is_safe": ...}` — the
+LLM's verdict) or from student rows in `session_messages`. Unlabeled
+messages are labeled with the live safety LLM only when `--label-with-llm`
+is given (costs money — do not add to CI); otherwise they count toward skip
+rate but not toward disagreement.
+
+Usage:
+    cd llm-backend
+    source venv/bin/activate
+    python tests/manual/safety_classifier_eval.py
+    python tests/manual/safety_classifier_eval.py --input logged.jsonl
+    python tests/manual/safety_classifier_eval.py --from-db --limit 2000 --label-with-llm
+    python tests/manual/safety_classifier_eval.py --extra-lexicon my_words.txt --max-words 12
+
+Output: per-tier skip counts, overall skip rate, and every disagreement.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tutor.agents.safety import _is_provably_safe  # noqa: E402
+from tutor.agents.safety_classifier import (  # noqa: E402
+    LEXICON_PATH,
+    LocalSafetyClassifier,
+    SafetyVerdictCache,
+    load_lexicon,
+)
+
+DEFAULT_INPUT = Path(__file__).parent.parent / "fixtures" / "safety" / "logged_messages.jsonl"
+
+
+def _load_jsonl(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _load_from_db(limit: int) -> list[dict]:
+    from database import get_db_manager
+    from shared.models.entities import SessionMessage
+
+    with get_db_manager().session_scope() as db:
+        rows = (
+            db.query(SessionMessage.content)
+            .filter(SessionMessage.role == "student")
+            .order_by(SessionMessage.timestamp.desc())
+            .limit(limit)
+            .all()
+        )
+        return [{"message": content} for (content,) in rows]
+
+
+def _label_with_llm(records: list[dict]) -> None:
+    """Fill in `is_safe` from the live safety LLM (fast_model config)."""
+    from unittest.mock import patch
+
+    from config import get_settings
+    from database import get_db_manager
+    from shared.services.llm_config_service import LLMConfigService
+    from shared.services.llm_service import LLMService
+    from tutor.agents.base_agent import AgentContext
+    from tutor.agents.safety import SafetyAgent
+
+    settings = get_settings()
+    with get_db_manager().session_scope() as db:
+        config = LLMConfigService(db).get_config("fast_model")
+    llm = LLMService(
+        api_key=settings.openai_api_key,
+        provider=config["provider"],
+        model_id=config["model_id"],
+        gemini_api_key=settings.gemini_api_key or None,
+        anthropic_api_key=settings.anthropic_api_key or None,
+    )
+    agent = SafetyAgent(llm)
+
+    async def _label(record: dict) -> None:
+        context = AgentContext(
+            session_id="safety-eval", turn_id="eval", student_message=record["message"],
+            current_step=1, student_grade=3, language_level="simple",
+        )
+        # Bypass the local tiers and the cache: we want the LLM's own verdict.
+        with patch("tutor.agents.safety._is_provably_safe", return_value=False), \
+                patch("tutor.agents.safety.get_local_safety_classifier") as local, \
+                patch("tutor.agents.safety.get_safety_verdict_cache") as cache:
+            local.return_value.is_known_safe.return_value = False
+            cache.return_value.get.return_value = None
+            record["is_safe"] = (await agent.execute(context)).is_safe
+
+    async def _run() -> None:
+        for record in records:
+            if "is_safe" not in record:
+                await _label(record)
+
+    asyncio.run(_run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--from-db", action="store_true", help="read student messages from session_messages")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--label-with-llm", action="store_true")
+    parser.add_argument("--extra-lexicon", type=Path, default=None)
+    parser.add_argument("--max-words", type=int, default=10)
+    args = parser.parse_args()
+
+    records = _load_from_db(args.limit) if args.from_db else _load_jsonl(args.input)
+    if args.label_with_llm:
+        _label_with_llm(records)
+
+    paths = [LEXICON_PATH] + ([args.extra_lexicon] if args.extra_lexicon else [])
+    classifier = LocalSafetyClassifier(load_lexicon(paths), max_words=args.max_words)
+    seen: dict[str, object] = {}
+    tiers: Counter = Counter()
+    disagreements = []
+
+    for record in records:
+        message = record["message"]
+        label = record.get("is_safe")
+        if _is_provably_safe(message):
+            tier = "allow_list"
+        elif classifier.is_known_safe(message):
+            tier = "lexicon"
+        else:
+            key = SafetyVerdictCache.key(message, "tutoring session")
+            tier = "cache" if key in seen else "llm"
+            seen[key] = label
+        tiers[tier] += 1
+        if tier in ("allow_list", "lexicon") and label is False:
+            disagreements.append((tier, message))
+
+    total = len(records)
+    skipped = total - tiers["llm"]
+    print(f"{total} messages ({sum('is_safe' in r for r in records)} labeled)")
+    for tier in ("allow_list", "lexicon", "cache", "llm"):
+        print(f"  {tier:<11}{tiers[tier]:>7}  {tiers[tier] / total:>6.1%}" if total else f"  {tier}: 0")
+    print(f"skip rate: {skipped / total:.1%}" if total else "skip rate: n/a")
+    print(f"disagreements (local safe, LLM unsafe): {len(disagreements)}")
+    for tier, message in disagreements:
+        print(f"  [{tier}] {message!r}")
+    sys.exit(1 if disagreements else 0)
+
+
+if __name__ == "__main__":
+    main()
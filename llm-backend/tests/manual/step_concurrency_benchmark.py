@@ -0,0 +1,289 @@
+"""Latency of POST /sessions/{id}/step under many simultaneous requests: sync vs. async handler.
+
+Fires --requests concurrent /step calls (one per session, so no CAS
+conflicts) at the sessions router through httpx's in-process ASGI
+transport, and compares two handlers over the same SessionService:
+
+- before — the old handler: a sync `def` endpoint run in Starlette's
+  threadpool, `SessionService.process_step` with `asyncio.run` per request,
+  DB through the sync pool held for the whole request.
+- after  — the current `submit_step`: async endpoint, DB phases on the async
+  pool, the tutor turn awaited on the server's event loop.
+
+The tutor turn (`TeacherOrchestrator.process_turn`) is replaced by a stub
+that sleeps --llm-ms and appends a student/teacher message pair, so the
+numbers isolate request plumbing. The DB is a throwaway SQLite file (WAL)
+unless --database-url points at a Postgres database to seed into (the
+benchmark then leaves its bench-* rows behind). Both pools use the
+db_pool_* / db_async_pool_* settings (--sync-pool-size overrides the first).
+
+With the default sync pool (5 + 10 overflow) "before" holds a connection
+per request for the whole LLM wait, and once Starlette's 40 threadpool
+workers are all blocked on the pool, the `get_db` teardowns that would
+return connections cannot get a thread either: requests stall until the
+30 s pool timeout. Pass --sync-pool-size 250 to see the threadpool limit
+alone. "after" only holds a connection during its DB phases, so the
+configured async pool is enough. On SQLite every save still queues for the
+single writer (and aiosqlite runs a thread per connection); on Postgres
+neither applies.
+No credentials, no network.
+
+Usage:
+    cd llm-backend
+    source venv/bin/activate
+    python tests/manual/step_concurrency_benchmark.py
+    python tests/manual/step_concurrency_benchmark.py --requests 200 --llm-ms 2000
+    python tests/manual/step_concurrency_benchmark.py --modes after --out step.json
+
+Output: per mode, wall time, throughput, p50/p95/max request latency,
+errors and the peak number of live threads.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import httpx  # noqa: E402
+from fastapi import APIRouter, Depends, FastAPI, HTTPException  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlalchemy.orm import Session as DBSession  # noqa: E402
+
+import database  # noqa: E402
+from config import get_settings  # noqa: E402
+from database import AsyncDatabaseManager, DatabaseManager, async_database_url, get_db  # noqa: E402
+from shared.models.entities import Base, LLMConfig, Session as SessionModel  # noqa: E402
+from shared.models.schemas import StepRequest, StepResponse  # noqa: E402
+from shared.repositories import SessionRepository  # noqa: E402
+from tutor.api.sessions import router as sessions_router  # noqa: E402
+from tutor.models.messages import StudentContext, create_student_message, create_teacher_message  # noqa: E402
+from tutor.models.session_state import create_session  # noqa: E402
+from tutor.models.study_plan import StudyPlan, StudyPlanStep, Topic, TopicGuidelines  # noqa: E402
+from tutor.orchestration.orchestrator import TeacherOrchestrator, TurnResult  # noqa: E402
+from tutor.services import SessionService  # noqa: E402
+from tutor.services.session_state_store import append_new_messages, dump_state_json  # noqa: E402
+
+MODES = ("before", "after")
+
+
+def _legacy_router() -> APIRouter:
+    """The pre-async /step handler (ownership check aside), under /legacy."""
+    router = APIRouter()
+
+    @router.post("/legacy/{session_id}/step", response_model=StepResponse)
+    def submit_step(session_id: str, request: StepRequest, db: DBSession = Depends(get_db)):
+        try:
+            if not SessionRepository(db).get_by_id(session_id):
+                raise HTTPException(status_code=404, detail="Session not found")
+            return SessionService(db).process_step(session_id, request)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error processing step: {e}")
+
+    return router
+
+
+def _stub_turn(latency_s: float):
+    async def process_turn(self, session, student_message):
+        await asyncio.sleep(latency_s)
+        session.add_message(create_student_message(student_message))
+        session.add_message(create_teacher_message("Nice work!", audio_text="Nice work!"))
+        return TurnResult(response="Nice work!", intent="continuation", state_changed=True)
+    return process_turn
+
+
+def _state(session_id: str):
+    topic = Topic(
+        topic_id="bench", topic_name="Fractions", subject="Math", grade_level=3,
+        guidelines=TopicGuidelines(learning_objectives=["Add fractions"]),
+        study_plan=StudyPlan(steps=[StudyPlanStep(step_id=1, type="explain", concept="Fractions")]),
+    )
+    session = create_session(topic=topic, student_context=StudentContext(grade=3))
+    session.session_id = session_id
+    session.add_message(create_teacher_message("Welcome!"))
+    return session
+
+
+def _seed(engine, session_ids) -> None:
+    with DBSession(engine) as db:
+        for key, model in (("tutor", "gpt-4o"), ("fast_model", "gpt-4o-mini")):
+            if db.get(LLMConfig, key) is None:
+                db.add(LLMConfig(component_key=key, provider="openai", model_id=model, reasoning_effort="low"))
+        for session_id in session_ids:
+            state = _state(session_id)
+            db.add(SessionModel(
+                id=session_id, student_json="{}", goal_json="{}",
+                state_json=dump_state_json(state), mode=state.mode,
+                state_version=1, created_at=datetime.utcnow(),
+            ))
+            append_new_messages(db, session_id, state, stored=0)
+        db.commit()
+
+
+def _install_databases(sync_url: str, sync_pool_size: int = 0):
+    settings = get_settings()
+    pool = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+    async_pool = {
+        "pool_size": settings.db_async_pool_size,
+        "max_overflow": settings.db_async_max_overflow,
+        "pool_timeout": settings.db_async_pool_timeout,
+    }
+    if sync_pool_size:
+        pool.update(pool_size=sync_pool_size, max_overflow=0)
+    sqlite = sync_url.startswith("sqlite")
+    sync_engine = create_engine(
+        sync_url, connect_args={"check_same_thread": False} if sqlite else {}, **pool,
+    )
+    async_engine = create_async_engine(async_database_url(sync_url), **async_pool)
+    if sqlite:
+        @event.listens_for(sync_engine, "connect")
+        def _busy_timeout(dbapi_connection, _record):
+            dbapi_connection.execute("PRAGMA busy_timeout = 30000")
+
+        @event.listens_for(async_engine.sync_engine, "connect")
+        def _async_busy_timeout(dbapi_connection, _record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA busy_timeout = 30000")
+            cursor.close()
+
+        with sync_engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    Base.metadata.create_all(sync_engine)
+
+    sync_manager = DatabaseManager()
+    sync_manager._engine = sync_engine
+    async_manager = AsyncDatabaseManager()
+    async_manager._engine = async_engine
+    database._db_manager = sync_manager
+    database._async_db_manager = async_manager
+    return sync_engine, async_manager
+
+
+class _ThreadSampler:
+    """Peak `threading.active_count()` while running."""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+async def _fire(app: FastAPI, paths: list[str], warmup: str) -> dict:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        async def one(path):
+            start = time.perf_counter()
+            resp = await client.post(path, json={"student_reply": "3/4"})
+            return time.perf_counter() - start, resp.status_code
+
+        await client.post(warmup, json={"student_reply": "3/4"})
+        with _ThreadSampler() as threads:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(one(p) for p in paths))
+            wall = time.perf_counter() - start
+
+    latencies = sorted(t for t, status in results if status == 200)
+    errors = sum(1 for _, status in results if status != 200)
+    return {
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(paths) / wall, 1),
+        "p50_s": round(statistics.median(latencies), 3) if latencies else None,
+        "p95_s": round(latencies[int(len(latencies) * 0.95) - 1], 3) if latencies else None,
+        "max_s": round(latencies[-1], 3) if latencies else None,
+        "errors": errors,
+        "peak_threads": threads.peak,
+    }
+
+
+async def _run(args) -> dict:
+    sync_url = args.database_url
+    tmp = None
+    if not sync_url:
+        tmp = tempfile.TemporaryDirectory()
+        sync_url = f"sqlite:///{tmp.name}/bench.db"
+    sync_engine, async_manager = _install_databases(sync_url, args.sync_pool_size)
+
+    app = FastAPI()
+    app.include_router(sessions_router)
+    app.include_router(_legacy_router())
+
+    run_id = datetime.utcnow().strftime("%H%M%S%f")
+    results = {}
+    try:
+        with patch.object(TeacherOrchestrator, "process_turn", _stub_turn(args.llm_ms / 1000)):
+            for mode in args.modes:
+                ids = [f"bench-{run_id}-{mode}-{i}" for i in range(args.requests + 1)]
+                _seed(sync_engine, ids)
+                prefix = "/legacy" if mode == "before" else "/sessions"
+                paths = [f"{prefix}/{i}/step" for i in ids]
+                results[mode] = await _fire(app, paths[1:], warmup=paths[0])
+    finally:
+        await async_manager.close()
+        sync_engine.dispose()
+        if tmp:
+            tmp.cleanup()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="simultaneous /step requests")
+    parser.add_argument("--llm-ms", type=float, default=1000, help="simulated tutor turn latency")
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated: before,after")
+    parser.add_argument("--database-url", default="", help="sync Postgres URL to seed into (default: temp SQLite)")
+    parser.add_argument("--sync-pool-size", type=int, default=0, help="override the sync pool size (no overflow)")
+    parser.add_argument("--out", type=Path, default=None, help="write results as JSON")
+    args = parser.parse_args()
+    args.modes = [m for m in args.modes.split(",") if m]
+    unknown = set(args.modes) - set(MODES)
+    if unknown:
+        raise SystemExit(f"Unknown modes: {', '.join(sorted(unknown))}")
+
+    results = asyncio.run(_run(args))
+
+    pools = f"sync pool {args.sync_pool_size}" if args.sync_pool_size else "configured pools"
+    print(f"{args.requests} concurrent /step requests, simulated tutor turn {args.llm_ms:g} ms, {pools}")
+    print(f"{'mode':>8}{'wall s':>9}{'req/s':>8}{'p50 s':>8}{'p95 s':>8}{'max s':>8}{'errors':>8}{'threads':>9}")
+    for mode, r in results.items():
+        print(
+            f"{mode:>8}{r['wall_s']:>9.2f}{r['throughput_rps']:>8.1f}{r['p50_s'] or 0:>8.2f}"
+            f"{r['p95_s'] or 0:>8.2f}{r['max_s'] or 0:>8.2f}{r['errors']:>8}{r['peak_threads']:>9}"
+        )
+    if args.out:
+        args.out.write_text(json.dumps(
+            {"requests": args.requests, "llm_ms": args.llm_ms, "sync_pool_size": args.sync_pool_size,
+             "results": results},
+            indent=2,
+        ))
+
+
+if __name__ == "__main__":
+    main()
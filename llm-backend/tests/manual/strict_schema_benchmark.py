@@ -0,0 +1,50 @@
+"""Micro-benchmark for the per-model strict schema cache.
+
+Compares what every tutor turn used to pay — `model_json_schema()` plus the
+recursive `make_schema_strict` walk — with a cached `get_strict_schema()`
+lookup, for each agent output model. No network, no DB.
+
+Usage:
+    cd llm-backend
+    source venv/bin/activate
+    python tests/manual/strict_schema_benchmark.py
+    python tests/manual/strict_schema_benchmark.py --iterations 5000
+
+Output: per-model µs/call uncached vs. cached and the saving per call.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from shared.utils.strict_schema import get_strict_schema, make_schema_strict  # noqa: E402
+from tutor.agents.master_tutor import SimplifiedCardOutput, TutorTurnOutput  # noqa: E402
+from tutor.agents.safety import SafetyOutput  # noqa: E402
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'model':<24}{'uncached µs':>14}{'cached µs':>12}{'saved µs':>12}")
+    for model in (TutorTurnOutput, SimplifiedCardOutput, SafetyOutput):
+        get_strict_schema(model)  # warm: the first call computes it
+        uncached = _per_call_us(
+            lambda: make_schema_strict(model.model_json_schema()), args.iterations,
+        )
+        cached = _per_call_us(lambda: get_strict_schema(model), args.iterations)
+        print(f"{model.__name__:<24}{uncached:>14.1f}{cached:>12.2f}{uncached - cached:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,475 @@
+"""Per-stage wall time, DB round-trips and peak memory of the topic pipeline DAG, offline.
+
+Runs one seeded topic through the topic DAG's stages in DAG order —
+explanations, baatcheet_dialogue, baatcheet_audio_review,
+baatcheet_audio_synthesis, check_ins, practice_bank, audio_review,
+audio_synthesis — via the real stage launchers and `run_in_background_v2`
+(job locks, stage-run rows and all). Everything external is replaced:
+
+- LLM calls are replayed from the fixture's recording
+  (shared/services/llm_replay.py), sleeping the recorded latency times
+  --latency-scale, or a flat --latency-ms.
+- The DB is a throwaway SQLite file seeded from the fixture's topic.json and
+  the default llm_config rows from db.py.
+- S3 is the in-memory blob store; TTS returns fake MP3 bytes after
+  --tts-latency-ms, with provider pacing off.
+
+The visuals stages are skipped: they render animations in a headless
+browser. Card ids minted during the run are deterministic so the prompts,
+and with them the replay keys, are the same on every run.
+
+Per stage it reports wall time, DB round-trips (statements sent to the DB,
+launch to terminal) and peak traced Python memory above what was allocated
+when the stage started (tracemalloc, which also slows the run; --no-memory
+turns it off). One untimed warm-up run goes first (--warmup) so the first
+stage isn't charged for lazy imports. --out writes the results as JSON
+tagged with the git commit; --compare prints the deltas against an earlier
+results file, so two commits can be compared on the same laptop.
+
+Fixture: tests/fixtures/topic_pipeline/ (topic.json + llm_recording.jsonl).
+The bundled recording is synthetic — built with --synthesize, which answers
+each schema with a small valid response — so it measures pipeline overhead,
+not LLM quality, and has ~0 ms recorded latency; pass --latency-ms to
+simulate provider time. After editing a prompt, re-run --synthesize (or use
+--match schema). To capture a real recording, run --record with the API
+keys (and the Claude Code CLI, for claude_code components) in .env; it
+writes to --recording.
+
+Usage:
+    cd llm-backend
+    source venv/bin/activate
+    python tests/manual/topic_pipeline_benchmark.py
+    python tests/manual/topic_pipeline_benchmark.py --latency-ms 50 --out before.json
+    python tests/manual/topic_pipeline_benchmark.py --latency-ms 50 --compare before.json
+    python tests/manual/topic_pipeline_benchmark.py --stages explanations,check_ins --repeat 3
+    python tests/manual/topic_pipeline_benchmark.py --synthesize
+    python tests/manual/topic_pipeline_benchmark.py --record --recording /tmp/live.jsonl
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+FIXTURE_DIR = Path(__file__).parent.parent / "fixtures" / "topic_pipeline"
+SKIPPED_STAGES = {"visuals", "baatcheet_visuals"}
+
+
+def _configure_env(live: bool) -> None:
+    """Must run before config.get_settings() is first called."""
+    os.environ["BLOB_STORE_BACKEND"] = "memory"
+    os.environ["TTS_PROVIDER"] = "elevenlabs"
+    os.environ.setdefault("ELEVENLABS_API_KEY", "benchmark")
+    os.environ["TTS_ELEVENLABS_REQUESTS_PER_SECOND"] = "0"
+    os.environ["LLM_REPLAY_MODE"] = "off"  # installed explicitly below
+    if not live:
+        os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+
+class _DeterministicUUIDs:
+    """Stand-in for uuid4 in services that mint card ids."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._n = 0
+
+    def __call__(self) -> uuid.UUID:
+        with self._lock:
+            self._n += 1
+            return uuid.UUID(int=self._n)
+
+
+# ─── Synthetic responses (--synthesize) ──────────────────────────────────────
+
+
+def _line(text: str) -> dict:
+    return {"display": text, "audio": text}
+
+
+def _explanation_cards(topic: str) -> dict:
+    titles = ["What is it?", "An everyday example", "Picture it", "Try it yourself", "Another example", "Summary"]
+    types = ["concept", "example", "visual", "example", "analogy", "summary"]
+    return {
+        "cards": [
+            {
+                "card_idx": i, "card_type": card_type, "title": title,
+                "lines": [_line(f"{title} for {topic}, part {n}.") for n in (1, 2)],
+                "visual": None,
+            }
+            for i, (card_type, title) in enumerate(zip(types, titles), start=1)
+        ],
+        "summary": {
+            "key_analogies": ["sharing a roti"], "key_examples": ["half of eight"],
+            "teaching_notes": f"Introduces {topic} with everyday examples.",
+        },
+    }
+
+
+def _check_in(activity: str, n: int) -> dict:
+    base = {
+        "activity_type": activity, "title": "Quick check!",
+        "instruction": f"Question {n}: pick the right answer.",
+        "hint": "Think about equal parts.", "success_message": "Well done!",
+        "audio_text": f"Question {n}. Pick the right answer.",
+    }
+    if activity == "pick_one":
+        base.update(options=["one half", "one third", "one fourth"], correct_index=0)
+    elif activity == "true_false":
+        base.update(statement="Two halves make one whole.", correct_answer=True)
+    elif activity == "match_pairs":
+        base.update(pairs=[
+            {"left": "one half", "right": "two equal parts"},
+            {"left": "one fourth", "right": "four equal parts"},
+        ])
+    return base
+
+
+def _check_ins() -> dict:
+    check_ins = []
+    for position, (light, heavy) in ((3, ("pick_one", "match_pairs")), (5, ("true_false", "match_pairs"))):
+        for activity in (light, heavy):
+            check_ins.append({"insert_after_card_idx": position, **_check_in(activity, len(check_ins) + 1)})
+    return {"check_ins": check_ins}
+
+
+def _practice_bank(topic: str) -> dict:
+    questions = []
+    for n in range(1, 33):
+        question = {
+            "difficulty": ("easy", "medium", "hard")[n % 3],
+            "concept_tag": "equal_parts",
+            "question_text": f"{topic} question {n}",
+            "explanation_why": "Equal parts make a fraction.",
+        }
+        if n % 2:
+            question.update(format="pick_one", options=[f"{n} halves", f"{n} thirds"], correct_index=0)
+        else:
+            question.update(format="true_false", statement=f"Statement {n} about halves.", correct_answer_bool=True)
+        questions.append(question)
+    return {"questions": questions}
+
+
+def _lesson_plan() -> dict:
+    return {
+        "misconceptions": [], "concrete_materials": ["paper strips"], "macro_structure": [],
+        "spine": None,
+        "card_plan": [{"slot": n, "card_type": "tutor_turn", "intent": f"beat {n}"} for n in range(1, 31)],
+    }
+
+
+def _dialogue(topic: str) -> dict:
+    cards = []
+
+    def add(card: dict) -> None:
+        cards.append({"card_idx": len(cards) + 2, **card})
+
+    for n in range(1, 29):
+        tutor = n % 2 == 1
+        add({
+            "card_type": "tutor_turn" if tutor else "peer_turn",
+            "speaker": "tutor" if tutor else "peer",
+            "lines": [_line(f"{'Mohan Sir' if tutor else 'Meera'} on {topic}, beat {n}.")],
+        })
+        if n in (4, 10, 16, 22):
+            for activity in ("pick_one", "match_pairs"):
+                ci = _check_in(activity, n)
+                ci.pop("title")
+                add({"card_type": "check_in", "check_in": ci})
+    add({"card_type": "summary", "speaker": "tutor", "lines": [_line(f"Today we learned {topic}.")]})
+    return {"cards": cards}
+
+
+def _card_review(prompt: str) -> dict:
+    match = re.search(r'"card_idx":\s*(\d+)', prompt)
+    return {"card_idx": int(match.group(1)) if match else 1, "revisions": [], "notes": ""}
+
+
+def _make_synthetic_call(topic: str):
+    def call(self, prompt, reasoning_effort="none", json_mode=True, json_schema=None,
+             schema_name="response", system_prompt_file=None):
+        if schema_name == "GenerationOutput":
+            payload = _explanation_cards(topic)
+        elif schema_name == "CheckInGenerationOutput":
+            payload = _check_ins()
+        elif schema_name == "PracticeBankOutput":
+            payload = _practice_bank(topic)
+        elif schema_name == "LessonPlanOutput":
+            payload = _lesson_plan()
+        elif schema_name == "DialogueGenerationOutput":
+            payload = _dialogue(topic)
+        elif schema_name == "CardReviewOutput":
+            payload = _card_review(prompt)
+        else:
+            raise ValueError(f"No synthetic response for schema {schema_name!r}")
+        return {"output_text": json.dumps(payload), "reasoning": None}
+    return call
+
+
+# ─── Harness ─────────────────────────────────────────────────────────────────
+
+
+def _git_commit() -> dict:
+    def git(*args):
+        return subprocess.run(["git", *args], capture_output=True, text=True, cwd=FIXTURE_DIR).stdout.strip()
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown", "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def _seed(factory, topic: dict) -> None:
+    from db import _LLM_CONFIG_SEEDS
+    from book_ingestion_v2.models.database import BookChapter
+    from shared.models.entities import Book, LLMConfig, TeachingGuideline
+
+    with factory() as db:
+        db.add(Book(**topic["book"]))
+        db.add(BookChapter(**topic["chapter"]))
+        db.add(TeachingGuideline(**{**topic["guideline"], "metadata_json": json.dumps(topic["guideline"]["metadata_json"])}))
+        for seed in _LLM_CONFIG_SEEDS:
+            db.add(LLMConfig(reasoning_effort="max", **seed))
+        db.commit()
+
+
+class _StatementCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.count += 1
+
+
+def _run_pipeline(topic: dict, stage_ids: list[str], *, measure_memory: bool, tts_latency_s: float) -> dict:
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.dialects.postgresql import JSONB
+    from sqlalchemy.ext.compiler import compiles
+    from sqlalchemy.orm import sessionmaker
+
+    import database
+    from book_ingestion_v2.api import processing_routes
+    from book_ingestion_v2.dag.cascade import build_launcher_kwargs
+    from book_ingestion_v2.dag.launcher_map import LAUNCHER_BY_STAGE
+    from book_ingestion_v2.services import baatcheet_dialogue_generator_service, check_in_enrichment_service
+    from book_ingestion_v2.services.audio_generation_service import AudioGenerationService
+    from book_ingestion_v2.services.chapter_job_service import ChapterJobService
+    from shared.models.entities import Base
+    from shared.services.llm_replay import get_llm_replay
+    from shared.utils.blob_store import reset_blob_store
+
+    @compiles(JSONB, "sqlite")
+    def _jsonb_as_text(element, compiler, **kw):  # noqa: ARG001
+        return "TEXT"
+
+    def fake_synthesize(self, text, *, speaker=None, emotion=None):
+        time.sleep(tts_latency_s)
+        return b"ID3" + text.encode("utf-8")[:64]
+
+    threads = []
+    original_run_in_background = processing_routes.run_in_background_v2
+
+    def run_in_background(target_fn, job_id, *args):
+        thread = original_run_in_background(target_fn, job_id, *args)
+        threads.append(thread)
+        return thread
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{tmp}/pipeline.db", connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+        _seed(factory, topic)
+        manager = database.DatabaseManager()
+        manager._engine = engine
+        database._db_manager = manager
+        reset_blob_store()
+
+        counter = _StatementCounter()
+        event.listen(engine, "before_cursor_execute", counter)
+        ids = {
+            "book_id": topic["book"]["id"], "chapter_id": topic["chapter"]["id"],
+            "guideline_id": topic["guideline"]["id"],
+        }
+        uuids = _DeterministicUUIDs()
+
+        with patch.object(processing_routes, "run_in_background_v2", run_in_background), \
+                patch.object(AudioGenerationService, "_synthesize", fake_synthesize), \
+                patch.object(check_in_enrichment_service, "uuid4", uuids), \
+                patch.object(baatcheet_dialogue_generator_service, "uuid4", uuids):
+            for stage_id in stage_ids:
+                llm_before = _llm_calls(get_llm_replay())
+                statements_before = counter.count
+                if measure_memory:
+                    tracemalloc.reset_peak()
+                    baseline_mem = tracemalloc.get_traced_memory()[0]
+                start = time.perf_counter()
+                with factory() as db:
+                    job_id = LAUNCHER_BY_STAGE[stage_id](db, **build_launcher_kwargs(stage_id, **ids))
+                threads.pop().join()
+                wall = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1] - baseline_mem if measure_memory else 0
+                with factory() as db:
+                    job = ChapterJobService(db).get_job(job_id)
+                results[stage_id] = {
+                    "status": job.status,
+                    "error": job.error_message,
+                    "wall_s": round(wall, 3),
+                    "db_round_trips": counter.count - statements_before,
+                    "peak_mem_mb": round(peak / 1024 / 1024, 1),
+                    "llm_calls": _llm_calls(get_llm_replay()) - llm_before,
+                }
+        database._db_manager = None
+        engine.dispose()
+    return results
+
+
+def _llm_calls(replay) -> int:
+    stats = replay.stats()
+    return stats["hits"] + stats["fallback_hits"] + stats["recorded"]
+
+
+def _summarize(runs: list[dict]) -> dict:
+    stages = {}
+    for stage_id in runs[0]:
+        samples = [run[stage_id] for run in runs]
+        stages[stage_id] = {
+            **samples[-1],
+            "wall_s": round(statistics.median(s["wall_s"] for s in samples), 3),
+            "wall_s_samples": [s["wall_s"] for s in samples],
+        }
+    return stages
+
+
+def _print_table(stages: dict, baseline: dict = None) -> None:
+    header = f"{'stage':<28}{'status':<24}{'wall s':>9}{'db trips':>10}{'peak MB':>9}{'llm':>5}"
+    print(header + ("  vs baseline (wall / trips / MB)" if baseline else ""))
+    totals = {"wall_s": 0.0, "db_round_trips": 0, "llm_calls": 0}
+    for stage_id, s in stages.items():
+        for k in totals:
+            totals[k] += s[k]
+        row = (
+            f"{stage_id:<28}{s['status']:<24}{s['wall_s']:>9.2f}{s['db_round_trips']:>10}"
+            f"{s['peak_mem_mb']:>9.1f}{s['llm_calls']:>5}"
+        )
+        old = (baseline or {}).get(stage_id)
+        if old:
+            row += (
+                f"  {_delta(s['wall_s'], old['wall_s'])} / "
+                f"{s['db_round_trips'] - old['db_round_trips']:+d} / "
+                f"{s['peak_mem_mb'] - old['peak_mem_mb']:+.1f}"
+            )
+        print(row)
+        if s.get("error"):
+            print(f"    error: {s['error'][:200]}")
+    print(f"{'total':<52}{totals['wall_s']:>9.2f}{totals['db_round_trips']:>10}{'':>9}{totals['llm_calls']:>5}")
+
+
+def _delta(new: float, old: float) -> str:
+    return f"{(new - old) / old * 100:+.0f}%" if old else "n/a"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", type=Path, default=FIXTURE_DIR / "topic.json")
+    parser.add_argument("--recording", type=Path, default=FIXTURE_DIR / "llm_recording.jsonl")
+    parser.add_argument("--stages", default="", help="comma-separated stage ids (default: all non-visual stages)")
+    parser.add_argument("--latency-ms", type=float, default=-1, help="flat LLM latency per call (-1: recorded)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="multiply LLM latency by this")
+    parser.add_argument("--match", choices=("exact", "schema"), default="exact")
+    parser.add_argument("--tts-latency-ms", type=float, default=0, help="fake TTS latency per clip")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stage; wall time is the median")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs first (not with --record / --synthesize)")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    parser.add_argument("--out", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, default=None, help="results JSON from an earlier run")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", action="store_true", help="call live LLMs and record them")
+    mode.add_argument("--synthesize", action="store_true", help="rebuild the recording from synthetic responses")
+    args = parser.parse_args()
+
+    _configure_env(live=args.record)
+    from book_ingestion_v2.dag.topic_pipeline_dag import DAG
+    from shared.services.llm_replay import LLMReplay, install_llm_replay, replayable
+    from shared.services.llm_service import LLMService
+
+    topic = json.loads(args.fixture.read_text())
+    stage_ids = [s.id for s in DAG.topo_sort() if s.id not in SKIPPED_STAGES]
+    if args.stages:
+        wanted = set(args.stages.split(","))
+        stage_ids = [s for s in stage_ids if s in wanted]
+
+    if args.record or args.synthesize:
+        args.recording.unlink(missing_ok=True)
+        replay = LLMReplay("record", str(args.recording))
+    else:
+        replay = LLMReplay(
+            "replay", str(args.recording),
+            latency_ms=args.latency_ms, latency_scale=args.latency_scale, match=args.match,
+        )
+    install_llm_replay(replay)
+
+    synthetic = (
+        patch.object(LLMService, "call", replayable("call")(_make_synthetic_call(topic["guideline"]["topic_title"])))
+        if args.synthesize else None
+    )
+    if synthetic:
+        synthetic.start()
+    if not args.no_memory:
+        tracemalloc.start()
+
+    runs = []
+    live = args.record or args.synthesize
+    repeat = 1 if live else max(1, args.repeat)
+    # Warm-up runs pay for lazy imports, client construction and schema builds.
+    for n in range((0 if live else args.warmup) + repeat):
+        run = _run_pipeline(
+            topic, stage_ids, measure_memory=not args.no_memory, tts_latency_s=args.tts_latency_ms / 1000,
+        )
+        if live or n >= args.warmup:
+            runs.append(run)
+    if synthetic:
+        synthetic.stop()
+
+    stages = _summarize(runs)
+    results = {
+        **_git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "fixture": str(args.fixture.name),
+        "recording": str(args.recording.name),
+        "llm_latency_ms": args.latency_ms,
+        "llm_latency_scale": args.latency_scale,
+        "tts_latency_ms": args.tts_latency_ms,
+        "repeat": repeat,
+        "warmup": 0 if live else args.warmup,
+        "llm_replay": replay.stats(),
+        "stages": stages,
+    }
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print(f"commit {results['commit']}{' (dirty)' if results['dirty'] else ''}, "
+          f"llm replay {results['llm_replay']}")
+    if baseline:
+        print(f"baseline commit {baseline['commit']}{' (dirty)' if baseline['dirty'] else ''}")
+    _print_table(stages, baseline["stages"] if baseline else None)
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -479,3 +479,63 @@ class TestStreamSync:
 
         with pytest.raises(err_cls):
             list(adapter.stream_sync("hi"))
+
+
+class TestStreamAsync:
+    """stream_async mirrors stream_sync on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_yields_text_deltas_skipping_thinking(self, adapter):
+        thinking_block = MagicMock()
+        thinking_block.type = "thinking"
+        text_block = MagicMock()
+        text_block.type = "text"
+        make_event = TestStreamSync()._make_event
+        make_delta = TestStreamSync()._make_delta
+        events = [
+            make_event("content_block_start", content_block=thinking_block),
+            make_event("content_block_delta", delta=make_delta(text="internal")),
+            make_event("content_block_stop"),
+            make_event("content_block_start", content_block=text_block),
+            make_event("content_block_delta", delta=make_delta(text="visible")),
+            make_event("content_block_stop"),
+        ]
+
+        async def _events():
+            for ev in events:
+                yield ev
+
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=_events())
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        adapter.async_client.messages.stream.return_value = ctx
+
+        chunks = [c async for c in adapter.stream_async("hi", json_mode=True)]
+        assert chunks == ["visible"]
+
+
+class TestBuildAsyncClient:
+    def test_uses_pool_limits(self):
+        import httpx
+        limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+        with patch("shared.services.anthropic_adapter.anthropic") as mock_anthropic:
+            ad = AnthropicAdapter(api_key="k", pool_limits=limits)
+            mock_anthropic.AsyncAnthropic.return_value = MagicMock()
+            built = ad.build_async_client()
+
+        assert built is not ad.async_client
+        mock_anthropic.DefaultAsyncHttpxClient.assert_called_with(limits=limits)
+
+    @pytest.mark.asyncio
+    async def test_call_async_prefers_explicit_client(self, adapter):
+        mock_block = MagicMock()
+        mock_block.type = "text"
+        mock_block.text = '{"ok": true}'
+        loop_client = MagicMock()
+        loop_client.messages.create = AsyncMock(return_value=MagicMock(content=[mock_block]))
+        adapter.async_client.messages.create = AsyncMock()
+
+        result = await adapter.call_async("p", client=loop_client)
+
+        assert result["parsed"] == {"ok": True}
+        adapter.async_client.messages.create.assert_not_called()
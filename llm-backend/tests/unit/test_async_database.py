@@ -0,0 +1,289 @@
+"""Unit tests for the async database layer (database.AsyncDatabaseManager)
+and the tutor WebSocket path that runs on it.
+
+The latency tests use a real aiosqlite engine on a temp file, with a fixed
+delay added to every statement inside the driver's connection thread —
+the stand-in for a network round-trip to Postgres. DB waits then cost wall
+time without holding the event loop, exactly like asyncpg I/O.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import WebSocketDisconnect
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import database
+from database import AsyncDatabaseManager, async_database_url
+from shared.models.entities import Base, LLMConfig, Session as SessionModel
+from tutor.api.sessions import _save_session_to_db_async, websocket_endpoint
+from tutor.models.messages import StudentContext, create_student_message, create_teacher_message
+from tutor.models.session_state import create_session
+from tutor.models.study_plan import StudyPlan, StudyPlanStep, Topic, TopicGuidelines
+from tutor.services.session_state_store import append_new_messages, dump_state_json
+
+STATEMENT_LATENCY = 0.03
+
+
+def _make_state(session_id: str, turns: int):
+    topic = Topic(
+        topic_id="t1",
+        topic_name="Fractions",
+        subject="Math",
+        grade_level=3,
+        guidelines=TopicGuidelines(learning_objectives=["Add fractions"]),
+        study_plan=StudyPlan(steps=[
+            StudyPlanStep(step_id=1, type="explain", concept="Fractions"),
+        ]),
+    )
+    session = create_session(topic=topic, student_context=StudentContext(grade=3))
+    session.session_id = session_id
+    for n in range(turns):
+        session.add_message(create_student_message(f"answer {n}"))
+        session.add_message(create_teacher_message(f"reply {n}"))
+    return session
+
+
+def _seed(path, session_ids, turns: int) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(text("PRAGMA journal_mode=WAL"))
+    with engine.begin() as conn:
+        conn.execute(LLMConfig.__table__.insert().values(
+            component_key="tutor", provider="openai", model_id="gpt-4o", reasoning_effort="low",
+        ))
+    from sqlalchemy.orm import Session as SyncSession
+    with SyncSession(engine) as db:
+        for session_id in session_ids:
+            state = _make_state(session_id, turns)
+            db.add(SessionModel(
+                id=session_id, student_json="{}", goal_json="{}",
+                state_json=dump_state_json(state), mode=state.mode,
+                state_version=1, created_at=datetime.utcnow(),
+            ))
+            append_new_messages(db, session_id, state, stored=0)
+        db.commit()
+    engine.dispose()
+
+
+@asynccontextmanager
+async def _async_db(path, latency: float = 0.0):
+    """Install an AsyncDatabaseManager on `path` as the global async manager."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=20)
+
+    if latency:
+        @event.listens_for(engine.sync_engine, "connect")
+        def _slow_statements(dbapi_connection, _record):
+            # Runs in aiosqlite's connection thread, once per statement.
+            dbapi_connection.run_async(
+                lambda conn: conn.set_trace_callback(lambda _sql: time.sleep(latency))
+            )
+
+    manager = AsyncDatabaseManager()
+    manager._engine = engine
+    previous, database._async_db_manager = database._async_db_manager, manager
+    try:
+        yield manager
+    finally:
+        await manager.close()
+        database._async_db_manager = previous
+
+
+class _LoopMonitor:
+    """Longest gap between event-loop ticks while running."""
+
+    def __init__(self, tick: float = 0.005):
+        self.tick = tick
+        self.max_gap = 0.0
+        self._task = None
+
+    async def _run(self):
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(self.tick)
+            now = time.perf_counter()
+            self.max_gap = max(self.max_gap, now - last - self.tick)
+            last = now
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(self._run())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._task.cancel()
+
+
+class _FakeSocket:
+    """Anonymous client that disconnects after the initial state update."""
+
+    def __init__(self):
+        self.query_params = {}
+        self.sent = []
+        self.closed = None
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000, reason=""):
+        self.closed = code
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def receive_json(self):
+        raise WebSocketDisconnect()
+
+
+@pytest.fixture
+def orchestrator():
+    orch = MagicMock()
+    orch.generate_welcome_message = AsyncMock(return_value=("Hello!", "Hello!"))
+    with patch("shared.services.llm_client_registry.get_shared_llm_service"), \
+            patch("tutor.orchestration.TeacherOrchestrator", return_value=orch):
+        yield orch
+
+
+class TestAsyncDatabaseUrl:
+    def test_postgres_urls_use_asyncpg(self):
+        assert async_database_url("postgresql://u:p@h:5432/db") == "postgresql+asyncpg://u:p@h:5432/db"
+        assert async_database_url("postgresql+psycopg2://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+    def test_sslmode_becomes_asyncpg_ssl(self):
+        assert async_database_url("postgresql://u:p@h/db?sslmode=require") == (
+            "postgresql+asyncpg://u:p@h/db?ssl=require"
+        )
+
+    def test_sqlite_and_async_urls(self):
+        assert async_database_url("sqlite:///./tutor.db") == "sqlite+aiosqlite:///./tutor.db"
+        assert async_database_url("postgresql+asyncpg://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+
+class TestAsyncDatabaseManager:
+    def test_engine_uses_async_pool_settings(self):
+        settings = MagicMock(
+            database_url="postgresql://u:p@h:5432/db", log_level="INFO",
+            db_async_pool_size=7, db_async_max_overflow=3, db_async_pool_timeout=12,
+        )
+        with patch("database.get_settings", return_value=settings):
+            engine = AsyncDatabaseManager().engine
+        assert engine.url.drivername == "postgresql+asyncpg"
+        assert engine.pool.size() == 7
+        assert engine.pool._max_overflow == 3
+        assert engine.pool._timeout == 12
+
+    @pytest.mark.asyncio
+    async def test_session_scope_commits_and_rolls_back(self, tmp_path):
+        path = tmp_path / "db.sqlite"
+        _seed(path, ["s1"], turns=0)
+        async with _async_db(path) as manager:
+            assert await manager.health_check()
+
+            async with manager.session_scope() as db:
+                row = await db.get(SessionModel, "s1")
+                row.mode = "clarify_doubts"
+            with pytest.raises(RuntimeError):
+                async with manager.session_scope() as db:
+                    row = await db.get(SessionModel, "s1")
+                    row.mode = "exam"
+                    await db.flush()
+                    raise RuntimeError("boom")
+
+            async with manager.session_factory() as db:
+                assert await db.scalar(select(SessionModel.mode).where(SessionModel.id == "s1")) == "clarify_doubts"
+
+
+class TestWebSocketOnAsyncPool:
+    @pytest.mark.asyncio
+    async def test_connect_welcome_and_save(self, tmp_path, orchestrator):
+        path = tmp_path / "db.sqlite"
+        _seed(path, ["s1"], turns=0)
+        socket = _FakeSocket()
+        async with _async_db(path) as manager:
+            await websocket_endpoint(socket, "s1")
+
+            async with manager.session_factory() as db:
+                row = await db.get(SessionModel, "s1")
+        assert socket.closed is None
+        assert [m["type"] for m in socket.sent] == ["state_update", "assistant"]
+        assert row.state_version == 2
+        assert row.message_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_session_is_closed(self, tmp_path, orchestrator):
+        path = tmp_path / "db.sqlite"
+        _seed(path, [], turns=0)
+        socket = _FakeSocket()
+        async with _async_db(path):
+            await websocket_endpoint(socket, "missing")
+        assert socket.closed == 4004
+
+    @pytest.mark.asyncio
+    async def test_cas_conflict_reloads_from_db(self, tmp_path):
+        path = tmp_path / "db.sqlite"
+        _seed(path, ["s1"], turns=1)
+        session = _make_state("s1", turns=2)
+        async with _async_db(path):
+            version, reloaded = await _save_session_to_db_async("s1", session, 1)
+            assert (version, reloaded) == (2, None)
+            version, reloaded = await _save_session_to_db_async("s1", session, 1)
+        assert version == 2
+        assert len(reloaded.full_conversation_log) == 4
+
+
+class TestConcurrentSessionLatency:
+    """N sessions doing DB I/O at once must overlap, not queue behind each other."""
+
+    N = 8
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_do_not_serialize(self, tmp_path, orchestrator):
+        path = tmp_path / "db.sqlite"
+        ids = [f"s{i}" for i in range(self.N + 2)]
+        _seed(path, ids, turns=1)
+        async with _async_db(path, latency=STATEMENT_LATENCY):
+            await websocket_endpoint(_FakeSocket(), ids[-1])  # warms the config cache
+            start = time.perf_counter()
+            await websocket_endpoint(_FakeSocket(), ids[-2])
+            single = time.perf_counter() - start
+
+            sockets = [_FakeSocket() for _ in range(self.N)]
+            async with _LoopMonitor() as loop:
+                start = time.perf_counter()
+                await asyncio.gather(*(
+                    websocket_endpoint(socket, session_id)
+                    for socket, session_id in zip(sockets, ids)
+                ))
+                concurrent = time.perf_counter() - start
+
+        assert all(s.sent and s.sent[0]["type"] == "state_update" for s in sockets)
+        # Each connect waits on several statements; serialized, N of them
+        # would take N times one connect.
+        assert single >= 2 * STATEMENT_LATENCY
+        assert concurrent < single * self.N / 3
+        assert loop.max_gap < STATEMENT_LATENCY
+
+    @pytest.mark.asyncio
+    async def test_saves_do_not_block_the_event_loop(self, tmp_path):
+        path = tmp_path / "db.sqlite"
+        ids = [f"s{i}" for i in range(4)]
+        _seed(path, ids, turns=1)
+        states = [_make_state(session_id, turns=2) for session_id in ids]
+        async with _async_db(path, latency=STATEMENT_LATENCY):
+            async with _LoopMonitor() as loop:
+                start = time.perf_counter()
+                results = await asyncio.gather(*(
+                    _save_session_to_db_async(state.session_id, state, 1) for state in states
+                ))
+                elapsed = time.perf_counter() - start
+
+        assert results == [(2, None)] * len(ids)
+        # SQLite takes one writer at a time, so the saves themselves queue
+        # here (Postgres row locks would not) — but the loop keeps ticking.
+        assert elapsed > 4 * STATEMENT_LATENCY
+        assert loop.max_gap < STATEMENT_LATENCY
@@ -0,0 +1,145 @@
+"""Unit tests for content-hash skipping in AudioGenerationService.
+
+A clip is re-synthesized only when its URL is missing or the stored hash of
+(normalized text, voice, emotion, provider) no longer matches. Clips made
+before hashes were recorded are kept. `force=True` re-synthesizes everything.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from book_ingestion_v2.services.audio_generation_service import (
+    AudioGenerationService,
+    audio_content_hash,
+)
+
+
+def _make_service(provider: str = "elevenlabs") -> AudioGenerationService:
+    svc = AudioGenerationService.__new__(AudioGenerationService)
+    svc.provider = provider
+    svc.tts_client = None
+    svc.s3 = MagicMock()
+    svc.bucket = "test-bucket"
+    svc.region = "us-east-1"
+    svc.audio_config = None
+    svc.language = "en"
+    svc.elevenlabs_api_key = "test-key"
+    svc._synth_and_upload = MagicMock(side_effect=lambda text, s3_key, **_: f"https://s3/{s3_key}")
+    return svc
+
+
+def _cards(*texts: str) -> list[dict]:
+    return [{
+        "card_idx": 1, "card_type": "concept", "title": "C1",
+        "lines": [{"audio": t, "display": t} for t in texts],
+    }]
+
+
+def _dialogue(*lines: dict) -> SimpleNamespace:
+    return SimpleNamespace(guideline_id="g1", cards_json=[{
+        "card_id": "c1", "card_idx": 1, "card_type": "dialogue", "speaker": "peer",
+        "lines": [dict(line) for line in lines],
+    }])
+
+
+def _synthesized(svc: AudioGenerationService) -> list[str]:
+    return [c.args[0] for c in svc._synth_and_upload.call_args_list]
+
+
+class TestAudioContentHash:
+    def test_whitespace_only_edits_keep_the_hash(self):
+        assert audio_content_hash("Hello  world", provider="elevenlabs") == \
+            audio_content_hash(" Hello world ", provider="elevenlabs")
+
+    def test_emotion_matters_on_elevenlabs_only(self):
+        for provider, differs in (("elevenlabs", True), ("google_tts", False)):
+            plain = audio_content_hash("Wow", provider=provider)
+            excited = audio_content_hash("Wow", provider=provider, emotion="excited")
+            assert (plain != excited) is differs
+
+
+class TestGenerateForCards:
+    def test_generation_records_hash_and_rerun_skips(self):
+        svc = _make_service()
+        cards = _cards("one", "two")
+
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+
+        line = cards[0]["lines"][0]
+        assert line["audio_hash"] == audio_content_hash("one", provider="elevenlabs")
+        assert _synthesized(svc) == ["one", "two"]
+
+    def test_force_revoices_clips_whose_hash_matches(self):
+        svc = _make_service()
+        cards = _cards("one", "two")
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+        svc._synth_and_upload.reset_mock()
+
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A", force=True)
+
+        assert _synthesized(svc) == ["one", "two"]
+
+    def test_only_edited_lines_are_resynthesized(self):
+        svc = _make_service()
+        cards = _cards("one", "two", "three")
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+        svc._synth_and_upload.reset_mock()
+
+        cards[0]["lines"][1]["audio"] = "two, revised"
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+
+        assert _synthesized(svc) == ["two, revised"]
+        assert cards[0]["lines"][1]["audio_hash"] == \
+            audio_content_hash("two, revised", provider="elevenlabs")
+
+    def test_provider_switch_revoices_everything(self):
+        cards = _cards("one", "two")
+        _make_service("google_tts").generate_for_cards(cards, guideline_id="g1", variant_key="A")
+
+        svc = _make_service("elevenlabs")
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+
+        assert _synthesized(svc) == ["one", "two"]
+
+    def test_legacy_clip_without_hash_kept_unless_forced(self):
+        svc = _make_service()
+        cards = _cards("one")
+        cards[0]["lines"][0]["audio_url"] = "https://s3/old.mp3"
+
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+        assert _synthesized(svc) == []
+
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A", force=True)
+        assert _synthesized(svc) == ["one"]
+        assert "audio_hash" in cards[0]["lines"][0]
+
+    def test_check_in_hashes_use_field_prefix(self):
+        svc = _make_service()
+        cards = [{
+            "card_idx": 2, "card_id": "ck1", "card_type": "check_in", "title": "Q",
+            "lines": [],
+            "check_in": {"activity_type": "pick_one", "audio_text": "Pick one", "hint": "Look again"},
+        }]
+
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="A")
+
+        check_in = cards[0]["check_in"]
+        assert check_in["audio_text_hash"] == audio_content_hash("Pick one", provider="elevenlabs")
+        assert check_in["hint_audio_hash"] == audio_content_hash("Look again", provider="elevenlabs")
+
+
+class TestGenerateForTopicDialogue:
+    def test_emotion_change_revoices_only_that_line(self):
+        svc = _make_service()
+        dialogue = _dialogue(
+            {"audio": "Hi!", "display": "Hi!", "emotion": "excited"},
+            {"audio": "Okay.", "display": "Okay."},
+        )
+        svc.generate_for_topic_dialogue(dialogue)
+        svc._synth_and_upload.reset_mock()
+
+        dialogue.cards_json[0]["lines"][0]["emotion"] = "curious"
+        svc.generate_for_topic_dialogue(dialogue)
+
+        assert _synthesized(svc) == ["Hi!"]
+        assert svc._synth_and_upload.call_args.kwargs["speaker"] == "peer"
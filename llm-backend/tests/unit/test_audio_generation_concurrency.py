@@ -0,0 +1,159 @@
+"""Unit tests for AudioGenerationService's concurrent synthesis pipeline.
+
+Covers the worker pool in `_run_jobs` (parallelism, deterministic URL
+assignment, fail-fast on TTSProviderError) and the per-provider limiter in
+`_synth_and_upload` (provider slot released before the S3 upload).
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from book_ingestion_v2.services import audio_generation_service as ags
+from book_ingestion_v2.services.audio_generation_service import (
+    AudioGenerationService,
+    TTSProviderError,
+)
+from shared.utils.rate_limiter import reset_provider_limiters
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters():
+    reset_provider_limiters()
+    yield
+    reset_provider_limiters()
+
+
+def _make_service(concurrency: int) -> AudioGenerationService:
+    svc = AudioGenerationService.__new__(AudioGenerationService)
+    svc.provider = "elevenlabs"
+    svc.tts_client = None
+    svc.s3 = MagicMock()
+    svc.bucket = "test-bucket"
+    svc.region = "us-east-1"
+    svc.audio_config = None
+    svc.language = "en"
+    svc.elevenlabs_api_key = "test-key"
+    svc.synthesis_concurrency = concurrency
+    return svc
+
+
+def _cards(n_lines: int) -> list[dict]:
+    return [{
+        "card_idx": 1, "card_type": "concept", "title": "C1",
+        "lines": [{"audio": f"line {i}", "display": f"line {i}"} for i in range(n_lines)],
+    }]
+
+
+class _InFlight:
+    """Tracks the peak number of overlapping calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.current -= 1
+
+
+class TestRunJobs:
+    def test_lines_run_concurrently_with_deterministic_urls(self):
+        svc = _make_service(concurrency=4)
+        in_flight = _InFlight()
+
+        def synth(text, s3_key, **_):
+            with in_flight:
+                time.sleep(0.02)
+            return f"https://s3/{s3_key}"
+
+        svc._synth_and_upload = MagicMock(side_effect=synth)
+        cards = _cards(12)
+
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="v1")
+
+        assert in_flight.peak > 1
+        assert [line["audio_url"] for line in cards[0]["lines"]] == [
+            f"https://s3/audio/g1/v1/1/{i}.mp3" for i in range(12)
+        ]
+
+    def test_provider_error_stops_unstarted_jobs(self):
+        svc = _make_service(concurrency=2)
+        started = []
+
+        def synth(text, s3_key, **_):
+            started.append(s3_key)
+            if text == "line 0":
+                raise TTSProviderError("EL down")
+            time.sleep(0.01)
+            return f"https://s3/{s3_key}"
+
+        svc._synth_and_upload = MagicMock(side_effect=synth)
+        cards = _cards(40)
+
+        with pytest.raises(TTSProviderError):
+            svc.generate_for_cards(cards, guideline_id="g1", variant_key="v1")
+
+        # Only clips already racing the failure ran; their URLs are kept.
+        assert len(started) < 2 * svc.synthesis_concurrency + 2
+        recorded = {
+            line["audio_url"].removeprefix("https://s3/")
+            for line in cards[0]["lines"] if "audio_url" in line
+        }
+        assert recorded == set(started) - {"audio/g1/v1/1/0.mp3"}
+
+    def test_generic_failures_are_counted_not_raised(self):
+        svc = _make_service(concurrency=3)
+
+        def synth(text, s3_key, **_):
+            if text.endswith("3"):
+                raise RuntimeError("S3 hiccup")
+            return f"https://s3/{s3_key}"
+
+        svc._synth_and_upload = MagicMock(side_effect=synth)
+        cards = _cards(6)
+
+        svc.generate_for_cards(cards, guideline_id="g1", variant_key="v1")
+
+        assert "audio_url" not in cards[0]["lines"][3]
+        assert sum("audio_url" in line for line in cards[0]["lines"]) == 5
+
+
+class TestProviderLimiter:
+    def test_upload_runs_outside_the_provider_slot(self, monkeypatch):
+        monkeypatch.setattr(
+            ags, "get_settings",
+            lambda: MagicMock(
+                tts_synthesis_concurrency=1,
+                tts_elevenlabs_requests_per_second=0,
+                tts_google_requests_per_second=0,
+            ),
+        )
+        svc = _make_service(concurrency=1)
+        svc._synthesize = MagicMock(return_value=b"mp3")
+        slot_free_during_upload = []
+
+        def upload(data, key, content_type=None):
+            slots = ags._provider_limiter("elevenlabs").slots
+            free = slots.acquire(blocking=False)
+            if free:
+                slots.release()
+            slot_free_during_upload.append(free)
+
+        svc.s3.upload_bytes.side_effect = upload
+
+        url = svc._synth_and_upload("hi", "audio/g1/v1/1/0.mp3")
+
+        assert url == "https://test-bucket.s3.us-east-1.amazonaws.com/audio/g1/v1/1/0.mp3"
+        assert slot_free_during_upload == [True]
+
+    def test_limiter_is_shared_per_provider(self):
+        assert ags._provider_limiter("elevenlabs") is ags._provider_limiter("elevenlabs")
+        assert ags._provider_limiter("elevenlabs") is not ags._provider_limiter("google_tts")
@@ -9,7 +9,7 @@ and last_prompt tracking.
 import asyncio
 import json
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from pydantic import BaseModel, Field
 
 from tutor.agents.base_agent import BaseAgent, AgentContext
@@ -56,10 +56,15 @@ def make_context(**overrides):
 def make_llm_mock(output_text='{"field": "value", "score": 0.5}'):
     """Create a mock LLM service that returns structured output."""
     llm = Mock()
-    llm.call.return_value = {"output_text": output_text}
+    llm.acall = AsyncMock(return_value={"output_text": output_text})
     return llm
 
 
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
 # ---------------------------------------------------------------------------
 # AgentContext
 # ---------------------------------------------------------------------------
@@ -131,8 +136,8 @@ class TestExecuteHappyPath:
 
         await agent.execute(ctx)
 
-        llm.call.assert_called_once()
-        call_kwargs = llm.call.call_args
+        llm.acall.assert_awaited_once()
+        call_kwargs = llm.acall.call_args
         # prompt should contain the student message
         assert "What is 2+2?" in call_kwargs.kwargs.get("prompt", call_kwargs[1].get("prompt", ""))
 
@@ -210,15 +215,12 @@ class TestExecuteTimeout:
     @pytest.mark.asyncio
     async def test_timeout_raises_agent_timeout_error(self):
         llm = Mock()
-        llm.call.side_effect = asyncio.TimeoutError()
+        llm.acall = AsyncMock(side_effect=asyncio.TimeoutError())
         agent = TestableAgent(llm, timeout_seconds=5)
         ctx = make_context()
 
         # The asyncio.TimeoutError is caught inside execute and re-raised
-        # as AgentTimeoutError. However, the LLM call is run in an executor,
-        # so the TimeoutError propagates as a generic exception and gets
-        # wrapped in AgentExecutionError instead. We need to mock at the
-        # right level.
+        # as AgentTimeoutError (or wrapped in AgentExecutionError).
         with pytest.raises((AgentTimeoutError, AgentExecutionError)):
             await agent.execute(ctx)
 
@@ -231,7 +233,7 @@ class TestExecuteGeneralException:
     @pytest.mark.asyncio
     async def test_general_exception_raises_agent_execution_error(self):
         llm = Mock()
-        llm.call.side_effect = ValueError("something broke")
+        llm.acall = AsyncMock(side_effect=ValueError("something broke"))
         agent = TestableAgent(llm)
         ctx = make_context()
 
@@ -255,69 +257,131 @@ class TestSummarizeOutput:
 
 
 # ---------------------------------------------------------------------------
-# ResponseFieldExtractor — extracts streaming "response" string from JSON
+# StreamingFieldParser — streams "response" text and emits closed fields
 # ---------------------------------------------------------------------------
 
-class TestResponseFieldExtractor:
-    """Cover the streaming JSON → response-text extractor used by execute_stream."""
+def _feed_all(parser, parts):
+    events = []
+    for part in parts:
+        events.extend(parser.feed(part))
+    return events
+
+
+def _text(events):
+    return "".join(payload for kind, payload in events if kind == "text")
+
+
+def _fields(events):
+    return [payload for kind, payload in events if kind == "field"]
 
-    def _new_extractor(self):
-        from tutor.agents.base_agent import ResponseFieldExtractor
-        return ResponseFieldExtractor()
+
+class TestStreamingFieldParser:
+    """Cover the incremental JSON parser used by execute_stream."""
+
+    def _new_parser(self):
+        from tutor.agents.base_agent import StreamingFieldParser
+        return StreamingFieldParser()
 
     def test_extracts_simple_response_value(self):
-        ext = self._new_extractor()
-        out = ext.feed('{"response": "Hello world", "other": 1}')
-        assert out == "Hello world"
+        parser = self._new_parser()
+        events = parser.feed('{"response": "Hello world", "other": 1}')
+        assert _text(events) == "Hello world"
+        assert parser.done is True
+        assert parser.fields == {"response": "Hello world", "other": 1}
 
     def test_handles_chunked_input(self):
-        ext = self._new_extractor()
-        # Trigger pattern is split across chunks — extractor must remember state.
-        parts = ['{"resp', 'onse": "Hi', ' there"}']
-        result = "".join(ext.feed(p) for p in parts)
-        assert result == "Hi there"
+        parser = self._new_parser()
+        # Key split across chunks — parser must remember state.
+        events = _feed_all(parser, ['{"resp', 'onse": "Hi', ' there"}'])
+        assert _text(events) == "Hi there"
 
     def test_ignores_other_keys(self):
-        ext = self._new_extractor()
-        out = ext.feed('{"prefix": "ignored", "response": "real text"}')
-        assert out == "real text"
+        parser = self._new_parser()
+        events = parser.feed('{"prefix": "ignored", "response": "real text"}')
+        assert _text(events) == "real text"
 
     def test_handles_escape_sequences(self):
-        ext = self._new_extractor()
-        out = ext.feed(r'{"response": "line1\nline2\tend"}')
-        assert out == "line1\nline2\tend"
+        parser = self._new_parser()
+        events = parser.feed(r'{"response": "line1\nline2\tend"}')
+        assert _text(events) == "line1\nline2\tend"
 
     def test_handles_escaped_quote(self):
-        ext = self._new_extractor()
-        out = ext.feed(r'{"response": "she said \"hi\""}')
-        assert out == 'she said "hi"'
+        parser = self._new_parser()
+        events = parser.feed(r'{"response": "she said \"hi\""}')
+        assert _text(events) == 'she said "hi"'
 
     def test_handles_unicode_escape(self):
-        ext = self._new_extractor()
-        # é is é
-        out = ext.feed(r'{"response": "café"}')
-        assert out == "café"
+        parser = self._new_parser()
+        events = parser.feed(r'{"response": "caf\u00e9"}')
+        assert _text(events) == "café"
+
+    def test_escapes_split_across_chunks(self):
+        parser = self._new_parser()
+        # Backslash, \u digits and a surrogate pair all straddle chunk edges.
+        parts = ['{"response": "a\\', 'nb caf\\u00', 'e9 \\ud83d', '\\ude00!"}']
+        events = _feed_all(parser, parts)
+        texts = [payload for kind, payload in events if kind == "text"]
+        assert "".join(texts) == "a\nb café 😀!"
+        assert all("\\" not in t for t in texts)
 
     def test_invalid_unicode_escape_returns_raw(self):
-        ext = self._new_extractor()
-        # ZZZZ is not valid hex — extractor falls back to the raw escape body.
-        out = ext.feed(r'{"response": "x\uZZZZy"}')
-        assert "ZZZZ" in out
-
-    def test_state_done_after_value_closes(self):
-        ext = self._new_extractor()
-        ext.feed('{"response": "first"')
-        # Anything after the closing quote is dropped — no further extraction.
-        more = ext.feed(', "response": "second"}')
-        assert more == ""
-
-    def test_scan_buffer_truncation_is_safe(self):
-        # The extractor truncates its scan buffer to 20 chars beyond 30 to
-        # avoid unbounded memory while waiting for the trigger.
-        ext = self._new_extractor()
-        long_prefix = "x" * 200 + '"response": "hit"'
-        out = ext.feed(long_prefix)
-        assert out == "hit"
+        parser = self._new_parser()
+        # ZZZZ is not valid hex — the text falls back to the raw escape body.
+        events = parser.feed(r'{"response": "x\uZZZZy"}')
+        assert "ZZZZ" in _text(events)
+
+    def test_nothing_after_object_closes(self):
+        parser = self._new_parser()
+        parser.feed('{"response": "first"}')
+        assert parser.feed(', "response": "second"}') == []
+
+    def test_skips_text_before_the_object(self):
+        parser = self._new_parser()
+        events = _feed_all(parser, ["Sure! ```js", 'on\n{"response": "hit"}', "\n```"])
+        assert _text(events) == "hit"
+        assert parser.done is True and parser.failed is False
+
+    def test_malformed_object_fails_quietly(self):
+        parser = self._new_parser()
+        assert parser.feed('{response: "hit"}') == []
+        assert parser.failed is True
+
+    def test_fields_emitted_as_each_value_closes(self):
+        parser = self._new_parser()
+        parts = [
+            '{"response": "Look", "audio_text": "Look at this"',
+            ', "visual_explanation": {"output_type": "image", "tags": ["a", "}"]',
+            '}, "mastery_updates": [{"concept": "x", "score": 0.5}], "turn_summary": nu',
+            'll}',
+        ]
+        per_chunk = [_fields(parser.feed(part)) for part in parts]
+
+        assert per_chunk[0] == [("response", "Look"), ("audio_text", "Look at this")]
+        assert per_chunk[1] == []  # visual_explanation still open
+        assert per_chunk[2] == [
+            ("visual_explanation", {"output_type": "image", "tags": ["a", "}"]}),
+            ("mastery_updates", [{"concept": "x", "score": 0.5}]),
+        ]
+        assert per_chunk[3] == [("turn_summary", None)]
+        assert parser.done is True
+
+    def test_scalar_field_waits_for_its_terminator(self):
+        parser = self._new_parser()
+        assert _fields(parser.feed('{"score": 0.')) == []
+        assert _fields(parser.feed('75 , "field": true}')) == [("score", 0.75), ("field", True)]
+
+    def test_matches_json_loads_for_any_chunking(self):
+        payload = json.dumps({
+            "response": 'Tricky "quotes", {braces} and \\ slashes — ok?',
+            "question_format": {"type": "mcq", "options": ["1/2", "[1]"]},
+            "mastery_updates": [],
+            "answer_correct": False,
+        })
+        for size in (1, 2, 3, 7, 64):
+            parser = self._new_parser()
+            events = _feed_all(parser, [payload[i:i + size] for i in range(0, len(payload), size)])
+            assert parser.fields == json.loads(payload)
+            assert _text(events) == json.loads(payload)["response"]
 
 
 # ---------------------------------------------------------------------------
@@ -332,7 +396,7 @@ class TestExecuteStream:
         chunks = ['{"response": "Hel', 'lo!", "score": 0.9, "field": "ok"}']
 
         llm = Mock()
-        llm.call_stream = Mock(return_value=iter(chunks))
+        llm.acall_stream = Mock(return_value=_aiter(chunks))
         agent = TestableAgent(llm)
 
         events = []
@@ -348,6 +412,37 @@ class TestExecuteStream:
         assert isinstance(results[0], SomeModel)
         assert results[0].field == "ok"
 
+    @pytest.mark.asyncio
+    async def test_fenced_payload_still_streams_tokens(self):
+        chunks = ["```json\n", '{"response": "Hel', 'lo!", "score": 0.9, "field": "ok"}', "\n```"]
+
+        llm = Mock()
+        llm.acall_stream = Mock(return_value=_aiter(chunks))
+        agent = TestableAgent(llm)
+
+        events = [ev async for ev in agent.execute_stream(make_context())]
+
+        assert "".join(d for kind, d in events if kind == "token") == "Hello!"
+        assert ("field", ("field", "ok")) in events
+        assert events[-1][0] == "result" and events[-1][1].field == "ok"
+
+    @pytest.mark.asyncio
+    async def test_yields_field_events_before_result(self):
+        chunks = ['{"response": "Hi", "field": "ok"', ', "score": 0.5}']
+
+        llm = Mock()
+        llm.acall_stream = Mock(return_value=_aiter(chunks))
+        agent = TestableAgent(llm)
+
+        events = [ev async for ev in agent.execute_stream(make_context())]
+
+        kinds = [kind for kind, _ in events]
+        assert [d for kind, d in events if kind == "field"] == [
+            ("response", "Hi"), ("field", "ok"), ("score", 0.5),
+        ]
+        assert kinds.index("field") < kinds.index("result")
+        assert kinds[-1] == "result"
+
     @pytest.mark.asyncio
     async def test_stream_with_invalid_final_json_raises(self):
         # Stream ends with malformed JSON — validate_agent_output should raise
@@ -355,7 +450,7 @@ class TestExecuteStream:
         chunks = ['{"response": "ok"', ", broken"]
 
         llm = Mock()
-        llm.call_stream = Mock(return_value=iter(chunks))
+        llm.acall_stream = Mock(return_value=_aiter(chunks))
         agent = TestableAgent(llm)
 
         with pytest.raises((AgentExecutionError, AgentOutputError)):
@@ -364,12 +459,12 @@ class TestExecuteStream:
 
     @pytest.mark.asyncio
     async def test_stream_propagates_llm_exception(self):
-        def _raising_iter():
+        async def _raising_iter():
             yield '{"response": "partial"'
             raise RuntimeError("upstream LLM crashed")
 
         llm = Mock()
-        llm.call_stream = Mock(return_value=_raising_iter())
+        llm.acall_stream = Mock(return_value=_raising_iter())
         agent = TestableAgent(llm)
 
         with pytest.raises(AgentExecutionError):
@@ -382,15 +477,16 @@ class TestExecuteStream:
 # ---------------------------------------------------------------------------
 
 class TestExecuteFastModelBranch:
-    """The use_fast_model flag routes through llm.call_fast instead of llm.call."""
+    """The use_fast_model flag routes through llm.acall_fast instead of llm.acall."""
 
     @pytest.mark.asyncio
     async def test_fast_model_uses_call_fast(self):
         llm = Mock()
-        llm.call_fast.return_value = {"output_text": '{"field": "v"}'}
+        llm.acall_fast = AsyncMock(return_value={"output_text": '{"field": "v"}'})
+        llm.acall = AsyncMock()
         agent = TestableAgent(llm, use_fast_model=True)
 
         result = await agent.execute(make_context())
         assert isinstance(result, SomeModel)
-        assert llm.call_fast.called is True
-        assert llm.call.called is False
+        assert llm.acall_fast.called is True
+        assert llm.acall.called is False
@@ -0,0 +1,163 @@
+"""Unit tests for shared/utils/blob_store.py — local and in-memory backends."""
+
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlsplit
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from book_ingestion_v2.services.audio_generation_service import AudioGenerationService
+from shared.api import blob_routes
+from shared.utils.blob_store import LocalBlobStore, MemoryBlobStore, create_blob_store, reset_blob_store
+from shared.utils.s3_client import S3Client, get_s3_client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_blob_store():
+    reset_blob_store()
+    yield
+    reset_blob_store()
+
+
+@pytest.fixture(params=["local", "memory"])
+def store(request, tmp_path):
+    if request.param == "local":
+        return LocalBlobStore(str(tmp_path / "blobs"), public_base_url="http://api/blobs")
+    return MemoryBlobStore(public_base_url="http://api/blobs")
+
+
+def _settings(**overrides):
+    defaults = dict(
+        blob_store_backend="memory", blob_store_local_root="./blob-store",
+        blob_store_public_base_url="http://api/blobs", s3_max_concurrency=4,
+        blob_store_signing_key="",
+    )
+    defaults.update(overrides)
+    return MagicMock(**defaults)
+
+
+class TestBackendContract:
+    def test_round_trip_and_listing(self, store):
+        store.upload_bytes(b"png", "books/b1/1.png", content_type="image/png")
+        store.upload_json({"title": "Maths"}, "books/b1/metadata.json")
+        store.upload_many({"books/b2/1.txt": b"a", "books/b1/1.txt": b"b"})
+
+        assert store.download_bytes("books/b1/1.png") == b"png"
+        assert store.download_json("books/b1/metadata.json") == {"title": "Maths"}
+        assert store.list_keys("books/b1/") == [
+            "books/b1/1.png", "books/b1/1.txt", "books/b1/metadata.json",
+        ]
+        assert store.file_exists("books/b2/1.txt")
+
+    def test_missing_key_matches_s3_errors(self, store):
+        assert store.download_bytes_if_exists("nope") is None
+        assert store.download_many(["nope"], missing_ok=True) == {"nope": None}
+        with pytest.raises(ClientError) as exc:
+            store.download_bytes("nope")
+        assert exc.value.response["Error"]["Code"] == "NoSuchKey"
+
+    def test_delete_folder_and_many(self, store):
+        store.upload_many({f"books/b1/{i}.png": b"x" for i in range(3)})
+        store.upload_bytes(b"keep", "books/b2/1.png")
+
+        assert store.delete_folder("books/b1/") == 3
+        assert store.delete_many(["books/b2/1.png", "missing"]) == 2
+        assert store.list_keys("") == []
+
+    def test_public_url_uses_configured_base(self, store):
+        assert store.public_url("audio/g1/A/1/0.mp3") == "http://api/blobs/audio/g1/A/1/0.mp3"
+
+    def test_upload_arg_order_guard(self, store):
+        with pytest.raises(TypeError, match="swap"):
+            store.upload_bytes("books/b1/1.png", b"png")
+
+
+class TestLocalBlobStore:
+    def test_rejects_keys_outside_root(self, tmp_path):
+        store = LocalBlobStore(str(tmp_path))
+        with pytest.raises(ValueError):
+            store.upload_bytes(b"x", "../escape.txt")
+
+    def test_large_reads_return_file_bytes(self, tmp_path):
+        store = LocalBlobStore(str(tmp_path))
+        data = bytes(range(256)) * 8192
+        store.upload_bytes(data, "books/b1/page.png")
+
+        result = store.download_bytes("books/b1/page.png")
+        assert type(result) is bytes and result == data
+
+
+class TestBackendSelection:
+    def test_config_selects_backend(self, tmp_path):
+        with patch("config.get_settings", return_value=_settings()):
+            assert isinstance(get_s3_client(), MemoryBlobStore)
+            assert get_s3_client() is get_s3_client()
+        with patch("config.get_settings", return_value=_settings(blob_store_local_root=str(tmp_path))):
+            assert isinstance(create_blob_store("local"), LocalBlobStore)
+        with pytest.raises(ValueError), patch("config.get_settings", return_value=_settings()):
+            create_blob_store("gcs")
+
+    def test_s3_backend_keeps_https_audio_urls(self):
+        s3 = S3Client(MagicMock(), bucket_name="bucket", region="ap-south-1")
+        assert s3.public_url("audio/x.mp3") == "https://bucket.s3.ap-south-1.amazonaws.com/audio/x.mp3"
+
+    def test_audio_urls_follow_the_store(self):
+        svc = AudioGenerationService.__new__(AudioGenerationService)
+        svc.s3 = MemoryBlobStore(public_base_url="http://api/blobs")
+        assert svc._s3_url("audio/g1/A/1/0.mp3") == "http://api/blobs/audio/g1/A/1/0.mp3"
+
+
+class TestBlobRoute:
+    def _client(self, store):
+        app = FastAPI()
+        app.include_router(blob_routes.router)
+        return TestClient(app), patch.object(blob_routes, "get_blob_store", return_value=store)
+
+    def test_public_audio_loads_without_a_token(self, store):
+        # audioController fetch() sends no Authorization header.
+        store.upload_bytes(b"ID3audio", "audio/g1/A/1/0.mp3", content_type="audio/mpeg")
+        client, patched = self._client(store)
+        with patched:
+            resp = client.get(urlsplit(store.public_url("audio/g1/A/1/0.mp3")).path)
+
+        assert "authorization" not in {k.lower() for k in resp.request.headers}
+        assert resp.status_code == 200
+        assert resp.content == b"ID3audio"
+
+    def test_private_keys_need_a_valid_signature(self, store):
+        store.upload_bytes(b"\x89PNG", "books/b1/chapters/01/pages/1.png", content_type="image/png")
+        store.upload_bytes(b"\x89PNG", "issues/i1/screenshot.png", content_type="image/png")
+        client, patched = self._client(store)
+        with patched:
+            signed = urlsplit(store.get_presigned_url("books/b1/chapters/01/pages/1.png"))
+            ok = client.get(f"{signed.path}?{signed.query}")
+            unsigned = client.get("/blobs/issues/i1/screenshot.png")
+            other_key = client.get(f"/blobs/issues/i1/screenshot.png?{signed.query}")
+            expired = urlsplit(store.get_presigned_url("issues/i1/screenshot.png", expiration=-1))
+            stale = client.get(f"{expired.path}?{expired.query}")
+            traversal = client.get("/blobs/audio/%2E%2E/issues/i1/screenshot.png")
+
+        assert ok.status_code == 200 and ok.content == b"\x89PNG"
+        assert unsigned.status_code == 403
+        assert other_key.status_code == 403
+        assert stale.status_code == 403
+        assert traversal.status_code in (403, 404)
+
+    def test_serves_local_and_memory_objects(self, store):
+        store.upload_bytes(b"ID3audio", "audio/g1/A/1/0.mp3", content_type="audio/mpeg")
+        client, patched = self._client(store)
+        with patched:
+            ok = client.get("/blobs/audio/g1/A/1/0.mp3")
+            missing = client.get("/blobs/audio/none.mp3")
+
+        assert ok.status_code == 200
+        assert ok.content == b"ID3audio"
+        assert ok.headers["content-type"] == "audio/mpeg"
+        assert missing.status_code == 404
+
+    def test_s3_backend_is_not_proxied(self):
+        client, patched = self._client(S3Client(MagicMock(), bucket_name="b"))
+        with patched:
+            assert client.get("/blobs/audio/anything.mp3").status_code == 404
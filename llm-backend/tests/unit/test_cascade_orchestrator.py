@@ -10,6 +10,8 @@ Covers:
 - Stale flagging on descendants when cascade kicks off.
 - Read-order overlay surfaces `is_stale` from the row.
 - Terminal hook fires `on_stage_complete`.
+- Cascade state persisted in `topic_cascades`: cross-instance reads,
+  single launch per completion event, orphan drop on cancel.
 """
 from __future__ import annotations
 
@@ -461,8 +463,8 @@ class TestStartCascadeFromExplanations:
                 guideline_id=seed_topic["guideline_id"],
                 from_stage_id="explanations",
             )
-        # State was cleaned up — no orphan cascade entry.
-        assert orch.get_cascade(seed_topic["guideline_id"]) is None
+        # State was cleaned up — no orphan cascade row.
+        assert orch.get_cascade(seed_topic["guideline_id"], db=db_session) is None
 
     def test_lock_collision_does_not_commit_stale_flags(
         self, db_session, seed_topic, monkeypatch,
@@ -522,8 +524,8 @@ class TestStartCascadeFromExplanations:
                 guideline_id=seed_topic["guideline_id"],
                 from_stage_id="visuals",
             )
-        # No orphan cascade entry — future kickoffs aren't blocked.
-        assert orch.get_cascade(seed_topic["guideline_id"]) is None
+        # No orphan cascade row — future kickoffs aren't blocked.
+        assert orch.get_cascade(seed_topic["guideline_id"], db=db_session) is None
 
     def test_rerun_with_stale_upstream_dep_raises(
         self, db_session, seed_topic, fake_launchers,
@@ -676,6 +678,44 @@ class TestCascadeEventChain:
         assert repo.get(gid, "visuals").is_stale is False
         assert repo.get(gid, "check_ins").is_stale is False
 
+    def test_first_stage_failing_inside_launch_leaves_descendants_fresh(
+        self, db_session, seed_topic, fake_launchers, reset_singleton,
+        monkeypatch,
+    ):
+        # A first stage that fails before `_launch_next` returns halts
+        # the cascade mid-kickoff. The stale flags were committed with
+        # the claim, so the halt clears them instead of racing them.
+        gid = seed_topic["guideline_id"]
+        repo = TopicStageRunRepository(db_session)
+        repo.upsert_terminal(gid, "visuals", state="done", duration_ms=1)
+        repo.upsert_terminal(gid, "check_ins", state="done", duration_ms=1)
+
+        orch = cascade_module.get_cascade_orchestrator()
+        monkeypatch.setattr(orch, "_session_factory", _no_close_factory(db_session))
+        recording_launcher = LAUNCHER_BY_STAGE["explanations"]
+
+        def fast_failing_launcher(db, **kwargs):
+            job_id = recording_launcher(db, **kwargs)
+            _finish_running_job(
+                db, gid, "explanations", status="failed", error="boom",
+            )
+            return job_id
+        monkeypatch.setitem(
+            LAUNCHER_BY_STAGE, "explanations", fast_failing_launcher,
+        )
+
+        orch.start_cascade(
+            db_session,
+            book_id=seed_topic["book_id"],
+            chapter_id=seed_topic["chapter_id"],
+            guideline_id=gid,
+            from_stage_id="explanations",
+        )
+
+        assert orch.get_cascade(gid) is None
+        assert repo.get(gid, "visuals").is_stale is False
+        assert repo.get(gid, "check_ins").is_stale is False
+
     def test_cancel_mid_cascade_skips_next_launch(
         self, db_session, seed_topic, fake_launchers, reset_singleton,
         monkeypatch,
@@ -701,8 +741,12 @@ class TestCascadeEventChain:
         launched_ids = [c["stage_id"] for c in fake_launchers]
         assert launched_ids == ["explanations"]
 
-    def test_cancel_with_no_active_returns_false(self, fresh_orchestrator):
-        assert fresh_orchestrator.cancel("nonexistent-guideline") is False
+    def test_cancel_with_no_active_returns_false(
+        self, db_session, fresh_orchestrator,
+    ):
+        assert fresh_orchestrator.cancel(
+            "nonexistent-guideline", db=db_session,
+        ) is False
 
 
 # ---------------------------------------------------------------------------
@@ -865,14 +909,14 @@ class TestLaunchNextDefenseCleanup:
             quality_level="balanced", force_first=True,
             pending={"visuals"},
         )
-        fresh_orchestrator._cascades[gid] = state
+        fresh_orchestrator._save(db_session, state)
 
         fresh_orchestrator._launch_next(state, db=db_session)
 
         assert state.halted_at == "no_ready_stages"
-        # Cleanup should drop the cascade entry — pending is non-empty
+        # Cleanup should drop the cascade row — pending is non-empty
         # but `halted_at` flips `_maybe_cleanup` past its guard.
-        assert fresh_orchestrator.get_cascade(gid) is None
+        assert fresh_orchestrator.get_cascade(gid, db=db_session) is None
 
 
 # ---------------------------------------------------------------------------
@@ -1091,6 +1135,115 @@ class TestReconciliationFiresCascade:
         assert repo.get(gid, "explanations").state == "failed"
 
 
+# ---------------------------------------------------------------------------
+# Persisted cascade state (`topic_cascades`)
+# ---------------------------------------------------------------------------
+
+
+class TestPersistedCascadeState:
+    """Cascade state lives in `topic_cascades`, so separate orchestrator
+    instances (one per process in production) see and drive the same
+    cascades, and a completion event launches the next stage once."""
+
+    def _start(self, orch, db_session, seed_topic):
+        return orch.start_cascade(
+            db_session,
+            book_id=seed_topic["book_id"],
+            chapter_id=seed_topic["chapter_id"],
+            guideline_id=seed_topic["guideline_id"],
+            from_stage_id="explanations",
+        )
+
+    def test_other_instance_sees_and_advances_cascade(
+        self, db_session, seed_topic, fake_launchers,
+    ):
+        gid = seed_topic["guideline_id"]
+        cascade = self._start(CascadeOrchestrator(), db_session, seed_topic)
+
+        # A second instance — e.g. the worker process whose thread ran
+        # the stage — picks the cascade up from the row.
+        other = CascadeOrchestrator(
+            session_factory=_no_close_factory(db_session),
+        )
+        cur = other.get_cascade(gid)
+        assert cur.cascade_id == cascade.cascade_id
+        assert cur.running == "explanations"
+        assert cur.pending == cascade.pending
+
+        _finish_running_job(db_session, gid, "explanations")
+        other.on_stage_complete(
+            guideline_id=gid, stage_id="explanations", terminal_state="done",
+        )
+        cur = other.get_cascade(gid)
+        assert cur.running is not None and cur.running != "explanations"
+        assert cur.stage_results == {"explanations": "done"}
+        assert "explanations" not in cur.pending
+
+    def test_duplicate_completion_launches_next_stage_once(
+        self, db_session, seed_topic, fake_launchers,
+    ):
+        gid = seed_topic["guideline_id"]
+        orch = CascadeOrchestrator(
+            session_factory=_no_close_factory(db_session),
+        )
+        self._start(orch, db_session, seed_topic)
+        _finish_running_job(db_session, gid, "explanations")
+
+        # Terminal hook + reconciliation (or two processes) both report
+        # the same completion; only the first claims the next stage.
+        for _ in range(2):
+            orch.on_stage_complete(
+                guideline_id=gid, stage_id="explanations",
+                terminal_state="done",
+            )
+        launched = [c["stage_id"] for c in fake_launchers]
+        assert launched.count("explanations") == 1
+        assert len(launched) == 2
+
+    def test_second_instance_kickoff_raises_already_active(
+        self, db_session, seed_topic, fake_launchers,
+    ):
+        self._start(CascadeOrchestrator(), db_session, seed_topic)
+        with pytest.raises(CascadeAlreadyActiveError):
+            self._start(CascadeOrchestrator(), db_session, seed_topic)
+
+    def test_list_active_reads_rows(
+        self, db_session, seed_topic, fake_launchers,
+    ):
+        cascade = self._start(CascadeOrchestrator(), db_session, seed_topic)
+        active = CascadeOrchestrator().list_active(db=db_session)
+        assert [c.cascade_id for c in active] == [cascade.cascade_id]
+
+    def test_cancel_drops_cascade_whose_stage_never_launched(
+        self, db_session, seed_topic, fake_launchers,
+    ):
+        # Simulate a process that died after claiming `explanations` but
+        # before its chapter job existed: the row says running, yet no
+        # terminal hook will ever arrive.
+        gid = seed_topic["guideline_id"]
+        orch = CascadeOrchestrator()
+        self._start(orch, db_session, seed_topic)
+        db_session.query(ChapterProcessingJob).filter(
+            ChapterProcessingJob.guideline_id == gid,
+        ).delete()
+        db_session.commit()
+
+        assert orch.cancel(gid, db=db_session) is True
+        assert orch.get_cascade(gid, db=db_session) is None
+
+    def test_cancel_keeps_row_while_stage_in_flight(
+        self, db_session, seed_topic, fake_launchers,
+    ):
+        gid = seed_topic["guideline_id"]
+        orch = CascadeOrchestrator()
+        self._start(orch, db_session, seed_topic)
+
+        assert orch.cancel(gid, db=db_session) is True
+        cur = orch.get_cascade(gid, db=db_session)
+        assert cur.cancelled is True
+        assert cur.running == "explanations"
+
+
 # ---------------------------------------------------------------------------
 # API endpoints
 # ---------------------------------------------------------------------------
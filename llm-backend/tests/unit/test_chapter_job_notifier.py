@@ -0,0 +1,106 @@
+"""Unit tests for chapter-job completion notifications.
+
+Covers:
+- `watch` events are set by `notify_local` from another thread
+- waiters are scoped to their job_id and unregistered on exit
+- `notify_chapter_job_terminal` wakes local waiters and skips NOTIFY off Postgres
+- `_execute_chapter_job` notifies once the job is terminal
+"""
+from __future__ import annotations
+
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from book_ingestion_v2.services import chapter_job_notifier as cjn
+
+
+@pytest.fixture(autouse=True)
+def fresh_notifier():
+    cjn.reset_chapter_job_notifier()
+    yield
+    cjn.reset_chapter_job_notifier()
+
+
+class TestWatch:
+    def test_notify_from_other_thread_wakes_waiter(self):
+        notifier = cjn.get_chapter_job_notifier()
+        with notifier.watch("job-1") as finished:
+            threading.Timer(0.05, notifier.notify_local, args=("job-1",)).start()
+            assert finished.wait(5) is True
+
+    def test_other_job_does_not_wake_waiter(self):
+        notifier = cjn.get_chapter_job_notifier()
+        with notifier.watch("job-1") as finished:
+            notifier.notify_local("job-2")
+            assert finished.is_set() is False
+
+    def test_all_waiters_for_job_are_woken_and_unregistered(self):
+        notifier = cjn.get_chapter_job_notifier()
+        with notifier.watch("job-1") as a, notifier.watch("job-1") as b:
+            notifier.notify_local("job-1")
+            assert a.is_set() and b.is_set()
+        assert notifier._waiters == {}
+
+    def test_sqlite_session_starts_no_listener(self, db_session):
+        notifier = cjn.get_chapter_job_notifier()
+        with notifier.watch("job-1", db_session):
+            pass
+        assert notifier._listener is None
+
+
+class TestNotifyChapterJobTerminal:
+    def test_wakes_local_waiter_without_pg_notify(self, db_session):
+        notifier = cjn.get_chapter_job_notifier()
+        with notifier.watch("job-1") as finished:
+            cjn.notify_chapter_job_terminal(db_session, "job-1")
+            assert finished.is_set()
+
+    def test_publishes_pg_notify_on_postgres(self):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        cjn.notify_chapter_job_terminal(db, "job-1")
+        stmt, params = db.execute.call_args.args
+        assert "pg_notify" in str(stmt)
+        assert params == {"channel": cjn.NOTIFY_CHANNEL, "job_id": "job-1"}
+        db.commit.assert_called_once()
+
+    def test_publish_failure_is_swallowed(self):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        db.execute.side_effect = RuntimeError("connection lost")
+        cjn.notify_chapter_job_terminal(db, "job-1")
+        db.rollback.assert_called_once()
+
+
+class TestExecuteChapterJobNotifies:
+    @pytest.mark.parametrize("fails", [False, True])
+    def test_notifies_after_job_finishes(self, fails):
+        from book_ingestion_v2.api import processing_routes as pr
+
+        job_id = str(uuid.uuid4())
+        order: list[str] = []
+
+        def target(db, jid):
+            order.append("target")
+            if fails:
+                raise RuntimeError("boom")
+
+        manager = MagicMock()
+        manager.session_factory.return_value = MagicMock()
+        with patch("database.get_db_manager", return_value=manager), \
+                patch.object(pr, "ChapterJobService"), \
+                patch.object(pr, "_write_topic_stage_run_started"), \
+                patch.object(
+                    pr, "_write_topic_stage_run_terminal",
+                    side_effect=lambda *a, **k: order.append("terminal"),
+                ), \
+                patch.object(
+                    pr, "notify_chapter_job_terminal",
+                    side_effect=lambda db, jid: order.append(f"notify:{jid}"),
+                ):
+            pr._execute_chapter_job(target, job_id)
+
+        assert order == ["target", "terminal", f"notify:{job_id}"]
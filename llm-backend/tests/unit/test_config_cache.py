@@ -0,0 +1,150 @@
+"""Unit tests for shared/services/config_cache.py — ConfigCache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.models.entities import ConfigVersion, FeatureFlag, LLMConfig
+from shared.services.config_cache import (
+    FEATURE_FLAGS_NAMESPACE,
+    LLM_CONFIG_NAMESPACE,
+    ConfigCache,
+)
+from shared.services.feature_flag_service import FeatureFlagService
+from shared.services.llm_config_service import LLMConfigService
+
+
+@pytest.fixture
+def cache():
+    cache = ConfigCache(ttl_seconds=60)
+    with patch("shared.services.config_cache.get_config_cache", return_value=cache), \
+         patch("shared.services.llm_config_service.get_config_cache", return_value=cache), \
+         patch("shared.services.feature_flag_service.get_config_cache", return_value=cache):
+        yield cache
+
+
+class TestConfigCacheGet:
+    def test_second_lookup_is_served_from_memory(self, db_session, cache):
+        loader = MagicMock(return_value={"provider": "openai"})
+
+        first = cache.get(db_session, LLM_CONFIG_NAMESPACE, "tutor", loader)
+        second = cache.get(db_session, LLM_CONFIG_NAMESPACE, "tutor", loader)
+
+        assert first == second == {"provider": "openai"}
+        loader.assert_called_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["version_checks"] == 1
+
+    def test_none_is_cached(self, db_session, cache):
+        loader = MagicMock(return_value=None)
+        cache.get(db_session, FEATURE_FLAGS_NAMESPACE, "missing", loader)
+        cache.get(db_session, FEATURE_FLAGS_NAMESPACE, "missing", loader)
+        loader.assert_called_once()
+
+    def test_zero_ttl_disables_caching(self, db_session):
+        cache = ConfigCache(ttl_seconds=0)
+        loader = MagicMock(return_value=1)
+        cache.get(db_session, LLM_CONFIG_NAMESPACE, "k", loader)
+        cache.get(db_session, LLM_CONFIG_NAMESPACE, "k", loader)
+        assert loader.call_count == 2
+
+    def test_remote_version_change_drops_namespace_after_ttl(self, db_session, cache):
+        loader = MagicMock(side_effect=["old", "new"])
+        assert cache.get(db_session, LLM_CONFIG_NAMESPACE, "tutor", loader) == "old"
+
+        # Another worker bumps the version row; our TTL then lapses.
+        db_session.add(ConfigVersion(namespace=LLM_CONFIG_NAMESPACE, version=7))
+        db_session.commit()
+        cache._checked_at[LLM_CONFIG_NAMESPACE] -= 120
+
+        assert cache.get(db_session, LLM_CONFIG_NAMESPACE, "tutor", loader) == "new"
+
+    def test_unchanged_version_keeps_entries(self, db_session, cache):
+        loader = MagicMock(return_value="v")
+        cache.get(db_session, LLM_CONFIG_NAMESPACE, "tutor", loader)
+        cache._checked_at[LLM_CONFIG_NAMESPACE] -= 120
+
+        cache.get(db_session, LLM_CONFIG_NAMESPACE, "tutor", loader)
+
+        loader.assert_called_once()
+        assert cache.stats()["version_checks"] == 2
+
+    def test_failed_version_check_falls_back_to_loader(self, cache):
+        db = MagicMock()
+        db.query.side_effect = RuntimeError("no table")
+        loader = MagicMock(return_value="x")
+
+        cache.get(db, LLM_CONFIG_NAMESPACE, "tutor", loader)
+        cache.get(db, LLM_CONFIG_NAMESPACE, "tutor", loader)
+
+        assert loader.call_count == 2
+
+    def test_failed_version_check_keeps_callers_transaction(self, db_session, cache):
+        # The check runs in a savepoint: its failure must not abort or roll
+        # back work the caller has pending in the same session.
+        from sqlalchemy import text
+
+        db_session.execute(text("ALTER TABLE config_versions RENAME TO config_versions_gone"))
+        db_session.commit()
+        db_session.add(LLMConfig(component_key="tutor", provider="openai", model_id="gpt-5.2"))
+        db_session.flush()
+
+        assert cache.get(db_session, LLM_CONFIG_NAMESPACE, "tutor", lambda: "x") == "x"
+
+        db_session.commit()
+        assert db_session.query(LLMConfig).filter_by(component_key="tutor").count() == 1
+
+
+class TestBump:
+    def test_bump_increments_version_and_clears_local(self, db_session, cache):
+        loader = MagicMock(return_value="v")
+        cache.get(db_session, FEATURE_FLAGS_NAMESPACE, "f", loader)
+
+        cache.bump(db_session, FEATURE_FLAGS_NAMESPACE)
+        cache.bump(db_session, FEATURE_FLAGS_NAMESPACE)
+        db_session.commit()
+
+        row = db_session.query(ConfigVersion).filter_by(namespace=FEATURE_FLAGS_NAMESPACE).one()
+        assert row.version == 2
+        cache.get(db_session, FEATURE_FLAGS_NAMESPACE, "f", loader)
+        assert loader.call_count == 2
+
+
+class TestServicesUseCache:
+    def test_llm_config_lookup_hits_db_once(self, db_session, cache):
+        db_session.add(LLMConfig(component_key="tutor", provider="openai", model_id="gpt-5.2"))
+        db_session.commit()
+        svc = LLMConfigService(db_session)
+
+        with patch.object(svc.repo, "get_by_key", wraps=svc.repo.get_by_key) as spy:
+            first = svc.get_config("tutor")
+            first["model_id"] = "mutated"
+            second = svc.get_config("tutor")
+
+        assert spy.call_count == 1
+        # Callers get copies — mutating one never corrupts the cache
+        assert second["model_id"] == "gpt-5.2"
+
+    def test_llm_config_update_is_visible_immediately(self, db_session, cache):
+        db_session.add(LLMConfig(component_key="tutor", provider="openai", model_id="gpt-5.2"))
+        db_session.commit()
+        svc = LLMConfigService(db_session)
+        svc.get_config("tutor")
+
+        svc.update_config("tutor", "openai", "gpt-5.4", "high")
+        db_session.commit()
+
+        assert svc.get_config("tutor")["model_id"] == "gpt-5.4"
+
+    def test_feature_flag_toggle_is_visible_immediately(self, db_session, cache):
+        db_session.add(FeatureFlag(flag_name="show_visuals_in_tutor_flow", enabled=True))
+        db_session.commit()
+        svc = FeatureFlagService(db_session)
+        assert svc.is_enabled("show_visuals_in_tutor_flow") is True
+
+        svc.update_flag("show_visuals_in_tutor_flow", False)
+        db_session.commit()
+
+        assert svc.is_enabled("show_visuals_in_tutor_flow") is False
+        assert svc.flag_exists("show_visuals_in_tutor_flow") is True
+        assert svc.flag_exists("nope") is False
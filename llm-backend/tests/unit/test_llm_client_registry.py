@@ -0,0 +1,119 @@
+"""Unit tests for shared/services/llm_client_registry.py — LLMClientRegistry."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.services.llm_client_registry import (
+    LLMClientRegistry,
+    get_llm_client_registry,
+    get_shared_llm_service,
+)
+
+
+@pytest.fixture
+def registry():
+    with patch("shared.services.llm_client_registry.LLMService") as mock_cls:
+        mock_cls.side_effect = lambda **kw: MagicMock(**{"provider": kw["provider"]})
+        yield LLMClientRegistry()
+
+
+def _get(registry, **overrides):
+    params = dict(provider="openai", model_id="gpt-5.2", reasoning_effort="high")
+    params.update(overrides)
+    return registry.get("sk-test", **params)
+
+
+class TestRegistryGet:
+    def test_same_params_reuse_instance(self, registry):
+        first = _get(registry)
+        second = _get(registry)
+
+        assert first is second
+        assert registry.stats() == {
+            "size": 1, "hits": 1, "constructions": 1, "invalidations": 0,
+        }
+
+    @pytest.mark.parametrize("override", [
+        {"model_id": "gpt-5.4"},
+        {"reasoning_effort": "low"},
+        {"provider": "anthropic"},
+        {"anthropic_api_key": "a-key"},
+        {"fast_model_id": "gpt-4o"},
+        {"initial_retry_delay": 10},
+    ])
+    def test_any_param_change_is_a_new_entry(self, registry, override):
+        base = _get(registry)
+        other = _get(registry, **override)
+
+        assert base is not other
+        assert registry.stats()["constructions"] == 2
+
+    def test_api_key_is_fingerprinted_in_key(self, registry):
+        _get(registry)
+        (key,) = registry._services.keys()
+        assert "sk-test" not in repr(key)
+
+
+class TestRegistryInvalidate:
+    def test_invalidate_by_provider_and_model(self, registry):
+        old = _get(registry, model_id="gpt-5.2")
+        _get(registry, model_id="gpt-5.4")
+
+        removed = registry.invalidate("openai", "gpt-5.2")
+
+        assert removed == 1
+        assert _get(registry, model_id="gpt-5.2") is not old
+        assert registry.stats()["invalidations"] == 1
+
+    def test_invalidate_all(self, registry):
+        _get(registry)
+        _get(registry, provider="google", model_id="gemini-3-pro-preview")
+
+        assert registry.invalidate() == 2
+        assert registry.stats()["size"] == 0
+
+
+class TestConfigServiceInvalidation:
+    def test_update_config_invalidates_previous_model(self):
+        from shared.services.llm_config_service import LLMConfigService
+
+        svc = LLMConfigService.__new__(LLMConfigService)
+        svc.repo = MagicMock()
+        svc.repo.get_by_key.return_value = MagicMock(provider="openai", model_id="gpt-5.2")
+        svc.repo.upsert.return_value = MagicMock(
+            component_key="tutor", provider="anthropic", model_id="claude-opus-4-8",
+            reasoning_effort="high", description="", updated_at=None, updated_by=None,
+        )
+
+        with patch(
+            "shared.services.llm_client_registry.get_llm_client_registry"
+        ) as mock_get_registry:
+            svc.update_config("tutor", "anthropic", "claude-opus-4-8", "high")
+
+        mock_get_registry.return_value.invalidate.assert_called_once_with("openai", "gpt-5.2")
+
+
+class TestSharedLLMService:
+    def test_builds_from_config_dict_and_settings(self):
+        settings = MagicMock(openai_api_key="sk", gemini_api_key="", anthropic_api_key="ak")
+        registry = MagicMock()
+        with patch("config.get_settings", return_value=settings), \
+             patch("shared.services.llm_client_registry.get_llm_client_registry", return_value=registry):
+            get_shared_llm_service(
+                {"provider": "anthropic", "model_id": "claude-opus-4-8", "reasoning_effort": "max"},
+                fast_model_id="gpt-4o-mini",
+            )
+
+        registry.get.assert_called_once_with(
+            "sk",
+            provider="anthropic",
+            model_id="claude-opus-4-8",
+            reasoning_effort="max",
+            gemini_api_key=None,
+            anthropic_api_key="ak",
+            fast_model_id="gpt-4o-mini",
+        )
+
+    def test_global_registry_is_singleton(self):
+        assert get_llm_client_registry() is get_llm_client_registry()
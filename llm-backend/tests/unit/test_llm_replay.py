@@ -0,0 +1,196 @@
+"""Unit tests for LLM record/replay (shared/services/llm_replay.py).
+
+Drives a real LLMService whose provider methods are patched, so the
+`replayable` hook on call / call_fast / call_stream is exercised exactly as
+in production.
+"""
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from shared.services.llm_replay import (
+    LLMReplay,
+    LLMReplayMissError,
+    get_llm_replay,
+    install_llm_replay,
+    llm_request_key,
+    reset_llm_replay,
+)
+from shared.services.llm_service import LLMService
+
+
+def _service(provider: str = "openai", model_id: str = "gpt-4o") -> LLMService:
+    return LLMService(api_key="sk-test", provider=provider, model_id=model_id, reasoning_effort="low")
+
+
+@pytest.fixture(autouse=True)
+def _replay_off():
+    install_llm_replay(None)
+    yield
+    reset_llm_replay()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "replay.jsonl")
+
+
+def _record(path, fn):
+    """Run `fn(service)` in record mode against a fake provider; return provider calls."""
+    install_llm_replay(LLMReplay("record", path))
+    service = _service()
+    with patch.object(LLMService, "_call_chat_completions", side_effect=lambda p, *a, **k: f"live:{p}") as live:
+        fn(service)
+    return live.call_count
+
+
+class TestRequestKey:
+    def test_key_covers_prompt_and_params(self):
+        base = {"prompt": "p", "reasoning_effort": "high", "schema_name": "A", "json_schema": {"x": 1}}
+        assert llm_request_key("call", base) == llm_request_key("call", dict(base))
+        assert llm_request_key("call", base) != llm_request_key("call_fast", base)
+        assert llm_request_key("call", base) != llm_request_key("call", {**base, "prompt": "q"})
+        assert llm_request_key("call", base) != llm_request_key("call", {**base, "schema_name": "B"})
+        assert llm_request_key("call", base) != llm_request_key("call", {**base, "json_schema": {"x": 2}})
+
+    def test_system_prompt_file_is_keyed_by_contents(self, tmp_path):
+        a, b = tmp_path / "a" / "sys.txt", tmp_path / "b" / "sys.txt"
+        for f in (a, b):
+            f.parent.mkdir()
+            f.write_text("instructions")
+        key_a = llm_request_key("call", {"prompt": "p", "system_prompt_file": str(a)})
+        assert key_a == llm_request_key("call", {"prompt": "p", "system_prompt_file": str(b)})
+        b.write_text("edited instructions")
+        assert key_a != llm_request_key("call", {"prompt": "p", "system_prompt_file": str(b)})
+
+
+class TestRecordReplay:
+    def test_replay_serves_recorded_response_without_provider(self, path):
+        assert _record(path, lambda s: s.call("hello", schema_name="Greeting")) == 1
+
+        entry = json.loads(open(path).read())
+        assert entry["method"] == "call"
+        assert entry["schema_name"] == "Greeting"
+        assert entry["model_id"] == "gpt-4o"
+        assert entry["response"] == {"output_text": "live:hello", "reasoning": None}
+
+        replay = LLMReplay("replay", path, latency_ms=0)
+        install_llm_replay(replay)
+        with patch.object(LLMService, "_call_chat_completions") as live:
+            # A different model still hits: model is recorded, not keyed.
+            result = _service(model_id="gpt-4.1").call("hello", schema_name="Greeting")
+        live.assert_not_called()
+        assert result["output_text"] == "live:hello"
+        assert replay.stats()["hits"] == 1
+
+    def test_replay_miss_raises(self, path):
+        _record(path, lambda s: s.call("hello"))
+        install_llm_replay(LLMReplay("replay", path))
+        with pytest.raises(LLMReplayMissError, match="schema 'response'"):
+            _service().call("something else")
+
+    def test_auto_records_misses_and_replays_hits(self, path):
+        replay = LLMReplay("auto", path, latency_ms=0)
+        install_llm_replay(replay)
+        service = _service()
+        with patch.object(LLMService, "_call_chat_completions", return_value="{}") as live:
+            service.call("a")
+            service.call("a")
+            service.call_fast("b")
+        assert live.call_count == 2
+        assert replay.stats() == {
+            "mode": "auto", "match": "exact", "entries": 2,
+            "hits": 1, "fallback_hits": 0, "misses": 2, "recorded": 2,
+        }
+
+    def test_schema_match_falls_back_in_recording_order(self, path):
+        def run(s):
+            s.call("first", schema_name="Cards")
+            s.call("second", schema_name="Cards")
+        _record(path, run)
+
+        install_llm_replay(LLMReplay("replay", path, latency_ms=0, match="schema"))
+        service = _service()
+        outputs = [service.call(f"edited {n}", schema_name="Cards")["output_text"] for n in range(3)]
+        assert outputs == ["live:first", "live:second", "live:first"]
+        with pytest.raises(LLMReplayMissError):
+            service.call("x", schema_name="Other")
+
+    def test_live_response_is_recorded_by_value(self, path):
+        install_llm_replay(LLMReplay("auto", path, latency_ms=0))
+        service = _service()
+        with patch.object(LLMService, "_call_chat_completions", return_value="live"):
+            service.call("a")["output_text"] = "edited by caller"
+            assert service.call("a")["output_text"] == "live"
+
+    def test_replayed_response_is_a_deep_copy(self, path):
+        _record(path, lambda s: s.call("hello"))
+        entry = json.loads(open(path).read())
+        entry["response"]["parsed"] = {"cards": ["one"]}
+        with open(path, "w") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        install_llm_replay(LLMReplay("replay", path, latency_ms=0))
+        service = _service()
+        service.call("hello")["parsed"]["cards"].append("edited by caller")
+        assert service.call("hello")["parsed"] == {"cards": ["one"]}
+
+    def test_recorded_latency_is_replayed_and_scaled(self, path):
+        _record(path, lambda s: s.call("hello"))
+        lines = [json.loads(line) for line in open(path)]
+        lines[0]["latency_ms"] = 400
+        with open(path, "w") as f:
+            f.write(json.dumps(lines[0]) + "\n")
+
+        install_llm_replay(LLMReplay("replay", path, latency_scale=0.1))
+        start = time.perf_counter()
+        _service().call("hello")
+        assert 0.04 <= time.perf_counter() - start < 0.3
+
+
+class TestStreaming:
+    def test_stream_chunks_are_recorded_and_replayed(self, path):
+        install_llm_replay(LLMReplay("record", path))
+        with patch.object(LLMService, "_stream_chat_completions", return_value=iter(["Hel", "lo"])):
+            assert list(_service().call_stream("hi")) == ["Hel", "lo"]
+
+        install_llm_replay(LLMReplay("replay", path, latency_ms=0))
+        with patch.object(LLMService, "_stream_chat_completions") as live:
+            assert list(_service().call_stream("hi")) == ["Hel", "lo"]
+        live.assert_not_called()
+
+    def test_stream_falling_back_to_call_records_once(self, path):
+        install_llm_replay(LLMReplay("record", path))
+        service = _service(provider="claude_code", model_id="claude")
+        with patch.object(LLMService, "_call_claude_code", return_value={"output_text": "whole", "reasoning": None}):
+            assert list(service.call_stream("hi")) == ["whole"]
+
+        entries = [json.loads(line) for line in open(path)]
+        assert [(e["method"], e["chunks"]) for e in entries] == [("call_stream", ["whole"])]
+
+
+class TestGlobalInstance:
+    def test_off_by_default_and_built_from_settings(self, path):
+        reset_llm_replay()
+        with patch("config.get_settings") as settings:
+            settings.return_value.llm_replay_mode = "off"
+            assert get_llm_replay() is None
+
+        reset_llm_replay()
+        with patch("config.get_settings") as settings:
+            settings.return_value.llm_replay_mode = "Auto"
+            settings.return_value.llm_replay_path = path
+            settings.return_value.llm_replay_latency_ms = 5
+            settings.return_value.llm_replay_latency_scale = 1.0
+            settings.return_value.llm_replay_match = "exact"
+            replay = get_llm_replay()
+        assert replay.mode == "auto" and replay.latency_ms == 5
+        assert get_llm_replay() is replay
+
+    def test_unknown_mode_is_rejected(self, path):
+        with pytest.raises(ValueError):
+            LLMReplay("off", path)
+        with pytest.raises(ValueError):
+            LLMReplay("replay", path, match="fuzzy")
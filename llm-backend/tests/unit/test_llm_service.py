@@ -530,3 +530,205 @@ class TestCallFastEdgeCases:
         kwargs = service._call_chat_completions.call_args
         assert kwargs.kwargs.get("json_mode") is False
         assert out == {"output_text": "fast", "reasoning": None}
+
+
+# ---------------------------------------------------------------------------
+# Native async entry points — acall / acall_fast / acall_stream
+# ---------------------------------------------------------------------------
+
+class _AsyncIter:
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class TestAsyncEntryPoints:
+    @pytest.mark.asyncio
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    async def test_acall_responses_api_uses_async_client(self, mock_openai_cls, mock_async_cls):
+        from unittest.mock import AsyncMock
+        async_client = Mock()
+        async_client.responses.create = AsyncMock(return_value=_make_responses_result('{"a": 1}'))
+        mock_async_cls.return_value = async_client
+
+        service = LLMService(api_key="fake-key", provider="openai", model_id="gpt-5.2")
+        result = await service.acall("hi", json_schema={"type": "object"}, schema_name="S")
+
+        assert result["output_text"] == '{"a": 1}'
+        kwargs = async_client.responses.create.call_args.kwargs
+        assert kwargs["text"]["format"]["name"] == "S"
+        # Sync client never touched on the async path
+        mock_openai_cls.return_value.responses.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    async def test_async_client_reused_within_one_loop(self, mock_openai_cls, mock_async_cls):
+        from unittest.mock import AsyncMock
+        async_client = Mock()
+        async_client.chat.completions.create = AsyncMock(return_value=_make_chat_response("x"))
+        mock_async_cls.return_value = async_client
+
+        service = LLMService(api_key="fake-key", provider="openai", model_id="gpt-4o")
+        await service.acall("one")
+        await service.acall_fast("two")
+
+        assert mock_async_cls.call_count == 1
+        assert async_client.chat.completions.create.await_count == 2
+
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    def test_separate_loops_get_separate_clients(self, mock_openai_cls, mock_async_cls):
+        import asyncio
+        mock_async_cls.side_effect = lambda **kw: Mock()
+        service = LLMService(api_key="fake-key", provider="openai", model_id="gpt-4o")
+
+        async def _client():
+            return service.async_client
+
+        first = asyncio.run(_client())
+        second = asyncio.run(_client())
+        assert first is not second
+
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    def test_run_blocking_closes_loop_clients(self, mock_openai_cls, mock_async_cls):
+        from unittest.mock import AsyncMock
+        from shared.services.llm_service import run_blocking
+        clients = []
+
+        def _make(**kw):
+            client = Mock()
+            client.close = AsyncMock()
+            clients.append(client)
+            return client
+        mock_async_cls.side_effect = _make
+        first = LLMService(api_key="fake-key", provider="openai", model_id="gpt-4o")
+        second = LLMService(api_key="fake-key", provider="openai", model_id="gpt-4o")
+
+        async def _use_both():
+            first.async_client
+            second.async_client
+            return "done"
+
+        assert run_blocking(_use_both()) == "done"
+        assert len(clients) == 2
+        for client in clients:
+            client.close.assert_awaited_once()
+        assert len(first._async_bundles) == 0
+        assert len(second._async_bundles) == 0
+
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    def test_run_blocking_closes_clients_when_coroutine_raises(
+        self, mock_openai_cls, mock_async_cls,
+    ):
+        from unittest.mock import AsyncMock
+        from shared.services.llm_service import run_blocking
+        client = Mock()
+        client.close = AsyncMock()
+        mock_async_cls.return_value = client
+        service = LLMService(api_key="fake-key", provider="openai", model_id="gpt-4o")
+
+        async def _fail():
+            service.async_client
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_blocking(_fail())
+        client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    async def test_acall_fast_uses_fast_model(self, mock_openai_cls, mock_async_cls):
+        from unittest.mock import AsyncMock
+        async_client = Mock()
+        async_client.chat.completions.create = AsyncMock(return_value=_make_chat_response("ok"))
+        mock_async_cls.return_value = async_client
+
+        service = LLMService(
+            api_key="fake-key", provider="openai", model_id="gpt-5.2", fast_model_id="gpt-4o-mini",
+        )
+        out = await service.acall_fast("hi")
+
+        assert out == {"output_text": "ok", "reasoning": None}
+        assert async_client.chat.completions.create.call_args.kwargs["model"] == "gpt-4o-mini"
+
+    @pytest.mark.asyncio
+    @patch("shared.services.llm_service.asyncio.sleep")
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    async def test_acall_retries_on_rate_limit(self, mock_openai_cls, mock_async_cls, mock_sleep):
+        from unittest.mock import AsyncMock
+        from openai import RateLimitError
+        rate_err = RateLimitError("slow down", response=Mock(status_code=429, headers={}), body=None)
+        async_client = Mock()
+        async_client.chat.completions.create = AsyncMock(
+            side_effect=[rate_err, _make_chat_response("done")]
+        )
+        mock_async_cls.return_value = async_client
+
+        service = LLMService(api_key="fake-key", provider="openai", model_id="gpt-4o")
+        result = await service.acall("hi")
+
+        assert result["output_text"] == "done"
+        mock_sleep.assert_awaited_once_with(1.0)
+
+    @pytest.mark.asyncio
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    async def test_acall_routes_to_anthropic_async(self, mock_openai_cls, mock_async_cls):
+        from unittest.mock import AsyncMock
+        service = LLMService(api_key="fake-key", provider="anthropic", model_id="claude-opus-4-6")
+        adapter = Mock()
+        adapter.call_async = AsyncMock(return_value={"output_text": "claude"})
+        service.anthropic_adapter = adapter
+
+        out = await service.acall("hi", reasoning_effort="high")
+        assert out == {"output_text": "claude"}
+        kwargs = adapter.call_async.call_args.kwargs
+        assert kwargs["reasoning_effort"] == "high"
+        assert kwargs["client"] is adapter.build_async_client.return_value
+
+    @pytest.mark.asyncio
+    @patch("shared.services.llm_service.AsyncOpenAI")
+    @patch("shared.services.llm_service.OpenAI")
+    async def test_acall_stream_responses_api(self, mock_openai_cls, mock_async_cls):
+        from unittest.mock import AsyncMock
+        events = [
+            Mock(type="response.created"),
+            Mock(type="response.output_text.delta", delta="Hel"),
+            Mock(type="response.output_text.delta", delta="lo"),
+        ]
+        async_client = Mock()
+        async_client.responses.create = AsyncMock(return_value=_AsyncIter(events))
+        mock_async_cls.return_value = async_client
+
+        service = LLMService(api_key="fake-key", provider="openai", model_id="gpt-5.2")
+        chunks = [c async for c in service.acall_stream("hi")]
+
+        assert chunks == ["Hel", "lo"]
+        assert async_client.responses.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    @patch("shared.services.llm_service.OpenAI")
+    async def test_acall_stream_claude_code_falls_back_to_acall(self, mock_openai_cls):
+        from unittest.mock import AsyncMock
+        with patch("shared.services.llm_service.ClaudeCodeAdapter", create=True):
+            service = LLMService(
+                api_key="fake-key", provider="claude_code", model_id="claude-opus-4-6",
+            )
+        service.acall = AsyncMock(return_value={"output_text": "full text"})
+
+        chunks = [c async for c in service.acall_stream("hi")]
+        assert chunks == ["full text"]
@@ -0,0 +1,378 @@
+"""Unit tests for concurrent chapter page OCR.
+
+Covers OCRWorkerPool (bounded parallelism, one task per page), the
+per-provider limiter in `extract_page_text`, and ChapterPageService's
+upload → background OCR and bulk_ocr paths against a file-backed SQLite DB
+(each pool task opens its own session, as in production).
+"""
+import io
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from book_ingestion_v2.constants import ChapterStatus, OCRStatus
+from book_ingestion_v2.models.database import BookChapter, ChapterPage
+from book_ingestion_v2.services import ocr_worker_pool as owp
+from book_ingestion_v2.services.chapter_page_service import ChapterPageService
+from book_ingestion_v2.services.ocr_worker_pool import (
+    OCRWorkerPool,
+    extract_page_text,
+    reset_ocr_worker_pool,
+)
+from shared.models.entities import Base
+from shared.utils.blob_store import MemoryBlobStore
+from shared.utils.rate_limiter import get_provider_limiter, reset_provider_limiters
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool_and_limiters():
+    reset_ocr_worker_pool()
+    reset_provider_limiters()
+    yield
+    reset_ocr_worker_pool()
+    reset_provider_limiters()
+
+
+class _InFlight:
+    """Tracks the peak number of overlapping calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.current -= 1
+
+
+class _FakeOCR:
+    provider = "openai"
+    model = "fake-vision"
+
+    def __init__(self, delay: float = 0.0, fail_on: bytes = b""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.in_flight = _InFlight()
+        self.calls = []
+
+    def extract_text_from_image(self, image_path=None, image_bytes=None, prompt=None):
+        assert image_path is None and image_bytes
+        self.calls.append(image_bytes)
+        with self.in_flight:
+            time.sleep(self.delay)
+        if self.fail_on and self.fail_on == image_bytes:
+            raise RuntimeError("vision API down")
+        return f"text for {len(image_bytes)} bytes"
+
+
+def _unpaced(concurrency: int = 8):
+    reset_provider_limiters()
+    get_provider_limiter("ocr:openai", 0, concurrency)
+
+
+def _png(shade: int) -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", (4, 4), (shade, shade, shade)).save(out, format="PNG")
+    return out.getvalue()
+
+
+class TestOCRWorkerPool:
+    def test_tasks_run_in_parallel_up_to_max_workers(self):
+        pool = OCRWorkerPool(max_workers=3, session_factory=MagicMock)
+        in_flight = _InFlight()
+
+        def task(db, n):
+            with in_flight:
+                time.sleep(0.03)
+            return n % 2 == 0
+
+        futures = [pool.submit(f"p{n}", task, n) for n in range(9)]
+        results = [f.result() for f in futures]
+
+        assert results == [n % 2 == 0 for n in range(9)]
+        assert in_flight.peak == 3
+        assert pool.stats() == {
+            "max_workers": 3, "in_flight": 0, "submitted": 9, "succeeded": 5, "failed": 4,
+        }
+        pool.shutdown()
+
+    def test_page_already_in_flight_is_not_queued_twice(self):
+        pool = OCRWorkerPool(max_workers=2, session_factory=MagicMock)
+        release = threading.Event()
+        calls = []
+
+        def task(db, label):
+            calls.append(label)
+            release.wait(2)
+            return True
+
+        first = pool.submit("page-1", task, "upload")
+        second = pool.submit("page-1", task, "bulk")
+        assert second is first
+        assert pool.is_in_flight("page-1")
+
+        release.set()
+        assert first.result() is True
+        assert calls == ["upload"]
+        assert not pool.is_in_flight("page-1")
+        pool.shutdown()
+
+    def test_task_exception_counts_as_failure_and_closes_session(self):
+        session = MagicMock()
+        pool = OCRWorkerPool(max_workers=1, session_factory=lambda: session)
+
+        def task(db):
+            raise RuntimeError("boom")
+
+        assert pool.submit("p", task).result() is False
+        session.close.assert_called_once()
+        assert pool.stats()["failed"] == 1
+        pool.shutdown()
+
+
+class TestExtractPageText:
+    def test_passes_bytes_and_respects_provider_slots(self):
+        _unpaced(concurrency=2)
+        ocr = _FakeOCR(delay=0.03)
+        threads = [
+            threading.Thread(target=extract_page_text, args=(ocr, b"img", "prompt"))
+            for _ in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(ocr.calls) == 6
+        assert ocr.in_flight.peak == 2
+
+    def test_limiter_rate_comes_from_provider_settings(self):
+        with patch("config.get_settings") as settings:
+            settings.return_value.ocr_openai_requests_per_second = 2.0
+            settings.return_value.ocr_claude_code_requests_per_second = 0.5
+            settings.return_value.ocr_concurrency = 3
+            assert owp._provider_limiter("openai").bucket.rate == 2.0
+            assert owp._provider_limiter("claude_code").bucket.rate == 0.5
+            assert owp._provider_limiter("openai").bucket.burst == 3
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'ocr.db'}",
+        connect_args={"check_same_thread": False, "timeout": 10},
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def store():
+    blob_store = MemoryBlobStore()
+    with patch(
+        "book_ingestion_v2.services.chapter_page_service.get_s3_client",
+        return_value=blob_store,
+    ):
+        yield blob_store
+
+
+def _add_chapter(factory, total_pages: int) -> str:
+    chapter_id = str(uuid.uuid4())
+    with factory() as db:
+        db.add(BookChapter(
+            id=chapter_id, book_id="book-1", chapter_number=3, chapter_title="Fractions",
+            start_page=1, end_page=total_pages, total_pages=total_pages,
+        ))
+        db.commit()
+    return chapter_id
+
+
+def _use_pool(factory, max_workers: int = 4) -> OCRWorkerPool:
+    pool = OCRWorkerPool(max_workers=max_workers, session_factory=factory)
+    owp._ocr_worker_pool = pool
+    return pool
+
+
+def _wait_for(pool: OCRWorkerPool, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while pool.stats()["in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestUploadPage:
+    def test_upload_returns_pending_and_ocr_completes_in_background(self, file_db, store):
+        _unpaced()
+        pool = _use_pool(file_db)
+        ocr = _FakeOCR(delay=0.02)
+        chapter_id = _add_chapter(file_db, total_pages=3)
+
+        with file_db() as db:
+            service = ChapterPageService(db, ocr_service=ocr)
+            responses = [
+                service.upload_page("book-1", chapter_id, n, _png(n), f"p{n}.jpg")
+                for n in (1, 2, 3)
+            ]
+        assert [r.ocr_status for r in responses] == ["pending"] * 3
+        assert "books/book-1/chapters/03/pages/raw/1.jpg" in store.objects
+
+        _wait_for(pool)
+
+        with file_db() as db:
+            pages = db.query(ChapterPage).order_by(ChapterPage.page_number).all()
+            assert [p.ocr_status for p in pages] == [OCRStatus.COMPLETED.value] * 3
+            assert [p.ocr_model for p in pages] == ["fake-vision"] * 3
+            assert db.get(BookChapter, chapter_id).status == ChapterStatus.UPLOAD_COMPLETE.value
+        # OCR got the converted PNG from memory; nothing was downloaded back.
+        assert sorted(ocr.calls) == sorted(
+            store.objects[f"books/book-1/chapters/03/pages/{n}.png"] for n in (1, 2, 3)
+        )
+        assert store.objects["books/book-1/chapters/03/pages/2.txt"].startswith(b"text for")
+
+    def test_failed_background_ocr_marks_page_failed(self, file_db, store):
+        _unpaced()
+        pool = _use_pool(file_db)
+        chapter_id = _add_chapter(file_db, total_pages=1)
+
+        with file_db() as db:
+            service = ChapterPageService(db, ocr_service=MagicMock(
+                provider="openai", model="m",
+                extract_text_from_image=MagicMock(side_effect=RuntimeError("vision API down")),
+            ))
+            service.upload_page("book-1", chapter_id, 1, _png(9), "p1.png")
+        _wait_for(pool)
+
+        with file_db() as db:
+            page = db.query(ChapterPage).one()
+            assert page.ocr_status == OCRStatus.FAILED.value
+            assert "vision API down" in page.ocr_error
+            assert page.text_s3_key is None
+            assert db.get(BookChapter, chapter_id).status == ChapterStatus.UPLOAD_IN_PROGRESS.value
+
+
+class TestBulkOCR:
+    def _seed_pages(self, factory, store, chapter_id, count, status="pending"):
+        with factory() as db:
+            for n in range(1, count + 1):
+                key = f"books/book-1/chapters/03/pages/{n}.png"
+                store.upload_bytes(_png(n), key)
+                db.add(ChapterPage(
+                    id=f"page-{n}", book_id="book-1", chapter_id=chapter_id, page_number=n,
+                    image_s3_key=key, ocr_status=status,
+                ))
+            db.commit()
+
+    def test_bulk_ocr_runs_pages_concurrently_and_reports_progress(self, file_db, store):
+        _unpaced()
+        _use_pool(file_db, max_workers=4)
+        ocr = _FakeOCR(delay=0.03, fail_on=_png(5))
+        chapter_id = _add_chapter(file_db, total_pages=8)
+        self._seed_pages(file_db, store, chapter_id, 8, status="failed")
+
+        job_service = MagicMock()
+        with file_db() as db, \
+                patch("book_ingestion_v2.services.chapter_job_service.ChapterJobService",
+                      return_value=job_service), \
+                patch("book_ingestion_v2.services.chapter_page_service.LLMConfigService") as cfg, \
+                patch("book_ingestion_v2.services.chapter_page_service.get_ocr_service",
+                      return_value=ocr):
+            cfg.return_value.get_config.return_value = {"provider": "openai", "model_id": "fake"}
+            service = ChapterPageService(db, ocr_service=ocr)
+            service.bulk_ocr(db, "job-1", chapter_id, "book-1")
+
+        assert ocr.in_flight.peak == 4
+        last = job_service.update_progress.call_args_list[-1]
+        assert last.kwargs == {"current_item": "Done", "completed": 7, "failed": 1}
+        job_service.release_lock.assert_called_once_with("job-1", status="completed_with_errors")
+
+        with file_db() as db:
+            statuses = {p.page_number: p.ocr_status for p in db.query(ChapterPage)}
+            assert statuses[5] == OCRStatus.FAILED.value
+            assert sum(s == OCRStatus.COMPLETED.value for s in statuses.values()) == 7
+            assert db.get(BookChapter, chapter_id).status == ChapterStatus.UPLOAD_IN_PROGRESS.value
+
+    def test_interrupted_processing_pages_are_picked_up(self, file_db, store):
+        _unpaced()
+        _use_pool(file_db)
+        ocr = _FakeOCR()
+        chapter_id = _add_chapter(file_db, total_pages=2)
+        self._seed_pages(file_db, store, chapter_id, 2, status="processing")
+
+        with file_db() as db, \
+                patch("book_ingestion_v2.services.chapter_job_service.ChapterJobService"), \
+                patch("book_ingestion_v2.services.chapter_page_service.LLMConfigService") as cfg, \
+                patch("book_ingestion_v2.services.chapter_page_service.get_ocr_service",
+                      return_value=ocr):
+            cfg.return_value.get_config.return_value = {"provider": "openai", "model_id": "fake"}
+            ChapterPageService(db, ocr_service=ocr).bulk_ocr(db, "job-1", chapter_id, "book-1")
+
+        with file_db() as db:
+            assert {p.ocr_status for p in db.query(ChapterPage)} == {OCRStatus.COMPLETED.value}
+            assert db.get(BookChapter, chapter_id).status == ChapterStatus.UPLOAD_COMPLETE.value
+
+
+class TestRetryOCR:
+    def _seed_failed_page(self, factory, store, chapter_id):
+        key = "books/book-1/chapters/03/pages/1.png"
+        store.upload_bytes(_png(1), key)
+        with factory() as db:
+            db.add(ChapterPage(
+                id="page-1", book_id="book-1", chapter_id=chapter_id, page_number=1,
+                image_s3_key=key, ocr_status=OCRStatus.FAILED.value, ocr_error="earlier",
+            ))
+            db.commit()
+
+    def test_retry_runs_on_pool_and_completes_chapter(self, file_db, store):
+        _unpaced()
+        pool = _use_pool(file_db)
+        ocr = _FakeOCR()
+        chapter_id = _add_chapter(file_db, total_pages=1)
+        self._seed_failed_page(file_db, store, chapter_id)
+
+        with file_db() as db:
+            response = ChapterPageService(db, ocr_service=ocr).retry_ocr(
+                "book-1", chapter_id, 1,
+            )
+            assert response.ocr_status == OCRStatus.COMPLETED.value
+            assert db.get(BookChapter, chapter_id).status == ChapterStatus.UPLOAD_COMPLETE.value
+        assert pool.stats()["submitted"] == 1
+
+    def test_retry_waits_on_page_already_in_flight(self, file_db, store):
+        _unpaced()
+        pool = _use_pool(file_db)
+        ocr = _FakeOCR()
+        chapter_id = _add_chapter(file_db, total_pages=1)
+        self._seed_failed_page(file_db, store, chapter_id)
+
+        release = threading.Event()
+        service_for_bulk = ChapterPageService(MagicMock(), ocr_service=ocr)
+
+        def slow_task(db, *args, **kwargs):
+            release.wait(2)
+            return service_for_bulk._ocr_page_task(db, *args, **kwargs)
+
+        pool.submit(
+            "page-1", slow_task, "page-1", "books/book-1/chapters/03/pages/1.txt",
+        )
+        threading.Timer(0.05, release.set).start()
+
+        with file_db() as db:
+            response = ChapterPageService(db, ocr_service=ocr).retry_ocr(
+                "book-1", chapter_id, 1,
+            )
+        assert response.ocr_status == OCRStatus.COMPLETED.value
+        assert len(ocr.calls) == 1
+        assert pool.stats()["submitted"] == 1
@@ -88,7 +88,7 @@ def build_orchestrator():
     # last_prompt is a read-only property on BaseAgent — mock the internal attribute instead
     orch.master_tutor._last_prompt = "mock prompt"
     # process_turn now runs translation+safety in parallel via asyncio.gather.
-    # The translation step calls llm.call_fast which would otherwise return a Mock,
+    # The translation step calls llm.acall_fast which would otherwise return a Mock,
     # corrupting the student_message string. Pass-through the original text.
     orch._translate_to_english = AsyncMock(side_effect=lambda text: text)
     return orch
@@ -216,7 +216,7 @@ class TestProcessTurnCompleted:
         orch = build_orchestrator()
         orch.safety_agent.execute.return_value = make_safe_result()
         # Mock the post-completion LLM call
-        orch.llm.call = Mock(return_value={"output_text": "Great session!"})
+        orch.llm.acall = AsyncMock(return_value={"output_text": "Great session!"})
 
         session = make_test_session()
         # Advance past all steps to mark as complete
@@ -234,7 +234,7 @@ class TestProcessTurnCompleted:
     async def test_completed_session_still_records_student_message(self):
         orch = build_orchestrator()
         orch.safety_agent.execute.return_value = make_safe_result()
-        orch.llm.call = Mock(return_value={"output_text": "Bye!"})
+        orch.llm.acall = AsyncMock(return_value={"output_text": "Bye!"})
 
         session = make_test_session()
         session.current_step = 4
@@ -644,7 +644,7 @@ class TestGenerateWelcomeMessage:
     @pytest.mark.asyncio
     async def test_with_topic_returns_parsed_json(self):
         orch = build_orchestrator()
-        orch.llm.call = Mock(return_value={
+        orch.llm.acall = AsyncMock(return_value={
             "output_text": '{"response": "Welcome to Fractions!", "audio_text": "Welcome to Fractions"}'
         })
 
@@ -652,13 +652,13 @@ class TestGenerateWelcomeMessage:
         msg, audio = await orch.generate_welcome_message(session)
         assert msg == "Welcome to Fractions!"
         assert audio == "Welcome to Fractions"
-        orch.llm.call.assert_called_once()
+        orch.llm.acall.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_with_topic_plain_text_treated_as_message(self):
         orch = build_orchestrator()
         # LLM returned non-JSON plain text — the parser uses raw text as message
-        orch.llm.call = Mock(return_value={"output_text": "Welcome to Fractions!"})
+        orch.llm.acall = AsyncMock(return_value={"output_text": "Welcome to Fractions!"})
 
         session = make_test_session()
         msg, audio = await orch.generate_welcome_message(session)
@@ -670,7 +670,7 @@ class TestGenerateWelcomeMessage:
         orch = build_orchestrator()
         # When output_text key is missing entirely, .get() returns the default ""
         # which is falsy, so the fallback message is returned.
-        orch.llm.call = Mock(return_value={})
+        orch.llm.acall = AsyncMock(return_value={})
 
         session = make_test_session()
         msg, audio = await orch.generate_welcome_message(session)
@@ -681,9 +681,104 @@ class TestGenerateWelcomeMessage:
     async def test_with_topic_empty_output_returns_fallback(self):
         orch = build_orchestrator()
         # Empty string is falsy, so the fallback is used.
-        orch.llm.call = Mock(return_value={"output_text": ""})
+        orch.llm.acall = AsyncMock(return_value={"output_text": ""})
 
         session = make_test_session()
         msg, audio = await orch.generate_welcome_message(session)
         assert msg == "Welcome! Let's start learning."
         assert audio is None
+
+
+# ---------------------------------------------------------------------------
+# process_turn_stream — speculative Pixi generation
+# ---------------------------------------------------------------------------
+
+VISUAL = {"visual_prompt": "3 apples", "output_type": "image", "title": "3", "narration": None}
+
+
+def _stream(*events, after_visual=None):
+    """Fake execute_stream: yields events, running `after_visual` once the
+    visual_explanation field has been handed to the orchestrator."""
+    async def _gen(context):
+        for event in events:
+            yield event
+            if after_visual and event[0] == "field" and event[1][0] == "visual_explanation":
+                await after_visual()
+    return _gen
+
+
+class TestProcessTurnStreamVisual:
+    @pytest.mark.asyncio
+    async def test_pixi_starts_before_stream_finishes(self):
+        orch = build_orchestrator()
+        orch.safety_agent.execute.return_value = make_safe_result()
+        orch.pixi_generator.generate = AsyncMock(return_value="app.stage.addChild()")
+        output = make_tutor_output(visual_explanation=VISUAL)
+        started_mid_stream = []
+
+        async def _check():
+            await asyncio.sleep(0)  # let the background task run
+            started_mid_stream.append(orch.pixi_generator.generate.await_count)
+
+        orch.master_tutor.execute_stream = _stream(
+            ("token", "Look"),
+            ("field", ("visual_explanation", VISUAL)),
+            ("field", ("mastery_updates", [])),
+            ("result", output),
+            after_visual=_check,
+        )
+
+        session = make_test_session()
+        events = [ev async for ev in orch.process_turn_stream(session, "show me")]
+
+        assert started_mid_stream == [1]
+        assert orch.pixi_generator.generate.await_count == 1
+        kinds = [kind for kind, _ in events]
+        assert kinds[-2:] == ["result", "visual"]
+        assert events[-1][1]["pixi_code"] == "app.stage.addChild()"
+        assert "visual_prompt" not in events[-1][1]
+        pixi_log = orch.agent_logs.get_logs(session.session_id, agent_name="pixi_generator")
+        assert pixi_log[-1].metadata["speculative"] is True
+        assert pixi_log[-1].metadata["started_ms"] <= pixi_log[-1].metadata["tutor_done_ms"]
+
+    @pytest.mark.asyncio
+    async def test_pixi_cancelled_when_final_output_drops_visual(self):
+        orch = build_orchestrator()
+        orch.safety_agent.execute.return_value = make_safe_result()
+        cancelled = asyncio.Event()
+
+        async def _slow_generate(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        orch.pixi_generator.generate = _slow_generate
+        orch.master_tutor.execute_stream = _stream(
+            ("field", ("visual_explanation", VISUAL)),
+            ("result", make_tutor_output(visual_explanation=None)),
+            after_visual=lambda: asyncio.sleep(0),
+        )
+
+        events = [ev async for ev in orch.process_turn_stream(make_test_session(), "hi")]
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert [kind for kind, _ in events] == ["result"]
+
+    @pytest.mark.asyncio
+    async def test_no_pixi_when_visuals_disabled(self):
+        orch = build_orchestrator()
+        orch.visuals_enabled = False
+        orch.safety_agent.execute.return_value = make_safe_result()
+        orch.pixi_generator.generate = AsyncMock()
+        orch.master_tutor.execute_stream = _stream(
+            ("field", ("visual_explanation", VISUAL)),
+            ("result", make_tutor_output(visual_explanation=VISUAL)),
+        )
+
+        events = [ev async for ev in orch.process_turn_stream(make_test_session(), "hi")]
+
+        orch.pixi_generator.generate.assert_not_called()
+        assert [kind for kind, _ in events] == ["result"]
@@ -385,6 +385,43 @@ class TestSimplifyCardService:
                 service.simplify_card("sess_test", card_idx=0, reason='example')
             assert exc_info.value.to_http_exception().status_code == 400
 
+    @pytest.mark.asyncio
+    async def test_simplify_card_async_awaits_llm_on_running_loop(self):
+        """The async twin builds the same remedial card without asyncio.run."""
+        session = _make_session_with_card_phase()
+        simplified_card = {"card_type": "simplification", "title": "Simpler", "content": "Easy."}
+
+        mock_expl = MagicMock()
+        mock_expl.cards_json = SAMPLE_CARDS
+
+        from tutor.services.session_service import SessionService
+
+        with patch("tutor.services.session_service.ExplanationRepository") as mock_repo_cls, \
+                patch("asyncio.run", side_effect=AssertionError("asyncio.run on the async path")):
+            mock_repo_cls.return_value.get_variant.return_value = mock_expl
+
+            service = SessionService.__new__(SessionService)
+            service.db = MagicMock()
+            service.session_repo = MagicMock()
+            service.event_repo = MagicMock()
+            service.orchestrator = MagicMock()
+            service.orchestrator.generate_simplified_card = AsyncMock(return_value=simplified_card)
+
+            session_row = MagicMock()
+            session_row.state_json = session.model_dump_json()
+            session_row.state_version = 1
+            service.session_repo.get_by_id.return_value = session_row
+
+            persisted_states = []
+            service._persist_session_state = lambda sid, state, ver: persisted_states.append(state)
+
+            result = await service.simplify_card_async("sess_test", card_idx=2, reason='example')
+
+        assert result["card_id"] == "remedial_A_2_1"
+        assert result["simplification"] == simplified_card
+        assert service.orchestrator.generate_simplified_card.call_args[1]["card_title"] == "Number Line"
+        assert persisted_states[0].card_phase.remedial_cards[2][0].depth == 1
+
 
 # ---------------------------------------------------------------------------
 # 3. Precomputed summary with confusion events
@@ -704,7 +704,7 @@ class TestSessionServiceCardPhase:
             ),
         )
 
-        with patch("asyncio.run", return_value=("Welcome to fractions!", "Welcome audio")):
+        with patch("tutor.services.session_service.run_blocking", return_value=("Welcome to fractions!", "Welcome audio")):
             response = svc.create_new_session(request)
 
         assert "session_phase" not in response.first_turn
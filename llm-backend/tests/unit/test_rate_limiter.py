@@ -0,0 +1,58 @@
+"""Unit tests for shared/utils/rate_limiter.py."""
+
+from shared.utils.rate_limiter import TokenBucket, get_provider_limiter, reset_provider_limiters
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    def test_burst_then_paced_at_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, burst=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3:] == [0.5, 0.5]
+        assert clock.now == 1.0
+
+    def test_tokens_refill_while_idle_up_to_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, burst=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += 10  # idle long enough to refill past the burst
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    def test_non_positive_rate_disables_pacing(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0, clock=clock, sleep=clock.sleep)
+
+        assert sum(bucket.acquire() for _ in range(100)) == 0.0
+        assert clock.sleeps == []
+
+
+class TestProviderLimiterRegistry:
+    def test_one_limiter_per_name_with_first_use_settings(self):
+        reset_provider_limiters()
+        tts = get_provider_limiter("tts:elevenlabs", 2.0, 3)
+
+        assert get_provider_limiter("tts:elevenlabs", 9.0, 9) is tts
+        assert (tts.bucket.rate, tts.bucket.burst) == (2.0, 3)
+        assert get_provider_limiter("ocr:openai", 2.0, 3) is not tts
+
+        reset_provider_limiters()
+        assert get_provider_limiter("tts:elevenlabs", 9.0, 9).bucket.rate == 9.0
+        reset_provider_limiters()
@@ -0,0 +1,258 @@
+"""Unit tests for the materialized report card (student_topic_progress).
+
+The materialized views must always equal ReportCardService's from-scratch
+computation: on the first (lazy) build, after incremental refreshes from
+session saves and practice grading, and after a session is deleted.
+"""
+
+import json
+import uuid
+import warnings
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import SAWarning
+
+from shared.models.entities import (
+    PracticeAttempt,
+    Session as SessionModel,
+    StudentProgressBuild,
+    StudentTopicProgress,
+    TeachingGuideline,
+    User,
+)
+from shared.repositories.session_repository import SessionRepository
+from tutor.api.sessions import _save_session_to_db
+from tutor.models.messages import StudentContext
+from tutor.models.session_state import SessionState, create_session
+from tutor.models.study_plan import StudyPlan, StudyPlanStep, Topic, TopicGuidelines
+from tutor.services.practice_grading_service import PracticeGradingService
+from tutor.services.report_card_service import PROGRESS_VERSION, ReportCardService
+from tutor.services.session_state_store import (
+    append_new_messages,
+    dump_state_json,
+    load_session_state,
+    session_summary_columns,
+)
+
+USER_ID = "user-1"
+BASE_TIME = datetime(2026, 1, 1, 9, 0, 0)
+
+
+def _setup(db):
+    db.add(User(id=USER_ID, cognito_sub="sub-1", auth_provider="email"))
+    for gid, chapter, topic in [
+        ("g1", "Fractions", "Comparing Fractions"),
+        ("g2", "Fractions", "Adding Fractions"),
+        ("g3", "Shapes", "Triangles"),
+    ]:
+        db.add(TeachingGuideline(
+            id=gid, country="India", board="CBSE", grade=3, subject="Mathematics",
+            chapter=chapter, topic=topic, guideline="test",
+        ))
+    db.commit()
+
+
+def _make_state(session_id: str, guideline_id: str, *, mode="teach_me", covered=()) -> SessionState:
+    topic = Topic(
+        topic_id=guideline_id,
+        topic_name=f"Chapter - {guideline_id}",
+        subject="Mathematics",
+        grade_level=3,
+        guidelines=TopicGuidelines(learning_objectives=["learn"]),
+        study_plan=StudyPlan(steps=[
+            StudyPlanStep(step_id=1, type="explain", concept="a"),
+            StudyPlanStep(step_id=2, type="explain", concept="b"),
+        ]),
+    )
+    session = create_session(topic=topic, student_context=StudentContext(grade=3), mode=mode)
+    session.session_id = session_id
+    session.concepts_covered_set = set(covered)
+    session.mastery_estimates = {"a": 0.0, "b": 0.0}
+    return session
+
+
+def _insert(db, session: SessionState, minutes: int) -> SessionModel:
+    row = SessionModel(
+        id=session.session_id,
+        student_json="{}",
+        goal_json="{}",
+        state_json=dump_state_json(session),
+        user_id=USER_ID,
+        subject="Mathematics",
+        mode=session.mode,
+        state_version=1,
+        created_at=BASE_TIME + timedelta(minutes=minutes),
+        **session_summary_columns(session),
+    )
+    db.add(row)
+    append_new_messages(db, session.session_id, session, stored=0)
+    db.commit()
+    return row
+
+
+def _insert_legacy(db, session_id: str, topic_name: str, minutes: int) -> None:
+    """A pre-summary row whose topic has no guideline id."""
+    state = {"mode": "teach_me", "topic": {"topic_name": topic_name},
+             "mastery_estimates": {"x": 0.5}, "concepts_covered_set": ["x"]}
+    db.add(SessionModel(
+        id=session_id, student_json="{}", goal_json="{}", state_json=json.dumps(state),
+        user_id=USER_ID, subject="Science", created_at=BASE_TIME + timedelta(minutes=minutes),
+    ))
+    db.commit()
+
+
+def _attempt(db, guideline_id: str, score: float, minutes: int, status="graded") -> PracticeAttempt:
+    attempt = PracticeAttempt(
+        id=f"att-{uuid.uuid4().hex[:8]}",
+        user_id=USER_ID,
+        guideline_id=guideline_id,
+        question_ids=[],
+        questions_snapshot_json=[],
+        answers_json={},
+        total_score=score if status == "graded" else None,
+        total_possible=10,
+        status=status,
+        graded_at=BASE_TIME + timedelta(minutes=minutes) if status == "graded" else None,
+    )
+    db.add(attempt)
+    db.commit()
+    return attempt
+
+
+def _seed_history(db):
+    _setup(db)
+    _insert(db, _make_state("s1", "g1", covered={"a"}), 1)
+    _insert(db, _make_state("s2", "g1", covered={"b"}), 2)
+    _insert(db, _make_state("s3", "g2", mode="clarify_doubts"), 3)
+    _insert_legacy(db, "s4", "Plants - Roots", 4)
+    _attempt(db, "g1", 6.0, 5)
+    _attempt(db, "g1", 8.0, 6)
+    _attempt(db, "g3", 4.5, 7)
+
+
+def _assert_in_sync(db):
+    service = ReportCardService(db)
+    assert service.get_report_card(USER_ID) == service.compute_report_card(USER_ID)
+    assert service.get_topic_progress(USER_ID) == service.compute_topic_progress(USER_ID)
+
+
+class TestLazyBuild:
+    def test_first_read_builds_rows_matching_from_scratch(self, db_session):
+        _seed_history(db_session)
+
+        _assert_in_sync(db_session)
+
+        build = db_session.get(StudentProgressBuild, USER_ID)
+        assert build.version == PROGRESS_VERSION
+        g1 = db_session.get(StudentTopicProgress, (USER_ID, "g1"))
+        assert g1.session_count == 2
+        assert g1.concepts_covered == ["a", "b"]
+        assert (g1.latest_practice_score, g1.practice_attempt_count) == (8.0, 2)
+        report = ReportCardService(db_session).get_report_card(USER_ID)
+        assert report["total_sessions"] == 4
+        assert {s["subject"] for s in report["subjects"]} == {"Mathematics", "Science"}
+
+    def test_reads_after_build_do_not_rebuild(self, db_session):
+        _seed_history(db_session)
+        service = ReportCardService(db_session)
+        service.get_report_card(USER_ID)
+
+        with patch.object(service, "rebuild") as rebuild:
+            service.get_report_card(USER_ID)
+            service.get_topic_progress(USER_ID)
+        rebuild.assert_not_called()
+
+    def test_unknown_user_writes_no_build_marker(self, db_session):
+        assert ReportCardService(db_session).get_report_card("nobody")["subjects"] == []
+        assert db_session.get(StudentProgressBuild, "nobody") is None
+
+
+class TestIncrementalRefresh:
+    def test_session_save_refreshes_topic_row(self, db_session):
+        _seed_history(db_session)
+        ReportCardService(db_session).get_topic_progress(USER_ID)
+        session = _make_state("s5", "g2")
+        row = _insert(db_session, session, 8)
+        session = load_session_state(db_session, row)
+
+        session.concepts_covered_set.add("a")
+        _save_session_to_db(db_session, "s5", session, 1)
+
+        progress = ReportCardService(db_session).get_topic_progress(USER_ID)["user_progress"]
+        assert progress["g2"] == {"coverage": 50.0, "session_count": 1, "status": "studied"}
+        _assert_in_sync(db_session)
+
+    def test_save_without_progress_change_skips_refresh(self, db_session):
+        _seed_history(db_session)
+        ReportCardService(db_session).get_report_card(USER_ID)
+        row = db_session.get(SessionModel, "s1")
+        session = load_session_state(db_session, row)
+
+        session.card_phase = None
+        with patch.object(ReportCardService, "refresh_topic") as refresh:
+            _save_session_to_db(db_session, "s1", session, 1)
+        refresh.assert_not_called()
+
+    def test_grading_refreshes_practice_columns(self, db_session):
+        _seed_history(db_session)
+        ReportCardService(db_session).get_report_card(USER_ID)
+        attempt = _attempt(db_session, "g2", 0, 0, status="grading")
+        attempt.questions_snapshot_json = [
+            {"_format": "true_false", "_id": "q0", "correct_answer_bool": True},
+        ]
+        attempt.answers_json = {"0": True}
+        attempt.total_possible = 1
+        db_session.commit()
+
+        PracticeGradingService(db_session, MagicMock()).grade_attempt(attempt.id)
+
+        g2 = db_session.get(StudentTopicProgress, (USER_ID, "g2"))
+        assert (g2.latest_practice_score, g2.latest_practice_total, g2.practice_attempt_count) == (1.0, 1, 1)
+        _assert_in_sync(db_session)
+
+    def test_refresh_is_noop_before_first_build(self, db_session):
+        _seed_history(db_session)
+
+        assert ReportCardService(db_session).refresh_topic(USER_ID, "g1") is False
+        assert db_session.query(StudentTopicProgress).count() == 0
+
+
+class TestVerifyAndInvalidate:
+    def test_verify_reports_drift_and_rebuild_repairs_it(self, db_session):
+        _seed_history(db_session)
+        service = ReportCardService(db_session)
+        assert service.verify(USER_ID) == []
+
+        row = db_session.get(StudentTopicProgress, (USER_ID, "g1"))
+        row.concepts_covered = []
+        db_session.commit()
+        assert service.verify(USER_ID) == ["report_card", "topic_progress"]
+
+        service.rebuild(USER_ID)
+        assert service.verify(USER_ID) == []
+
+    def test_rebuild_after_rows_loaded_in_same_session(self, db_session):
+        _seed_history(db_session)
+        service = ReportCardService(db_session)
+        service.get_report_card(USER_ID)
+        loaded = db_session.query(StudentTopicProgress).all()
+        assert loaded
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", SAWarning)
+            written = service.rebuild(USER_ID)
+
+        assert written == len(loaded)
+        assert db_session.query(StudentTopicProgress).count() == len(loaded)
+        _assert_in_sync(db_session)
+
+    def test_deleting_a_session_rebuilds_on_next_read(self, db_session):
+        _seed_history(db_session)
+        ReportCardService(db_session).get_report_card(USER_ID)
+
+        assert SessionRepository(db_session).delete("s2")
+
+        assert db_session.get(StudentProgressBuild, USER_ID) is None
+        _assert_in_sync(db_session)
+        assert db_session.get(StudentTopicProgress, (USER_ID, "g1")).session_count == 1
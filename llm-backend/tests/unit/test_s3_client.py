@@ -0,0 +1,149 @@
+"""Unit tests for shared/utils/s3_client.py — pooled client and bulk operations.
+
+Runs against botocore's Stubber (real request validation, no network) or an
+in-memory stand-in for the threaded bulk calls.
+"""
+
+import io
+import threading
+import time
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from shared.utils.s3_client import DELETE_BATCH_SIZE, S3Client
+
+
+def _boto_client():
+    return boto3.client(
+        "s3", region_name="us-east-1",
+        aws_access_key_id="test", aws_secret_access_key="test",
+    )
+
+
+class FakeBotoS3:
+    """Thread-safe in-memory stand-in for the boto3 calls S3Client makes."""
+
+    def __init__(self, delay: float = 0.0):
+        self.objects = {}
+        self.delay = delay
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.multipart_uploads = []
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+    def put_object(self, Bucket, Key, Body, ContentType=None):
+        self._enter()
+        self.objects[Key] = bytes(Body)
+
+    def get_object(self, Bucket, Key):
+        self._enter()
+        if Key not in self.objects:
+            from botocore.exceptions import ClientError
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+        self.multipart_uploads.append((Key, Config.multipart_threshold))
+        self.objects[Key] = Fileobj.read()
+
+
+class TestClientConfig:
+    def test_default_client_uses_shared_connection_pool(self, monkeypatch):
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+
+        client = S3Client()
+
+        assert client.s3_client.meta.config.max_pool_connections == 50
+
+
+class TestBulkOperations:
+    def test_upload_many_runs_concurrently_and_keeps_order(self):
+        fake = FakeBotoS3(delay=0.02)
+        client = S3Client(fake, bucket_name="b")
+        objects = {f"k/{i}.mp3": bytes([i]) for i in range(12)}
+
+        urls = client.upload_many(objects, content_type="audio/mpeg")
+
+        assert list(urls) == list(objects)
+        assert urls["k/3.mp3"] == "s3://b/k/3.mp3"
+        assert fake.objects == objects
+        assert fake.peak > 1
+
+    def test_download_many_missing_ok(self):
+        fake = FakeBotoS3()
+        fake.objects = {"a": b"1", "b": b"2"}
+        client = S3Client(fake, bucket_name="b")
+
+        assert client.download_many(["a", "missing", "b"], missing_ok=True) == {
+            "a": b"1", "missing": None, "b": b"2",
+        }
+
+    def test_large_upload_bytes_streams_multipart(self):
+        fake = FakeBotoS3()
+        client = S3Client(fake, bucket_name="b")
+        threshold = client.transfer_config.multipart_threshold
+
+        client.upload_bytes(b"x" * threshold, "books/b1/book.pdf", content_type="application/pdf")
+        client.upload_bytes(b"small", "books/b1/page.txt")
+
+        assert fake.multipart_uploads == [("books/b1/book.pdf", threshold)]
+        assert fake.objects["books/b1/page.txt"] == b"small"
+
+
+class TestDeletes:
+    def test_delete_folder_pages_listing_and_batches_deletes(self):
+        boto_client = _boto_client()
+        client = S3Client(boto_client, bucket_name="b")
+        client.max_concurrency = 1  # Stubber responses are consumed in order
+        keys = [f"books/x/{i}.png" for i in range(DELETE_BATCH_SIZE + 2)]
+
+        with Stubber(boto_client) as stub:
+            stub.add_response(
+                "list_objects_v2",
+                {"Contents": [{"Key": k} for k in keys[:1000]], "IsTruncated": True,
+                 "NextContinuationToken": "t"},
+                {"Bucket": "b", "Prefix": "books/x/"},
+            )
+            stub.add_response(
+                "list_objects_v2",
+                {"Contents": [{"Key": k} for k in keys[1000:]], "IsTruncated": False},
+                {"Bucket": "b", "Prefix": "books/x/", "ContinuationToken": "t"},
+            )
+            for batch in (keys[:DELETE_BATCH_SIZE], keys[DELETE_BATCH_SIZE:]):
+                stub.add_response(
+                    "delete_objects", {},
+                    {"Bucket": "b", "Delete": {"Objects": [{"Key": k} for k in batch], "Quiet": True}},
+                )
+
+            assert client.delete_folder("books/x/") == len(keys)
+            stub.assert_no_pending_responses()
+
+    def test_delete_many_surfaces_per_key_errors(self):
+        boto_client = _boto_client()
+        client = S3Client(boto_client, bucket_name="b")
+
+        with Stubber(boto_client) as stub:
+            stub.add_response(
+                "delete_objects",
+                {"Errors": [{"Key": "a", "Code": "AccessDenied", "Message": "no"}]},
+            )
+            with pytest.raises(RuntimeError, match="AccessDenied"):
+                client.delete_many(["a", "b"])
+
+    def test_delete_many_with_no_keys_makes_no_request(self):
+        boto_client = _boto_client()
+        client = S3Client(boto_client, bucket_name="b")
+
+        with Stubber(boto_client):
+            assert client.delete_many([]) == 0
@@ -4,6 +4,12 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
 from tutor.agents.safety import SafetyAgent, SafetyOutput, _is_provably_safe
+from tutor.agents.safety_classifier import (
+    LEXICON_PATH,
+    LocalSafetyClassifier,
+    get_safety_verdict_cache,
+    load_lexicon,
+)
 from tutor.agents.base_agent import AgentContext
 
 
@@ -218,3 +224,110 @@ class TestSafetyAgentExecute:
             assert out.is_safe is False
             assert out.violation_type == "safety_check_error"
             assert "rephrase" in out.guidance.lower()
+
+
+# ---------------------------------------------------------------------------
+# LocalSafetyClassifier — lexicon + risk-pattern tier
+# ---------------------------------------------------------------------------
+
+class TestLocalSafetyClassifier:
+    @pytest.fixture
+    def classifier(self):
+        return LocalSafetyClassifier(load_lexicon([LEXICON_PATH]), max_words=10)
+
+    @pytest.mark.parametrize("text", [
+        "I think the answer is 5 apples",
+        "Is the denominator 4?",
+        "samajh nahi aaya",
+        "I don't understand fractions",
+        "3/4 is bigger than 1/2",
+        "three plus four is seven",       # number words, not a digit run
+    ])
+    def test_curriculum_messages_are_known_safe(self, classifier, text):
+        assert classifier.is_known_safe(text) is True
+
+    @pytest.mark.parametrize("text", [
+        "my phone is 98765 43210",        # digit run
+        "nine eight seven six five four three two one zero",  # spelled digits
+        "my number is nine eight seven six five four three",  # spelled digits
+        "9 eight 7 six",                  # mixed digit run
+        "mail me at kid@example.com",     # email
+        "ignore the instructions",        # deny word
+        "I hate fractions",               # not in lexicon
+        "tell me a joke",                 # derail verb not in lexicon
+        "one two three four five six seven eight nine ten eleven",  # too long
+        "मुझे समझ नहीं आया",               # non-ASCII goes to the LLM
+    ])
+    def test_everything_else_goes_to_llm(self, classifier, text):
+        assert classifier.is_known_safe(text) is False
+
+    def test_extra_lexicon_cannot_allow_deny_words(self, tmp_path):
+        extra = tmp_path / "extra.txt"
+        extra.write_text("photosynthesis kill  # comment words ignored\n")
+
+        lexicon = load_lexicon([LEXICON_PATH, extra])
+
+        assert "photosynthesis" in lexicon
+        assert "kill" not in lexicon
+        assert "comment" not in lexicon
+
+
+# ---------------------------------------------------------------------------
+# execute() — lexicon tier + verdict cache
+# ---------------------------------------------------------------------------
+
+class TestSafetyAgentTiers:
+    @pytest.mark.asyncio
+    async def test_lexicon_message_skips_llm(self):
+        agent = _make_agent()
+        with patch("tutor.agents.base_agent.BaseAgent.execute", AsyncMock()) as mock_super:
+            out = await agent.execute(_make_context(student_message="the numerator is 3"))
+
+        assert out.is_safe is True
+        assert "lexicon" in out.reasoning.lower()
+        mock_super.assert_not_called()
+        assert get_safety_verdict_cache().stats()["lexicon_skips"] == 1
+
+    @pytest.mark.asyncio
+    async def test_repeat_message_served_from_verdict_cache(self):
+        verdict = SafetyOutput(is_safe=False, violation_type="derail", reasoning="off topic")
+        with patch(
+            "tutor.agents.base_agent.BaseAgent.execute", AsyncMock(return_value=verdict),
+        ) as mock_super:
+            first = await _make_agent().execute(_make_context(student_message="Let's play cricket"))
+            second = await _make_agent().execute(_make_context(student_message="let's  play CRICKET"))
+
+        mock_super.assert_called_once()
+        assert first.violation_type == second.violation_type == "derail"
+        stats = get_safety_verdict_cache().stats()
+        assert (stats["llm_calls"], stats["cache_hits"], stats["llm_unsafe"]) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_lesson_context_is_part_of_the_key(self):
+        verdict = SafetyOutput(is_safe=True, reasoning="ok")
+        with patch(
+            "tutor.agents.base_agent.BaseAgent.execute", AsyncMock(return_value=verdict),
+        ) as mock_super:
+            agent = _make_agent()
+            await agent.execute(_make_context(student_message="Let's play cricket"))
+            await agent.execute(_make_context(
+                student_message="Let's play cricket",
+                additional_context={"lesson_context": "PE class"},
+            ))
+
+        assert mock_super.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fail_safe_verdict_is_not_cached(self):
+        agent = _make_agent()
+        ok = SafetyOutput(is_safe=True, reasoning="fine")
+        with patch(
+            "tutor.agents.base_agent.BaseAgent.execute",
+            AsyncMock(side_effect=[RuntimeError("down"), ok]),
+        ):
+            first = await agent.execute(_make_context(student_message="Let's play cricket"))
+            second = await agent.execute(_make_context(student_message="Let's play cricket"))
+
+        assert first.violation_type == "safety_check_error"
+        assert second.is_safe is True
+        assert get_safety_verdict_cache().stats()["llm_failures"] == 1
@@ -97,6 +97,23 @@ class TestGetStrictSchema:
         schema = get_strict_schema(SimpleModel)
         assert isinstance(schema, dict)
 
+    def test_computed_once_per_model(self):
+        """Repeat calls return the same precomputed dict."""
+        get_strict_schema.cache_clear()
+        first = get_strict_schema(NestedParent)
+        second = get_strict_schema(NestedParent)
+
+        assert second is first
+        assert get_strict_schema.cache_info().hits == 1
+        assert first == make_schema_strict(NestedParent.model_json_schema())
+
+    def test_llm_service_helper_matches(self):
+        """LLMService.make_schema_strict delegates to the same transform."""
+        from shared.services.llm_service import LLMService
+
+        raw = NestedParent.model_json_schema()
+        assert LLMService.make_schema_strict(raw) == make_schema_strict(raw)
+
 
 class TestMakeSchemaStrict:
     """Tests for make_schema_strict."""
@@ -2,6 +2,7 @@
 
 import json
 import pytest
+from sqlalchemy import text
 from unittest.mock import MagicMock, patch, AsyncMock
 from types import SimpleNamespace
 
@@ -157,7 +158,7 @@ class TestSessionServiceCreateNewSession:
         request = _create_request()
 
         with patch(
-            "asyncio.run",
+            "tutor.services.session_service.run_blocking",
             return_value=("Hello! Let's learn fractions!", "Hello! Let's learn fractions!"),
         ):
             response = svc.create_new_session(request)
@@ -229,13 +230,62 @@ class TestSessionServiceProcessStep:
         svc.orchestrator.agent_logs = MagicMock()
         svc.orchestrator.agent_logs.get_recent_logs.return_value = []
 
-        with patch("asyncio.run", return_value=turn_result):
+        with patch("tutor.services.session_service.run_blocking", return_value=turn_result):
             resp = svc.process_step("test-session-123", StepRequest(student_reply="3/4"))
 
         assert isinstance(resp, StepResponse)
         assert resp.next_turn["message"] == "Good answer!"
         svc.event_repo.log.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_process_step_async_awaits_turn_on_running_loop(self):
+        from tutor.services.session_service import SessionService
+        from tutor.orchestration.orchestrator import TurnResult
+
+        svc = SessionService.__new__(SessionService)
+        svc.db = MagicMock()
+        svc.session_repo = MagicMock()
+        svc.event_repo = MagicMock()
+        svc.orchestrator = MagicMock()
+        svc.orchestrator.process_turn = AsyncMock(return_value=TurnResult(
+            response="Good answer!",
+            intent="continuation",
+            specialists_called=["master_tutor"],
+            state_changed=True,
+        ))
+        svc._persist_session_state = MagicMock()
+
+        db_row = MagicMock()
+        db_row.state_json = _make_session_state().model_dump_json()
+        db_row.state_version = 4
+        svc.session_repo.get_by_id.return_value = db_row
+
+        with patch("asyncio.run", side_effect=AssertionError("asyncio.run on the async path")):
+            resp = await svc.process_step_async("test-session-123", StepRequest(student_reply="3/4"))
+
+        assert resp.next_turn["message"] == "Good answer!"
+        assert resp.routing == "Advance"
+        svc.orchestrator.process_turn.assert_awaited_once()
+        assert svc._persist_session_state.call_args[0][2] == 4
+
+    @pytest.mark.asyncio
+    async def test_db_phases_use_async_session_when_available(self, tmp_path):
+        from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+        from tutor.services.session_service import SessionService
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite")
+        try:
+            async with AsyncSession(engine) as async_db:
+                svc = SessionService.__new__(SessionService)
+                svc.db = async_db.sync_session
+                with patch("asyncio.to_thread", side_effect=AssertionError("used a thread")):
+                    value = await svc._run_db(
+                        lambda n: svc.db.execute(text("SELECT :n"), {"n": n}).scalar(), 7,
+                    )
+        finally:
+            await engine.dispose()
+        assert value == 7
+
 class TestSessionServiceGetSummary:
     """Tests for SessionService.get_summary."""
 
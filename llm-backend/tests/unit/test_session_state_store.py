@@ -0,0 +1,179 @@
+"""Unit tests for tutor/services/session_state_store.py — split hot-state / message-log storage."""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from shared.models.entities import Session as SessionModel, SessionMessage
+from shared.repositories.session_repository import SessionRepository
+from tutor.api.sessions import _save_session_to_db
+from tutor.models.messages import StudentContext, create_student_message, create_teacher_message
+from tutor.models.session_state import SessionState, create_session
+from tutor.models.study_plan import StudyPlan, StudyPlanStep, Topic, TopicGuidelines
+from tutor.services.session_state_store import (
+    append_new_messages,
+    dump_state_json,
+    load_session_state,
+    load_state_dict,
+)
+
+SESSION_ID = "sess-store-1"
+
+
+def _make_state() -> SessionState:
+    topic = Topic(
+        topic_id="t1",
+        topic_name="Fractions",
+        subject="Math",
+        grade_level=3,
+        guidelines=TopicGuidelines(learning_objectives=["Add fractions"]),
+        study_plan=StudyPlan(steps=[
+            StudyPlanStep(step_id=1, type="explain", concept="Fractions"),
+        ]),
+    )
+    session = create_session(topic=topic, student_context=StudentContext(grade=3))
+    session.session_id = SESSION_ID
+    return session
+
+
+def _add_turn(session: SessionState, n: int) -> None:
+    session.add_message(create_student_message(f"answer {n}"))
+    session.add_message(create_teacher_message(f"reply {n}", audio_text=f"spoken {n}"))
+
+
+def _insert_row(db, session: SessionState) -> SessionModel:
+    row = SessionModel(
+        id=SESSION_ID,
+        student_json="{}",
+        goal_json="{}",
+        state_json=dump_state_json(session),
+        mode=session.mode,
+        state_version=1,
+        created_at=datetime.utcnow(),
+    )
+    db.add(row)
+    append_new_messages(db, SESSION_ID, session, stored=0)
+    db.commit()
+    return row
+
+
+def _stored_seqs(db) -> list[int]:
+    return [
+        seq for (seq,) in db.query(SessionMessage.seq)
+        .filter(SessionMessage.session_id == SESSION_ID)
+        .order_by(SessionMessage.seq)
+    ]
+
+
+class TestRoundTrip:
+    def test_state_json_excludes_log_and_load_rebuilds_it(self, db_session):
+        session = _make_state()
+        _add_turn(session, 1)
+        row = _insert_row(db_session, session)
+
+        assert "full_conversation_log" not in json.loads(row.state_json)
+        loaded = load_session_state(db_session, row)
+        assert loaded.model_dump() == session.model_dump()
+
+    def test_load_state_dict_fills_log(self, db_session):
+        session = _make_state()
+        _add_turn(session, 1)
+        row = _insert_row(db_session, session)
+
+        state = load_state_dict(db_session, row)
+
+        assert [m["content"] for m in state["full_conversation_log"]] == ["answer 1", "reply 1"]
+        assert state["full_conversation_log"][1]["audio_text"] == "spoken 1"
+
+
+class TestIncrementalSave:
+    def test_each_save_appends_only_new_messages(self, db_session):
+        session = _make_state()
+        _add_turn(session, 1)
+        row = _insert_row(db_session, session)
+
+        version = 1
+        for turn in range(2, 5):
+            session = load_session_state(db_session, row)
+            _add_turn(session, turn)
+            with patch.object(db_session, "add_all", wraps=db_session.add_all) as add_all:
+                version, reloaded = _save_session_to_db(db_session, SESSION_ID, session, version)
+            assert reloaded is None
+            assert len(add_all.call_args.args[0]) == 2
+
+        assert version == 4
+        assert _stored_seqs(db_session) == list(range(8))
+        db_session.refresh(row)
+        assert len(load_session_state(db_session, row).full_conversation_log) == 8
+
+    def test_repeated_saves_of_same_object_use_tracked_count(self, db_session):
+        session = _make_state()
+        _insert_row(db_session, session)
+
+        _add_turn(session, 1)
+        version, _ = _save_session_to_db(db_session, SESSION_ID, session, 1)
+        session.card_phase = None  # non-log change only
+        version, _ = _save_session_to_db(db_session, SESSION_ID, session, version)
+
+        assert version == 3
+        assert _stored_seqs(db_session) == [0, 1]
+
+    def test_version_conflict_writes_no_messages(self, db_session):
+        session = _make_state()
+        _insert_row(db_session, session)
+        _add_turn(session, 1)
+
+        version, reloaded = _save_session_to_db(db_session, SESSION_ID, session, 7)
+
+        assert version == 1
+        assert reloaded is not None and reloaded.full_conversation_log == []
+        assert _stored_seqs(db_session) == []
+
+
+class TestLegacyRows:
+    def test_inline_log_loads_and_moves_to_table_on_first_save(self, db_session):
+        session = _make_state()
+        _add_turn(session, 1)
+        row = SessionModel(
+            id=SESSION_ID, student_json="{}", goal_json="{}",
+            state_json=session.model_dump_json(), state_version=1,
+        )
+        db_session.add(row)
+        db_session.commit()
+
+        loaded = load_session_state(db_session, row)
+        assert len(loaded.full_conversation_log) == 2
+
+        _add_turn(loaded, 2)
+        _save_session_to_db(db_session, SESSION_ID, loaded, 1)
+
+        db_session.refresh(row)
+        assert "full_conversation_log" not in json.loads(row.state_json)
+        assert _stored_seqs(db_session) == [0, 1, 2, 3]
+
+    def test_split_disabled_writes_inline(self):
+        session = _make_state()
+        _add_turn(session, 1)
+        db = MagicMock()
+        with patch(
+            "tutor.services.session_state_store.get_settings",
+            return_value=MagicMock(session_split_message_log=False),
+        ):
+            state_json = dump_state_json(session)
+            staged = append_new_messages(db, SESSION_ID, session)
+
+        assert len(json.loads(state_json)["full_conversation_log"]) == 2
+        assert staged == 0
+        db.add_all.assert_not_called()
+
+
+class TestListAllMessageCount:
+    def test_counts_from_message_table(self, db_session):
+        session = _make_state()
+        _add_turn(session, 1)
+        _add_turn(session, 2)
+        _insert_row(db_session, session)
+
+        (entry,) = SessionRepository(db_session).list_all()
+
+        assert entry["message_count"] == 4
@@ -0,0 +1,153 @@
+"""Unit tests for the denormalized session summary columns.
+
+Covers the write path (session_summary_columns on save), the read path
+(read_session_summary + the repository / report-card readers), and the
+db.py backfill for rows that predate the columns.
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from shared.models.entities import Session as SessionModel
+from shared.repositories.session_repository import SessionRepository
+from tutor.api.sessions import _save_session_to_db
+from tutor.models.messages import StudentContext, create_student_message, create_teacher_message
+from tutor.models.session_state import SessionState, create_session
+from tutor.models.study_plan import StudyPlan, StudyPlanStep, Topic, TopicGuidelines
+from tutor.services.report_card_service import ReportCardService
+from tutor.services.session_state_store import (
+    SESSION_SUMMARY_VERSION,
+    append_new_messages,
+    dump_state_json,
+    read_session_summary,
+    session_summary_columns,
+    summarize_state_dict,
+)
+
+USER_ID = "user-1"
+GUIDELINE_ID = "g1"
+
+
+def _make_state(session_id: str) -> SessionState:
+    topic = Topic(
+        topic_id=GUIDELINE_ID,
+        topic_name="Fractions - Comparing",
+        subject="Mathematics",
+        grade_level=3,
+        guidelines=TopicGuidelines(learning_objectives=["Compare fractions"]),
+        study_plan=StudyPlan(steps=[
+            StudyPlanStep(step_id=1, type="explain", concept="halves"),
+            StudyPlanStep(step_id=2, type="explain", concept="quarters"),
+        ]),
+    )
+    session = create_session(topic=topic, student_context=StudentContext(grade=3))
+    session.session_id = session_id
+    session.concepts_covered_set = {"halves"}
+    session.mastery_estimates = {"halves": 0.8, "quarters": 0.1}
+    session.add_message(create_student_message("hi"))
+    session.add_message(create_teacher_message("hello"))
+    return session
+
+
+def _insert(db, session: SessionState, *, summarized: bool = True) -> SessionModel:
+    row = SessionModel(
+        id=session.session_id,
+        student_json="{}",
+        goal_json="{}",
+        state_json=dump_state_json(session) if summarized else session.model_dump_json(),
+        user_id=USER_ID,
+        guideline_id=GUIDELINE_ID,
+        subject="Mathematics",
+        mode=session.mode,
+        teach_me_mode="explain",
+        state_version=1,
+        created_at=datetime.utcnow(),
+        **(session_summary_columns(session) if summarized else {}),
+    )
+    db.add(row)
+    if summarized:
+        append_new_messages(db, session.session_id, session, stored=0)
+    db.commit()
+    return row
+
+
+class TestSummaryDerivations:
+    def test_state_dict_summary_matches_model_summary(self):
+        session = _make_state("s1")
+        from_model = session_summary_columns(session)
+        from_dict = summarize_state_dict(json.loads(session.model_dump_json()))
+
+        assert from_dict == from_model
+        assert from_model["coverage"] == 50.0
+        assert from_model["message_count"] == 2
+
+    def test_state_dict_summary_tolerates_partial_state(self):
+        summary = summarize_state_dict({"topic": "oops", "mastery_estimates": "nope"})
+
+        assert summary["topic_id"] is None
+        assert summary["plan_concepts"] == []
+        assert summary["coverage"] == 0.0
+        assert summary["is_complete"] is None  # not a valid SessionState
+
+
+class TestWritePath:
+    def test_ws_save_refreshes_summary(self, db_session):
+        session = _make_state("s1")
+        row = _insert(db_session, session)
+
+        session.concepts_covered_set.add("quarters")
+        session.add_message(create_student_message("done"))
+        _save_session_to_db(db_session, "s1", session, 1)
+
+        db_session.refresh(row)
+        assert row.coverage == 100.0
+        assert row.message_count == 3
+        assert row.concepts_covered == ["halves", "quarters"]
+        assert row.summary_version == SESSION_SUMMARY_VERSION
+
+
+class TestReadPath:
+    def test_summarized_rows_never_parse_state_json(self, db_session):
+        _insert(db_session, _make_state("s1"))
+        db_session.query(SessionModel).update({"state_json": "NOT JSON"})
+        db_session.commit()
+
+        (entry,) = SessionRepository(db_session).list_by_user(USER_ID)
+        (guideline_entry,) = SessionRepository(db_session).list_by_guideline(USER_ID, GUIDELINE_ID)
+        progress = ReportCardService(db_session).get_topic_progress(USER_ID)
+
+        assert entry["topic_name"] == "Fractions - Comparing"
+        assert entry["coverage"] == 50.0
+        assert guideline_entry["coverage"] == 50.0
+        assert guideline_entry["is_complete"] is False
+        assert progress["user_progress"][GUIDELINE_ID]["coverage"] == 50.0
+
+    def test_unsummarized_row_falls_back_to_state_json(self, db_session):
+        row = _insert(db_session, _make_state("s1"), summarized=False)
+
+        summary = read_session_summary(db_session, row)
+
+        assert summary["topic_id"] == GUIDELINE_ID
+        assert summary["message_count"] == 2
+        assert summary["mode"] == "teach_me"
+
+
+class TestBackfill:
+    def test_backfill_fills_legacy_rows_once(self, db_session):
+        from db import backfill_session_summaries
+
+        _insert(db_session, _make_state("s1"), summarized=False)
+        _insert(db_session, _make_state("s2"))
+        manager = MagicMock()
+        manager.session_factory.return_value = db_session
+
+        with patch("db.get_db_manager", return_value=manager):
+            assert backfill_session_summaries(batch_size=1) == 1
+            assert backfill_session_summaries() == 0
+
+        row = db_session.get(SessionModel, "s1")
+        assert row.summary_version == SESSION_SUMMARY_VERSION
+        assert row.topic_name == "Fractions - Comparing"
+        assert row.plan_concepts == ["halves", "quarters"]
+        assert row.state_version == 1
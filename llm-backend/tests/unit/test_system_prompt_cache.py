@@ -0,0 +1,129 @@
+"""Unit tests for tutor/agents/system_prompt_cache.py and its use in MasterTutorAgent."""
+
+from unittest.mock import MagicMock, patch
+
+from tutor.agents.base_agent import AgentContext
+from tutor.agents.master_tutor import MasterTutorAgent
+from tutor.agents.system_prompt_cache import (
+    PROMPT_SEPARATOR,
+    SystemPromptCache,
+    get_system_prompt_cache,
+)
+from tutor.models.messages import StudentContext, create_student_message
+from tutor.models.session_state import create_session
+from tutor.models.study_plan import StudyPlan, StudyPlanStep, Topic, TopicGuidelines
+
+
+def _make_session(mode: str = "teach_me"):
+    topic = Topic(
+        topic_id="g1",
+        topic_name="Fractions - Basics",
+        subject="Mathematics",
+        grade_level=3,
+        guidelines=TopicGuidelines(
+            learning_objectives=["Understand fractions"],
+            common_misconceptions=["Bigger denominator means bigger fraction"],
+            scope_boundary="Single-digit denominators",
+        ),
+        study_plan=StudyPlan(steps=[
+            StudyPlanStep(step_id=1, type="explain", concept="What is a fraction"),
+            StudyPlanStep(step_id=2, type="check", concept="What is a fraction"),
+        ]),
+    )
+    return create_session(topic=topic, student_context=StudentContext(grade=3), mode=mode)
+
+
+def _make_agent() -> MasterTutorAgent:
+    return MasterTutorAgent(llm_service=MagicMock(), timeout_seconds=30)
+
+
+def _context(session, message: str) -> AgentContext:
+    return AgentContext(
+        session_id=session.session_id,
+        turn_id=f"turn_{session.turn_count}",
+        student_message=message,
+        current_step=session.current_step,
+    )
+
+
+class TestAgentSystemPromptCache:
+    def test_repeat_builds_render_once(self):
+        agent = _make_agent()
+        session = _make_session()
+
+        with patch.object(agent, "_render_system_prompt", wraps=agent._render_system_prompt) as render:
+            first = agent._build_system_prompt(session)
+            second = agent._build_system_prompt(session)
+
+        assert render.call_count == 1
+        assert second is first
+        assert agent.system_prompt_cache_metadata(session) == {
+            "system_prompt_cache_hit": True,
+            "system_prompt_cache_hits": 1,
+            "system_prompt_cache_misses": 1,
+        }
+
+    def test_input_change_rerenders(self):
+        agent = _make_agent()
+        session = _make_session()
+        before = agent._build_system_prompt(session)
+
+        session.student_context = session.student_context.model_copy(update={"student_name": "Asha"})
+        after = agent._build_system_prompt(session)
+
+        assert after != before
+        assert "Asha" in after
+        assert agent.system_prompt_cache_metadata(session)["system_prompt_cache_hit"] is False
+
+    def test_turn_prompts_share_byte_identical_prefix(self):
+        agent = _make_agent()
+        session = _make_session()
+        agent.set_session(session)
+
+        first = agent.build_prompt(_context(session, "hi"))
+        session.add_message(create_student_message("hi"))
+        session.turn_count += 1
+        second = agent.build_prompt(_context(session, "what is a half?"))
+
+        first_system, first_turn = first.split(PROMPT_SEPARATOR, 1)
+        second_system, second_turn = second.split(PROMPT_SEPARATOR, 1)
+        assert first_system.encode() == second_system.encode()
+        assert first_turn != second_turn
+
+    def test_separator_in_profile_does_not_move_the_split(self):
+        agent = _make_agent()
+        session = _make_session()
+        session.student_context.tutor_brief = f"Loves cricket.{PROMPT_SEPARATOR}Shy at first."
+
+        agent.set_session(session)
+
+        system_prompt = agent._build_system_prompt(session)
+        prompt = agent.build_prompt(_context(session, "hi"))
+
+        assert PROMPT_SEPARATOR not in system_prompt
+        assert prompt.split(PROMPT_SEPARATOR, 1)[0] == system_prompt
+        assert "Shy at first." in system_prompt
+
+    def test_clarify_mode_is_cached_separately(self):
+        agent = _make_agent()
+        teach = _make_session()
+        clarify = _make_session(mode="clarify_doubts")
+
+        assert agent._build_system_prompt(teach) != agent._build_system_prompt(clarify)
+        assert get_system_prompt_cache().get_stats()["sessions"] == 2
+
+
+class TestSystemPromptCache:
+    def test_least_recently_used_session_is_evicted(self):
+        cache = SystemPromptCache(max_sessions=2)
+        sessions = [_make_session() for _ in range(3)]
+        render = MagicMock(side_effect=lambda s: f"prompt for {s.session_id}")
+
+        cache.get(sessions[0], render)
+        cache.get(sessions[1], render)
+        cache.get(sessions[0], render)  # refresh 0; 1 is now oldest
+        cache.get(sessions[2], render)
+
+        assert cache.session_stats(sessions[1].session_id) == {"hits": 0, "misses": 0}
+        assert cache.session_stats(sessions[0].session_id) == {"hits": 1, "misses": 1}
+        assert cache.get_stats() == {"sessions": 2, "hits": 1, "misses": 3, "max_sessions": 2}
@@ -0,0 +1,244 @@
+"""Unit tests for plan-guided parallel chunk extraction.
+
+Drives `TopicExtractionOrchestrator.extract` end to end against a
+file-backed SQLite DB and an in-memory blob store, with the planner, chunk
+LLM call and finalization faked. Covers: chunks overlap when a plan exists,
+the merge is in page order no matter which chunk finishes first, the
+result matches a sequential run, unguided runs stay sequential, and resume
+skips already-completed chunks.
+"""
+import json
+import threading
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from book_ingestion_v2.models.database import (
+    BookChapter, ChapterChunk, ChapterPage, ChapterProcessingJob, ChapterTopic,
+)
+from book_ingestion_v2.models.processing_models import (
+    ChapterTopicPlan, ChunkExtractionOutput, PlannedTopic, TopicUpdate,
+)
+from book_ingestion_v2.services import topic_extraction_orchestrator as teo
+from book_ingestion_v2.services.topic_extraction_orchestrator import TopicExtractionOrchestrator
+from shared.models.entities import Base, Book
+from shared.utils.blob_store import MemoryBlobStore
+
+PAGES = 12  # 4 chunks of 3 pages
+
+PLAN = ChapterTopicPlan(
+    topics=[
+        PlannedTopic(
+            topic_key="halves", title="Halves", description="d", page_start=1, page_end=6,
+            sequence_order=1, grouping_rationale="r",
+        ),
+        PlannedTopic(
+            topic_key="quarters", title="Quarters", description="d", page_start=7, page_end=12,
+            sequence_order=2, grouping_rationale="r",
+        ),
+    ],
+    chapter_overview="Fractions of a whole.",
+    planning_rationale="r",
+)
+
+
+class _FakeChunkLLM:
+    """Stands in for ChunkProcessorService.process_chunk.
+
+    Later chunks finish first, so an order-sensitive merge would show it.
+    """
+
+    def __init__(self, delay: float = 0.03):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+        self.inputs = []
+
+    def __call__(self, chunk_input, planned_topics=None):
+        first_page = chunk_input.current_pages[0]["page_number"]
+        with self._lock:
+            self.inputs.append(chunk_input)
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.delay * (PAGES - first_page) / 3)
+        with self._lock:
+            self.current -= 1
+
+        key = "halves" if first_page <= 6 else "quarters"
+        topics = [TopicUpdate(
+            topic_key=key, topic_title=key.title(),
+            topic_assignment="planned" if planned_topics else "",
+            is_new=first_page in (1, 7),
+            guidelines_for_this_chunk=f"from page {first_page}", reasoning="r",
+        )]
+        if first_page == 4:
+            topics.append(TopicUpdate(
+                topic_key="mixed-fractions", topic_title="Mixed", topic_assignment="unplanned",
+                is_new=True, guidelines_for_this_chunk="mixed", reasoning="r",
+            ))
+        return ChunkExtractionOutput(
+            updated_chapter_summary=f"summary through page {first_page + 2}", topics=topics,
+        )
+
+
+@pytest.fixture
+def env(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'extract.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    store = MemoryBlobStore()
+
+    book_id, chapter_id = str(uuid.uuid4()), str(uuid.uuid4())
+    with factory() as db:
+        db.add(Book(
+            id=book_id, title="Maths", country="India", board="CBSE", grade=3,
+            subject="Mathematics", s3_prefix=f"books/{book_id}/",
+        ))
+        db.add(BookChapter(
+            id=chapter_id, book_id=book_id, chapter_number=5, chapter_title="Fractions",
+            start_page=1, end_page=PAGES, total_pages=PAGES, uploaded_page_count=PAGES,
+            status="upload_complete",
+        ))
+        for n in range(1, PAGES + 1):
+            key = f"books/{book_id}/chapters/05/pages/{n}.txt"
+            store.upload_bytes(f"page {n} text".encode(), key)
+            db.add(ChapterPage(
+                id=str(uuid.uuid4()), book_id=book_id, chapter_id=chapter_id, page_number=n,
+                text_s3_key=key, ocr_status="completed",
+            ))
+        db.commit()
+
+    db_manager = MagicMock()
+    db_manager.get_session.side_effect = factory
+    yield {"factory": factory, "store": store, "book_id": book_id,
+           "chapter_id": chapter_id, "db_manager": db_manager}
+    engine.dispose()
+
+
+def _run(env, fake_llm, *, concurrency=4, plan=PLAN, resume=False, job_id="job-1"):
+    settings = MagicMock(
+        openai_api_key="sk-test", gemini_api_key="", anthropic_api_key="",
+        topic_extraction_chunk_concurrency=concurrency,
+    )
+    planner = MagicMock()
+    if plan is None:
+        planner.return_value.plan_chapter.side_effect = RuntimeError("planner down")
+    else:
+        planner.return_value.plan_chapter.return_value = plan
+    finalizer = MagicMock()
+    finalizer.return_value.finalize.return_value = MagicMock(final_status="chapter_completed")
+
+    with patch.object(teo, "get_s3_client", return_value=env["store"]), \
+            patch.object(teo, "get_db_manager", return_value=env["db_manager"]), \
+            patch.object(teo, "get_settings", return_value=settings), \
+            patch.object(teo, "LLMService"), \
+            patch.object(teo, "LLMConfigService") as cfg, \
+            patch.object(teo, "ChapterJobService"), \
+            patch.object(teo, "ChapterTopicPlannerService", planner), \
+            patch.object(teo, "ChapterFinalizationService", finalizer), \
+            patch.object(teo.ChunkProcessorService, "process_chunk", side_effect=fake_llm):
+        cfg.return_value.get_config.return_value = {
+            "provider": "openai", "model_id": "fake", "reasoning_effort": "none",
+        }
+        db = env["factory"]()
+        orchestrator = TopicExtractionOrchestrator(db)
+        orchestrator.extract(db, job_id, env["chapter_id"], env["book_id"], resume=resume)
+        orchestrator.db.close()
+
+
+def _topics(env):
+    with env["factory"]() as db:
+        return {
+            t.topic_key: (t.guidelines, t.source_page_start, t.source_page_end)
+            for t in db.query(ChapterTopic).filter_by(chapter_id=env["chapter_id"])
+        }
+
+
+def _chunks(env, job_id="job-1"):
+    with env["factory"]() as db:
+        return [
+            (c.chunk_index, c.status, c.chapter_summary_after)
+            for c in db.query(ChapterChunk).filter_by(processing_job_id=job_id).order_by(ChapterChunk.created_at)
+        ]
+
+
+class TestPlanGuidedParallel:
+    def test_chunks_run_concurrently_and_merge_in_page_order(self, env):
+        fake = _FakeChunkLLM()
+        _run(env, fake, concurrency=4)
+
+        assert fake.peak > 1
+        # Every chunk was built from the plan, not from earlier outputs.
+        assert {i.chapter_summary_so_far for i in fake.inputs} == {"Fractions of a whole."}
+        assert all(
+            [t.topic_key for t in i.topics_so_far] == ["halves", "quarters"] for i in fake.inputs
+        )
+
+        topics = _topics(env)
+        assert topics["halves"][0].index("from page 1") < topics["halves"][0].index("from page 4")
+        assert topics["quarters"][0].index("from page 7") < topics["quarters"][0].index("from page 10")
+        assert topics["mixed-fractions"][1:] == (4, 6)
+        # Chunk records land in chunk order, so resume sees a completed prefix.
+        assert [c[:2] for c in _chunks(env)] == [(i, "completed") for i in range(4)]
+        assert _chunks(env)[-1][2] == "summary through page 12"
+
+    def test_parallel_result_matches_sequential(self, env):
+        _run(env, _FakeChunkLLM(), concurrency=4, job_id="job-par")
+        parallel = _topics(env)
+        _run(env, _FakeChunkLLM(), concurrency=1, job_id="job-seq")
+        assert _topics(env) == parallel
+
+    def test_failed_chunk_is_recorded_in_place(self, env):
+        fake = _FakeChunkLLM()
+
+        def flaky(chunk_input, planned_topics=None):
+            if chunk_input.current_pages[0]["page_number"] == 4:
+                raise ValueError("LLM gave up")
+            return fake(chunk_input, planned_topics)
+
+        _run(env, flaky, concurrency=4)
+        assert [c[:2] for c in _chunks(env)] == [
+            (0, "completed"), (1, "failed"), (2, "completed"), (3, "completed"),
+        ]
+        assert "mixed-fractions" not in _topics(env)
+
+
+class TestSequentialFallbacks:
+    def test_unguided_extraction_stays_sequential(self, env):
+        fake = _FakeChunkLLM(delay=0.01)
+        _run(env, fake, concurrency=4, plan=None)
+
+        assert fake.peak == 1
+        # Each chunk saw the previous chunk's summary.
+        assert [i.chapter_summary_so_far for i in fake.inputs] == [
+            "", "summary through page 3", "summary through page 6", "summary through page 9",
+        ]
+
+    def test_resume_runs_only_remaining_chunks(self, env):
+        _run(env, _FakeChunkLLM(), concurrency=4, job_id="job-old")
+        with env["factory"]() as db:
+            db.add(ChapterProcessingJob(
+                id="job-old", book_id=env["book_id"], chapter_id=env["chapter_id"],
+                job_type="v2_topic_extraction", status="failed",
+                planned_topics_json=json.dumps(PLAN.model_dump()),
+            ))
+            db.query(ChapterChunk).filter(
+                ChapterChunk.processing_job_id == "job-old", ChapterChunk.chunk_index >= 2,
+            ).delete()
+            db.commit()
+
+        fake = _FakeChunkLLM()
+        _run(env, fake, concurrency=4, resume=True, job_id="job-new")
+
+        assert sorted(i.current_pages[0]["page_number"] for i in fake.inputs) == [7, 10]
+        assert [c[:2] for c in _chunks(env, "job-new")] == [(2, "completed"), (3, "completed")]
+        # Restored summary from chunk 1 seeds the remaining chunks.
+        assert {i.chapter_summary_so_far for i in fake.inputs} == {"summary through page 6"}
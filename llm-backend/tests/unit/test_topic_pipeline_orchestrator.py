@@ -2,12 +2,14 @@
 
 Covers:
 - `_poll_to_terminal` timeout path marks the job failed (zombie-job fix)
+- `_poll_to_terminal` wakes on a completion notification, not the poll interval
 - `_run_one_stage` tags `pipeline_run_id` into the job's progress_detail
 - `stages_to_run_from_status` decision helper
 - `get_chapter_topic_statuses` single-pass helper
 """
 from __future__ import annotations
 
+import time
 import uuid
 from unittest.mock import patch
 
@@ -120,6 +122,54 @@ class TestPollToTerminal:
         assert orch._poll_to_terminal(db_session, job_id) == "completed"
 
 
+    def test_completion_notification_wakes_wait(self, db_session, ids, monkeypatch):
+        """A job finishing mid-wait is picked up from the notification, not
+        after the fallback re-read interval."""
+        svc = ChapterJobService(db_session)
+        job_id = svc.acquire_lock(
+            book_id=ids["book_id"],
+            chapter_id=ids["chapter_id"],
+            job_type=V2JobType.EXPLANATION_GENERATION.value,
+            guideline_id=ids["guideline_id"],
+        )
+        svc.start_job(job_id)
+
+        from book_ingestion_v2.services.chapter_job_notifier import (
+            notify_chapter_job_terminal,
+        )
+        monkeypatch.setattr(tpo, "POLL_INTERVAL_SEC", 5)
+
+        # The stage finishes right after the orchestrator's read of the
+        # row — the window a plain sleep would miss. (SQLite test sessions
+        # can't be shared across threads, so the "stage" runs inside the
+        # heartbeat check instead of on its own thread.)
+        real_check = ChapterJobService.is_job_heartbeat_stale
+        finished: list[bool] = []
+
+        def check_then_finish(self, jid):
+            stale = real_check(self, jid)
+            if not finished:
+                finished.append(True)
+                svc.release_lock(job_id, status="completed")
+                notify_chapter_job_terminal(db_session, job_id)
+            return stale
+
+        monkeypatch.setattr(
+            ChapterJobService, "is_job_heartbeat_stale", check_then_finish,
+        )
+
+        orch = tpo.TopicPipelineOrchestrator(
+            session_factory=lambda: db_session,
+            book_id=ids["book_id"],
+            chapter_id=ids["chapter_id"],
+            guideline_id=ids["guideline_id"],
+            quality_level="balanced",
+        )
+        start = time.monotonic()
+        assert orch._poll_to_terminal(db_session, job_id) == "completed"
+        assert time.monotonic() - start < tpo.POLL_INTERVAL_SEC
+
+
 class TestStagesToRunFromStatus:
     def _make_stage(self, stage_id, state):
         from book_ingestion_v2.models.schemas import StageStatus
@@ -0,0 +1,126 @@
+"""Unit tests for the student-message translation cache and English detector."""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from shared.models.entities import TranslationCacheEntry
+
+from tutor.orchestration.orchestrator import TeacherOrchestrator
+from tutor.services.translation_cache import (
+    TranslationCache,
+    get_translation_cache,
+    translation_cache_key,
+)
+from tutor.utils.language_utils import is_clearly_english
+
+PROMPT = "Translate: {text}"
+
+
+class TestIsClearlyEnglish:
+    @pytest.mark.parametrize("text", [
+        "I think the answer is 42",
+        "ok",
+        "Can you explain it again please?",
+        "what is a fraction",
+        "I don't understand",
+    ])
+    def test_english(self, text):
+        assert is_clearly_english(text)
+
+    @pytest.mark.parametrize("text", [
+        "samajh nahi aaya",
+        "fraction kya hota hai",
+        "haan",
+        "mujhe dobara batao",
+        "मुझे समझ नहीं आया",
+        "photosynthesis",        # unknown word — let the LLM decide
+        "",
+    ])
+    def test_not_clearly_english(self, text):
+        assert not is_clearly_english(text)
+
+
+class TestTranslationCache:
+    @pytest.mark.asyncio
+    async def test_english_and_numbers_skip_the_llm(self):
+        cache = TranslationCache(max_entries=10)
+        llm = AsyncMock(return_value="unused")
+
+        assert await cache.translate("I don't understand", PROMPT, llm) == ("I don't understand", "skip")
+        assert await cache.translate(" 3/4 + 1 ", PROMPT, llm) == (" 3/4 + 1 ", "skip")
+        llm.assert_not_awaited()
+        assert cache.stats()["skipped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_repeat_message_served_from_memory(self):
+        cache = TranslationCache(max_entries=10)
+        llm = AsyncMock(return_value="I didn't understand")
+
+        first = await cache.translate("samajh nahi aaya", PROMPT, llm)
+        second = await cache.translate("  Samajh   nahi aaya ", PROMPT, llm)
+
+        assert first == ("I didn't understand", "llm")
+        assert second == ("I didn't understand", "memory")
+        llm.assert_awaited_once()
+        stats = cache.stats()
+        assert (stats["requests"], stats["memory_hits"], stats["llm_calls"]) == (2, 1, 1)
+        assert stats["llm_avoided_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_failed_translation_not_cached(self):
+        cache = TranslationCache(max_entries=10)
+
+        assert await cache.translate("kya", PROMPT, AsyncMock(return_value=None)) == ("kya", "llm")
+        assert await cache.translate("kya", PROMPT, AsyncMock(return_value="what")) == ("what", "llm")
+        assert cache.stats()["llm_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_evicts_oldest_and_prompt_change_misses(self):
+        cache = TranslationCache(max_entries=2)
+        for text in ("kya", "haan", "nahi"):
+            await cache.translate(text, PROMPT, AsyncMock(return_value=text.upper()))
+
+        assert translation_cache_key("kya", PROMPT) not in cache._memory
+        assert len(cache._memory) == 2
+        _, source = await cache.translate("haan", "New prompt: {text}", AsyncMock(return_value="yes"))
+        assert source == "llm"
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_serves_other_workers(self):
+        # One in-memory DB visible from the worker threads.
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+        )
+        TranslationCacheEntry.__table__.create(engine)
+        factory = sessionmaker(bind=engine)
+        writer = TranslationCache(max_entries=10, shared=True, session_factory=factory)
+        await writer.translate("haan", PROMPT, AsyncMock(return_value="yes"))
+        for task in list(writer._writes):
+            await task
+
+        reader = TranslationCache(max_entries=10, shared=True, session_factory=factory)
+        llm = AsyncMock()
+        assert await reader.translate("haan", PROMPT, llm) == ("yes", "shared")
+        assert await reader.translate("haan", PROMPT, llm) == ("yes", "memory")
+        llm.assert_not_awaited()
+
+
+class TestOrchestratorTranslation:
+    @pytest.mark.asyncio
+    async def test_translate_uses_cache(self):
+        llm = Mock()
+        llm.acall_fast = AsyncMock(return_value={"output_text": json.dumps({"english": "I don't know"})})
+        orch = TeacherOrchestrator(llm)
+
+        assert await orch._translate_to_english("pata nahi") == "I don't know"
+        assert await orch._translate_to_english("pata nahi") == "I don't know"
+        assert await orch._translate_to_english("I think it is 5") == "I think it is 5"
+
+        llm.acall_fast.assert_awaited_once()
+        assert "pata nahi" in llm.acall_fast.await_args.kwargs["prompt"]
+        assert get_translation_cache().stats()["skipped"] == 1
@@ -0,0 +1,236 @@
+"""Unit tests for shared/services/tts_audio_cache.py and its use in /text-to-speech."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared.services.tts_audio_cache import TTSAudioCache, reset_tts_audio_cache, tts_cache_key
+from tutor.api import tts as tts_api
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tts_audio_cache():
+    reset_tts_audio_cache()
+    yield
+    reset_tts_audio_cache()
+
+
+class FakeS3:
+    """In-memory stand-in for S3Client's byte methods."""
+
+    def __init__(self, fail: bool = False):
+        self.objects = {}
+        self.fail = fail
+
+    def download_bytes_if_exists(self, s3_key):
+        if self.fail:
+            raise RuntimeError("s3 down")
+        return self.objects.get(s3_key)
+
+    def upload_bytes(self, data, s3_key, content_type=None):
+        if self.fail:
+            raise RuntimeError("s3 down")
+        self.objects[s3_key] = data
+        return f"s3://bucket/{s3_key}"
+
+
+def _cache(**overrides) -> TTSAudioCache:
+    kwargs = dict(max_memory_bytes=1024, s3_prefix=None)
+    kwargs.update(overrides)
+    return TTSAudioCache(**kwargs)
+
+
+async def _flush_uploads(cache: TTSAudioCache) -> None:
+    if cache._uploads:
+        await asyncio.gather(*cache._uploads)
+
+
+class TestCacheKey:
+    def test_key_covers_every_input(self):
+        spec = {"voice_id": "v1", "model_id": "m1"}
+        base = tts_cache_key("elevenlabs", "tutor", spec, "Hello")
+
+        assert base == tts_cache_key("elevenlabs", "tutor", dict(spec), "Hello")
+        assert base != tts_cache_key("google_tts", "tutor", spec, "Hello")
+        assert base != tts_cache_key("elevenlabs", "peer", spec, "Hello")
+        assert base != tts_cache_key("elevenlabs", "tutor", {**spec, "model_id": "m2"}, "Hello")
+        assert base != tts_cache_key("elevenlabs", "tutor", spec, "Hello!")
+
+
+class TestTTSAudioCache:
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_from_memory(self):
+        cache = _cache()
+        synth = AsyncMock(return_value=b"mp3")
+
+        first = await cache.get_or_synthesize("k", synth)
+        second = await cache.get_or_synthesize("k", synth)
+
+        assert first == (b"mp3", "provider")
+        assert second == (b"mp3", "memory")
+        synth.assert_awaited_once()
+        stats = cache.stats()
+        assert (stats["requests"], stats["misses"], stats["memory_hits"]) == (2, 1, 1)
+        assert stats["hit_rate"] == 0.5
+        assert stats["bytes_saved"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_synthesize_once(self):
+        cache = _cache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def _synth():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return b"audio"
+
+        tasks = [asyncio.create_task(cache.get_or_synthesize("k", _synth)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert sorted(source for _, source in results) == ["provider"] + ["shared"] * 4
+        assert cache.stats()["collapsed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_synthesis_failure_reaches_waiters_and_is_not_cached(self):
+        cache = _cache()
+        release = asyncio.Event()
+
+        async def _failing():
+            await release.wait()
+            raise RuntimeError("provider down")
+
+        tasks = [asyncio.create_task(cache.get_or_synthesize("k", _failing)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await cache.get_or_synthesize("k", AsyncMock(return_value=b"ok")) == (b"ok", "provider")
+
+    @pytest.mark.asyncio
+    async def test_s3_tier_shared_across_processes(self):
+        s3 = FakeS3()
+        writer = _cache(s3_prefix="tts-cache/", s3_client=s3)
+        await writer.get_or_synthesize("abcdef", AsyncMock(return_value=b"mp3"))
+        await _flush_uploads(writer)
+        assert list(s3.objects) == ["tts-cache/ab/abcdef.mp3"]
+
+        reader = _cache(s3_prefix="tts-cache/", s3_client=s3)
+        synth = AsyncMock()
+        assert await reader.get_or_synthesize("abcdef", synth) == (b"mp3", "s3")
+        synth.assert_not_awaited()
+        assert await reader.get_or_synthesize("abcdef", synth) == (b"mp3", "memory")
+
+    @pytest.mark.asyncio
+    async def test_use_s3_false_skips_s3_tier(self):
+        s3 = FakeS3()
+        s3.objects["tts-cache/ab/abcdef.mp3"] = b"shared"
+        cache = _cache(s3_prefix="tts-cache/", s3_client=s3)
+
+        result = await cache.get_or_synthesize(
+            "abcdef", AsyncMock(return_value=b"private"), use_s3=False,
+        )
+        await cache.get_or_synthesize("123456", AsyncMock(return_value=b"mp3"), use_s3=False)
+        await _flush_uploads(cache)
+
+        assert result == (b"private", "provider")
+        assert list(s3.objects) == ["tts-cache/ab/abcdef.mp3"]
+        assert await cache.get_or_synthesize("123456", AsyncMock(), use_s3=False) == (b"mp3", "memory")
+
+    @pytest.mark.asyncio
+    async def test_retry_after_cancelled_leader_keeps_use_s3_false(self):
+        s3 = FakeS3()
+        s3.objects["tts-cache/ab/abcdef.mp3"] = b"shared"
+        cache = _cache(s3_prefix="tts-cache/", s3_client=s3)
+        never = asyncio.Event()
+
+        async def _stuck():
+            await never.wait()
+
+        leader = asyncio.create_task(cache.get_or_synthesize("abcdef", _stuck, use_s3=False))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            cache.get_or_synthesize("abcdef", AsyncMock(return_value=b"private"), use_s3=False)
+        )
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == (b"private", "provider")
+        await _flush_uploads(cache)
+        assert s3.objects == {"tts-cache/ab/abcdef.mp3": b"shared"}
+
+    @pytest.mark.asyncio
+    async def test_s3_errors_fall_back_to_provider(self):
+        cache = _cache(s3_prefix="tts-cache/", s3_client=FakeS3(fail=True))
+
+        result = await cache.get_or_synthesize("k", AsyncMock(return_value=b"mp3"))
+        await _flush_uploads(cache)
+
+        assert result == (b"mp3", "provider")
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_evicts_least_recently_used_by_bytes(self):
+        cache = _cache(max_memory_bytes=10)
+        for key in ("a", "b"):
+            await cache.get_or_synthesize(key, AsyncMock(return_value=b"x" * 4))
+        await cache.get_or_synthesize("a", AsyncMock())  # refresh a; b is oldest
+        await cache.get_or_synthesize("c", AsyncMock(return_value=b"x" * 4))
+
+        assert list(cache._memory) == ["a", "c"]
+        assert cache.stats()["memory_bytes"] == 8
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_synthesizes(self):
+        cache = _cache(enabled=False)
+        synth = AsyncMock(return_value=b"mp3")
+
+        await cache.get_or_synthesize("k", synth)
+        await cache.get_or_synthesize("k", synth)
+
+        assert synth.await_count == 2
+
+
+class TestTextToSpeechEndpoint:
+    @pytest.mark.asyncio
+    async def test_repeat_text_skips_provider(self):
+        async def _call(text):
+            response = await tts_api.text_to_speech(
+                tts_api.TTSRequest(text=text), current_user=None, db=MagicMock(),
+            )
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            return body, response.headers["X-TTS-Cache"]
+
+        with patch.object(tts_api, "resolve_tts_provider", return_value="google_tts"), \
+                patch.object(tts_api, "_synth_google", return_value=b"mp3") as synth, \
+                patch("config.get_settings") as settings:
+            settings.return_value = MagicMock(
+                tts_cache_enabled=True, tts_cache_memory_mb=1, tts_cache_s3_prefix="",
+            )
+            first = await _call("Great job!")
+            second = await _call("Great job!")
+            await _call("Try again")
+
+        assert first == (b"mp3", "provider")
+        assert second == (b"mp3", "memory")
+        assert synth.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_personalized_text_is_not_written_to_s3(self):
+        s3 = FakeS3()
+        cache = TTSAudioCache(max_memory_bytes=1024, s3_prefix="tts-cache/", s3_client=s3)
+        request = tts_api.TTSRequest(text="Well done, Aarav!", personalized=True)
+
+        with patch.object(tts_api, "get_tts_audio_cache", return_value=cache), \
+                patch.object(tts_api, "resolve_tts_provider", return_value="google_tts"), \
+                patch.object(tts_api, "_synth_google", return_value=b"mp3"):
+            response = await tts_api.text_to_speech(request, current_user=None, db=MagicMock())
+        await _flush_uploads(cache)
+
+        assert response.headers["X-TTS-Cache"] == "provider"
+        assert s3.objects == {}
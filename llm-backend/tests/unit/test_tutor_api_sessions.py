@@ -9,7 +9,7 @@ WebSocket endpoint is excluded (too complex for unit tests).
 
 import json
 import pytest
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -65,6 +65,15 @@ def _build_app_and_client():
 
     app.dependency_overrides[get_db] = override_get_db
 
+    # Async endpoints (step, simplify-card) run sync helpers via run_sync;
+    # hand them the same mock session.
+    from database import get_async_db
+
+    async def override_get_async_db():
+        yield _FakeAsyncSession(mock_db)
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
     # Override auth dependencies so endpoints don't require real JWT tokens.
     from auth.middleware.auth_middleware import get_current_user, get_optional_user
 
@@ -89,6 +98,15 @@ def _build_app_and_client():
     }
 
 
+class _FakeAsyncSession:
+    """AsyncSession stand-in: run_sync calls fn with the wrapped sync session."""
+    def __init__(self, sync_session):
+        self.sync_session = sync_session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+
 def _make_anonymous_session_mock(**kwargs):
     """Create a mock DB session row with user_id=None (anonymous) to pass ownership checks."""
     mock_session = MagicMock()
@@ -222,11 +240,11 @@ class TestSubmitStep:
 
         mock_svc = MagicMock()
         MockService.return_value = mock_svc
-        mock_svc.process_step.return_value = MagicMock(
+        mock_svc.process_step_async = AsyncMock(return_value=MagicMock(
             next_turn={"message": "Correct!"},
             routing="Advance",
             last_grading=None,
-        )
+        ))
 
         resp = client.post(
             "/sessions/sess-123/step",
@@ -262,7 +280,7 @@ class TestSubmitStep:
 
         mock_svc = MagicMock()
         MockService.return_value = mock_svc
-        mock_svc.process_step.side_effect = RuntimeError("boom")
+        mock_svc.process_step_async = AsyncMock(side_effect=RuntimeError("boom"))
 
         resp = client.post(
             "/sessions/sess-123/step",
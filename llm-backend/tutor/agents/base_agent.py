@@ -6,8 +6,9 @@ LLMService from shared.services for LLM calls.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Dict, Tuple, Type, Optional, Union
+from typing import Any, AsyncGenerator, Dict, List, Tuple, Type, Optional, Union
 import json
+import re
 import time
 import asyncio
 import logging
@@ -22,74 +23,230 @@ from tutor.utils.schema_utils import get_strict_schema, validate_agent_output
 logger = logging.getLogger("tutor.agents")
 
 
-class ResponseFieldExtractor:
-    """Extracts the 'response' field value from streaming structured JSON.
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'[{}\[\]",]')
 
-    As JSON tokens arrive, detects the "response" key and streams its string
-    value character-by-character (handling JSON escape sequences).
+
+class StreamingFieldParser:
+    """Incremental parser for the top-level JSON object an agent streams.
+
+    `feed(chunk)` returns the events the chunk completes:
+
+    - ("text", str)            — decoded text of the `stream_field` string
+                                 value, as soon as it arrives
+    - ("field", (name, value)) — a top-level field whose value just closed,
+                                 already `json.loads`-ed
+
+    so callers can act on `audio_text`, `question_format`,
+    `visual_explanation` or `mastery_updates` before the model finishes.
+    Scanning jumps between structural characters with compiled regexes
+    rather than walking the text one character at a time, and consumed text
+    is dropped once per chunk. After a complete object `fields` holds every
+    top-level field (no second parse needed). Text before the first `{` (a
+    ```json fence or a preamble) is skipped; `failed` is set on malformed
+    input after that, and the parser then emits nothing further.
     """
 
-    TRIGGER = '"response"'
-
-    def __init__(self):
-        self._scan_buffer = ""
-        self._state = "scanning"  # scanning | found_key | in_value | done
-        self._escape_next = False
-        self._unicode_remaining = 0  # how many hex digits left to collect for \uXXXX
-        self._unicode_buf = ""
-
-    def feed(self, chunk: str) -> str:
-        """Feed a JSON chunk. Returns any extracted response text."""
-        if self._state == "done":
-            return ""
-
-        output = []
-        for char in chunk:
-            if self._state == "scanning":
-                self._scan_buffer += char
-                if len(self._scan_buffer) > 30:
-                    self._scan_buffer = self._scan_buffer[-20:]
-                if self._scan_buffer.endswith(self.TRIGGER):
-                    self._state = "found_key"
-                    self._scan_buffer = ""
-
-            elif self._state == "found_key":
-                self._scan_buffer += char
-                stripped = self._scan_buffer.lstrip()
-                if stripped.startswith(":"):
-                    after_colon = stripped[1:].lstrip()
-                    if after_colon.startswith('"'):
-                        self._state = "in_value"
-                        self._scan_buffer = ""
-
-            elif self._state == "in_value":
-                if self._unicode_remaining > 0:
-                    self._unicode_buf += char
-                    self._unicode_remaining -= 1
-                    if self._unicode_remaining == 0:
-                        try:
-                            output.append(chr(int(self._unicode_buf, 16)))
-                        except ValueError:
-                            output.append(self._unicode_buf)
-                        self._unicode_buf = ""
-                        self._escape_next = False
-                elif self._escape_next:
-                    if char == "u":
-                        self._unicode_remaining = 4
-                        self._unicode_buf = ""
-                    else:
-                        _ESC = {"n": "\n", "t": "\t", '"': '"', "\\": "\\", "r": "\r", "/": "/"}
-                        output.append(_ESC.get(char, char))
-                        self._escape_next = False
-                elif char == "\\":
-                    self._escape_next = True
-                elif char == '"':
-                    self._state = "done"
+    def __init__(self, stream_field: str = "response"):
+        self.stream_field = stream_field
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self.failed = False
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"  # start | key_or_end | key | colon | value_start | value | comma_or_end
+        self._key: Optional[str] = None
+        self._value_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._streaming = False  # inside the stream_field string value
+        self._emit_from = 0
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        if self.done or self.failed:
+            return []
+        self._buf += chunk
+        events: List[Tuple[str, Any]] = []
+        try:
+            self._advance(events)
+        except ValueError:
+            self.failed = True
+        self._compact()
+        return events
+
+    def _advance(self, events: List[Tuple[str, Any]]) -> None:
+        buf = self._buf
+        while not self.done:
+            if self._state == "value":
+                if not self._scan_value(events):
+                    return
+                continue
+
+            self._pos = _WHITESPACE.match(buf, self._pos).end()
+            if self._pos >= len(buf):
+                return
+            char = buf[self._pos]
+
+            if self._state == "start":
+                brace = buf.find("{", self._pos)
+                if brace < 0:
+                    self._pos = len(buf)
+                    return
+                self._pos = brace + 1
+                self._state = "key_or_end"
+            elif self._state in ("key_or_end", "key"):
+                if char == "}" and self._state == "key_or_end":
+                    self._pos += 1
+                    self.done = True
+                    return
+                if char != '"':
+                    raise ValueError("expected a key")
+                end = self._find_string_end(self._pos + 1)
+                if end is None:
+                    return
+                self._key = json.loads(buf[self._pos:end + 1])
+                self._pos = end + 1
+                self._state = "colon"
+            elif self._state == "colon":
+                if char != ":":
+                    raise ValueError("expected ':'")
+                self._pos += 1
+                self._state = "value_start"
+            elif self._state == "value_start":
+                self._value_start = self._pos
+                self._depth = 0
+                self._in_string = False
+                self._streaming = char == '"' and self._key == self.stream_field
+                self._emit_from = self._pos + 1
+                self._state = "value"
+            elif self._state == "comma_or_end":
+                self._pos += 1
+                if char == ",":
+                    self._state = "key"
+                elif char == "}":
+                    self.done = True
+                else:
+                    raise ValueError("expected ',' or '}'")
+
+    def _find_string_end(self, i: int) -> Optional[int]:
+        """Index of the quote closing a string whose body starts at `i`."""
+        buf = self._buf
+        while True:
+            m = _STRING_SPECIAL.search(buf, i)
+            if m is None:
+                return None
+            j = m.start()
+            if buf[j] == '"':
+                return j
+            if j + 1 >= len(buf):
+                return None
+            i = j + 2
+
+    def _scan_value(self, events: List[Tuple[str, Any]]) -> bool:
+        """Advance through the current top-level value; True once it closed."""
+        buf = self._buf
+        i = self._pos
+        end = None
+        while end is None:
+            if self._in_string:
+                m = _STRING_SPECIAL.search(buf, i)
+                if m is None:
+                    i = len(buf)
+                    break
+                j = m.start()
+                if buf[j] == "\\":
+                    escape_len = self._escape_length(j)
+                    if escape_len is None:
+                        i = j
+                        break
+                    i = j + escape_len
+                    continue
+                self._in_string = False
+                i = j + 1
+                if self._depth == 0:
+                    end = i
+            else:
+                m = _STRUCTURAL.search(buf, i)
+                if m is None:
+                    i = len(buf)
                     break
+                j = m.start()
+                char = buf[j]
+                if char == '"':
+                    self._in_string = True
+                    i = j + 1
+                elif char in "{[":
+                    self._depth += 1
+                    i = j + 1
+                elif char in "}]":
+                    if self._depth == 0:
+                        end = j  # closes the enclosing object; scalar ends here
+                    else:
+                        self._depth -= 1
+                        i = j + 1
+                        if self._depth == 0:
+                            end = i
+                elif self._depth == 0:  # ","
+                    end = j
                 else:
-                    output.append(char)
-
-        return "".join(output)
+                    i = j + 1
+
+        if self._streaming:
+            text_end = end - 1 if end is not None else i
+            if text_end > self._emit_from:
+                events.append(("text", _decode_json_string(buf[self._emit_from:text_end])))
+                self._emit_from = text_end
+
+        if end is None:
+            self._pos = i
+            return False
+        value = json.loads(buf[self._value_start:end])
+        self.fields[self._key] = value
+        events.append(("field", (self._key, value)))
+        self._streaming = False
+        self._pos = end
+        self._state = "comma_or_end"
+        return True
+
+    def _escape_length(self, j: int) -> Optional[int]:
+        """Length of the escape at `j`, or None if it is not fully buffered.
+
+        A high surrogate is held until its low-surrogate partner arrives so
+        an emoji is never emitted as two halves.
+        """
+        buf = self._buf
+        if j + 1 >= len(buf):
+            return None
+        if buf[j + 1] != "u":
+            return 2
+        if j + 6 > len(buf):
+            return None
+        if self._streaming and buf[j + 2] in "dD" and buf[j + 3] in "89abAB":
+            if j + 12 > len(buf):
+                return None
+            if buf[j + 6:j + 8] == "\\u":
+                return 12
+        return 6
+
+    def _compact(self) -> None:
+        """Drop text no longer needed (once per chunk, not per character)."""
+        keep = self._value_start if self._state == "value" else self._pos
+        if self._streaming:
+            keep = min(keep, self._emit_from)
+        if keep > 0:
+            self._buf = self._buf[keep:]
+            self._pos -= keep
+            self._value_start -= keep
+            self._emit_from -= keep
+
+
+def _decode_json_string(body: str) -> str:
+    """Decode the inside of a JSON string literal (no surrounding quotes)."""
+    try:
+        return json.loads(f'"{body}"')
+    except ValueError:
+        return body
 
 
 class AgentContext(BaseModel):
@@ -109,7 +266,9 @@ class BaseAgent(ABC):
     """
     Abstract base class for all specialist agents.
 
-    Uses the existing LLMService (OpenAI GPT-5.2) for structured output.
+    Uses the existing LLMService (OpenAI GPT-5.2) for structured output via
+    its native-async entry points (`acall`/`acall_fast`/`acall_stream`), so
+    agent calls never occupy a thread-pool slot.
     Provides logging, timeout handling, and output validation.
     """
 
@@ -155,21 +314,14 @@ class BaseAgent(ABC):
             output_model = self.get_output_model()
             schema = get_strict_schema(output_model)
 
-            loop = asyncio.get_event_loop()
             if self._use_fast_model:
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: self.llm.call_fast(prompt=prompt, json_mode=True),
-                )
+                result = await self.llm.acall_fast(prompt=prompt, json_mode=True)
             else:
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: self.llm.call(
-                        prompt=prompt,
-                        reasoning_effort=self._reasoning_effort,
-                        json_schema=schema,
-                        schema_name=output_model.__name__,
-                    ),
+                result = await self.llm.acall(
+                    prompt=prompt,
+                    reasoning_effort=self._reasoning_effort,
+                    json_schema=schema,
+                    schema_name=output_model.__name__,
                 )
 
             output_text = result.get("output_text", "{}")
@@ -219,8 +371,10 @@ class BaseAgent(ABC):
     ) -> AsyncGenerator[Tuple[str, Union[str, BaseModel]], None]:
         """Execute agent with streaming. Yields tuples:
 
-        - ("token", str)       — text chunk from the response field
-        - ("result", BaseModel) — final validated output (always last)
+        - ("token", str)                 — text chunk from the response field
+        - ("field", (name, value))       — a top-level output field, as soon
+                                            as its value has closed
+        - ("result", BaseModel)          — final validated output (always last)
         """
         start_time = time.time()
 
@@ -237,45 +391,32 @@ class BaseAgent(ABC):
             output_model = self.get_output_model()
             schema = get_strict_schema(output_model)
 
-            extractor = ResponseFieldExtractor()
+            parser = StreamingFieldParser()
             full_json_chunks: list[str] = []
-            queue: asyncio.Queue = asyncio.Queue()
-            loop = asyncio.get_event_loop()
 
-            def _stream_in_thread():
-                try:
-                    for chunk in self.llm.call_stream(
-                        prompt=prompt,
-                        reasoning_effort=self._reasoning_effort,
-                        json_schema=schema,
-                        schema_name=output_model.__name__,
-                    ):
-                        full_json_chunks.append(chunk)
-                        response_text = extractor.feed(chunk)
-                        if response_text:
-                            loop.call_soon_threadsafe(queue.put_nowait, ("token", response_text))
-                    loop.call_soon_threadsafe(queue.put_nowait, ("done", None))
-                except Exception as e:
-                    loop.call_soon_threadsafe(queue.put_nowait, ("error", e))
-
-            # Fire streaming in background thread
-            _future = loop.run_in_executor(None, _stream_in_thread)
-
-            while True:
-                msg_type, data = await queue.get()
-                if msg_type == "token":
-                    yield ("token", data)
-                elif msg_type == "done":
-                    break
-                elif msg_type == "error":
-                    raise AgentExecutionError(self.agent_name, str(data))
+            async for chunk in self.llm.acall_stream(
+                prompt=prompt,
+                reasoning_effort=self._reasoning_effort,
+                json_schema=schema,
+                schema_name=output_model.__name__,
+            ):
+                full_json_chunks.append(chunk)
+                for kind, payload in parser.feed(chunk):
+                    if kind == "text":
+                        if payload:
+                            yield ("token", payload)
+                    else:
+                        yield ("field", payload)
 
-            # Parse the complete JSON
-            complete_text = "".join(full_json_chunks)
-            try:
-                parsed = json.loads(complete_text)
-            except (json.JSONDecodeError, TypeError):
-                parsed = {}
+            # The parser already holds every field of a complete object;
+            # anything else goes through a full parse as before.
+            if parser.done:
+                parsed = parser.fields
+            else:
+                try:
+                    parsed = json.loads("".join(full_json_chunks))
+                except (json.JSONDecodeError, TypeError):
+                    parsed = {}
 
             validated = validate_agent_output(
                 output=parsed,
@@ -6,7 +6,6 @@ and returns both the student-facing response and structured state updates in
 one LLM call.
 """
 
-import asyncio
 import json
 import logging
 import time
@@ -15,6 +14,7 @@ from typing import Any, Dict, Literal, Optional, Type
 from pydantic import BaseModel, Field
 
 from tutor.agents.base_agent import BaseAgent, AgentContext
+from tutor.agents.system_prompt_cache import PROMPT_SEPARATOR, get_system_prompt_cache
 from tutor.models.session_state import SessionState
 from tutor.utils.schema_utils import get_strict_schema, validate_agent_output
 from tutor.prompts.master_tutor_prompts import (
@@ -209,6 +209,7 @@ class MasterTutorAgent(BaseAgent):
     def __init__(self, llm_service, timeout_seconds: int = 60, reasoning_effort: str = "none"):
         super().__init__(llm_service, timeout_seconds=timeout_seconds, reasoning_effort=reasoning_effort)
         self._session: Optional[SessionState] = None
+        self._last_system_prompt_cache_hit: Optional[bool] = None
 
     @property
     def agent_name(self) -> str:
@@ -220,10 +221,20 @@ class MasterTutorAgent(BaseAgent):
     def set_session(self, session: SessionState) -> None:
         self._session = session
 
+    def system_prompt_cache_metadata(self, session: SessionState) -> Dict[str, Any]:
+        """Agent-log metadata: whether the last prompt reused the cached system
+        prompt, plus the session's running hit/miss counts."""
+        stats = get_system_prompt_cache().session_stats(session.session_id)
+        return {
+            "system_prompt_cache_hit": self._last_system_prompt_cache_hit,
+            "system_prompt_cache_hits": stats["hits"],
+            "system_prompt_cache_misses": stats["misses"],
+        }
+
     async def generate_welcome(self, session: SessionState) -> TutorTurnOutput:
         system_prompt = self._build_system_prompt(session)
         welcome_prompt = self._build_welcome_prompt(session)
-        combined = f"{system_prompt}\n\n---\n\n{welcome_prompt}"
+        combined = f"{system_prompt}{PROMPT_SEPARATOR}{welcome_prompt}"
         output = await self._execute_with_prompt(combined)
         output.session_complete = False
         output.advance_to_step = None
@@ -233,7 +244,7 @@ class MasterTutorAgent(BaseAgent):
     async def generate_bridge(self, session: SessionState, bridge_type: str) -> TutorTurnOutput:
         system_prompt = self._build_system_prompt(session)
         bridge_prompt = self._build_bridge_prompt(session, bridge_type)
-        combined = f"{system_prompt}\n\n---\n\n{bridge_prompt}"
+        combined = f"{system_prompt}{PROMPT_SEPARATOR}{bridge_prompt}"
         output = await self._execute_with_prompt(combined)
         output.session_complete = False
         output.advance_to_step = None
@@ -278,7 +289,7 @@ class MasterTutorAgent(BaseAgent):
             previous_attempts_section=previous_attempts_section,
         )
 
-        combined = f"{system_prompt}\n\n---\n\n{simplify_prompt}"
+        combined = f"{system_prompt}{PROMPT_SEPARATOR}{simplify_prompt}"
 
         # Use structured output with SimplifiedCardOutput schema
         start_time = time.time()
@@ -287,15 +298,11 @@ class MasterTutorAgent(BaseAgent):
         output_model = SimplifiedCardOutput
         schema = get_strict_schema(output_model)
 
-        loop = asyncio.get_event_loop()
-        raw = await loop.run_in_executor(
-            None,
-            lambda: self.llm.call(
-                prompt=combined,
-                reasoning_effort=self._reasoning_effort,
-                json_schema=schema,
-                schema_name=output_model.__name__,
-            ),
+        raw = await self.llm.acall(
+            prompt=combined,
+            reasoning_effort=self._reasoning_effort,
+            json_schema=schema,
+            schema_name=output_model.__name__,
         )
 
         output_text = raw.get("output_text", "{}")
@@ -674,9 +681,21 @@ class MasterTutorAgent(BaseAgent):
         system_prompt = self._build_system_prompt(session)
         turn_prompt = self._build_turn_prompt(session, context)
 
-        return f"{system_prompt}\n\n---\n\n{turn_prompt}"
+        return f"{system_prompt}{PROMPT_SEPARATOR}{turn_prompt}"
 
     def _build_system_prompt(self, session: SessionState) -> str:
+        """The session's system prompt, byte-identical across turns until one
+        of its inputs changes (see tutor/agents/system_prompt_cache.py)."""
+        prompt, hit = get_system_prompt_cache().get(
+            session,
+            # The separator may only appear between system and turn prompt, or
+            # the Anthropic adapter would split inside profile / summary text.
+            lambda s: self._render_system_prompt(s).replace(PROMPT_SEPARATOR, "\n\n"),
+        )
+        self._last_system_prompt_cache_hit = hit
+        return prompt
+
+    def _render_system_prompt(self, session: SessionState) -> str:
         from tutor.prompts.language_utils import get_response_language_instruction, get_audio_language_instruction
 
         topic = session.topic
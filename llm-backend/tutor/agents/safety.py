@@ -3,14 +3,21 @@ Safety Agent - Content Moderation
 
 Fast safety gate that checks student messages before the master tutor runs.
 Includes a rule-based pre-filter that short-circuits obviously safe messages
-(~95% of kids' tutoring messages) without an LLM call.
+(~95% of kids' tutoring messages) without an LLM call, a lexicon tier and a
+process-wide verdict cache (tutor/agents/safety_classifier.py).
 """
 
+import logging
 import re
 from typing import Type, Optional
 from pydantic import BaseModel, Field
 
 from tutor.agents.base_agent import BaseAgent, AgentContext
+from tutor.agents.safety_classifier import (
+    SafetyVerdictCache,
+    get_local_safety_classifier,
+    get_safety_verdict_cache,
+)
 from tutor.prompts.templates import SAFETY_TEMPLATE
 
 
@@ -86,36 +93,60 @@ class SafetyAgent(BaseAgent):
         return SafetyOutput
 
     async def execute(self, context: AgentContext):
-        """Override to add allow-list pre-filter. Skips LLM only for provably safe messages.
+        """Override to add local pre-filters and a verdict cache in front of the LLM.
 
-        If the fast model (gpt-4o-mini) returns malformed output, fails safe
-        by treating the message as unsafe rather than crashing the turn.
+        Skips the LLM for provably safe messages, for messages made only of
+        known-safe vocabulary, and for messages whose verdict is already
+        cached. If the fast model (gpt-4o-mini) returns malformed output,
+        fails safe by treating the message as unsafe rather than crashing
+        the turn; that fallback is never cached.
         """
+        stats = get_safety_verdict_cache()
         if _is_provably_safe(context.student_message):
+            stats.record("allow_list")
             return SafetyOutput(
                 is_safe=True,
                 reasoning="Allow-list pre-filter: message is provably safe (math/short answer)",
             )
+        if get_local_safety_classifier().is_known_safe(context.student_message):
+            stats.record("lexicon")
+            return SafetyOutput(
+                is_safe=True,
+                reasoning="Lexicon pre-filter: every word is known-safe curriculum vocabulary",
+            )
+
+        key = SafetyVerdictCache.key(context.student_message, self._lesson_context(context))
+        cached = stats.get(key)
+        if cached is not None:
+            stats.record("cache")
+            return cached.model_copy()
+
         # LLM-based check with fail-safe fallback
         try:
-            return await super().execute(context)
+            output = await super().execute(context)
         except Exception as e:
-            import logging
             logging.getLogger("tutor.safety").warning(
                 f"Safety LLM check failed ({type(e).__name__}: {e}), failing safe"
             )
+            stats.record("llm", unsafe=True, failed=True)
             return SafetyOutput(
                 is_safe=False,
                 violation_type="safety_check_error",
                 guidance="Let's keep our conversation focused on learning. Could you rephrase that?",
                 reasoning=f"Safety check failed ({type(e).__name__}), failing safe",
             )
+        stats.record("llm", unsafe=not output.is_safe)
+        stats.put(key, output.model_copy())
+        return output
+
+    @staticmethod
+    def _lesson_context(context: AgentContext) -> str:
+        return context.additional_context.get("lesson_context", "tutoring session")
 
     def build_prompt(self, context: AgentContext) -> str:
-        additional = context.additional_context
         return SAFETY_TEMPLATE.render(
             message=context.student_message,
-            context=additional.get("lesson_context", "tutoring session"),
+            context=self._lesson_context(context),
         )
 
     def _summarize_output(self, output: SafetyOutput) -> dict:
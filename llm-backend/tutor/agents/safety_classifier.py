@@ -0,0 +1,215 @@
+"""
+Safety pre-classifier and verdict cache — keep the safety LLM off the
+critical path for messages that don't need it.
+
+`SafetyAgent.execute` consults, in order:
+
+1. `_is_provably_safe` (safety.py) — math, 1-2 characters, a handful of
+   known short answers.
+2. `LocalSafetyClassifier` — a short ASCII message that trips none of the
+   risk patterns and whose every word is in the known-safe lexicon
+   (`data/safety_lexicon.txt`, plus `safety_lexicon_extra_path`). It can
+   only ever say "safe"; anything it doesn't recognise goes to the LLM, so
+   it fails safe.
+3. `SafetyVerdictCache` — LLM verdicts keyed on the normalized message and
+   lesson context, shared by every session in the process. Fail-safe
+   verdicts from LLM errors are never cached.
+4. The LLM.
+
+`stats()` on the cache counts every tier; `GET /health/safety` serves it.
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+LEXICON_PATH = Path(__file__).parent / "data" / "safety_lexicon.txt"
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+_DIGIT_WORD = r"(?:zero|one|two|three|four|five|six|seven|eight|nine|\d)"
+
+# Anything matching these goes to the LLM regardless of the lexicon:
+# phone/ID-like digit runs (numerals, or four or more spelled-out digits
+# in a row), emails, links, and characters the lexicon can't vouch for.
+RISK_PATTERNS = (
+    re.compile(r"(?:\d[\s\-.]?){7,}"),
+    re.compile(rf"\b{_DIGIT_WORD}(?:[\s\-.,]+{_DIGIT_WORD}){{3,}}\b"),
+    re.compile(r"@"),
+    re.compile(r"https?:|www\.|\.(?:com|in|org|net)\b", re.IGNORECASE),
+    re.compile(r"[^a-z0-9\s\.,\?!'\+\-\*/=\(\)%]", re.IGNORECASE),
+)
+
+# Never treated as safe even if an extra lexicon lists them.
+DENY_WORDS = frozenset("""
+    address phone mobile whatsapp instagram email password otp
+    ignore instructions instruction prompt system pretend roleplay jailbreak
+    kill die dead death suicide hurt hate stupid dumb idiot shut
+""".split())
+
+
+def normalize_safety_input(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def load_lexicon(paths: Iterable[Path]) -> FrozenSet[str]:
+    """Words from one-word-or-more-per-line files; `#` starts a comment."""
+    words = set()
+    for path in paths:
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            words.update(line.split("#", 1)[0].lower().split())
+    return frozenset(words - DENY_WORDS)
+
+
+class LocalSafetyClassifier:
+    """Lexicon + regex tier. `is_known_safe` never returns a false "unsafe"."""
+
+    def __init__(self, lexicon: FrozenSet[str], max_words: int = 10, enabled: bool = True):
+        self.lexicon = lexicon
+        self.max_words = max_words
+        self.enabled = enabled
+
+    def is_known_safe(self, text: str) -> bool:
+        if not self.enabled:
+            return False
+        normalized = normalize_safety_input(text)
+        if not normalized.isascii():
+            return False
+        if any(pattern.search(normalized) for pattern in RISK_PATTERNS):
+            return False
+        words = _WORD_RE.findall(normalized.replace("'", ""))
+        if not words or len(words) > self.max_words:
+            return False
+        return all(word in self.lexicon for word in words)
+
+
+class SafetyVerdictCache:
+    """Process-wide LRU of LLM safety verdicts plus per-tier counters."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._verdicts: "OrderedDict[str, Any]" = OrderedDict()
+        self._requests = 0
+        self._allow_list_skips = 0
+        self._lexicon_skips = 0
+        self._cache_hits = 0
+        self._llm_calls = 0
+        self._llm_failures = 0
+        self._llm_unsafe = 0
+
+    @staticmethod
+    def key(message: str, context: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(context.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(normalize_safety_input(message).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is not None:
+                self._verdicts.move_to_end(key)
+            return verdict
+
+    def put(self, key: str, verdict: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.max_entries:
+                self._verdicts.popitem(last=False)
+
+    def record(self, tier: str, *, unsafe: bool = False, failed: bool = False) -> None:
+        """Count one check, by the tier that answered it.
+
+        tier: allow_list | lexicon | cache | llm. For `llm`, `unsafe` and
+        `failed` (fail-safe fallback after an LLM error) are also counted.
+        """
+        with self._lock:
+            self._requests += 1
+            if tier == "allow_list":
+                self._allow_list_skips += 1
+            elif tier == "lexicon":
+                self._lexicon_skips += 1
+            elif tier == "cache":
+                self._cache_hits += 1
+            else:
+                self._llm_calls += 1
+                self._llm_unsafe += int(unsafe)
+                self._llm_failures += int(failed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            avoided = self._allow_list_skips + self._lexicon_skips + self._cache_hits
+            return {
+                "requests": self._requests,
+                "allow_list_skips": self._allow_list_skips,
+                "lexicon_skips": self._lexicon_skips,
+                "cache_hits": self._cache_hits,
+                "llm_calls": self._llm_calls,
+                "llm_unsafe": self._llm_unsafe,
+                "llm_failures": self._llm_failures,
+                "skip_rate": round(avoided / self._requests, 4) if self._requests else 0.0,
+                "cached_verdicts": len(self._verdicts),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verdicts.clear()
+            self._requests = 0
+            self._allow_list_skips = 0
+            self._lexicon_skips = 0
+            self._cache_hits = 0
+            self._llm_calls = 0
+            self._llm_failures = 0
+            self._llm_unsafe = 0
+
+
+_local_classifier: Optional[LocalSafetyClassifier] = None
+_verdict_cache: Optional[SafetyVerdictCache] = None
+_singletons_lock = threading.Lock()
+
+
+def get_local_safety_classifier() -> LocalSafetyClassifier:
+    global _local_classifier
+    if _local_classifier is None:
+        with _singletons_lock:
+            if _local_classifier is None:
+                from config import get_settings
+                settings = get_settings()
+                paths = [LEXICON_PATH]
+                if settings.safety_lexicon_extra_path:
+                    paths.append(Path(settings.safety_lexicon_extra_path))
+                _local_classifier = LocalSafetyClassifier(
+                    load_lexicon(paths),
+                    max_words=settings.safety_lexicon_max_words,
+                    enabled=settings.safety_local_classifier_enabled,
+                )
+    return _local_classifier
+
+
+def get_safety_verdict_cache() -> SafetyVerdictCache:
+    global _verdict_cache
+    if _verdict_cache is None:
+        with _singletons_lock:
+            if _verdict_cache is None:
+                from config import get_settings
+                _verdict_cache = SafetyVerdictCache(
+                    max_entries=get_settings().safety_verdict_cache_max_entries,
+                )
+    return _verdict_cache
+
+
+def reset_safety_classifier() -> None:
+    """Drop the global classifier and verdict cache (useful for testing)."""
+    global _local_classifier, _verdict_cache
+    _local_classifier = None
+    _verdict_cache = None
@@ -0,0 +1,113 @@
+"""
+System prompt cache — one rendered system prompt per tutoring session.
+
+`MasterTutorAgent` sends `{system_prompt}\\n\\n---\\n\\n{turn_prompt}` on every
+call. The system half (study-plan steps, misconceptions, personalization,
+language instructions) depends only on the session's topic, student profile,
+mode and pre-computed explanation summary, which rarely change mid-session.
+Re-using the exact string keeps the prompt prefix byte-identical from turn to
+turn, which is what provider-side prompt caching keys on: the Anthropic
+adapter marks the part before the separator `cache_control`, and OpenAI
+caches stable prefixes automatically.
+
+The cache is process-wide because orchestrators (and so agents) are built
+per request / per WebSocket connection. Entries are keyed by session id and
+hold the fingerprint of the inputs they were rendered from; a different
+fingerprint re-renders and replaces the entry.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+from tutor.models.session_state import SessionState
+
+# Separator between the cacheable system prompt and the per-turn prompt.
+PROMPT_SEPARATOR = "\n\n---\n\n"
+
+# Sessions kept; least recently used entries are evicted beyond this.
+MAX_CACHED_SESSIONS = 1024
+
+
+def system_prompt_fingerprint(session: SessionState) -> str:
+    """Hash of every session field `_build_system_prompt` reads."""
+    digest = hashlib.sha256()
+    for part in (
+        session.mode,
+        session.topic.model_dump_json() if session.topic else "",
+        session.student_context.model_dump_json(),
+        session.precomputed_explanation_summary or "",
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class SystemPromptCache:
+    """Thread-safe, LRU-bounded session_id -> rendered system prompt cache."""
+
+    def __init__(self, max_sessions: int = MAX_CACHED_SESSIONS):
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        # session_id -> [fingerprint, prompt, hits, misses]
+        self._entries: "OrderedDict[str, list]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        session: SessionState,
+        render: Callable[[SessionState], str],
+    ) -> Tuple[str, bool]:
+        """Return (system_prompt, cache_hit), rendering on a miss."""
+        fingerprint = system_prompt_fingerprint(session)
+        session_id = session.session_id
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is not None and entry[0] == fingerprint:
+                entry[2] += 1
+                self._hits += 1
+                self._entries.move_to_end(session_id)
+                return entry[1], True
+
+        prompt = render(session)
+        with self._lock:
+            entry = self._entries.get(session_id)
+            hits, misses = (entry[2], entry[3]) if entry is not None else (0, 0)
+            self._entries[session_id] = [fingerprint, prompt, hits, misses + 1]
+            self._entries.move_to_end(session_id)
+            self._misses += 1
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+        return prompt, False
+
+    def session_stats(self, session_id: str) -> Dict[str, int]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return {"hits": 0, "misses": 0}
+            return {"hits": entry[2], "misses": entry[3]}
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "sessions": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "max_sessions": self.max_sessions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_system_prompt_cache = SystemPromptCache()
+
+
+def get_system_prompt_cache() -> SystemPromptCache:
+    """Get the process-wide system prompt cache."""
+    return _system_prompt_cache
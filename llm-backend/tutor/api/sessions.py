@@ -1,14 +1,14 @@
 """Session management API endpoints — REST + WebSocket."""
-import json
 import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session as DBSession
 from pydantic import BaseModel
 
-from database import get_db
+from database import get_async_db, get_db
 from shared.models import (
     CreateSessionRequest,
     CreateSessionResponse,
@@ -29,6 +29,10 @@ from shared.models.schemas import (
 from tutor.services import SessionService, ReportCardService
 from tutor.models.agent_logs import get_agent_log_store
 from tutor.models.session_state import SessionState
+from tutor.services.session_state_store import (
+    append_new_messages, dump_state_json, load_session_state, load_state_dict,
+    session_summary_columns, sync_student_progress,
+)
 from tutor.models.messages import (
     ClientMessage,
     SessionStateDTO,
@@ -306,7 +310,7 @@ def get_session_replay(
     if session.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not your session")
 
-    state = json.loads(session.state_json)
+    state = load_state_dict(db, session)
 
     # Compute canonical is_complete via SessionState.is_complete (single source
     # of truth). This gives the frontend a backend-authoritative completion flag
@@ -450,22 +454,25 @@ def record_card_progress(
 
 
 @router.post("/{session_id}/step", response_model=StepResponse)
-def submit_step(
+async def submit_step(
     session_id: str,
     request: StepRequest,
-    db: DBSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_optional_user),
 ):
-    """Submit a student answer and get the next turn."""
+    """Submit a student answer and get the next turn.
+
+    Runs on the event loop with DB work on the async pool, so a request
+    waiting on the tutor LLM holds no worker thread.
+    """
     try:
-        repo = SessionRepository(db)
-        session = repo.get_by_id(session_id)
+        session = await db.run_sync(lambda s: SessionRepository(s).get_by_id(session_id))
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         _check_session_ownership(session, current_user)
 
-        service = SessionService(db)
-        return service.process_step(session_id, request)
+        service = await db.run_sync(SessionService)
+        return await service.process_step_async(session_id, request)
     except HTTPException:
         raise
     except LearnLikeMagicException as e:
@@ -585,22 +592,24 @@ def card_action(
 
 
 @router.post("/{session_id}/simplify-card")
-def simplify_card(
+async def simplify_card(
     session_id: str,
     request: SimplifyCardRequest,
     current_user=Depends(get_optional_user),
-    db: DBSession = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Generate a simplified version of a specific explanation card."""
-    repo = SessionRepository(db)
-    session_row = repo.get_by_id(session_id)
+    """Generate a simplified version of a specific explanation card.
+
+    Async like `submit_step`: the LLM call runs on the event loop.
+    """
+    session_row = await db.run_sync(lambda s: SessionRepository(s).get_by_id(session_id))
     if not session_row:
         raise HTTPException(status_code=404, detail="Session not found")
     _check_session_ownership(session_row, current_user)
 
     try:
-        service = SessionService(db)
-        return service.simplify_card(session_id, request.card_idx, request.reason)
+        service = await db.run_sync(SessionService)
+        return await service.simplify_card_async(session_id, request.card_idx, request.reason)
     except HTTPException:
         raise
     except LearnLikeMagicException as e:
@@ -649,7 +658,7 @@ def get_session_state(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     _check_session_ownership(session, current_user)
-    return json.loads(session.state_json)
+    return load_state_dict(db, session)
 
 
 # ──────────────────────────────────────────────
@@ -739,17 +748,19 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     For user-linked sessions, the token must belong to the session owner.
     Anonymous sessions (user_id=None) are allowed without a token for backward compat.
     """
-    from database import get_db_manager
+    from database import get_async_db_manager
     from auth.middleware.auth_middleware import _verify_cognito_token
     from auth.repositories.user_repository import UserRepository
 
-    db_manager = get_db_manager()
-    db = db_manager.session_factory()
+    # All DB work goes through the async (asyncpg) pool in short scopes, so
+    # a slow query or commit never blocks the other sockets on this worker
+    # and an idle socket holds no connection.
+    db_manager = get_async_db_manager()
 
     try:
         # 1. Look up session
-        repo = SessionRepository(db)
-        db_session = repo.get_by_id(session_id)
+        async with db_manager.session_factory() as db:
+            db_session = await db.run_sync(lambda s: SessionRepository(s).get_by_id(session_id))
         if not db_session:
             await websocket.close(code=4004, reason="Session not found")
             return
@@ -763,8 +774,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             try:
                 claims = await _verify_cognito_token(token, expected_token_use="access")
                 cognito_sub = claims.get("sub")
-                user_repo = UserRepository(db)
-                user = user_repo.get_by_cognito_sub(cognito_sub) if cognito_sub else None
+                user = None
+                if cognito_sub:
+                    async with db_manager.session_factory() as db:
+                        user = await db.run_sync(lambda s: UserRepository(s).get_by_cognito_sub(cognito_sub))
                 if not user or user.id != db_session.user_id:
                     await websocket.close(code=4003, reason="Not your session")
                     return
@@ -776,27 +789,22 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
         await websocket.accept()
         logger.info(f"WebSocket connected: {session_id}")
 
-        session = SessionState.model_validate_json(db_session.state_json)
-        ws_version = db_session.state_version or 1
-
         # Build orchestrator — read LLM config from DB (once at session start)
-        from config import get_settings
-        from shared.services.llm_service import LLMService
+        # and reuse the process-wide client bundle for it (warm connections).
+        from shared.services.llm_client_registry import get_shared_llm_service
         from shared.services.llm_config_service import LLMConfigService
         from shared.services.feature_flag_service import FeatureFlagService
         from tutor.orchestration import TeacherOrchestrator
 
-        settings = get_settings()
-        tutor_config = LLMConfigService(db).get_config("tutor")
-        llm_service = LLMService(
-            api_key=settings.openai_api_key,
-            provider=tutor_config["provider"],
-            model_id=tutor_config["model_id"],
-            reasoning_effort=tutor_config["reasoning_effort"],
-            gemini_api_key=settings.gemini_api_key if settings.gemini_api_key else None,
-            anthropic_api_key=settings.anthropic_api_key if settings.anthropic_api_key else None,
-        )
-        visuals_enabled = FeatureFlagService(db).is_enabled("show_visuals_in_tutor_flow")
+        async with db_manager.session_factory() as db:
+            session = await db.run_sync(load_session_state, db_session)
+            tutor_config = await db.run_sync(lambda s: LLMConfigService(s).get_config("tutor"))
+            visuals_enabled = await db.run_sync(
+                lambda s: FeatureFlagService(s).is_enabled("show_visuals_in_tutor_flow")
+            )
+        ws_version = db_session.state_version or 1
+
+        llm_service = get_shared_llm_service(tutor_config)
         orchestrator = TeacherOrchestrator(llm_service, visuals_enabled=visuals_enabled)
 
         # Send initial state
@@ -821,7 +829,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             from tutor.models.messages import create_teacher_message
 
             session.add_message(create_teacher_message(welcome, audio_text=audio_text))
-            ws_version, reloaded = _save_session_to_db(db, session_id, session, ws_version)
+            ws_version, reloaded = await _save_session_to_db_async(session_id, session, ws_version)
             if reloaded:
                 session = reloaded
             await websocket.send_json(create_assistant_response(welcome, audio_text=audio_text).model_dump())
@@ -843,7 +851,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 if session.is_in_card_phase() and session.card_phase:
                     card_idx = client_msg.payload.card_idx if client_msg.payload.card_idx is not None else 0
                     session.card_phase.current_card_idx = card_idx
-                    ws_version, reloaded = _save_session_to_db(db, session_id, session, ws_version)
+                    ws_version, reloaded = await _save_session_to_db_async(session_id, session, ws_version)
                     if reloaded:
                         session = reloaded
                 continue
@@ -867,7 +875,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 except (WebSocketDisconnect, Exception) as stream_err:
                     # Connection lost mid-stream — still persist state so the turn isn't lost
                     logger.warning(f"WS send failed mid-stream for {session_id}: {stream_err}")
-                    _save_session_to_db(db, session_id, session, ws_version)
+                    await _save_session_to_db_async(session_id, session, ws_version)
                     raise
 
                 if turn_result is None:
@@ -879,7 +887,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
 
                 result = turn_result
 
-                ws_version, reloaded = _save_session_to_db(db, session_id, session, ws_version)
+                ws_version, reloaded = await _save_session_to_db_async(session_id, session, ws_version)
                 if reloaded:
                     # CAS conflict: a REST endpoint (pause/end-clarify) modified
                     # the session concurrently. The turn's state changes are
@@ -947,8 +955,18 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             await websocket.send_json(create_error_response(f"Server error: {e}").model_dump())
         except Exception:
             pass
-    finally:
-        db.close()
+
+
+async def _save_session_to_db_async(
+    session_id: str,
+    session: SessionState,
+    expected_version: int,
+) -> tuple[int, Optional[SessionState]]:
+    """`_save_session_to_db` on the async pool, in its own short session."""
+    from database import get_async_db_manager
+
+    async with get_async_db_manager().session_factory() as db:
+        return await db.run_sync(_save_session_to_db, session_id, session, expected_version)
 
 
 def _save_session_to_db(
@@ -975,13 +993,14 @@ def _save_session_to_db(
             SessionModel.state_version == expected_version,
         )
         .values(
-            state_json=session.model_dump_json(),
+            state_json=dump_state_json(session),
             mastery=session.overall_mastery,
             step_idx=session.current_step,
             state_version=expected_version + 1,
             mode=session.mode,
             is_paused=session.is_paused if session.mode == "teach_me" else False,
             updated_at=datetime.utcnow(),
+            **session_summary_columns(session),
         )
     )
     if result.rowcount == 0:
@@ -993,7 +1012,9 @@ def _save_session_to_db(
                 f"WS version conflict for session {session_id}: "
                 f"expected v{expected_version}, DB at v{db_version}. Reloading."
             )
-            return db_version, SessionState.model_validate_json(db_record.state_json)
+            return db_version, load_session_state(db, db_record)
         return expected_version, None
+    append_new_messages(db, session_id, session)
     db.commit()
+    sync_student_progress(db, session_id, session)
     return expected_version + 1, None
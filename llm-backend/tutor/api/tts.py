@@ -11,6 +11,12 @@ Latency caveat (plan §runtime TTS): EL from us-east-1 → India is ~500ms vs
 Google's ~200ms. Personalized cards can't be prefetched (need student name
 at session start). Accepted: ~5% of cards have `{student_name}`, the
 pedagogical tone of personalized openers benefits from the warm voice.
+
+Repeated text is served from `shared.services.tts_audio_cache` (memory LRU
++ S3), keyed by provider, voice role, voice/model settings and normalized
+text; the `X-TTS-Cache` response header says which tier answered. Requests
+flagged `personalized` (text with the student's name substituted in) skip
+the S3 tier, so no student's name is persisted as audio.
 """
 
 import asyncio
@@ -41,6 +47,7 @@ from book_ingestion_v2.services.audio_generation_service import (
 )
 from config import get_settings
 from database import get_db
+from shared.services.tts_audio_cache import get_tts_audio_cache, tts_cache_key
 from shared.services.tts_config_service import resolve_tts_provider
 
 logger = logging.getLogger(__name__)
@@ -81,6 +88,26 @@ class TTSRequest(BaseModel):
     # Baatcheet uses "peer" for Meera's lines; everything else falls through
     # to the tutor voice.
     voice_role: Literal["tutor", "peer"] = "tutor"
+    # Text carries student-specific content (e.g. a substituted
+    # `{student_name}`); cached in process memory only, never in S3.
+    personalized: bool = False
+
+
+def _voice_spec(provider: str, voice_role: str) -> dict:
+    """Provider settings that shape the audio — part of the cache key.
+
+    Keep in sync with `_synth_google` / `_synth_elevenlabs`: anything they
+    send besides the text must appear here, or a settings change would keep
+    serving audio made with the old settings.
+    """
+    if provider == "elevenlabs":
+        return {
+            "voice_id": EL_PEER_VOICE_ID if voice_role == "peer" else EL_TUTOR_VOICE_ID,
+            "model_id": EL_MODEL_ID,
+            "voice_settings": EL_VOICE_SETTINGS_STEADY,
+        }
+    lang_code, voice_name = PEER_VOICE if voice_role == "peer" else TUTOR_VOICE
+    return {"language_code": lang_code, "voice_name": voice_name, "encoding": "MP3"}
 
 
 def _synth_google(text: str, voice_role: str) -> bytes:
@@ -179,34 +206,38 @@ async def text_to_speech(
 ):
     """Convert text to speech via the configured TTS provider.
 
-    Provider resolves admin DB row → env → default on every call so the
-    admin toggle takes effect for the next request without a redeploy.
-    The DB lookup is one indexed primary-key read, negligible vs the
-    synthesis call itself.
+    Provider resolves admin DB row → env → default on every call, read
+    through `shared.services.config_cache`: the row comes from process
+    memory, and an admin toggle is picked up within
+    `config_cache_ttl_seconds` without a redeploy.
     """
     provider = resolve_tts_provider(db)
     text = normalize_tts_text(request.text)
 
     try:
         if provider == "elevenlabs":
-            audio_bytes = await asyncio.to_thread(
-                _synth_elevenlabs, text, request.voice_role,
-            )
+            synth = _synth_elevenlabs
         elif provider == "google_tts":
-            audio_bytes = await asyncio.to_thread(
-                _synth_google, text, request.voice_role,
-            )
+            synth = _synth_google
         else:
             raise HTTPException(
                 status_code=500,
                 detail=f"Unknown tts_provider {provider!r}",
             )
 
+        key = tts_cache_key(
+            provider, request.voice_role, _voice_spec(provider, request.voice_role), text,
+        )
+        audio_bytes, source = await get_tts_audio_cache().get_or_synthesize(
+            key, lambda: asyncio.to_thread(synth, text, request.voice_role),
+            use_s3=not request.personalized,
+        )
+
         audio_stream = io.BytesIO(audio_bytes)
         return StreamingResponse(
             audio_stream,
             media_type="audio/mpeg",
-            headers={"Content-Disposition": "inline"},
+            headers={"Content-Disposition": "inline", "X-TTS-Cache": source},
         )
     except HTTPException:
         raise
@@ -6,7 +6,7 @@ Complete session state model that tracks all aspects of a tutoring session.
 
 from datetime import datetime
 from typing import Literal, Optional, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 import uuid
 
 from tutor.models.messages import Message, StudentContext
@@ -243,6 +243,14 @@ class SessionState(BaseModel):
     conversation_history: list[Message] = Field(default_factory=list)
     full_conversation_log: list[Message] = Field(default_factory=list)
 
+    # How many full_conversation_log entries are already in session_messages
+    # (None = unknown). Maintained by tutor.services.session_state_store;
+    # never serialized.
+    _persisted_log_length: Optional[int] = PrivateAttr(default=None)
+    # Report-card inputs as of the last load/save (None = unknown), so saves
+    # that don't change them skip the student_topic_progress refresh.
+    _progress_fields: Optional[tuple] = PrivateAttr(default=None)
+
     @field_validator("concepts_covered_set", "card_covered_concepts", mode="before")
     @classmethod
     def _coerce_to_set(cls, v):
@@ -5,9 +5,11 @@ Simplified architecture: Safety check -> Master Tutor -> State update.
 The master tutor handles all teaching responsibilities in a single LLM call.
 """
 
+import json
 import re
 import time
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncGenerator, Dict, Any, Optional, List, Tuple, Union
 from pydantic import BaseModel, Field
@@ -18,12 +20,21 @@ from tutor.models.messages import create_teacher_message, create_student_message
 from tutor.models.agent_logs import AgentLogEntry, get_agent_log_store
 from tutor.agents.base_agent import AgentContext
 from tutor.agents.safety import SafetyAgent, SafetyOutput
-from tutor.agents.master_tutor import MasterTutorAgent, TutorTurnOutput
+from tutor.agents.master_tutor import MasterTutorAgent, TutorTurnOutput, VisualExplanation
 from tutor.prompts.orchestrator_prompts import WELCOME_MESSAGE_PROMPT
 from tutor.services.pixi_code_generator import PixiCodeGenerator
+from tutor.services.translation_cache import get_translation_cache
 
 logger = logging.getLogger("tutor.orchestrator")
 
+# Tutor output fields whose arrival time mid-stream is logged per turn.
+EARLY_STREAM_FIELDS = ("audio_text", "question_format", "visual_explanation", "mastery_updates")
+
+
+@lru_cache(maxsize=1)
+def _translation_prompt() -> str:
+    return (Path(__file__).parent.parent / "prompts" / "translation.txt").read_text()
+
 
 class TurnResult(BaseModel):
     """Result of processing a turn."""
@@ -84,6 +95,13 @@ class TeacherOrchestrator:
             logger.error(f"Pixi code generation crashed — skipping visual: {e}", exc_info=True)
             return None
 
+    async def _timed_pixi_code(
+        self, visual_explanation: VisualExplanation, clock_start: float,
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
+        """`_generate_pixi_code` plus when it finished (ms since `clock_start`)."""
+        visual_dict = await self._generate_pixi_code(visual_explanation)
+        return visual_dict, int((time.time() - clock_start) * 1000)
+
     def _log_agent_event(
         self,
         session_id: str,
@@ -117,35 +135,27 @@ class TeacherOrchestrator:
         """Translate Hinglish/Hindi student input to English.
 
         Uses gpt-4o-mini for speed (~200-500ms vs 2-5s with main model).
-        Skips only for trivially non-translatable input (empty, pure numbers).
-        Does NOT skip for ASCII text since Roman-script Hinglish is all-ASCII
-        but still needs translation.
+        Empty / pure-number input and messages the local detector finds
+        clearly English skip the call; repeated messages are served from
+        the translation cache. Roman-script Hinglish is all-ASCII, so ASCII
+        alone is not treated as English.
         """
-        # Skip only for empty or pure-number input
-        stripped = text.strip()
-        if not stripped or all(c.isdigit() or c in ' +-*/=.,()%^' for c in stripped):
-            return text
-
-        _translation_prompt = (Path(__file__).parent.parent / "prompts" / "translation.txt").read_text()
-        prompt = _translation_prompt.format(text=text)
+        async def _call_llm() -> Optional[str]:
+            result = await self.llm.acall_fast(
+                prompt=_translation_prompt().format(text=text), json_mode=True,
+            )
+            raw = result.get("output_text", "")
+            try:
+                parsed = json.loads(raw) if isinstance(raw, str) else raw
+                english = parsed.get("english")
+            except (json.JSONDecodeError, AttributeError):
+                return None
+            return english.strip() if isinstance(english, str) else None
 
-        import asyncio
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: self.llm.call_fast(
-                prompt=prompt,
-                json_mode=True,
-            ),
+        english, _ = await get_translation_cache().translate(
+            text, _translation_prompt(), _call_llm,
         )
-
-        import json
-        raw = result.get("output_text", "")
-        try:
-            parsed = json.loads(raw) if isinstance(raw, str) else raw
-            return parsed.get("english", text).strip()
-        except (json.JSONDecodeError, AttributeError):
-            return text
+        return english
 
     async def process_turn(
         self,
@@ -283,6 +293,7 @@ class TeacherOrchestrator:
                     "advance_to_step": tutor_output.advance_to_step,
                     "question_asked": tutor_output.question_asked is not None,
                     "session_complete": tutor_output.session_complete,
+                    **self.master_tutor.system_prompt_cache_metadata(session),
                 },
             )
 
@@ -361,13 +372,19 @@ class TeacherOrchestrator:
         """Process a turn with streaming. Yields tuples:
 
         - ("token", str)         — text chunk for the student-facing response
-        - ("result", TurnResult) — final result with state updates applied (always last)
+        - ("result", TurnResult) — final result with state updates applied
+        - ("visual", dict)       — Pixi visual for the teach_me stream, after the result
+
+        Pixi code generation starts as soon as `visual_explanation` closes in
+        the tutor's stream, overlapping the rest of the tutor output, and is
+        cancelled if the final validated output no longer carries that visual.
 
         Non-streamable modes (clarify_doubts, post-completion) fall back to process_turn.
         """
         start_time = time.time()
         turn_id = session.get_current_turn_id()
         import asyncio
+        pixi_task: Optional[asyncio.Task] = None
 
         # --- Pre-streaming checks ---
 
@@ -471,10 +488,25 @@ class TeacherOrchestrator:
             tutor_start = time.time()
             self.master_tutor.set_session(session)
             tutor_output = None
+            fields_ready_ms: Dict[str, int] = {}
+            speculative_visual: Optional[VisualExplanation] = None
 
             async for msg_type, data in self.master_tutor.execute_stream(context):
                 if msg_type == "token":
                     yield ("token", data)
+                elif msg_type == "field":
+                    name, value = data
+                    if name in EARLY_STREAM_FIELDS:
+                        fields_ready_ms[name] = int((time.time() - tutor_start) * 1000)
+                    if name == "visual_explanation" and value and self.visuals_enabled:
+                        try:
+                            speculative_visual = VisualExplanation.model_validate(value)
+                        except ValueError:
+                            speculative_visual = None
+                        else:
+                            pixi_task = asyncio.create_task(
+                                self._timed_pixi_code(speculative_visual, tutor_start)
+                            )
                 elif msg_type == "result":
                     tutor_output = data
 
@@ -496,6 +528,8 @@ class TeacherOrchestrator:
                     "question_asked": tutor_output.question_asked is not None,
                     "session_complete": tutor_output.session_complete,
                     "streamed": True,
+                    "fields_ready_ms": fields_ready_ms,
+                    **self.master_tutor.system_prompt_cache_metadata(session),
                 },
             )
 
@@ -549,9 +583,44 @@ class TeacherOrchestrator:
                 question_format=tutor_output.question_format.model_dump() if tutor_output.question_format else None,
             ))
 
-            # Generate Pixi code in a separate step and yield as a "visual" message
-            if tutor_output.visual_explanation:
-                visual_dict = await self._generate_pixi_code(tutor_output.visual_explanation)
+            # Pixi code was (usually) started mid-stream; drop it if the
+            # validated output changed or removed the visual, otherwise wait
+            # for it and yield it as a "visual" message.
+            final_visual = tutor_output.visual_explanation
+            speculative = pixi_task is not None
+            if pixi_task is not None and final_visual != speculative_visual:
+                pixi_task.cancel()
+                pixi_task = None
+                self._log_agent_event(
+                    session_id=session.session_id,
+                    turn_id=turn_id,
+                    agent_name="pixi_generator",
+                    event_type="cancelled",
+                    metadata={"speculative": True, "visual_dropped": final_visual is None},
+                )
+            if final_visual and pixi_task is None and self.visuals_enabled:
+                speculative = False
+                pixi_task = asyncio.create_task(self._timed_pixi_code(final_visual, tutor_start))
+
+            if pixi_task is not None:
+                pixi_started_ms = fields_ready_ms.get("visual_explanation", tutor_duration) if speculative else tutor_duration
+                visual_dict, pixi_finished_ms = await pixi_task
+                pixi_task = None
+                self._log_agent_event(
+                    session_id=session.session_id,
+                    turn_id=turn_id,
+                    agent_name="pixi_generator",
+                    event_type="completed",
+                    duration_ms=pixi_finished_ms - pixi_started_ms,
+                    metadata={
+                        "speculative": speculative,
+                        "success": visual_dict is not None,
+                        "started_ms": pixi_started_ms,
+                        "tutor_done_ms": tutor_duration,
+                        "finished_ms": pixi_finished_ms,
+                        "overlap_ms": max(0, min(tutor_duration, pixi_finished_ms) - pixi_started_ms),
+                    },
+                )
                 if visual_dict:
                     yield ("visual", visual_dict)
 
@@ -567,6 +636,11 @@ class TeacherOrchestrator:
                 specialists_called=[],
                 state_changed=False,
             ))
+        finally:
+            # Turn failed or the consumer went away before the visual was
+            # collected — don't leave the Pixi call running.
+            if pixi_task is not None and not pixi_task.done():
+                pixi_task.cancel()
 
     async def _process_post_completion(self, session: SessionState, student_message: str) -> TurnResult:
         """Handle post-completion messages (shared by process_turn and process_turn_stream)."""
@@ -599,15 +673,10 @@ class TeacherOrchestrator:
             f"Keep it to 1-2 sentences. Speak directly to the student (use 'you')."
         )
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self.llm.call(
-                    prompt=prompt,
-                    reasoning_effort="none",
-                    json_mode=False,
-                ),
+            result = await self.llm.acall(
+                prompt=prompt,
+                reasoning_effort="none",
+                json_mode=False,
             )
             return result.get("output_text", "").strip() or "Feel free to start a new session whenever you're ready!"
         except Exception as e:
@@ -854,7 +923,11 @@ class TeacherOrchestrator:
             output=self._extract_output_dict(tutor_output),
             reasoning=tutor_output.reasoning,
             duration_ms=tutor_duration,
-            metadata={"mode": "clarify_doubts", "intent": tutor_output.intent},
+            metadata={
+                "mode": "clarify_doubts",
+                "intent": tutor_output.intent,
+                **self.master_tutor.system_prompt_cache_metadata(session),
+            },
         )
 
         # Track concepts discussed (from mastery_updates or turn summary)
@@ -953,15 +1026,10 @@ class TeacherOrchestrator:
         elif session.student_context.student_name:
             prompt += f"\n\nThe student's name is {session.student_context.student_name}. Address them by name."
 
-        import asyncio
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: self.llm.call(
-                prompt=prompt,
-                reasoning_effort="none",
-                json_mode=True,
-            ),
+        result = await self.llm.acall(
+            prompt=prompt,
+            reasoning_effort="none",
+            json_mode=True,
         )
 
         return self._parse_welcome_result(result, "Welcome! Let's start learning.")
@@ -1001,12 +1069,7 @@ class TeacherOrchestrator:
         elif session.student_context.student_name:
             prompt += f"\n\nThe student's name is {session.student_context.student_name}. Address them by name."
 
-        import asyncio
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: self.llm.call(prompt=prompt, reasoning_effort="none", json_mode=True),
-        )
+        result = await self.llm.acall(prompt=prompt, reasoning_effort="none", json_mode=True)
         return self._parse_welcome_result(result, f"Hi! I'm here to help with {topic_name}. What questions do you have?")
 
     async def generate_tutor_welcome(self, session: SessionState) -> tuple[str, Optional[str]]:
@@ -6,7 +6,6 @@ using an LLM (GPT Codex). Used by the orchestrator to generate visuals for
 the tutor's visual_explanation prompts.
 """
 
-import asyncio
 import logging
 
 from shared.services.llm_service import LLMService, LLMServiceError
@@ -67,8 +66,7 @@ class PixiCodeGenerator:
                 + "\nIf OUTPUT_TYPE is \"image\", create a static diagram/illustration."
                 + f"\n\nVISUAL DESCRIPTION:\n{visual_prompt}"
             )
-            result = await asyncio.to_thread(
-                self.llm.call,
+            result = await self.llm.acall(
                 prompt=prompt,
                 reasoning_effort="none",
                 json_mode=False,
@@ -8,7 +8,8 @@ Pipeline per attempt:
        - Free-form: enqueue an LLM grading task (fractional 0-1 + rationale).
   3. Run all LLM tasks in parallel via ThreadPoolExecutor(max_workers=10).
   4. Assemble grading_json + half-point-rounded total_score; save.
-  Any unhandled error → mark_grading_failed(error).
+  5. Refresh the student's report-card row for the guideline.
+  Any unhandled error in 1-4 → mark_grading_failed(error).
 
 Runs with the `practice_grader` LLM config (openai/gpt-4o-mini,
 reasoning_effort=none). LLMService's built-in retry handles rate limits /
@@ -24,6 +25,7 @@ from sqlalchemy.orm import Session as DBSession
 
 from shared.repositories.practice_attempt_repository import PracticeAttemptRepository
 from shared.services.llm_service import LLMService
+from shared.utils.strict_schema import get_strict_schema
 from tutor.prompts.practice_grading import (
     FREE_FORM_GRADING_PROMPT,
     PER_PICK_RATIONALE_PROMPT,
@@ -58,12 +60,8 @@ class PracticeGradingService:
         self.llm = llm_service
         self.attempt_repo = PracticeAttemptRepository(db)
 
-        self._ff_schema = LLMService.make_schema_strict(
-            FreeFormGradingOutput.model_json_schema()
-        )
-        self._rationale_schema = LLMService.make_schema_strict(
-            PickRationaleOutput.model_json_schema()
-        )
+        self._ff_schema = get_strict_schema(FreeFormGradingOutput)
+        self._rationale_schema = get_strict_schema(PickRationaleOutput)
 
     # ─── Entry point ──────────────────────────────────────────────────────
 
@@ -147,6 +145,7 @@ class PracticeGradingService:
                 f"Graded attempt {attempt_id}: score={total_score}/"
                 f"{attempt.total_possible}, ff={len(ff_tasks)}, wrong={len(pick_tasks)}"
             )
+            self._refresh_report_card(attempt.user_id, attempt.guideline_id)
 
         except Exception as e:
             logger.exception(f"Grading failed for attempt {attempt_id}")
@@ -157,6 +156,22 @@ class PracticeGradingService:
                     f"Failed to mark attempt {attempt_id} as grading_failed"
                 )
 
+    def _refresh_report_card(self, user_id: str, guideline_id: str) -> None:
+        """Bring the materialized report-card row up to date. A failure here
+        must not mark a successfully graded attempt as failed — the row is
+        rebuilt by `db.py --rebuild-report-cards` in the worst case."""
+        from tutor.services.report_card_service import ReportCardService
+
+        try:
+            if ReportCardService(self.db).refresh_topic(user_id, guideline_id):
+                self.db.commit()
+        except Exception:
+            logger.warning(
+                f"Report card refresh failed for user={user_id} guideline={guideline_id}",
+                exc_info=True,
+            )
+            self.db.rollback()
+
     # ─── Deterministic structured grading ─────────────────────────────────
 
     def _check_structured(self, q: dict, student_answer: Any) -> bool:
@@ -14,8 +14,9 @@ State machine (per attempt):
 Concurrent-tab start race is handled in start_or_resume via IntegrityError
 catch on the partial unique index — the losing caller re-reads the winner.
 
-Silent grading-thread death is NOT mitigated in v1 per locked-decisions.
-A 5-minute sweeper is post-v1 cleanup.
+Grading runs on a daemon thread by default; silent thread death there is
+not mitigated. With `background_jobs_backend = "queue"` it runs on the
+durable job queue instead, which retries a lost or crashed grading job.
 """
 import logging
 import random
@@ -30,6 +31,7 @@ from sqlalchemy.orm.attributes import flag_modified
 from shared.models.entities import PracticeAttempt, PracticeQuestion
 from shared.repositories.practice_attempt_repository import PracticeAttemptRepository
 from shared.repositories.practice_question_repository import PracticeQuestionRepository
+from shared.services.job_queue import PRACTICE_GRADING_QUEUE, enqueue_job, job_task, use_job_queue
 from tutor.models.practice import (
     Attempt,
     AttemptQuestion,
@@ -460,40 +462,51 @@ class PracticeService:
         return attempt
 
     def _spawn_grading_worker(self, attempt_id: str) -> None:
-        """Spawn a daemon thread running PracticeGradingService.grade_attempt.
+        """Start grading off the request: on the durable job queue when
+        `background_jobs_backend = "queue"`, else on a daemon thread.
 
-        Must use a fresh DB session — the current one belongs to the request.
-        The grader's LLMService is built from the `practice_grader` config
-        with `initial_retry_delay=10` to get the 10/20/40s backoff the plan
-        mandates.
+        Either way grading runs on a fresh DB session — the current one
+        belongs to the request.
         """
-        def _run():
-            from database import get_db_manager
-            from config import get_settings
-            from shared.services.llm_config_service import LLMConfigService
-            from shared.services.llm_service import LLMService
-            from tutor.services.practice_grading_service import PracticeGradingService
+        if use_job_queue():
+            enqueue_job(GRADING_JOB_TASK, attempt_id, entity_id=attempt_id)
+            return
 
-            db = get_db_manager().get_session()
+        def _run():
             try:
-                settings = get_settings()
-                config = LLMConfigService(db).get_config("practice_grader")
-                llm = LLMService(
-                    api_key=settings.openai_api_key,
-                    provider=config["provider"],
-                    model_id=config["model_id"],
-                    reasoning_effort=config["reasoning_effort"],
-                    gemini_api_key=settings.gemini_api_key if settings.gemini_api_key else None,
-                    anthropic_api_key=settings.anthropic_api_key if settings.anthropic_api_key else None,
-                    initial_retry_delay=10,
-                )
-                PracticeGradingService(db, llm).grade_attempt(attempt_id)
+                run_grading_job(attempt_id)
             except Exception:
                 logger.exception(f"Grading worker crashed for attempt {attempt_id}")
-            finally:
-                try:
-                    db.close()
-                except Exception:
-                    pass
 
         threading.Thread(target=_run, daemon=True).start()
+
+
+GRADING_JOB_TASK = "practice_grading"
+
+
+@job_task(GRADING_JOB_TASK, PRACTICE_GRADING_QUEUE)
+def run_grading_job(attempt_id: str) -> None:
+    """Grade one submitted attempt (queue task / thread body).
+
+    The grader's LLMService is built from the `practice_grader` config with
+    `initial_retry_delay=10` to get the 10/20/40s backoff the plan mandates.
+    Grading failures mark the attempt `grading_failed` inside
+    `grade_attempt`; anything raised here (config lookup, DB) is retried by
+    the queue. Re-running is safe: `grade_attempt` no-ops unless the
+    attempt is still `grading`.
+    """
+    from database import get_db_manager
+    from shared.services.llm_config_service import LLMConfigService
+    from shared.services.llm_client_registry import get_shared_llm_service
+    from tutor.services.practice_grading_service import PracticeGradingService
+
+    db = get_db_manager().get_session()
+    try:
+        config = LLMConfigService(db).get_config("practice_grader")
+        llm = get_shared_llm_service(config, initial_retry_delay=10)
+        PracticeGradingService(db, llm).grade_attempt(attempt_id)
+    finally:
+        try:
+            db.close()
+        except Exception:
+            pass
@@ -3,22 +3,42 @@
 Returns only deterministic metrics:
 - Coverage completion % (teach_me sessions only)
 - Practice score (latest fractional score + attempt count from practice_attempts)
+
+Reads are served from `student_topic_progress`, one pre-aggregated row per
+(student, guideline). A student's rows are built from scratch on their first
+read, then kept current by `refresh_topic()` — called when a session's
+progress fields change and when a practice attempt is graded.
+`compute_report_card()` / `compute_topic_progress()` are the from-scratch
+computation the rows must agree with; `verify()` compares the two.
 """
 
-import json
 import logging
 from collections import defaultdict
+from datetime import datetime
+from typing import Optional
 
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as DBSession, defer
 
 from shared.models.entities import (
     PracticeAttempt,
     Session as SessionModel,
+    StudentProgressBuild,
+    StudentTopicProgress,
     TeachingGuideline,
 )
+from tutor.services.session_state_store import SESSION_SUMMARY_VERSION, read_session_summary
 
 logger = logging.getLogger("tutor.report_card_service")
 
+# Bump when the aggregate's meaning changes; students with an older build
+# are rebuilt from scratch on their next read.
+PROGRESS_VERSION = 1
+
+# Row key for sessions that predate guideline ids (topic name only).
+_LEGACY_KEY_PREFIX = "topic-name:"
+
 
 class ReportCardService:
     """Aggregates session data into a deterministic student report card."""
@@ -30,31 +50,35 @@ class ReportCardService:
 
     def get_report_card(self, user_id: str) -> dict:
         """
-        Build the complete report card for a student.
+        Build the complete report card for a student from the materialized rows.
 
         Returns only deterministic data:
         - total_sessions, total_chapters_studied
         - Per topic: coverage % (teach_me only) + practice attempt stats
         - No aggregate scores, no strengths/weaknesses, no trends
         """
-        sessions = self._load_user_sessions(user_id)
-        practice_attempts = self._load_user_practice_attempts(user_id)
-        if not sessions and not practice_attempts:
+        self._ensure_materialized(user_id)
+        rows = self._load_progress_rows(user_id)
+        total_sessions = (
+            self.db.query(SessionModel.id).filter(SessionModel.user_id == user_id).count()
+        )
+        if not rows and not total_sessions:
             return self._empty_report_card()
 
-        guideline_lookup = self._build_guideline_lookup(sessions, practice_attempts)
-        grouped = self._group_sessions(sessions, guideline_lookup)
-        self._merge_practice_attempts_into_grouped(grouped, guideline_lookup, practice_attempts)
-        subjects_data = self._build_report(grouped)
-
-        total_sessions = len(sessions)
-        total_chapters = sum(len(s["chapters"]) for s in subjects_data)
-
-        return {
-            "total_sessions": total_sessions,
-            "total_chapters_studied": total_chapters,
-            "subjects": subjects_data,
+        guideline_lookup = self._lookup_guidelines({
+            r.guideline_id for r in rows if not r.guideline_id.startswith(_LEGACY_KEY_PREFIX)
+        })
+        grouped = self._group_progress_rows(rows, guideline_lookup)
+        practice = {
+            r.guideline_id: {
+                "latest_score": r.latest_practice_score,
+                "latest_total": r.latest_practice_total,
+                "count": r.practice_attempt_count,
+            }
+            for r in rows if r.practice_attempt_count
         }
+        self._merge_practice_into_grouped(grouped, guideline_lookup, practice)
+        return self._report_card(total_sessions, self._build_report(grouped))
 
     def get_topic_progress(self, user_id: str) -> dict:
         """
@@ -65,85 +89,243 @@ class ReportCardService:
         Coverage denominator = canonical concept list from most recent teach_me
         session's plan.
         """
+        self._ensure_materialized(user_id)
+        result = {}
+        for row in self._load_progress_rows(user_id):
+            if not row.teach_me_session_count or row.guideline_id.startswith(_LEGACY_KEY_PREFIX):
+                continue
+            result[row.guideline_id] = self._topic_progress_entry(
+                set(row.concepts_covered or []),
+                set(row.plan_concepts or []),
+                row.teach_me_session_count,
+            )
+        return {"user_progress": result}
+
+    def compute_report_card(self, user_id: str) -> dict:
+        """From-scratch report card: walks every session and graded attempt."""
         sessions = self._load_user_sessions(user_id)
-        progress: dict[str, dict] = {}
+        practice_attempts = self._load_user_practice_attempts(user_id)
+        if not sessions and not practice_attempts:
+            return self._empty_report_card()
 
-        for session_row in sessions:
-            try:
-                state = json.loads(session_row.state_json)
-            except (json.JSONDecodeError, TypeError):
-                continue
-            if not isinstance(state, dict):
-                continue
-            topic_data = state.get("topic")
-            if not isinstance(topic_data, dict):
-                continue
-            topic_id = topic_data.get("topic_id")
-            if not topic_id:
-                continue
+        guideline_lookup = self._build_guideline_lookup(sessions, practice_attempts)
+        grouped = self._group_sessions(sessions, guideline_lookup)
+        self._merge_practice_into_grouped(
+            grouped, guideline_lookup, self._summarize_practice(practice_attempts),
+        )
+        return self._report_card(len(sessions), self._build_report(grouped))
+
+    def compute_topic_progress(self, user_id: str) -> dict:
+        """From-scratch equivalent of `get_topic_progress`."""
+        aggregates = self._aggregate_sessions(self._load_user_sessions(user_id))
+        return {"user_progress": {
+            guideline_id: self._topic_progress_entry(
+                set(agg["concepts_covered"]),
+                set(agg["plan_concepts"]),
+                agg["teach_me_session_count"],
+            )
+            for guideline_id, agg in aggregates.items()
+            if agg["teach_me_session_count"] and not guideline_id.startswith(_LEGACY_KEY_PREFIX)
+        }}
 
-            mode = state.get("mode", "teach_me")
-            if mode != "teach_me":
-                continue
+    def refresh_topic(self, user_id: str, guideline_id: str) -> bool:
+        """Recompute one (student, guideline) row from its sessions + attempts.
 
-            existing = progress.get(topic_id, {
-                "covered_set": set(),
-                "plan_concepts": set(),
-                "session_count": 0,
-            })
+        No-op (returns False) for students who have not been materialized
+        yet — their first read builds every row. Does NOT commit.
+        """
+        build = self.db.get(StudentProgressBuild, user_id)
+        if build is None or build.version != PROGRESS_VERSION:
+            return False
+
+        sessions = self._load_user_sessions(user_id, guideline_id=guideline_id)
+        attempts = self._load_user_practice_attempts(user_id, guideline_id=guideline_id)
+        aggregate = self._aggregate_sessions(sessions).get(guideline_id)
+        practice = self._summarize_practice(attempts).get(guideline_id)
+
+        row = self.db.get(StudentTopicProgress, (user_id, guideline_id))
+        if aggregate is None and practice is None:
+            if row is not None:
+                self.db.delete(row)
+            return True
+        if row is None:
+            row = StudentTopicProgress(user_id=user_id, guideline_id=guideline_id)
+            self.db.add(row)
+        for column, value in self._progress_values(aggregate, practice).items():
+            setattr(row, column, value)
+        return True
+
+    def rebuild(self, user_id: str) -> int:
+        """Rebuild all of a student's rows from scratch and mark them built. Commits.
+
+        Returns the number of rows written.
+        """
+        sessions = self._load_user_sessions(user_id)
+        attempts = self._load_user_practice_attempts(user_id)
+        aggregates = self._aggregate_sessions(sessions)
+        practice = self._summarize_practice(attempts)
+
+        # "fetch" also evicts rows already loaded in this session, so the
+        # replacements below don't collide with stale identities.
+        self.db.query(StudentTopicProgress).filter(
+            StudentTopicProgress.user_id == user_id
+        ).delete(synchronize_session="fetch")
+        guideline_ids = aggregates.keys() | practice.keys()
+        for guideline_id in guideline_ids:
+            self.db.add(StudentTopicProgress(
+                user_id=user_id,
+                guideline_id=guideline_id,
+                **self._progress_values(aggregates.get(guideline_id), practice.get(guideline_id)),
+            ))
+
+        # No sessions and no attempts: nothing to mark (the user may not exist).
+        if sessions or attempts:
+            build = self.db.get(StudentProgressBuild, user_id)
+            if build is None:
+                build = StudentProgressBuild(user_id=user_id)
+                self.db.add(build)
+            build.version = PROGRESS_VERSION
+            build.built_at = datetime.utcnow()
+
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # A concurrent first read built the same student; theirs stands.
+            self.db.rollback()
+            logger.info("Report card rebuild for %s raced another build", user_id)
+        return len(guideline_ids)
+
+    def verify(self, user_id: str) -> list[str]:
+        """Compare the materialized report card / topic progress with the
+        from-scratch computation. Returns the names of mismatching views."""
+        mismatches = []
+        if self.get_report_card(user_id) != self.compute_report_card(user_id):
+            mismatches.append("report_card")
+        if self.get_topic_progress(user_id) != self.compute_topic_progress(user_id):
+            mismatches.append("topic_progress")
+        return mismatches
+
+    # ── Materialized rows ───────────────────────────────────────
+
+    def _ensure_materialized(self, user_id: str) -> None:
+        build = self.db.get(StudentProgressBuild, user_id)
+        if build is None or build.version != PROGRESS_VERSION:
+            self.rebuild(user_id)
+
+    def _load_progress_rows(self, user_id: str) -> list:
+        """The student's rows, oldest activity first (the from-scratch merge order)."""
+        rows = (
+            self.db.query(StudentTopicProgress)
+            .filter(StudentTopicProgress.user_id == user_id)
+            .all()
+        )
+        return sorted(rows, key=lambda r: (
+            r.last_session_at is None, r.last_session_at or datetime.min, r.guideline_id,
+        ))
+
+    @staticmethod
+    def _progress_values(aggregate: Optional[dict], practice: Optional[dict]) -> dict:
+        values = {
+            "subject": None,
+            "topic_name": None,
+            "session_count": 0,
+            "teach_me_session_count": 0,
+            "concepts_covered": [],
+            "plan_concepts": [],
+            "last_studied": None,
+            "last_session_at": None,
+        }
+        if aggregate:
+            values.update(aggregate)
+            values["concepts_covered"] = sorted(aggregate["concepts_covered"])
+        values["latest_practice_score"] = practice["latest_score"] if practice else None
+        values["latest_practice_total"] = practice["latest_total"] if practice else None
+        values["practice_attempt_count"] = practice["count"] if practice else 0
+        return values
+
+    def _group_progress_rows(self, rows, guideline_lookup) -> dict:
+        """`_group_sessions` over pre-aggregated rows instead of sessions."""
+        grouped = defaultdict(lambda: defaultdict(lambda: {"chapter_name": "", "topics": {}}))
+
+        for row in rows:
+            if not row.session_count:
+                continue  # practice-only — added by _merge_practice_into_grouped
 
-            concepts_covered = state.get("concepts_covered_set", [])
-            if isinstance(concepts_covered, list):
-                existing["covered_set"].update(concepts_covered)
+            subject = row.subject or "Unknown"
+            guideline_id = None if row.guideline_id.startswith(_LEGACY_KEY_PREFIX) else row.guideline_id
+            chapter_name, topic_name, chapter_key, topic_key = self._resolve_hierarchy(
+                guideline_id, row.topic_name or "", guideline_lookup,
+            )
 
-            mastery_estimates = state.get("mastery_estimates", {})
-            if isinstance(mastery_estimates, dict) and mastery_estimates:
-                existing["plan_concepts"] = set(mastery_estimates.keys())
+            existing = grouped[subject][chapter_key]["topics"].get(topic_key, {})
+            existing_covered = set(existing.get("concepts_covered", []))
+            existing_plan = set(existing.get("plan_concepts", []))
+            existing_last_studied = existing.get("last_studied")
 
-            existing["session_count"] += 1
-            progress[topic_id] = existing
+            if row.teach_me_session_count:
+                existing_covered.update(row.concepts_covered or [])
+                if row.last_studied:
+                    studied = row.last_studied.isoformat()
+                    existing_last_studied = max(existing_last_studied or studied, studied)
+                if row.plan_concepts:
+                    existing_plan = set(row.plan_concepts)
 
-        result = {}
-        for topic_id, data in progress.items():
-            plan = data["plan_concepts"]
-            covered = data["covered_set"]
-            coverage = 0.0
-            if plan:
-                coverage = round(len(covered & plan) / len(plan) * 100, 1)
-
-            result[topic_id] = {
-                "coverage": coverage,
-                "session_count": data["session_count"],
-                "status": "studied" if data["session_count"] > 0 else "not_started",
+            grouped[subject][chapter_key]["chapter_name"] = chapter_name
+            grouped[subject][chapter_key]["topics"][topic_key] = {
+                "topic_name": topic_name,
+                "guideline_id": guideline_id,
+                "concepts_covered": list(existing_covered),
+                "plan_concepts": list(existing_plan),
+                "last_studied": existing_last_studied,
             }
 
-        return {"user_progress": result}
+        return grouped
 
-    # ── Private helpers ─────────────────────────────────────────
+    # ── Session / attempt loading ───────────────────────────────
 
-    def _load_user_sessions(self, user_id: str) -> list:
-        """Load all sessions for the user, ordered by created_at ascending."""
-        return (
-            self.db.query(
-                SessionModel.id,
-                SessionModel.state_json,
-                SessionModel.subject,
-                SessionModel.mastery,
-                SessionModel.created_at,
-            )
+    def _load_user_sessions(self, user_id: str, guideline_id: Optional[str] = None) -> list[dict]:
+        """Load the user's sessions, ordered by created_at ascending.
+
+        Reads the denormalized summary columns; `state_json` is deferred and
+        only fetched for rows that predate them. `summary` is None for rows
+        whose state cannot be read (still counted in total_sessions).
+        With `guideline_id`, only that topic's sessions (plus not-yet-
+        summarized rows, whose topic is unknown until parsed) are loaded.
+        """
+        query = (
+            self.db.query(SessionModel)
+            .options(defer(SessionModel.state_json))
             .filter(SessionModel.user_id == user_id)
-            .order_by(SessionModel.created_at.asc(), SessionModel.id.asc())
-            .all()
         )
+        if guideline_id is not None:
+            query = query.filter(or_(
+                SessionModel.topic_id == guideline_id,
+                SessionModel.summary_version.is_(None),
+                SessionModel.summary_version != SESSION_SUMMARY_VERSION,
+            ))
+        rows = query.order_by(SessionModel.created_at.asc(), SessionModel.id.asc()).all()
+
+        sessions = []
+        for row in rows:
+            summary = read_session_summary(self.db, row)
+            if summary is None:
+                logger.warning("Skipping session %s: malformed state_json", row.id)
+            sessions.append({
+                "id": row.id,
+                "subject": row.subject,
+                "created_at": row.created_at,
+                "summary": summary,
+            })
+        return sessions
 
-    def _load_user_practice_attempts(self, user_id: str) -> list:
+    def _load_user_practice_attempts(self, user_id: str, guideline_id: Optional[str] = None) -> list:
         """Load graded practice attempts for the user, ordered by guideline_id + graded_at DESC.
 
-        Filters to status='graded' with non-null graded_at + total_score so the
-        grouping in `_merge_practice_attempts_into_grouped` can take attempts[0]
-        as the latest graded attempt per guideline.
+        Filters to status='graded' with non-null graded_at + total_score so
+        `_summarize_practice` can take the first attempt per guideline as the
+        latest graded attempt.
         """
-        return (
+        query = (
             self.db.query(
                 PracticeAttempt.guideline_id,
                 PracticeAttempt.total_score,
@@ -156,37 +338,112 @@ class ReportCardService:
                 PracticeAttempt.graded_at.isnot(None),
                 PracticeAttempt.total_score.isnot(None),
             )
-            .order_by(
+        )
+        if guideline_id is not None:
+            query = query.filter(PracticeAttempt.guideline_id == guideline_id)
+        return (
+            query.order_by(
                 PracticeAttempt.guideline_id.asc(),
                 PracticeAttempt.graded_at.desc(),
             )
             .all()
         )
 
+    # ── Aggregation ─────────────────────────────────────────────
+
+    @staticmethod
+    def _aggregate_sessions(sessions) -> dict:
+        """Fold sessions (created_at ascending) into per-guideline progress columns.
+
+        Sessions without a topic_id (pre-guideline legacy rows) are keyed by
+        topic name so the report card still lists them; topic progress skips them.
+        """
+        aggregates: dict[str, dict] = {}
+        for session in sessions:
+            summary = session["summary"]
+            if summary is None:
+                continue
+            key = summary["topic_id"]
+            if not key:
+                if summary["topic_name"] is None:
+                    continue
+                key = _LEGACY_KEY_PREFIX + summary["topic_name"]
+            agg = aggregates.setdefault(key, {
+                "subject": None,
+                "topic_name": None,
+                "session_count": 0,
+                "teach_me_session_count": 0,
+                "concepts_covered": set(),
+                "plan_concepts": [],
+                "last_studied": None,
+                "last_session_at": None,
+            })
+            agg["subject"] = session["subject"]
+            agg["topic_name"] = summary["topic_name"]
+            agg["session_count"] += 1
+            agg["last_session_at"] = session["created_at"]
+            if summary["mode"] == "teach_me":
+                agg["teach_me_session_count"] += 1
+                agg["concepts_covered"].update(summary["concepts_covered"])
+                agg["last_studied"] = session["created_at"]
+                if summary["plan_concepts"]:
+                    agg["plan_concepts"] = list(summary["plan_concepts"])
+        return aggregates
+
+    @staticmethod
+    def _summarize_practice(practice_attempts) -> dict:
+        """guideline_id → latest graded score/total + attempt count.
+
+        Attempts are expected to already be sorted guideline_id ASC,
+        graded_at DESC, so the first one per guideline is the latest.
+        """
+        practice: dict[str, dict] = {}
+        for attempt in practice_attempts:
+            if not attempt.guideline_id:
+                continue
+            entry = practice.get(attempt.guideline_id)
+            if entry is None:
+                practice[attempt.guideline_id] = {
+                    "latest_score": attempt.total_score,
+                    "latest_total": attempt.total_possible,
+                    "count": 1,
+                }
+            else:
+                entry["count"] += 1
+        return practice
+
+    @staticmethod
+    def _topic_progress_entry(covered: set, plan: set, session_count: int) -> dict:
+        coverage = 0.0
+        if plan:
+            coverage = round(len(covered & plan) / len(plan) * 100, 1)
+        return {
+            "coverage": coverage,
+            "session_count": session_count,
+            "status": "studied" if session_count > 0 else "not_started",
+        }
+
+    # ── Report assembly ─────────────────────────────────────────
+
     def _build_guideline_lookup(self, sessions, practice_attempts=None) -> dict:
         """
         Build guideline_id → hierarchy info by collecting all topic_ids from sessions
         and practice attempts, then batch-querying teaching_guidelines.
         """
         guideline_ids = set()
-        for s in sessions:
-            try:
-                state = json.loads(s.state_json)
-            except (json.JSONDecodeError, TypeError):
-                continue
-            if not isinstance(state, dict):
-                continue
-            topic = state.get("topic")
-            if not isinstance(topic, dict):
-                continue
-            topic_id = topic.get("topic_id")
-            if topic_id:
-                guideline_ids.add(topic_id)
+        for session in sessions:
+            summary = session["summary"]
+            if summary and summary["topic_id"]:
+                guideline_ids.add(summary["topic_id"])
 
         for a in practice_attempts or []:
             if a.guideline_id:
                 guideline_ids.add(a.guideline_id)
 
+        return self._lookup_guidelines(guideline_ids)
+
+    def _lookup_guidelines(self, guideline_ids: set) -> dict:
+        """Batch-query teaching_guidelines for guideline_id → {subject, chapter, topic, keys}."""
         if not guideline_ids:
             return {}
 
@@ -216,6 +473,26 @@ class ReportCardService:
             for g in guidelines
         }
 
+    @staticmethod
+    def _resolve_hierarchy(topic_id, topic_name_raw: str, guideline_lookup: dict) -> tuple:
+        """(chapter_name, topic_name, chapter_key, topic_key) for a session's topic."""
+        if topic_id and topic_id in guideline_lookup:
+            gl = guideline_lookup[topic_id]
+            return gl["chapter"], gl["topic"], gl["chapter_key"], gl["topic_key"]
+        if " - " in topic_name_raw:
+            parts = topic_name_raw.split(" - ", 1)
+            chapter_name = parts[0].strip()
+            topic_name = parts[1].strip()
+        else:
+            chapter_name = topic_name_raw or "Unknown"
+            topic_name = topic_name_raw or "Unknown"
+        return (
+            chapter_name,
+            topic_name,
+            chapter_name.lower().replace(" ", "-"),
+            topic_name.lower().replace(" ", "-"),
+        )
+
     def _group_sessions(self, sessions, guideline_lookup) -> dict:
         """
         Group sessions into subject → chapter → topic hierarchy.
@@ -223,46 +500,21 @@ class ReportCardService:
         """
         grouped = defaultdict(lambda: defaultdict(lambda: {"chapter_name": "", "topics": {}}))
 
-        for session_row in sessions:
-            try:
-                state = json.loads(session_row.state_json)
-            except (json.JSONDecodeError, TypeError):
-                logger.warning("Skipping session %s: malformed state_json", session_row.id)
+        for session in sessions:
+            summary = session["summary"]
+            if summary is None:
                 continue
-
-            if not isinstance(state, dict):
-                logger.warning("Skipping session %s: state_json is not a dict", session_row.id)
-                continue
-
-            topic_data = state.get("topic")
-            if not isinstance(topic_data, dict) or not topic_data:
+            if summary["topic_id"] is None and summary["topic_name"] is None:
                 continue
 
-            subject = topic_data.get("subject", session_row.subject or "Unknown")
-            topic_id = topic_data.get("topic_id")
-            topic_name_raw = topic_data.get("topic_name", "")
-            mode = state.get("mode", "teach_me")
-
-            # Resolve hierarchy
-            if topic_id and topic_id in guideline_lookup:
-                gl = guideline_lookup[topic_id]
-                chapter_name = gl["chapter"]
-                topic_name = gl["topic"]
-                chapter_key = gl["chapter_key"]
-                topic_key = gl["topic_key"]
-            elif " - " in topic_name_raw:
-                parts = topic_name_raw.split(" - ", 1)
-                chapter_name = parts[0].strip()
-                topic_name = parts[1].strip()
-                chapter_key = chapter_name.lower().replace(" ", "-")
-                topic_key = topic_name.lower().replace(" ", "-")
-            else:
-                chapter_name = topic_name_raw or "Unknown"
-                topic_name = topic_name_raw or "Unknown"
-                chapter_key = chapter_name.lower().replace(" ", "-")
-                topic_key = topic_name.lower().replace(" ", "-")
+            subject = session["subject"] or "Unknown"
+            topic_id = summary["topic_id"]
+            mode = summary["mode"]
+            chapter_name, topic_name, chapter_key, topic_key = self._resolve_hierarchy(
+                topic_id, summary["topic_name"] or "", guideline_lookup,
+            )
 
-            session_date = session_row.created_at.isoformat() if session_row.created_at else None
+            session_date = session["created_at"].isoformat() if session["created_at"] else None
 
             existing = grouped[subject][chapter_key]["topics"].get(topic_key, {})
             existing_covered = set(existing.get("concepts_covered", []))
@@ -270,13 +522,10 @@ class ReportCardService:
             existing_last_studied = existing.get("last_studied")
 
             if mode == "teach_me":
-                concepts_covered = state.get("concepts_covered_set", [])
-                if isinstance(concepts_covered, list):
-                    existing_covered.update(concepts_covered)
+                existing_covered.update(summary["concepts_covered"])
                 existing_last_studied = session_date
-                mastery_estimates = state.get("mastery_estimates", {})
-                if isinstance(mastery_estimates, dict) and mastery_estimates:
-                    existing_plan = set(mastery_estimates.keys())
+                if summary["plan_concepts"]:
+                    existing_plan = set(summary["plan_concepts"])
 
             grouped[subject][chapter_key]["chapter_name"] = chapter_name
             grouped[subject][chapter_key]["topics"][topic_key] = {
@@ -289,26 +538,20 @@ class ReportCardService:
 
         return grouped
 
-    def _merge_practice_attempts_into_grouped(
+    def _merge_practice_into_grouped(
         self,
         grouped,
         guideline_lookup: dict,
-        practice_attempts: list,
+        practice: dict,
     ) -> None:
-        """Merge graded practice attempts (v2 practice_attempts table) into the
-        grouped structure. Latest-graded score + attempt count per guideline.
+        """Merge per-guideline practice stats (latest graded score + attempt
+        count, see `_summarize_practice`) into the grouped structure.
 
         Creates a topic row if a guideline has practice data but no
-        teach_me/clarify_doubts sessions yet. Attempts are expected to already
-        be sorted guideline_id ASC, graded_at DESC.
+        teach_me/clarify_doubts sessions yet.
         """
-        by_guideline: dict[str, list] = defaultdict(list)
-        for attempt in practice_attempts:
-            if attempt.guideline_id:
-                by_guideline[attempt.guideline_id].append(attempt)
-
-        for guideline_id, attempts in by_guideline.items():
-            if not attempts or guideline_id not in guideline_lookup:
+        for guideline_id, stats in practice.items():
+            if guideline_id not in guideline_lookup:
                 continue
             gl = guideline_lookup[guideline_id]
             subject = gl.get("subject") or "Unknown"
@@ -317,7 +560,6 @@ class ReportCardService:
             chapter_key = gl["chapter_key"]
             topic_key = gl["topic_key"]
 
-            latest = attempts[0]
             chapter_entry = grouped[subject][chapter_key]
             if not chapter_entry.get("chapter_name"):
                 chapter_entry["chapter_name"] = chapter_name
@@ -328,9 +570,9 @@ class ReportCardService:
                 "plan_concepts": [],
                 "last_studied": None,
             })
-            topic_entry["latest_practice_score"] = latest.total_score
-            topic_entry["latest_practice_total"] = latest.total_possible
-            topic_entry["practice_attempt_count"] = len(attempts)
+            topic_entry["latest_practice_score"] = stats["latest_score"]
+            topic_entry["latest_practice_total"] = stats["latest_total"]
+            topic_entry["practice_attempt_count"] = stats["count"]
             chapter_entry["topics"][topic_key] = topic_entry
 
     def _build_report(self, grouped) -> list:
@@ -371,6 +613,14 @@ class ReportCardService:
 
         return subjects_data
 
+    @staticmethod
+    def _report_card(total_sessions: int, subjects_data: list) -> dict:
+        return {
+            "total_sessions": total_sessions,
+            "total_chapters_studied": sum(len(s["chapters"]) for s in subjects_data),
+            "subjects": subjects_data,
+        }
+
     def _empty_report_card(self) -> dict:
         """Return empty report card for users with no sessions."""
         return {
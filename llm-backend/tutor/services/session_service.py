@@ -1,9 +1,10 @@
 """Session management business logic — new single-agent architecture."""
 
-import json
+import asyncio
 import logging
-from typing import Optional, List
+from typing import Any, Callable, Optional, List
 from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_session
 from sqlalchemy.orm import Session as DBSession
 from uuid import uuid4
 
@@ -18,7 +19,7 @@ from shared.models import (
 )
 from shared.models.entities import StudyPlan as StudyPlanRecord
 from shared.repositories import SessionRepository, EventRepository, TeachingGuidelineRepository
-from shared.services.llm_service import LLMService
+from shared.services.llm_service import LLMService, run_blocking
 from shared.utils.exceptions import SessionNotFoundException, GuidelineNotFoundException, StaleStateError
 
 from tutor.exceptions import (
@@ -32,6 +33,10 @@ from tutor.models.session_state import (
     SessionState, CardPhaseState, DialoguePhaseState, create_session,
 )
 from tutor.models.messages import StudentContext, create_teacher_message
+from tutor.services.session_state_store import (
+    append_new_messages, dump_state_json, load_session_state,
+    read_session_summary, session_summary_columns, sync_student_progress,
+)
 from tutor.services.topic_adapter import convert_guideline_to_topic
 from shared.repositories.explanation_repository import ExplanationRepository
 from shared.repositories.dialogue_repository import DialogueRepository
@@ -47,7 +52,14 @@ logger = logging.getLogger("tutor.session_service")
 
 
 class SessionService:
-    """Orchestrates session creation, step processing, and summary generation."""
+    """Orchestrates session creation, step processing, and summary generation.
+
+    `process_step` and `simplify_card` have `*_async` twins for async
+    handlers: the LLM work runs on the caller's event loop and the DB phases
+    around it go through `_run_db`. Build the service on an AsyncSession's
+    sync session (`await async_db.run_sync(SessionService)`) so those phases
+    are awaited on the async pool.
+    """
 
     def __init__(self, db: DBSession):
         self.db = db
@@ -55,21 +67,17 @@ class SessionService:
         self.event_repo = EventRepository(db)
         self.guideline_repo = TeachingGuidelineRepository(db)
 
-        # Initialize LLM service — read config from DB (once at session start)
+        # LLM service — read config from DB (once at session start), then
+        # reuse the process-wide client bundle for that config so requests
+        # share warm keep-alive connections.
         from shared.services.llm_config_service import LLMConfigService
         from shared.services.feature_flag_service import FeatureFlagService
-        settings = get_settings()
+        from shared.services.llm_client_registry import get_shared_llm_service
         config_service = LLMConfigService(db)
         tutor_config = config_service.get_config("tutor")
         fast_config = config_service.get_config("fast_model")
-        self.llm_service = LLMService(
-            api_key=settings.openai_api_key,
-            provider=tutor_config["provider"],
-            model_id=tutor_config["model_id"],
-            reasoning_effort=tutor_config["reasoning_effort"],
-            fast_model_id=fast_config["model_id"],
-            gemini_api_key=settings.gemini_api_key if settings.gemini_api_key else None,
-            anthropic_api_key=settings.anthropic_api_key if settings.anthropic_api_key else None,
+        self.llm_service = get_shared_llm_service(
+            tutor_config, fast_model_id=fast_config["model_id"],
         )
         visuals_enabled = FeatureFlagService(db).is_enabled("show_visuals_in_tutor_flow")
         self.orchestrator = TeacherOrchestrator(self.llm_service, visuals_enabled=visuals_enabled)
@@ -153,8 +161,6 @@ class SessionService:
             f"mode={mode} teach_me_mode={session.teach_me_mode} is_refresher={is_refresher}"
         )
 
-        import asyncio
-
         # Check for pre-computed explanations (teach_me mode only)
         explanations = []
         if mode == "teach_me":
@@ -320,9 +326,9 @@ class SessionService:
 
             # Generate mode-specific welcome
             if mode == "clarify_doubts":
-                welcome, audio_text = asyncio.run(self.orchestrator.generate_clarify_welcome(session))
+                welcome, audio_text = run_blocking(self.orchestrator.generate_clarify_welcome(session))
             else:
-                welcome, audio_text = asyncio.run(self.orchestrator.generate_welcome_message(session))
+                welcome, audio_text = run_blocking(self.orchestrator.generate_welcome_message(session))
 
             first_turn = {
                 "message": welcome,
@@ -356,6 +362,40 @@ class SessionService:
 
     def process_step(self, session_id: str, request: StepRequest) -> StepResponse:
         """Process a student's answer using the new orchestrator."""
+        session, expected_version = self._load_step_session(session_id)
+        turn_result = run_blocking(
+            self.orchestrator.process_turn(session, request.student_reply)
+        )
+        return self._complete_step(session_id, session, expected_version, turn_result)
+
+    async def process_step_async(self, session_id: str, request: StepRequest) -> StepResponse:
+        """`process_step` on the running event loop (async handlers)."""
+        session, expected_version = await self._run_db(self._load_step_session, session_id)
+        turn_result = await self.orchestrator.process_turn(session, request.student_reply)
+        return await self._run_db(
+            self._complete_step, session_id, session, expected_version, turn_result,
+        )
+
+    async def _run_db(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a sync DB phase of an async method without blocking the loop.
+
+        On a service built over an AsyncSession's sync session the phase is
+        awaited on the async connection (`run_sync`); otherwise it runs in a
+        worker thread. The phase's transaction is committed before returning
+        so no pooled connection is held across the LLM call that follows.
+        """
+        def phase(_db=None):
+            result = fn(*args)
+            self.db.commit()
+            return result
+
+        async_db = async_session(self.db)
+        if async_db is not None:
+            return await async_db.run_sync(phase)
+        return await asyncio.to_thread(phase)
+
+    def _load_step_session(self, session_id: str) -> tuple[SessionState, int]:
+        """Load a session for a tutor turn: (state, expected state_version)."""
         # Load session from DB
         db_session = self.session_repo.get_by_id(session_id)
         if not db_session:
@@ -364,7 +404,7 @@ class SessionService:
         expected_version = db_session.state_version or 1
 
         # Deserialize SessionState
-        session = SessionState.model_validate_json(db_session.state_json)
+        session = load_session_state(self.db, db_session)
 
         if session.is_in_card_phase():
             raise CardPhaseError("Session is in card phase. Use /card-action endpoint.")
@@ -372,13 +412,12 @@ class SessionService:
             raise CardPhaseError(
                 "Session is in dialogue phase. Use /card-progress endpoint."
             )
+        return session, expected_version
 
-        # Process turn via orchestrator
-        import asyncio
-        turn_result = asyncio.run(
-            self.orchestrator.process_turn(session, request.student_reply)
-        )
-
+    def _complete_step(
+        self, session_id: str, session: SessionState, expected_version: int, turn_result,
+    ) -> StepResponse:
+        """Persist a processed turn and build the StepResponse."""
         # Update database with version check
         self._persist_session_state(session_id, session, expected_version)
 
@@ -474,7 +513,7 @@ class SessionService:
             id=session_id,
             student_json=request.student.model_dump_json(),
             goal_json=request.goal.model_dump_json(),
-            state_json=session.model_dump_json(),
+            state_json=dump_state_json(session),
             mastery=session.overall_mastery,
             step_idx=session.current_step,
             user_id=user_id,
@@ -485,10 +524,13 @@ class SessionService:
             state_version=1,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
+            **session_summary_columns(session),
         )
         self.db.add(db_record)
+        append_new_messages(self.db, session_id, session, stored=0)
         self.db.commit()
         self.db.refresh(db_record)
+        sync_student_progress(self.db, session_id, session)
 
     @staticmethod
     def _build_personalization(student_context: StudentContext, guideline) -> "Personalization":
@@ -531,7 +573,7 @@ class SessionService:
             raise SessionNotFoundException(session_id)
         expected_version = db_session.state_version or 1
 
-        session = SessionState.model_validate_json(db_session.state_json)
+        session = load_session_state(self.db, db_session)
 
         if phase == "card_phase":
             if not session.card_phase:
@@ -757,14 +799,18 @@ class SessionService:
 
         db_record = self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
         if db_record:
-            db_record.state_json = session.model_dump_json()
+            db_record.state_json = dump_state_json(session)
             db_record.mastery = session.overall_mastery
             db_record.step_idx = session.current_step
             db_record.mode = session.mode
             db_record.teach_me_mode = session.teach_me_mode if session.mode == "teach_me" else None
             db_record.is_paused = session.is_paused if session.mode == "teach_me" else False
             db_record.updated_at = datetime.utcnow()
+            for column, value in session_summary_columns(session).items():
+                setattr(db_record, column, value)
+            append_new_messages(self.db, session_id, session)
             self.db.commit()
+            sync_student_progress(self.db, session_id, session)
 
     def _persist_session_state(
         self, session_id: str, session: SessionState, expected_version: int
@@ -781,7 +827,7 @@ class SessionService:
                 SessionModel.state_version == expected_version,
             )
             .values(
-                state_json=session.model_dump_json(),
+                state_json=dump_state_json(session),
                 mastery=session.overall_mastery,
                 step_idx=session.current_step,
                 state_version=expected_version + 1,
@@ -789,12 +835,15 @@ class SessionService:
                 teach_me_mode=session.teach_me_mode if session.mode == "teach_me" else None,
                 is_paused=session.is_paused if session.mode == "teach_me" else False,
                 updated_at=datetime.utcnow(),
+                **session_summary_columns(session),
             )
         )
         if result.rowcount == 0:
             self.db.rollback()
             raise StaleStateError(f"Session {session_id} was modified concurrently (expected version {expected_version})")
+        append_new_messages(self.db, session_id, session)
         self.db.commit()
+        sync_student_progress(self.db, session_id, session)
 
     def pause_session(self, session_id: str) -> dict:
         """Pause a Teach Me session with version-safe persistence."""
@@ -803,7 +852,7 @@ class SessionService:
             raise SessionNotFoundException(session_id)
         expected_version = db_session.state_version or 1
 
-        session = SessionState.model_validate_json(db_session.state_json)
+        session = load_session_state(self.db, db_session)
 
         if session.mode != "teach_me":
             raise SessionModeError("Only Teach Me sessions can be paused")
@@ -827,7 +876,7 @@ class SessionService:
             raise SessionNotFoundException(session_id)
         expected_version = db_session.state_version or 1
 
-        session = SessionState.model_validate_json(db_session.state_json)
+        session = load_session_state(self.db, db_session)
         session.is_paused = False
 
         self._persist_session_state(session_id, session, expected_version)
@@ -852,7 +901,7 @@ class SessionService:
             raise SessionNotFoundException(session_id)
         expected_version = db_session.state_version or 1
 
-        session = SessionState.model_validate_json(db_session.state_json)
+        session = load_session_state(self.db, db_session)
         session.clarify_complete = True
 
         self._persist_session_state(session_id, session, expected_version)
@@ -866,12 +915,33 @@ class SessionService:
 
     def simplify_card(self, session_id: str, card_idx: int, reason: str) -> dict:
         """Generate a simplified version of a specific explanation card."""
+        loaded, llm_inputs = self._load_card_to_simplify(session_id, card_idx, reason)
+        card_dict = run_blocking(self.orchestrator.generate_simplified_card(**llm_inputs))
+        return self._save_simplified_card(session_id, loaded, card_idx, reason, card_dict)
+
+    async def simplify_card_async(self, session_id: str, card_idx: int, reason: str) -> dict:
+        """`simplify_card` on the running event loop (async handlers)."""
+        loaded, llm_inputs = await self._run_db(
+            self._load_card_to_simplify, session_id, card_idx, reason,
+        )
+        card_dict = await self.orchestrator.generate_simplified_card(**llm_inputs)
+        return await self._run_db(
+            self._save_simplified_card, session_id, loaded, card_idx, reason, card_dict,
+        )
+
+    def _load_card_to_simplify(self, session_id: str, card_idx: int, reason: str) -> tuple:
+        """Load and validate a card phase session for simplify_card.
+
+        Returns (loaded, llm_inputs): loaded is (db_session, session,
+        expected_version, explanation); llm_inputs are the keyword arguments
+        for `orchestrator.generate_simplified_card`.
+        """
         db_session = self.session_repo.get_by_id(session_id)
         if not db_session:
             raise SessionNotFoundException(session_id)
         expected_version = db_session.state_version or 1
 
-        session = SessionState.model_validate_json(db_session.state_json)
+        session = load_session_state(self.db, db_session)
 
         if not session.is_in_card_phase():
             raise CardPhaseError("Session is not in card phase")
@@ -888,23 +958,22 @@ class SessionService:
         if not explanation or not explanation.cards_json:
             raise VariantNotFoundError("Current variant cards not found")
 
-        all_cards = explanation.cards_json
-        if card_idx < 0 or card_idx >= len(all_cards):
+        if card_idx < 0 or card_idx >= len(explanation.cards_json):
             raise InvalidCardActionError(f"Invalid card_idx: {card_idx}")
 
+        loaded = (db_session, session, expected_version, explanation)
+        return loaded, self._simplified_card_inputs(loaded, card_idx, reason)
+
+    @staticmethod
+    def _simplified_card_inputs(loaded: tuple, card_idx: int, reason: str) -> dict:
+        """Keyword arguments for `orchestrator.generate_simplified_card`."""
+        _, session, _, explanation = loaded
+        all_cards = explanation.cards_json
+
         # Always use the ORIGINAL base card as the primary input to prevent
         # recursive title/content stacking. Pass previous attempts as separate context.
         existing = session.card_phase.remedial_cards.get(card_idx, [])
-        depth = len(existing) + 1
-
         target_card = all_cards[card_idx]
-        card_title = target_card.get("title", "Untitled")
-        card_content = target_card.get("content", "")
-
-        # Collect previous simplification attempts so the LLM can avoid repeating them
-        previous_attempts = [r.card for r in existing] if existing else []
-
-        import asyncio
 
         # Strip audio_text from cards to save tokens — LLM only needs display content
         cards_for_llm = [
@@ -912,16 +981,23 @@ class SessionService:
             for c in all_cards
         ]
 
-        card_dict = asyncio.run(
-            self.orchestrator.generate_simplified_card(
-                session=session,
-                card_title=card_title,
-                card_content=card_content,
-                all_cards=cards_for_llm,
-                reason=reason,
-                previous_attempts=previous_attempts,
-            )
-        )
+        return {
+            "session": session,
+            "card_title": target_card.get("title", "Untitled"),
+            "card_content": target_card.get("content", ""),
+            "all_cards": cards_for_llm,
+            "reason": reason,
+            # Previous simplification attempts, so the LLM can avoid repeating them
+            "previous_attempts": [r.card for r in existing] if existing else [],
+        }
+
+    def _save_simplified_card(
+        self, session_id: str, loaded: tuple, card_idx: int, reason: str, card_dict: dict,
+    ) -> dict:
+        """Record a generated simplification on the session and return the response."""
+        db_session, session, expected_version, explanation = loaded
+        all_cards = explanation.cards_json
+        depth = len(session.card_phase.remedial_cards.get(card_idx, [])) + 1
 
         variant_key = session.card_phase.current_variant_key
         card_id = f"remedial_{variant_key}_{card_idx}_{depth}"
@@ -1005,7 +1081,7 @@ class SessionService:
             raise SessionNotFoundException(session_id)
         expected_version = db_session.state_version or 1
 
-        session = SessionState.model_validate_json(db_session.state_json)
+        session = load_session_state(self.db, db_session)
 
         if not session.is_in_card_phase():
             raise CardPhaseError("Session is not in card phase")
@@ -1392,10 +1468,12 @@ class SessionService:
 
     def _get_past_discussions(self, user_id: str, guideline_id: str) -> list[dict]:
         """Get past Clarify Doubts sessions for this user + guideline."""
+        from sqlalchemy.orm import defer
         from shared.models.entities import Session as SessionModel
 
         rows = (
             self.db.query(SessionModel)
+            .options(defer(SessionModel.state_json))
             .filter(
                 SessionModel.user_id == user_id,
                 SessionModel.guideline_id == guideline_id,
@@ -1408,14 +1486,13 @@ class SessionService:
 
         results = []
         for row in rows:
-            try:
-                state = json.loads(row.state_json)
-                concepts = state.get("concepts_discussed", [])
-                if concepts:
-                    results.append({
-                        "session_date": row.created_at.isoformat() if row.created_at else None,
-                        "concepts_discussed": concepts,
-                    })
-            except (json.JSONDecodeError, TypeError):
+            summary = read_session_summary(self.db, row)
+            if summary is None:
                 continue
+            concepts = summary["concepts_discussed"]
+            if concepts:
+                results.append({
+                    "session_date": row.created_at.isoformat() if row.created_at else None,
+                    "concepts_discussed": concepts,
+                })
         return results
@@ -0,0 +1,270 @@
+"""
+Session state storage — hot-state row plus append-only message log.
+
+`SessionState.full_conversation_log` grows by one or two messages per turn,
+yet it used to be re-serialized into `sessions.state_json` on every save,
+so a session of N turns wrote O(N²) bytes. In split mode
+(`session_split_message_log`, on by default) the log is left out of
+`state_json` and each save inserts only the messages beyond what
+`session_messages` already holds, inside the same transaction as the
+version-checked `sessions` update.
+
+Loading is transparent: `load_session_state` rebuilds the log from
+`session_messages`. Rows written before the split still carry the log inline
+and load as-is; their first split-mode save moves it into the table.
+
+Every save also writes the denormalized summary columns on `sessions`
+(`session_summary_columns`), so history and report-card reads use
+`read_session_summary` and never parse `state_json` for summarized rows.
+After a committed save, `sync_student_progress` refreshes the student's
+materialized report-card row when the session's progress inputs changed.
+"""
+
+import json
+import logging
+from typing import Optional
+
+from sqlalchemy.orm import Session as DBSession
+
+from config import get_settings
+from shared.repositories.session_message_repository import SessionMessageRepository
+from tutor.models.messages import Message
+from tutor.models.session_state import SessionState
+
+logger = logging.getLogger(__name__)
+
+_LOG_FIELD = "full_conversation_log"
+
+
+def dump_state_json(session: SessionState) -> str:
+    """Serialize the value for `sessions.state_json`."""
+    if get_settings().session_split_message_log:
+        return session.model_dump_json(exclude={_LOG_FIELD})
+    return session.model_dump_json()
+
+
+def append_new_messages(
+    db: DBSession,
+    session_id: str,
+    session: SessionState,
+    stored: Optional[int] = None,
+) -> int:
+    """Stage log messages not yet in `session_messages`. Caller commits.
+
+    Must run in the same transaction as the `sessions` row write (after the
+    version-checked UPDATE, which serializes concurrent writers). The
+    stored-row count comes from `stored` (0 for a row being created), else
+    from what `load_session_state` / the previous save recorded on the
+    state, else from a count query. Returns the number of rows staged.
+    """
+    if not get_settings().session_split_message_log:
+        return 0
+
+    repo = SessionMessageRepository(db)
+    if stored is None:
+        stored = session._persisted_log_length
+    if stored is None:
+        stored = repo.count(session_id)
+    log = session.full_conversation_log
+    if stored > len(log):
+        logger.warning(
+            f"Session {session_id}: in-memory log has {len(log)} messages but "
+            f"{stored} are stored; not appending"
+        )
+        return 0
+    new_messages = log[stored:]
+    if new_messages:
+        repo.append(session_id, stored, new_messages)
+    # Recorded before the caller commits. Every caller abandons the state
+    # object if its commit fails, and a CAS conflict reloads via
+    # load_session_state, so a stale count is never reused.
+    session._persisted_log_length = len(log)
+    return len(new_messages)
+
+
+def _stored_messages(db: DBSession, session_id: str) -> list[Message]:
+    return [
+        Message(
+            role=row.role,
+            content=row.content,
+            audio_text=row.audio_text,
+            timestamp=row.timestamp,
+            message_id=row.message_id,
+        )
+        for row in SessionMessageRepository(db).get_for_session(session_id)
+    ]
+
+
+def load_session_state(db: DBSession, row) -> SessionState:
+    """Rebuild the full SessionState for a `sessions` row."""
+    state = SessionState.model_validate_json(row.state_json)
+    if not state.full_conversation_log:
+        state.full_conversation_log = _stored_messages(db, row.id)
+        state._persisted_log_length = len(state.full_conversation_log)
+    state._progress_fields = _progress_fields(state)
+    return state
+
+
+def load_state_dict(db: DBSession, row) -> dict:
+    """`json.loads(row.state_json)` with the message log filled back in."""
+    state = json.loads(row.state_json)
+    if not state.get(_LOG_FIELD):
+        state[_LOG_FIELD] = [
+            m.model_dump(mode="json") for m in _stored_messages(db, row.id)
+        ]
+    return state
+
+
+# Bump when the meaning of a summary column changes; rows with an older
+# version fall back to state_json until re-backfilled.
+SESSION_SUMMARY_VERSION = 1
+
+SUMMARY_COLUMNS = (
+    "topic_id",
+    "topic_name",
+    "message_count",
+    "is_complete",
+    "coverage",
+    "concepts_covered",
+    "plan_concepts",
+    "concepts_discussed",
+)
+
+
+def session_summary_columns(session: SessionState) -> dict:
+    """Summary column values for `sessions`, written alongside `state_json`."""
+    topic = session.topic
+    return {
+        "topic_id": topic.topic_id if topic else None,
+        "topic_name": topic.topic_name if topic else None,
+        "message_count": len(session.full_conversation_log),
+        "is_complete": session.is_complete,
+        "coverage": session.coverage_percentage,
+        "concepts_covered": sorted(session.concepts_covered_set),
+        "plan_concepts": list(session.mastery_estimates),
+        "concepts_discussed": list(session.concepts_discussed),
+        "summary_version": SESSION_SUMMARY_VERSION,
+    }
+
+
+def summarize_state_dict(state: dict, message_count: Optional[int] = None) -> dict:
+    """Summary columns derived from a raw `state_json` dict.
+
+    Tolerates the legacy / partial shapes the readers have always skipped
+    over. Used by the backfill and for rows that predate the columns.
+    `message_count` overrides the inline log length (split-storage rows).
+    """
+    topic = state.get("topic")
+    if not isinstance(topic, dict) or not topic:
+        topic = None
+
+    covered = state.get("concepts_covered_set", [])
+    covered = list(dict.fromkeys(covered)) if isinstance(covered, list) else []
+
+    mastery = state.get("mastery_estimates", {})
+    plan_concepts = list(mastery) if isinstance(mastery, dict) else []
+
+    discussed = state.get("concepts_discussed", [])
+    discussed = discussed if isinstance(discussed, list) else []
+
+    coverage = 0.0
+    study_plan = (topic or {}).get("study_plan")
+    steps = study_plan.get("steps", []) if isinstance(study_plan, dict) else []
+    all_concepts = {st.get("concept") for st in steps if isinstance(st, dict) and st.get("concept")}
+    if all_concepts:
+        coverage = round(len(set(covered) & all_concepts) / len(all_concepts) * 100, 1)
+
+    try:
+        is_complete = SessionState.model_validate(state).is_complete
+    except Exception:
+        is_complete = None
+
+    if message_count is None:
+        message_count = len(state.get(_LOG_FIELD) or state.get("conversation_history") or [])
+
+    return {
+        "topic_id": topic.get("topic_id") if topic else None,
+        "topic_name": (topic.get("topic_name") or topic.get("name")) if topic else None,
+        "message_count": message_count,
+        "is_complete": is_complete,
+        "coverage": coverage,
+        "concepts_covered": covered,
+        "plan_concepts": plan_concepts,
+        "concepts_discussed": discussed,
+        "summary_version": SESSION_SUMMARY_VERSION,
+    }
+
+
+def read_session_summary(db: DBSession, row) -> Optional[dict]:
+    """Summary fields plus mode / teach_me_mode for a `sessions` row.
+
+    Summarized rows are answered from the columns alone (query with
+    `defer(Session.state_json)` so the blob is never fetched). Older rows
+    fall back to parsing `state_json`. Returns None when that is unreadable.
+    `is_complete` is None when the state does not validate as a SessionState.
+    """
+    if row.summary_version == SESSION_SUMMARY_VERSION:
+        summary = {name: getattr(row, name) for name in SUMMARY_COLUMNS}
+        summary["concepts_covered"] = summary["concepts_covered"] or []
+        summary["plan_concepts"] = summary["plan_concepts"] or []
+        summary["concepts_discussed"] = summary["concepts_discussed"] or []
+        summary["mode"] = row.mode or "teach_me"
+        summary["teach_me_mode"] = row.teach_me_mode or "explain"
+        return summary
+
+    try:
+        state = json.loads(row.state_json)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(state, dict):
+        return None
+
+    message_count = None
+    if not state.get(_LOG_FIELD):
+        stored = SessionMessageRepository(db).count(row.id)
+        if stored:
+            message_count = stored
+    summary = summarize_state_dict(state, message_count)
+    summary["mode"] = state.get("mode", "teach_me")
+    summary["teach_me_mode"] = state.get("teach_me_mode", "explain")
+    return summary
+
+
+def _progress_fields(session: SessionState) -> tuple:
+    """The session inputs to the student's report-card aggregate."""
+    topic = session.topic
+    return (
+        topic.topic_id if topic else None,
+        topic.topic_name if topic else None,
+        session.mode,
+        tuple(sorted(session.concepts_covered_set)),
+        tuple(session.mastery_estimates),
+    )
+
+
+def sync_student_progress(db: DBSession, session_id: str, session: SessionState) -> None:
+    """Refresh the student's `student_topic_progress` row after a committed save.
+
+    Skipped when the progress inputs are unchanged since the last load/save,
+    which is most turns. Best-effort: a failure is logged and the row is left
+    for the next refresh or `db.py --rebuild-report-cards`.
+    """
+    fields = _progress_fields(session)
+    if fields == session._progress_fields:
+        return
+    topic_id = fields[0]
+    if not topic_id:
+        session._progress_fields = fields
+        return
+
+    from shared.models.entities import Session as SessionModel
+    from tutor.services.report_card_service import ReportCardService
+
+    try:
+        user_id = db.query(SessionModel.user_id).filter(SessionModel.id == session_id).scalar()
+        if user_id and ReportCardService(db).refresh_topic(user_id, topic_id):
+            db.commit()
+        session._progress_fields = fields
+    except Exception:
+        logger.warning(f"Session {session_id}: report card refresh failed", exc_info=True)
+        db.rollback()
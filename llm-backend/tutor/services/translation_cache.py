@@ -0,0 +1,240 @@
+"""
+Translation cache — memoized Hinglish/Hindi → English for student messages.
+
+Every chat turn translates the student's message with a fast-model call
+before the tutor sees it. Many messages need no translation, and the rest
+repeat a lot across students ("haan", "samajh nahi aaya", "ek baar aur
+batao"). Lookups go, in order:
+
+1. Local skip — empty / pure-number input and messages that
+   `is_clearly_english` accepts are returned unchanged, no LLM call.
+2. Process memory — LRU bounded by entry count
+   (`translation_cache_max_entries`).
+3. Shared tier (optional, `translation_cache_shared`) — the
+   `translation_cache` table, so every worker benefits from every other
+   worker's translations. DB errors are logged and treated as a miss.
+4. The LLM; a successful translation is written to both tiers.
+
+Keys hash the normalized message (NFKC, case-folded, whitespace collapsed)
+together with the prompt template, so editing `translation.txt` starts a
+fresh keyspace instead of serving translations from the old prompt.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from tutor.utils.language_utils import is_clearly_english
+
+logger = logging.getLogger(__name__)
+
+_TRIVIAL_CHARS = set(" +-*/=.,()%^")
+
+
+def normalize_translation_input(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def translation_cache_key(text: str, prompt_template: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(hashlib.sha256(prompt_template.encode("utf-8")).digest())
+    digest.update(normalize_translation_input(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def needs_translation(text: str) -> bool:
+    """False for input the LLM would return unchanged."""
+    stripped = text.strip()
+    if not stripped or all(c.isdigit() or c in _TRIVIAL_CHARS for c in stripped):
+        return False
+    return not is_clearly_english(stripped)
+
+
+class TranslationCache:
+    """Memory LRU + optional DB tier in front of the translation LLM call."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        shared: bool = False,
+        enabled: bool = True,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.shared = shared
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._writes: Set[asyncio.Task] = set()
+        self._requests = 0
+        self._skipped = 0
+        self._memory_hits = 0
+        self._shared_hits = 0
+        self._llm_calls = 0
+        self._llm_failures = 0
+
+    async def translate(
+        self,
+        text: str,
+        prompt_template: str,
+        call_llm: Callable[[], Awaitable[Optional[str]]],
+    ) -> Tuple[str, str]:
+        """Return (english, source); source is skip | memory | shared | llm.
+
+        `call_llm` returns the translation, or None when the response was
+        unusable — the original text is returned and nothing is cached.
+        """
+        with self._lock:
+            self._requests += 1
+        if not needs_translation(text):
+            with self._lock:
+                self._skipped += 1
+            return text, "skip"
+
+        key = translation_cache_key(text, prompt_template) if self.enabled else None
+        if key is not None:
+            with self._lock:
+                english = self._memory.get(key)
+                if english is not None:
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                    return english, "memory"
+            english = await self._shared_get(key)
+            if english is not None:
+                with self._lock:
+                    self._shared_hits += 1
+                self._memory_put(key, english)
+                return english, "shared"
+
+        with self._lock:
+            self._llm_calls += 1
+        english = await call_llm()
+        if english is None:
+            with self._lock:
+                self._llm_failures += 1
+            return text, "llm"
+        if key is not None:
+            self._memory_put(key, english)
+            self._schedule_shared_put(key, english)
+        return english, "llm"
+
+    def _memory_put(self, key: str, english: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = english
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _session(self):
+        if self._session_factory is None:
+            from database import get_db_manager
+            self._session_factory = get_db_manager().session_factory
+        return self._session_factory()
+
+    def _db_get(self, key: str) -> Optional[str]:
+        from shared.models.entities import TranslationCacheEntry
+
+        db = self._session()
+        try:
+            row = db.get(TranslationCacheEntry, key)
+            return row.english if row is not None else None
+        finally:
+            db.close()
+
+    def _db_put(self, key: str, english: str) -> None:
+        from shared.models.entities import TranslationCacheEntry
+
+        db = self._session()
+        try:
+            db.merge(TranslationCacheEntry(key=key, english=english))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def _shared_get(self, key: str) -> Optional[str]:
+        if not self.shared:
+            return None
+        try:
+            return await asyncio.to_thread(self._db_get, key)
+        except Exception as e:
+            logger.warning(f"Translation cache read failed for {key[:12]}: {e}")
+            return None
+
+    def _schedule_shared_put(self, key: str, english: str) -> None:
+        """Write in the background so the turn isn't held up by the DB."""
+        if not self.shared:
+            return
+        task = asyncio.create_task(self._shared_put(key, english))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _shared_put(self, key: str, english: str) -> None:
+        try:
+            await asyncio.to_thread(self._db_put, key, english)
+        except Exception as e:
+            logger.warning(f"Translation cache write failed for {key[:12]}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            cache_hits = self._memory_hits + self._shared_hits
+            return {
+                "enabled": self.enabled,
+                "shared": self.shared,
+                "requests": self._requests,
+                "skipped": self._skipped,
+                "memory_hits": self._memory_hits,
+                "shared_hits": self._shared_hits,
+                "llm_calls": self._llm_calls,
+                "llm_failures": self._llm_failures,
+                "llm_avoided_rate": (
+                    round((cache_hits + self._skipped) / self._requests, 4)
+                    if self._requests else 0.0
+                ),
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._requests = 0
+            self._skipped = 0
+            self._memory_hits = 0
+            self._shared_hits = 0
+            self._llm_calls = 0
+            self._llm_failures = 0
+
+
+_translation_cache: Optional[TranslationCache] = None
+_translation_cache_lock = threading.Lock()
+
+
+def get_translation_cache() -> TranslationCache:
+    global _translation_cache
+    if _translation_cache is None:
+        with _translation_cache_lock:
+            if _translation_cache is None:
+                from config import get_settings
+                settings = get_settings()
+                _translation_cache = TranslationCache(
+                    max_entries=settings.translation_cache_max_entries,
+                    shared=settings.translation_cache_shared,
+                    enabled=settings.translation_cache_enabled,
+                )
+    return _translation_cache
+
+
+def reset_translation_cache() -> None:
+    """Drop the global cache instance (useful for testing)."""
+    global _translation_cache
+    _translation_cache = None
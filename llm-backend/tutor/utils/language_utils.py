@@ -0,0 +1,74 @@
+"""
+Cheap local language checks for student input.
+
+`is_clearly_english` lets the orchestrator skip the translation LLM call for
+messages that need no translation. It is deliberately conservative: anything
+in Devanagari, anything with a Hinglish marker word, and anything made of
+words it doesn't recognise falls through to the LLM. A false "English" only
+costs a slightly less clean tutor prompt; a false "not English" costs one
+fast-model call, as before.
+"""
+
+import re
+
+_WORD_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+# Roman-script Hindi words that don't double as common English words ("to",
+# "me", "main", "is", "do", "the" are ambiguous and left out on purpose).
+HINGLISH_MARKERS = frozenset("""
+    hai hain ho hota hoti hote tha thi nahi nahin nhi nai kya kyu kyun kyon
+    kaise kaisa kese kaun kab kahan kitna kitne kitni mujhe muje mujhko mera
+    meri mere tum tumhe tumhara aap aapka aapko hum humko humne yeh ye woh wo
+    vo haan haa ji acha accha achha achcha theek thik samajh samjha samjhi
+    samjh samaj samjhao batao bataiye bata karo karna kiya kiye raha rahi
+    rahe gaya gayi bhi sirf lekin aur matlab pata chahiye sakta sakte sakti
+    wala wali wale ek teen bahut bohot bahot zyada jyada abhi phir fir jab
+    agar toh yaar kuch kuchh sab sabhi apna apne usko isko unko inka uska
+    iska mein se ka ki ke ko ne hoga hogi kaunsa dobara fir se galat sahi
+""".split())
+
+# Common English words seen in student replies. Not a dictionary — messages
+# with too many words outside this set go to the LLM.
+ENGLISH_WORDS = frozenset("""
+    a about above add added after again all also am an and answer answers any
+    are area around as ask at back bad be because been before below between
+    big bigger both but by can can't cannot change check come correct could
+    count did didn't difference divide divided do does doesn't don't done
+    down each easy eight else equal equals even every example explain
+    explanation false few fifty find first five for four fraction fractions
+    from get give go going good got great half has have haven't he help her
+    here hi him his how hundred i i'm i've idea if in is isn't it it's its
+    just know last least left less let let's like little long look lot make
+    many maybe me mean means minus more most much multiply multiplied must my
+    need never next nine no not nothing now number numbers of off ok okay on
+    once one only or other our out over part please plus question questions
+    really repeat right said same say see seven should show side simple six
+    small smaller so some something sorry start still subtract sum sure take
+    tell ten than thank thanks that that's the their them then there these
+    they thing things think this those thousand three time times to too total
+    true try twenty two under understand understood up us use very wait want
+    was way we well were what what's when where which why will with wrong yes
+    yeah yet you your zero
+""".split())
+
+# Share of recognised English words needed for a message of 3+ words.
+MIN_ENGLISH_RATIO = 0.6
+
+
+def has_devanagari(text: str) -> bool:
+    return any("ऀ" <= ch <= "ॿ" for ch in text)
+
+
+def is_clearly_english(text: str) -> bool:
+    """True when `text` can be handed to the tutor without translation."""
+    if has_devanagari(text) or not text.isascii():
+        return False
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return False
+    if any(word in HINGLISH_MARKERS for word in words):
+        return False
+    known = sum(1 for word in words if word in ENGLISH_WORDS)
+    if len(words) <= 2:
+        return known == len(words)
+    return known / len(words) >= MIN_ENGLISH_RATIO
@@ -1,8 +1,9 @@
 """
 JSON Schema Utilities for structured LLM output.
 
-Provides helpers for transforming Pydantic schemas to meet
-OpenAI's strict mode requirements.
+Provides helpers for validating structured LLM output. The strict-schema
+helpers live in shared/utils/strict_schema.py (cached per model class) and
+are re-exported here.
 """
 
 import json
@@ -10,57 +11,13 @@ import re
 from typing import Any, Type, TypeVar
 from pydantic import BaseModel, ValidationError
 
+from shared.utils.strict_schema import get_strict_schema, make_schema_strict  # noqa: F401 — re-exported
 from tutor.exceptions import AgentOutputError
 
 
 T = TypeVar("T", bound=BaseModel)
 
 
-def get_strict_schema(model: Type[BaseModel]) -> dict[str, Any]:
-    """
-    Get a strict JSON schema from a Pydantic model.
-
-    Transforms the schema to meet OpenAI's strict mode requirements:
-    - All objects have additionalProperties: false
-    - All properties are in the required array
-    - $ref references have no sibling keywords
-    """
-    base_schema = model.model_json_schema()
-    return make_schema_strict(base_schema)
-
-
-def make_schema_strict(schema: dict[str, Any]) -> dict[str, Any]:
-    """Transform a JSON schema to meet OpenAI's strict mode requirements."""
-    def transform(obj: dict[str, Any]) -> dict[str, Any]:
-        if not isinstance(obj, dict):
-            return obj
-
-        if "$ref" in obj:
-            return {"$ref": obj["$ref"]}
-
-        result = {}
-        for key, value in obj.items():
-            if key == "$defs":
-                result[key] = {k: transform(v) for k, v in value.items()}
-            elif isinstance(value, dict):
-                result[key] = transform(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    transform(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                result[key] = value
-
-        if result.get("type") == "object" and "properties" in result:
-            result["additionalProperties"] = False
-            result["required"] = list(result["properties"].keys())
-
-        return result
-
-    return transform(schema)
-
-
 def validate_agent_output(
     output: dict[str, Any],
     model: Type[T],
@@ -0,0 +1,62 @@
+"""
+Background job worker — drains the durable job queue (`background_jobs`).
+
+Runs the ingestion stages and practice grading that API nodes enqueue when
+BACKGROUND_JOBS_BACKEND=queue (see shared/services/job_queue.py). Start as
+many workers as needed, on any machine that can reach the database: each
+claims jobs with SELECT ... FOR UPDATE SKIP LOCKED and runs at most
+job_queue_<queue>_concurrency jobs of each queue at once. SIGTERM / SIGINT
+stop claiming and wait for running jobs to finish.
+
+Usage:
+    python worker.py
+    python worker.py --queues ingestion
+    python worker.py --queues practice_grading --concurrency 16
+"""
+import argparse
+import importlib
+import logging
+import signal
+
+from config import get_settings
+from shared.services.job_queue import QUEUES, JobWorker, queue_concurrency
+
+# Modules whose @job_task registrations this worker needs.
+TASK_MODULES = (
+    "book_ingestion_v2.api.processing_routes",
+    "tutor.services.practice_service",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Background job worker")
+    parser.add_argument(
+        "--queues", default=",".join(QUEUES),
+        help=f"comma-separated queues to drain (default: {','.join(QUEUES)})",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=0,
+        help="jobs per queue at once (default: job_queue_<queue>_concurrency)",
+    )
+    args = parser.parse_args()
+
+    queues = [q for q in args.queues.split(",") if q]
+    unknown = set(queues) - set(QUEUES)
+    if unknown:
+        parser.error(f"unknown queues: {', '.join(sorted(unknown))}")
+
+    logging.basicConfig(
+        level=getattr(logging, get_settings().log_level.upper(), logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    for module in TASK_MODULES:
+        importlib.import_module(module)
+
+    worker = JobWorker({q: args.concurrency or queue_concurrency(q) for q in queues})
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -747,7 +747,7 @@ export async function transcribeAudio(audioBlob: Blob): Promise<string> {
 export async function synthesizeSpeech(
   text: string,
   language: string = 'en',
-  opts: { voiceRole?: 'tutor' | 'peer' } = {},
+  opts: { voiceRole?: 'tutor' | 'peer'; personalized?: boolean } = {},
 ): Promise<Blob> {
   // Can't use apiFetch — it parses JSON, but we need a raw audio blob.
   const headers: Record<string, string> = { 'Content-Type': 'application/json' };
@@ -760,6 +760,8 @@ export async function synthesizeSpeech(
 
   const body: Record<string, unknown> = { text, language };
   if (opts.voiceRole) body.voice_role = opts.voiceRole;
+  // Student-specific text stays out of the server's shared S3 audio cache.
+  if (opts.personalized) body.personalized = true;
 
   const response = await fetch(`${API_BASE_URL}/text-to-speech`, {
     method: 'POST',
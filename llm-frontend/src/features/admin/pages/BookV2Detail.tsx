@@ -22,6 +22,7 @@ import {
 import QualitySelector from '../components/QualitySelector';
 
 const POLL_INTERVAL = 3000;
+const OCR_IN_FLIGHT = ['pending', 'processing'];
 
 const STATUS_BADGE: Record<string, { bg: string; color: string; label: string }> = {
   toc_defined: { bg: '#F3F4F6', color: '#374151', label: 'TOC Defined' },
@@ -80,6 +81,7 @@ const BookV2Detail: React.FC = () => {
   const explPollingRef = useRef<Record<string, NodeJS.Timeout>>({});
   const topicExplPollingRef = useRef<Record<string, NodeJS.Timeout>>({});
   const ocrPollingRef = useRef<Record<string, NodeJS.Timeout>>({});
+  const pageOcrPollingRef = useRef<Record<string, NodeJS.Timeout>>({});
   const checkInPollingRef = useRef<Record<string, NodeJS.Timeout>>({});
   const practiceBankPollingRef = useRef<Record<string, NodeJS.Timeout>>({});
   const audioPollingRef = useRef<Record<string, NodeJS.Timeout>>({});
@@ -92,6 +94,7 @@ const BookV2Detail: React.FC = () => {
       Object.values(explPollingRef.current).forEach(clearInterval);
       Object.values(topicExplPollingRef.current).forEach(clearInterval);
       Object.values(ocrPollingRef.current).forEach(clearInterval);
+      Object.values(pageOcrPollingRef.current).forEach(clearInterval);
       Object.values(checkInPollingRef.current).forEach(clearInterval);
       Object.values(practiceBankPollingRef.current).forEach(clearInterval);
       Object.values(audioPollingRef.current).forEach(clearInterval);
@@ -188,6 +191,24 @@ const BookV2Detail: React.FC = () => {
     ocrPollingRef.current[chapterId] = setInterval(poll, POLL_INTERVAL);
   }, [id]);
 
+  // Uploads and single-page retries OCR in the background and return
+  // ocr_status="pending"; refresh the page grid until none are in flight.
+  const startPageOcrPolling = useCallback((chapterId: string) => {
+    if (!id || pageOcrPollingRef.current[chapterId]) return;
+    const poll = async () => {
+      try {
+        const pagesResp = await getChapterPages(id!, chapterId);
+        setChapterPages(prev => ({ ...prev, [chapterId]: pagesResp.pages }));
+        if (!pagesResp.pages.some(p => OCR_IN_FLIGHT.includes(p.ocr_status))) {
+          clearInterval(pageOcrPollingRef.current[chapterId]);
+          delete pageOcrPollingRef.current[chapterId];
+          loadBook();
+        }
+      } catch { /* ignore polling errors */ }
+    };
+    pageOcrPollingRef.current[chapterId] = setInterval(poll, POLL_INTERVAL);
+  }, [id]);
+
   const startTopicExplPolling = useCallback((guidelineId: string, chapterId: string) => {
     if (!id || topicExplPollingRef.current[guidelineId]) return;
     const poll = async () => {
@@ -317,6 +338,7 @@ const BookV2Detail: React.FC = () => {
       try {
         const pagesResp = await getChapterPages(id!, chId);
         setChapterPages(prev => ({ ...prev, [chId]: pagesResp.pages }));
+        if (pagesResp.pages.some(p => OCR_IN_FLIGHT.includes(p.ocr_status))) startPageOcrPolling(chId);
       } catch { /* ignore */ }
     }
     if (ch.status === 'chapter_completed' && !chapterTopics[chId]) {
@@ -392,6 +414,7 @@ const BookV2Detail: React.FC = () => {
     setUploadingChapter(null);
     setUploadProgress(null);
     loadBook();
+    startPageOcrPolling(ch.id);
   };
 
   const handleStartProcessing = async (ch: ChapterResponseV2) => {
@@ -661,6 +684,7 @@ const BookV2Detail: React.FC = () => {
       const detail = await getPageDetailV2(id, ch.id, pageNum);
       setPageDetail(detail);
       loadBook();
+      startPageOcrPolling(ch.id);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Re-upload failed');
     } finally {
@@ -679,6 +703,7 @@ const BookV2Detail: React.FC = () => {
       // Refresh pages list
       const pagesResp = await getChapterPages(id, ch.id);
       setChapterPages(prev => ({ ...prev, [ch.id]: pagesResp.pages }));
+      startPageOcrPolling(ch.id);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Retry OCR failed');
     } finally {
@@ -793,7 +818,7 @@ const BookV2Detail: React.FC = () => {
           const ocrJob = ocrJobs[ch.id];
           const pages = chapterPages[ch.id] || [];
           const topics = chapterTopics[ch.id] || [];
-          const pagesNeedingOcr = pages.filter(p => p.ocr_status === 'pending' || p.ocr_status === 'failed');
+          const pagesNeedingOcr = pages.filter(p => [...OCR_IN_FLIGHT, 'failed'].includes(p.ocr_status));
           const ocrRunning = ocrJob && ['pending', 'running'].includes(ocrJob.status);
           const ocrDone = ocrJob && ['completed', 'completed_with_errors', 'failed'].includes(ocrJob.status);
 
@@ -67,6 +67,7 @@ export function usePersonalizedAudio(
           try {
             const blob = await synthesizeSpeech(text, language, {
               voiceRole: card.speaker === 'peer' ? 'peer' : 'tutor',
+              personalized: true,
             });
             if (!cancelled) {
               attachClientAudioBlob(personalizedAudioKey(cardId, lineIdx), blob);
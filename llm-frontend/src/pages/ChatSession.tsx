@@ -788,7 +788,8 @@ export default function ChatSession() {
           audioBlob = await synthesizeSpeech(text, audioLang);
         }
       } else {
-        audioBlob = await synthesizeSpeech(text, audioLang);
+        // Live tutor turns can address the student by name.
+        audioBlob = await synthesizeSpeech(text, audioLang, { personalized: true });
       }
       // Discard if a newer play request was made while we were fetching
       if (audioPlayVersion.current !== version) return;